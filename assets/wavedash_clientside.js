@@ -0,0 +1,489 @@
+/*
+ * WaveDash clientside callbacks.
+ *
+ * Functions are registered under window.dash_clientside.wavedash and are
+ * referenced from Python with ClientsideFunction('wavedash', <name>).
+ */
+
+(function () {
+    // Decoded shared axes, keyed by axis key: {bdata, array}
+    var decodedAxes = {};
+
+    var TILE_ID_PREFIX = 'plot-tile-';
+
+    // Tile modes whose x-axis is the time axis (TIME_AXIS_MODES in
+    // plot_tiles.py); only these are linked, zoomed together and get cursors
+    var TIME_AXIS_MODES = ['lines', 'density', 'stft', 'envelope'];
+
+    function isTimeAxisMode(mode) {
+        return !mode || TIME_AXIS_MODES.indexOf(mode) !== -1;
+    }
+
+    // Analysis figures (e.g. spectra) mark their layout with meta.analysis
+    function isAnalysisFigure(payload) {
+        var meta = payload.layout && payload.layout.meta;
+        return Boolean(meta && meta.analysis);
+    }
+
+    var TYPED_ARRAYS = {
+        f4: Float32Array,
+        f8: Float64Array
+    };
+
+    function decodeTypedArray(spec) {
+        var binary = atob(spec.bdata);
+        var bytes = new Uint8Array(binary.length);
+        for (var i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return new TYPED_ARRAYS[spec.dtype](bytes.buffer);
+    }
+
+    function getSharedAxis(axes, key) {
+        var spec = axes && axes[key];
+        if (!spec) {
+            return undefined;
+        }
+        var cached = decodedAxes[key];
+        if (!cached || cached.bdata !== spec.bdata) {
+            // Decode once; every trace and tile then shares the same buffer
+            cached = {bdata: spec.bdata, array: decodeTypedArray(spec)};
+            decodedAxes[key] = cached;
+        }
+        return cached.array;
+    }
+
+    // Dense overlay traces pack their signals' y values with NaN separators
+    // and send the axis only once (meta.packed = axis length). Repeat the
+    // axis with the same separators and give each point its signal name as
+    // customdata for hover.
+    function expandDenseOverlay(trace) {
+        var names = trace.meta.signals;
+        var n = trace.meta.packed;
+        var axis = trace.x && trace.x.bdata ? decodeTypedArray(trace.x) : trace.x;
+        if (!axis || axis.length !== n) {
+            return trace;
+        }
+        var length = names.length * (n + 1) - 1;
+        var x = new Float64Array(length);
+        var customdata = new Array(length);
+        for (var s = 0; s < names.length; s++) {
+            var offset = s * (n + 1);
+            x.set(axis, offset);
+            for (var i = 0; i < n; i++) {
+                customdata[offset + i] = names[s];
+            }
+            if (offset + n < length) {
+                x[offset + n] = NaN;
+                customdata[offset + n] = names[s];
+            }
+        }
+        return Object.assign({}, trace, {x: x, customdata: customdata});
+    }
+
+    function noUpdate() {
+        return window.dash_clientside.no_update;
+    }
+
+    function changedOrNoUpdate(newValue, currentValue) {
+        return newValue === currentValue ? noUpdate() : newValue;
+    }
+
+    // Mirrors get_tile_wrapper_class / get_tile_header_class in plot_tiles.py
+    function tileWrapperClass(isActive) {
+        return isActive ? 'plot-tile-wrapper active' : 'plot-tile-wrapper';
+    }
+
+    function tileHeaderClass(isActive) {
+        return isActive ? 'tile-header active' : 'tile-header';
+    }
+
+    // Mirrors get_tile_status_text in plot_tiles.py
+    function tileStatusText(signalNames, isActive) {
+        var signals = typeof signalNames === 'string' ? [signalNames] : signalNames;
+        if (Array.isArray(signals) && signals.length) {
+            var status = signals.length === 1
+                ? 'Plotting: ' + signals[0]
+                : 'Plotting ' + signals.length + ' signals: ' + signals[0] + '...';
+            return isActive ? status + ' (Active)' : status;
+        }
+        return isActive ? 'Active' : 'Empty';
+    }
+
+    // Tiles within NEAR_MARGIN of the viewport render their figure; tiles
+    // beyond FAR_MARGIN drop their trace data
+    var NEAR_MARGIN = '200px';
+    var FAR_MARGIN = '300%';
+
+    // Visibility observers per scroll root and per-tile intersection state
+    var visibilityObservers = null;
+    var tileIntersections = {};
+
+    function tileVisibility(state) {
+        if (state.near) {
+            return 'visible';
+        }
+        return state.far ? 'hidden' : 'far';
+    }
+
+    function onTileIntersection(kind) {
+        return function (entries) {
+            entries.forEach(function (entry) {
+                var tileId = JSON.parse(entry.target.id);
+                var state = tileIntersections[tileId.index];
+                var previous = tileVisibility(state);
+                state[kind] = entry.isIntersecting;
+                var visibility = tileVisibility(state);
+                if (visibility !== previous) {
+                    window.dash_clientside.set_props(
+                        {type: 'plot-tile-visibility', index: tileId.index},
+                        {data: visibility}
+                    );
+                }
+            });
+        };
+    }
+
+    function observeTile(element) {
+        if (!visibilityObservers) {
+            var root = element.closest('.main-content');
+            visibilityObservers = [
+                new IntersectionObserver(onTileIntersection('near'), {root: root, rootMargin: NEAR_MARGIN}),
+                new IntersectionObserver(onTileIntersection('far'), {root: root, rootMargin: FAR_MARGIN})
+            ];
+        }
+        visibilityObservers.forEach(function (observer) {
+            observer.observe(element);
+        });
+    }
+
+    // Observe new tile wrappers; wrappers not rendered yet are retried briefly
+    function observeTiles(wrapperIds, attempt) {
+        var pending = wrapperIds.filter(function (wrapperId) {
+            if (tileIntersections[wrapperId.index]) {
+                return false;
+            }
+            var element = document.getElementById(domId(wrapperId));
+            if (!element) {
+                return true;
+            }
+            tileIntersections[wrapperId.index] = {near: false, far: false};
+            observeTile(element);
+            return false;
+        });
+        if (pending.length && attempt < 10) {
+            setTimeout(function () { observeTiles(pending, attempt + 1); }, 100);
+        }
+    }
+
+    // Lightweight figure shown in place of a far off-screen tile's traces
+    function placeholderFigure(tileIndex) {
+        return {
+            data: [],
+            layout: {
+                title: {text: 'Plot Tile ' + tileIndex, x: 0.5, xanchor: 'center'},
+                plot_bgcolor: 'white',
+                paper_bgcolor: 'white'
+            }
+        };
+    }
+
+    var CURSOR_COLORS = {a: '#e91e63', b: '#009688'};
+
+    // Vertical line shapes for the placed cursors
+    function cursorShapes(cursors) {
+        return ['a', 'b'].filter(function (name) {
+            return cursors && cursors[name] !== null && cursors[name] !== undefined;
+        }).map(function (name) {
+            return {
+                type: 'line',
+                xref: 'x',
+                yref: 'paper',
+                x0: cursors[name],
+                x1: cursors[name],
+                y0: 0,
+                y1: 1,
+                line: {color: CURSOR_COLORS[name], width: 1, dash: 'dash'},
+                label: {text: name.toUpperCase(), textposition: 'end', font: {color: CURSOR_COLORS[name]}}
+            };
+        });
+    }
+
+    // Relative difference below which two x-ranges are considered equal
+    var RANGE_TOLERANCE = 1e-9;
+
+    // Parse the x-range of a relayout event: an [x0, x1] array, null for
+    // autorange, or undefined when the event does not touch the x-axis
+    function relayoutXRange(relayoutData) {
+        if (!relayoutData) {
+            return undefined;
+        }
+        if (relayoutData['xaxis.autorange']) {
+            return null;
+        }
+        if ('xaxis.range[0]' in relayoutData && 'xaxis.range[1]' in relayoutData) {
+            return [Number(relayoutData['xaxis.range[0]']), Number(relayoutData['xaxis.range[1]'])];
+        }
+        if (Array.isArray(relayoutData['xaxis.range'])) {
+            return relayoutData['xaxis.range'].map(Number);
+        }
+        return undefined;
+    }
+
+    function sameXRange(a, b) {
+        if (!a || !b) {
+            return a === b;
+        }
+        var scale = Math.max(Math.abs(a[1] - a[0]), Math.abs(b[1] - b[0])) || 1;
+        return Math.abs(a[0] - b[0]) <= RANGE_TOLERANCE * scale
+            && Math.abs(a[1] - b[1]) <= RANGE_TOLERANCE * scale;
+    }
+
+    // Dash renders dict IDs as JSON with sorted keys
+    function domId(componentId) {
+        return JSON.stringify(componentId, Object.keys(componentId).sort());
+    }
+
+    function graphElement(graphId) {
+        var container = document.getElementById(domId(graphId));
+        return container && container.querySelector('.js-plotly-plot');
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        wavedash: Object.assign({}, (window.dash_clientside || {}).wavedash, {
+            /*
+             * Build a tile figure from its server payload, filling in the
+             * x data of every trace that references a shared axis and the
+             * hover names of dense overlay traces.
+             */
+            assemble_tile_figure: function (payload, axes, cursors) {
+                if (!payload) {
+                    return window.dash_clientside.no_update;
+                }
+                var data = (payload.data || []).map(function (trace) {
+                    var key = trace.meta && trace.meta.axis;
+                    if (key !== undefined && trace.x === undefined) {
+                        trace = Object.assign({}, trace, {x: getSharedAxis(axes, key)});
+                    }
+                    if (trace.meta && trace.meta.packed !== undefined) {
+                        trace = expandDenseOverlay(trace);
+                    }
+                    return trace;
+                });
+                var shapes = isAnalysisFigure(payload) ? [] : cursorShapes(cursors);
+                var layout = Object.assign({}, payload.layout, {shapes: shapes});
+                return Object.assign({}, payload, {data: data, layout: layout});
+            },
+
+            /*
+             * Place the selected cursor at the clicked x position (then
+             * switch to the other cursor), or clear both cursors. Cursor
+             * lines are redrawn on every rendered time-axis tile directly.
+             */
+            place_cursor: function (clickDataList, clearClicks, target, cursors, graphIds, tileModes) {
+                var triggered = window.dash_clientside.callback_context.triggered;
+                if (!triggered.length) {
+                    return [noUpdate(), noUpdate()];
+                }
+                var propId = triggered[0].prop_id;
+                var updated;
+                var nextTarget;
+                if (propId.indexOf('clear-cursors-button') === 0) {
+                    updated = {a: null, b: null};
+                    nextTarget = 'a';
+                } else {
+                    var point = triggered[0].value && triggered[0].value.points && triggered[0].value.points[0];
+                    var sourceId = JSON.parse(propId.slice(0, propId.lastIndexOf('.')));
+                    var sourceMode = tileModes[graphIds.findIndex(function (graphId) {
+                        return graphId.index === sourceId.index;
+                    })];
+                    if (!point || typeof point.x !== 'number' || !isTimeAxisMode(sourceMode)) {
+                        return [noUpdate(), noUpdate()];
+                    }
+                    updated = Object.assign({a: null, b: null}, cursors);
+                    updated[target] = point.x;
+                    nextTarget = target === 'a' ? 'b' : 'a';
+                }
+
+                var shapes = cursorShapes(updated);
+                graphIds.forEach(function (graphId, i) {
+                    var element = graphElement(graphId);
+                    if (element && window.Plotly && isTimeAxisMode(tileModes[i])) {
+                        window.Plotly.relayout(element, {shapes: shapes});
+                    }
+                });
+
+                return [updated, nextTarget];
+            },
+
+            /*
+             * Follow zoom/pan of a tile. With linked axes the other tiles
+             * are relaid out directly in the browser; the window is then
+             * published so the server can re-decimate the affected tiles.
+             * Relayouts echoed back from linked tiles carry the same range
+             * and are ignored, which prevents relayout loops.
+             */
+            sync_linked_xrange: function (relayoutList, linkValue, graphIds, tileSignals, tileModes, currentWindow) {
+                var triggered = window.dash_clientside.callback_context.triggered;
+                if (!triggered.length || !triggered[0].value) {
+                    return noUpdate();
+                }
+                var xRange = relayoutXRange(triggered[0].value);
+                if (xRange === undefined) {
+                    return noUpdate();
+                }
+                var propId = triggered[0].prop_id;
+                var sourceId = JSON.parse(propId.slice(0, propId.lastIndexOf('.')));
+                var sourceIndex = graphIds.findIndex(function (graphId) {
+                    return graphId.index === sourceId.index;
+                });
+                if (!isTimeAxisMode(tileModes[sourceIndex])) {
+                    // Zooming a spectrum zooms its own frequency axis only
+                    return noUpdate();
+                }
+                var linked = Array.isArray(linkValue) && linkValue.indexOf('linked') !== -1;
+
+                if (linked && currentWindow && currentWindow.linked && sameXRange(xRange, currentWindow.range)) {
+                    return noUpdate();
+                }
+
+                var tiles = [sourceId.index];
+                if (linked) {
+                    var update = xRange ? {'xaxis.range': xRange} : {'xaxis.autorange': true};
+                    graphIds.forEach(function (graphId, i) {
+                        if (graphId.index === sourceId.index || !(tileSignals[i] && tileSignals[i].length)) {
+                            return;
+                        }
+                        tiles.push(graphId.index);
+                        if (!isTimeAxisMode(tileModes[i])) {
+                            // Analysis tiles are rebuilt for the window by the server
+                            return;
+                        }
+                        var element = graphElement(graphId);
+                        if (element && window.Plotly) {
+                            window.Plotly.relayout(element, update);
+                        }
+                    });
+                }
+
+                return {range: xRange, tiles: tiles, linked: linked};
+            },
+
+            /*
+             * Start tracking the visibility of every tile wrapper (runs on
+             * load and whenever tiles are added). The observers report
+             * 'visible', 'hidden' or 'far' through set_props.
+             */
+            observe_tile_visibility: function (wrapperIds) {
+                if (!window.IntersectionObserver) {
+                    // No observer support: every tile renders
+                    return wrapperIds.map(function () { return 'visible'; });
+                }
+                observeTiles(wrapperIds, 0);
+                return wrapperIds.map(noUpdate);
+            },
+
+            /*
+             * Request a tile figure from the server only while the tile is
+             * near the viewport, and only when its signals, mode or (for
+             * spectrum and spectrogram tiles) window function differ from what was last
+             * requested. Far off-screen tiles drop their figure data and
+             * are re-requested when they come back.
+             */
+            gate_tile_request: function (signals, mode, visibility, fftWindow, currentRequest, tileId) {
+                var unchanged = [noUpdate(), noUpdate(), noUpdate()];
+                if (visibility === 'far') {
+                    if (!currentRequest) {
+                        return unchanged;
+                    }
+                    return [null, null, placeholderFigure(tileId.index)];
+                }
+                if (visibility !== 'visible') {
+                    return unchanged;
+                }
+                var request = {signals: signals || [], mode: mode};
+                if (mode === 'fft' || mode === 'stft') {
+                    request.window = fftWindow;
+                }
+                if (!currentRequest && !request.signals.length) {
+                    // Never-plotted empty tiles already show the empty figure
+                    return unchanged;
+                }
+                if (currentRequest && JSON.stringify(currentRequest) === JSON.stringify(request)) {
+                    return unchanged;
+                }
+                return [request, noUpdate(), noUpdate()];
+            },
+
+            /*
+             * Make the clicked tile the active tile.
+             */
+            select_tile: function (nClicksList) {
+                var triggered = window.dash_clientside.callback_context.triggered;
+                // Newly added tiles also trigger this callback, with n_clicks=null
+                if (!triggered.length || !triggered[0].value) {
+                    return noUpdate();
+                }
+                var propId = triggered[0].prop_id;
+                var tileId = JSON.parse(propId.slice(0, propId.lastIndexOf('.')));
+                return TILE_ID_PREFIX + tileId.index;
+            },
+
+            /*
+             * Move the active-tile highlight; only tiles whose state changes
+             * are touched.
+             */
+            update_tile_highlight: function (activeTile, wrapperIds, currentClasses) {
+                var wrapperClasses = [];
+                var headerClasses = [];
+                wrapperIds.forEach(function (wrapperId, i) {
+                    var isActive = TILE_ID_PREFIX + wrapperId.index === activeTile;
+                    var wrapperClass = tileWrapperClass(isActive);
+                    if (wrapperClass === currentClasses[i]) {
+                        wrapperClasses.push(noUpdate());
+                        headerClasses.push(noUpdate());
+                    } else {
+                        wrapperClasses.push(wrapperClass);
+                        headerClasses.push(tileHeaderClass(isActive));
+                    }
+                });
+                return [wrapperClasses, headerClasses];
+            },
+
+            /*
+             * Refresh the status label of every tile whose text changes.
+             */
+            update_tile_status_text: function (activeTile, tileConfig, statusIds, currentTexts) {
+                return statusIds.map(function (statusId, i) {
+                    var tileId = TILE_ID_PREFIX + statusId.index;
+                    var signalNames = tileConfig ? tileConfig[tileId] : null;
+                    var statusText = tileStatusText(signalNames, tileId === activeTile);
+                    return changedOrNoUpdate(statusText, currentTexts[i]);
+                });
+            },
+
+            /*
+             * Enable the plot and clear buttons and label the plot button
+             * from the selected signal, active tile and tile configuration.
+             */
+            update_button_states: function (selectedSignal, activeTile, tileConfig) {
+                var plotEnabled = Boolean(selectedSignal && activeTile);
+                var plotText;
+                if (plotEnabled) {
+                    var tileNumber = activeTile.slice(TILE_ID_PREFIX.length);
+                    plotText = "Add '" + selectedSignal + "' to Tile " + tileNumber;
+                } else if (selectedSignal) {
+                    plotText = 'Select a tile to plot to';
+                } else if (activeTile) {
+                    plotText = 'Select a signal to plot';
+                } else {
+                    plotText = 'Plot to Active Tile';
+                }
+
+                var clearEnabled = Boolean(activeTile && tileConfig && activeTile in tileConfig);
+
+                return [!plotEnabled, plotText, !clearEnabled, !selectedSignal];
+            }
+        })
+    });
+})();
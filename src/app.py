@@ -7,6 +7,7 @@ and main application entry point.
 
 import dash
 from dash import html, dcc
+from flask import jsonify
 from typing import List
 import os
 from pathlib import Path
@@ -15,10 +16,21 @@ from src.data.stores import create_data_stores
 from src.components.upload import create_file_upload_component
 from src.components.signal_list import create_signal_list_component
 from src.components.plot_tiles import create_plot_tiles_component
+from src.components.cursor_panel import create_cursor_panel_component
+from src.components.measurement_panel import create_measurement_panel_component
+from src.components.compare_panel import create_compare_panel_component
+from src.components.power_panel import create_power_panel_component
+from src.components.jitter_panel import create_jitter_panel_component
+from src.data.figure_cache import get_figure_cache
 # Import callbacks to register them
 import src.callbacks.upload_callbacks
 import src.callbacks.signal_callbacks
 import src.callbacks.plot_callbacks
+import src.callbacks.cursor_callbacks
+import src.callbacks.measurement_callbacks
+import src.callbacks.compare_callbacks
+import src.callbacks.power_callbacks
+import src.callbacks.jitter_callbacks
 
 
 def create_app() -> dash.Dash:
@@ -43,6 +55,11 @@ def create_app() -> dash.Dash:
     # Set the layout
     app.layout = create_app_layout()
     
+    # Report figure cache hit/miss counters and memory use
+    @app.server.route('/wavedash/cache-stats')
+    def figure_cache_stats():
+        return jsonify(get_figure_cache().stats())
+    
     return app
 
 
@@ -83,7 +100,9 @@ def create_app_layout() -> html.Div:
                             html.H3("Controls", className='sidebar-title'),
                             create_file_upload_component(),
                             html.Hr(),
-                            create_signal_list_component()
+                            create_signal_list_component(),
+                            html.Hr(),
+                            create_cursor_panel_component()
                         ],
                         className='sidebar'
                     ),
@@ -92,7 +111,11 @@ def create_app_layout() -> html.Div:
                     html.Div(
                         id='main-content',
                         children=[
-                            create_plot_tiles_component()
+                            create_plot_tiles_component(),
+                            create_measurement_panel_component(),
+                            create_compare_panel_component(),
+                            create_power_panel_component(),
+                            create_jitter_panel_component()
                         ],
                         className='main-content'
                     )
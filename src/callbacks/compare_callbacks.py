@@ -0,0 +1,131 @@
+"""
+Regression compare callback handlers for WaveDash application.
+
+This module contains the callbacks that load the golden run, compare the
+loaded run against it and plot a compared signal.
+"""
+
+from dash import callback, Output, Input, State
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.components.compare_panel import create_compare_figure, create_compare_table
+from src.data.datasets import Dataset, get_golden_registry, resolve_dataset
+from src.utils.spice_parser import parse_uploaded_raw_file
+from src.utils.waveform_diff import compare_datasets
+
+
+@callback(
+    [
+        Output('golden-status', 'children'),
+        Output('golden-data-store', 'data')
+    ],
+    [
+        Input('golden-upload', 'contents')
+    ],
+    [
+        State('golden-upload', 'filename')
+    ],
+    prevent_initial_call=True
+)
+def handle_golden_upload(contents: Optional[str], filename: Optional[str]) -> Tuple[str, Optional[Dict]]:
+    """
+    Parse the golden .raw file and keep it in the golden-run registry.
+
+    Args:
+        contents: Base64 encoded file contents from dcc.Upload
+        filename: Original filename of the uploaded file
+
+    Returns:
+        Tuple of (golden status message, golden-data-store data).
+    """
+    if contents is None or not filename:
+        return "No golden run loaded", None
+    if not filename.lower().endswith('.raw'):
+        return "Please upload a .raw file", None
+
+    parsing_result = parse_uploaded_raw_file(contents, filename)
+    if not parsing_result['success']:
+        return f"Failed to parse golden run: {parsing_result['error']}", None
+
+    get_golden_registry().register(Dataset(
+        parsing_result['dataset_id'], filename,
+        parsing_result['axes'], parsing_result['waves'], parsing_result['metadata'],
+        sketches=parsing_result['sketches']
+    ))
+    return (f"Golden: {filename} ({len(parsing_result['signals'])} signals)",
+            {'dataset_id': parsing_result['dataset_id'], 'filename': filename})
+
+
+@callback(
+    [
+        Output('compare-results', 'children'),
+        Output('compare-signal', 'options'),
+        Output('compare-signal', 'value'),
+        Output('compare-detail', 'style')
+    ],
+    [
+        Input('compare-button', 'n_clicks')
+    ],
+    [
+        State('parsed-data-store', 'data'),
+        State('golden-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def run_compare(n_clicks: Optional[int], parsed_data: Optional[Dict],
+                golden_data: Optional[Dict]) -> Tuple[List, List[Dict], Optional[str], Dict]:
+    """
+    Compare every signal the loaded run and the golden run have in common.
+
+    Args:
+        n_clicks: Number of times the compare button was clicked
+        parsed_data: Parsed SPICE data of the loaded run
+        golden_data: Contents of golden-data-store
+
+    Returns:
+        Tuple of (results components, signal dropdown options, most
+        divergent signal, detail section style).
+    """
+    dataset = resolve_dataset(parsed_data)
+    golden = get_golden_registry().get((golden_data or {}).get('dataset_id'))
+    if dataset is None or golden is None:
+        return create_compare_table(None), [], None, {'display': 'none'}
+
+    results = compare_datasets(dataset, golden)
+    options = [{'label': result['signal'], 'value': result['signal']} for result in results]
+    selected = results[0]['signal'] if results else None
+    return create_compare_table(results), options, selected, {'display': 'block' if results else 'none'}
+
+
+@callback(
+    Output('compare-graph', 'figure'),
+    [
+        Input('compare-signal', 'value'),
+        Input('compare-view', 'value')
+    ],
+    [
+        State('parsed-data-store', 'data'),
+        State('golden-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def update_compare_plot(signal_name: Optional[str], view: str, parsed_data: Optional[Dict],
+                        golden_data: Optional[Dict]) -> Any:
+    """
+    Plot the selected signal as an overlay or difference against the golden run.
+
+    Args:
+        signal_name: Signal selected in the compare dropdown
+        view: 'overlay' or 'difference'
+        parsed_data: Parsed SPICE data of the loaded run
+        golden_data: Contents of golden-data-store
+
+    Returns:
+        Compare figure.
+    """
+    dataset = resolve_dataset(parsed_data)
+    golden = get_golden_registry().get((golden_data or {}).get('dataset_id'))
+    if dataset is None or golden is None or not signal_name or \
+            not (dataset.has_signal(signal_name) and golden.has_signal(signal_name)):
+        signal_name = None
+    return create_compare_figure(dataset, golden, signal_name, view)
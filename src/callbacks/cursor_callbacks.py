@@ -0,0 +1,74 @@
+"""
+Cursor callback handlers for WaveDash application.
+
+This module contains callbacks for placing the measurement cursors and
+reading out every plotted signal at the cursor positions.
+"""
+
+from dash import callback, clientside_callback, ClientsideFunction, Output, Input, State, ALL
+from typing import List, Dict, Optional
+
+from src.components.cursor_panel import create_cursor_readout
+from src.components.plot_tiles import get_plotted_signals
+from src.data.datasets import resolve_dataset
+from src.utils.cursors import measure_cursors
+
+
+# Placing cursors and drawing the cursor lines on every tile happen on the
+# client; only the readout needs the server (exact values from the dataset).
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='place_cursor'),
+    [
+        Output('cursor-store', 'data'),
+        Output('cursor-target', 'value')
+    ],
+    [
+        Input({'type': 'plot-tile', 'index': ALL}, 'clickData'),
+        Input('clear-cursors-button', 'n_clicks')
+    ],
+    [
+        State('cursor-target', 'value'),
+        State('cursor-store', 'data'),
+        State({'type': 'plot-tile', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-mode', 'index': ALL}, 'value')
+    ],
+    prevent_initial_call=True
+)
+
+
+@callback(
+    Output('cursor-readout', 'children'),
+    [
+        Input('cursor-store', 'data'),
+        Input('tile-config-store', 'data')
+    ],
+    [
+        State('parsed-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def update_cursor_readout(cursors: Optional[Dict], tile_config: Optional[Dict],
+                          parsed_data: Optional[Dict]) -> List:
+    """
+    Read out every plotted signal at the cursor positions.
+
+    Args:
+        cursors: Cursor positions {'a': x or None, 'b': x or None}
+        tile_config: Configuration mapping tile IDs to signal names/lists
+        parsed_data: Parsed SPICE data
+
+    Returns:
+        Cursor readout components.
+    """
+    cursors = cursors or {}
+    if not parsed_data or (cursors.get('a') is None and cursors.get('b') is None):
+        return create_cursor_readout(None)
+
+    signal_names = get_plotted_signals(tile_config)
+    step = parsed_data.get('metadata', {}).get('processed_step')
+    dataset = resolve_dataset(parsed_data)
+    axis = dataset.get_axis(step)
+    waves = {name: dataset.get_wave(name, step) for name in signal_names if dataset.has_signal(name, step)}
+
+    measurement = measure_cursors(axis, waves, cursors.get('a'), cursors.get('b'))
+    return create_cursor_readout(measurement)
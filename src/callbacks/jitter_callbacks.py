@@ -0,0 +1,134 @@
+"""
+Period and jitter callback handlers for WaveDash application.
+
+This module contains the callbacks that offer the loaded signals, run the
+cycle-by-cycle analysis of the chosen signal in every step and plot its
+period, TIE or period histogram.
+"""
+
+from dash import callback, Output, Input, State
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.components.jitter_panel import create_jitter_figure, create_jitter_table
+from src.data.datasets import resolve_dataset
+from src.utils.jitter import DEFAULT_CYCLE_EDGE, analyze_jitter
+
+
+@callback(
+    [
+        Output('jitter-signal', 'options'),
+        Output('jitter-signal', 'value')
+    ],
+    [
+        Input('signal-list-store', 'data'),
+        Input('selected-signal-store', 'data')
+    ],
+    [
+        State('jitter-signal', 'value')
+    ],
+    prevent_initial_call=True
+)
+def update_jitter_signals(signals: Optional[List[str]], selected_signal: Optional[str],
+                          current: Optional[str]) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Offer the loaded signals, following the selected signal.
+
+    Args:
+        signals: Names of the loaded signals
+        selected_signal: Signal selected in the signal list
+        current: Signal currently chosen for the analysis
+
+    Returns:
+        Tuple of (dropdown options, chosen signal).
+    """
+    signals = signals or []
+    options = [{'label': name, 'value': name} for name in signals]
+    if selected_signal in signals:
+        return options, selected_signal
+    return options, current if current in signals else None
+
+
+@callback(
+    [
+        Output('jitter-results', 'children'),
+        Output('jitter-store', 'data'),
+        Output('jitter-detail', 'style')
+    ],
+    [
+        Input('jitter-button', 'n_clicks')
+    ],
+    [
+        State('jitter-signal', 'value'),
+        State('jitter-threshold', 'value'),
+        State('jitter-hysteresis', 'value'),
+        State('jitter-edge', 'value'),
+        State('parsed-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def run_jitter_analysis(n_clicks: Optional[int], signal_name: Optional[str], threshold: Optional[float],
+                        hysteresis: Optional[float], edge: Optional[str],
+                        parsed_data: Optional[Dict]) -> Tuple[List, Optional[Dict], Dict]:
+    """
+    Analyze the periods and jitter of the chosen signal in every step.
+
+    Args:
+        n_clicks: Number of times the analyze button was clicked
+        signal_name: Signal chosen in the dropdown
+        threshold: Threshold level, or None for the signal's mid-level
+        hysteresis: Width of the hysteresis band
+        edge: 'rise' or 'fall': the edge that starts a cycle
+        parsed_data: Parsed SPICE data
+
+    Returns:
+        Tuple of (results components, jitter-store data, detail section
+        style).
+    """
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None or not signal_name or not dataset.has_signal(signal_name):
+        return create_jitter_table(None), None, {'display': 'none'}
+
+    analysis = analyze_jitter(dataset, signal_name, threshold, hysteresis or 0.0, edge or DEFAULT_CYCLE_EDGE)
+    settings = {
+        'signal': signal_name,
+        'threshold': analysis['threshold'],
+        'hysteresis': hysteresis or 0.0,
+        'edge': edge or DEFAULT_CYCLE_EDGE
+    }
+    visible = analysis['total']['cycles'] > 0
+    return create_jitter_table(analysis), settings, {'display': 'block' if visible else 'none'}
+
+
+@callback(
+    Output('jitter-graph', 'figure'),
+    [
+        Input('jitter-store', 'data'),
+        Input('jitter-view', 'value')
+    ],
+    [
+        State('parsed-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def update_jitter_plot(settings: Optional[Dict], view: str, parsed_data: Optional[Dict]) -> Any:
+    """
+    Plot the last analysis in the chosen view.
+
+    The per-cycle arrays are derived again from the dataset's cached edge
+    index, so only the analysis settings travel through the store.
+
+    Args:
+        settings: Contents of jitter-store
+        view: 'period', 'histogram' or 'tie'
+        parsed_data: Parsed SPICE data
+
+    Returns:
+        Jitter figure.
+    """
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None or not settings or not dataset.has_signal(settings['signal']):
+        return create_jitter_figure(None, view)
+
+    analysis = analyze_jitter(dataset, settings['signal'], settings['threshold'], settings['hysteresis'],
+                              settings['edge'])
+    return create_jitter_figure(analysis, view, dataset.metadata.get('independent_var', "Time"))
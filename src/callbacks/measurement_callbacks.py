@@ -0,0 +1,81 @@
+"""
+Measurement callback handlers for WaveDash application.
+
+This module contains the callback that runs the waveform measurements over
+every plotted signal and simulation step, and the callback that plots a
+measured quantity against the step sweep.
+"""
+
+from dash import callback, Output, Input, State
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.components.measurement_panel import create_measurement_table, create_sweep_data, create_sweep_figure
+from src.components.plot_tiles import get_plotted_signals
+from src.data.batch_analysis import analyze_dataset, get_step_sweep
+from src.data.datasets import resolve_dataset
+
+
+@callback(
+    [
+        Output('measurement-results', 'children'),
+        Output('measurement-store', 'data')
+    ],
+    [
+        Input('measure-button', 'n_clicks')
+    ],
+    [
+        State('tile-config-store', 'data'),
+        State('parsed-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def update_measurements(n_clicks: Optional[int], tile_config: Optional[Dict],
+                        parsed_data: Optional[Dict]) -> Tuple[List, Optional[Dict]]:
+    """
+    Measure every plotted signal in every simulation step.
+
+    Large parameter sweeps are measured in the analysis process pool.
+
+    Args:
+        n_clicks: Number of times the measure button was clicked
+        tile_config: Configuration mapping tile IDs to signal names/lists
+        parsed_data: Parsed SPICE data
+
+    Returns:
+        Tuple of (measurement results components, measurement-store data).
+    """
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None:
+        return create_measurement_table(None), None
+
+    rows = analyze_dataset(dataset, get_plotted_signals(tile_config))
+    sweep_label, sweep_values = get_step_sweep(dataset)
+    return create_measurement_table(rows), create_sweep_data(rows, dataset.steps, sweep_label, sweep_values)
+
+
+@callback(
+    [
+        Output('sweep-graph', 'figure'),
+        Output('measurement-sweep', 'style')
+    ],
+    [
+        Input('measurement-store', 'data'),
+        Input('sweep-quantity', 'value')
+    ],
+    prevent_initial_call=True
+)
+def update_sweep_plot(measurements: Optional[Dict[str, Any]], quantity: str) -> Tuple[Any, Dict]:
+    """
+    Plot the selected quantity against the step sweep.
+
+    The plot is only shown for stepped simulations.
+
+    Args:
+        measurements: Contents of measurement-store
+        quantity: Measurement key to plot
+
+    Returns:
+        Tuple of (sweep figure, sweep section style).
+    """
+    stepped = bool(measurements) and len(measurements.get('sweep_values') or {}) > 1
+    return create_sweep_figure(measurements, quantity), {'display': 'block' if stepped else 'none'}
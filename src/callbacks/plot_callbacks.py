@@ -2,266 +2,440 @@
 Plot callback handlers for WaveDash application.
 
 This module contains callbacks for handling plot tile selection and signal plotting.
+Tiles use pattern-matching IDs so the callbacks scale to any number of tiles.
 """
 
-from dash import callback, Output, Input, State, ALL, ctx, no_update
-from typing import List, Dict, Any, Optional, Tuple
-import pandas as pd
-import plotly.graph_objects as go
+from dash import (
+    callback, clientside_callback, ClientsideFunction,
+    Output, Input, State, ALL, MATCH, Patch, no_update
+)
+from typing import List, Dict, Any, Optional
 
+from src.data.stores import get_axis_key
+from src.data.datasets import resolve_dataset
+from src.data.figure_cache import bucket_x_range, get_figure_cache, make_figure_key
+from src.utils.decimation import DEFAULT_PIXEL_WIDTH
+from src.data.spectrum_cache import get_spectra, get_spectrogram
+from src.utils.density import compute_density
+from src.utils.spectrum import DEFAULT_SPECTRUM_WINDOW
 from src.components.plot_tiles import (
+    DEFAULT_TILE_MODE,
+    MAX_TILE_COUNT,
+    TIME_AXIS_MODES,
+    create_plot_tile,
     create_empty_plot_figure, 
     create_signal_plot_figure,
     create_multi_signal_plot_figure,
-    get_tile_wrapper_style,
-    get_tile_header_style,
-    get_tile_status_text
+    create_density_plot_figure,
+    create_spectrum_plot_figure,
+    create_spectrogram_plot_figure,
+    create_xy_plot_figure,
+    create_histogram_plot_figure,
+    create_envelope_plot_figure,
+    get_tile_id,
+    get_tile_index,
+    get_tile_signals
 )
 
 
-@callback(
+# Tile focus is handled entirely on the client: selecting a tile, moving the
+# highlight and refreshing the status labels cost no server round-trips.
+# See assets/wavedash_clientside.js for the implementations.
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='select_tile'),
     Output('active-tile-store', 'data'),
     [
-        Input('plot-tile-1-wrapper', 'n_clicks'),
-        Input('plot-tile-2-wrapper', 'n_clicks'),
-        Input('plot-tile-3-wrapper', 'n_clicks'),
-        Input('plot-tile-4-wrapper', 'n_clicks')
-    ]
+        Input({'type': 'plot-tile-wrapper', 'index': ALL}, 'n_clicks')
+    ],
+    prevent_initial_call=True
 )
-def handle_tile_selection(tile1_clicks: Optional[int], tile2_clicks: Optional[int],
-                         tile3_clicks: Optional[int], tile4_clicks: Optional[int]) -> Optional[str]:
-    """
-    Handle tile wrapper clicks to update the active tile.
-    
-    Args:
-        tile1_clicks: Number of clicks on tile 1 wrapper
-        tile2_clicks: Number of clicks on tile 2 wrapper
-        tile3_clicks: Number of clicks on tile 3 wrapper
-        tile4_clicks: Number of clicks on tile 4 wrapper
-    
-    Returns:
-        ID of the active tile.
-    """
-    if not ctx.triggered:
-        return no_update
-    
-    # Find which tile was clicked
-    triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
-    # Map wrapper IDs to tile IDs
-    tile_mapping = {
-        'plot-tile-1-wrapper': 'plot-tile-1',
-        'plot-tile-2-wrapper': 'plot-tile-2', 
-        'plot-tile-3-wrapper': 'plot-tile-3',
-        'plot-tile-4-wrapper': 'plot-tile-4'
-    }
-    
-    return tile_mapping.get(triggered_id, no_update)
 
 
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='update_tile_highlight'),
     [
-        Output('plot-tile-1-wrapper', 'style'),
-        Output('plot-tile-2-wrapper', 'style'),
-        Output('plot-tile-3-wrapper', 'style'),
-        Output('plot-tile-4-wrapper', 'style')
+        Output({'type': 'plot-tile-wrapper', 'index': ALL}, 'className'),
+        Output({'type': 'plot-tile-header', 'index': ALL}, 'className')
     ],
     [
         Input('active-tile-store', 'data')
+    ],
+    [
+        State({'type': 'plot-tile-wrapper', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-wrapper', 'index': ALL}, 'className')
+    ]
+)
+
+
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='update_tile_status_text'),
+    Output({'type': 'plot-tile-status', 'index': ALL}, 'children'),
+    [
+        Input('active-tile-store', 'data'),
+        Input('tile-config-store', 'data')
+    ],
+    [
+        State({'type': 'plot-tile-status', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-status', 'index': ALL}, 'children')
     ]
 )
-def update_tile_wrapper_styles(active_tile: Optional[str]) -> Tuple[Dict, Dict, Dict, Dict]:
-    """
-    Update tile wrapper styles based on active tile.
-    
-    Args:
-        active_tile: ID of the currently active tile
-    
-    Returns:
-        Tuple of style dictionaries for all 4 tile wrappers.
-    """
-    styles = []
-    
-    for i in range(1, 5):
-        tile_id = f'plot-tile-{i}'
-        is_active = (tile_id == active_tile)
-        styles.append(get_tile_wrapper_style(is_active))
-    
-    return tuple(styles)
 
 
 @callback(
+    Output({'type': 'plot-tile-signals', 'index': ALL}, 'data'),
     [
-        Output('plot-tile-1-header', 'style'),
-        Output('plot-tile-2-header', 'style'),
-        Output('plot-tile-3-header', 'style'),
-        Output('plot-tile-4-header', 'style')
+        Input('tile-config-store', 'data')
     ],
     [
-        Input('active-tile-store', 'data')
+        State({'type': 'plot-tile-signals', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-signals', 'index': ALL}, 'data')
     ]
 )
-def update_tile_header_styles(active_tile: Optional[str]) -> Tuple[Dict, Dict, Dict, Dict]:
+def sync_tile_signal_stores(tile_config: Dict, store_ids: List[Dict],
+                            current_signals: List[Optional[List[str]]]) -> List[Any]:
     """
-    Update tile header styles based on active tile.
+    Fan the tile configuration out to the per-tile signal stores.
+    
+    Only stores whose signal list actually changed are written, so only
+    changed tiles (and of those, only tiles near the viewport) request a
+    new figure.
     
     Args:
-        active_tile: ID of the currently active tile
+        tile_config: Configuration mapping tile IDs to signal names/lists
+        store_ids: Pattern-matching IDs of all per-tile signal stores
+        current_signals: Signal lists currently held by the per-tile stores
     
     Returns:
-        Tuple of style dictionaries for all 4 tile headers.
+        List of signal lists, with no_update for tiles that are unchanged.
     """
-    styles = []
+    updates = []
     
-    for i in range(1, 5):
-        tile_id = f'plot-tile-{i}'
-        is_active = (tile_id == active_tile)
-        styles.append(get_tile_header_style(is_active))
+    for store_id, current in zip(store_ids, current_signals):
+        tile_id = get_tile_id(store_id['index'])
+        signals = get_tile_signals(tile_config.get(tile_id) if tile_config else None)
+        updates.append(_changed_or_no_update(signals, current or []))
     
-    return tuple(styles)
+    return updates
+
+
+# Off-screen tiles are lazy: an intersection observer reports each tile's
+# visibility, and a tile requests its figure only while it is near the
+# viewport. Far off-screen tiles drop their trace data until they return.
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='observe_tile_visibility'),
+    Output({'type': 'plot-tile-visibility', 'index': ALL}, 'data'),
+    [
+        Input({'type': 'plot-tile-wrapper', 'index': ALL}, 'id')
+    ]
+)
+
+
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='gate_tile_request'),
+    [
+        Output({'type': 'plot-tile-request', 'index': MATCH}, 'data'),
+        Output({'type': 'plot-tile-figure', 'index': MATCH}, 'data', allow_duplicate=True),
+        Output({'type': 'plot-tile', 'index': MATCH}, 'figure', allow_duplicate=True)
+    ],
+    [
+        Input({'type': 'plot-tile-signals', 'index': MATCH}, 'data'),
+        Input({'type': 'plot-tile-mode', 'index': MATCH}, 'value'),
+        Input({'type': 'plot-tile-visibility', 'index': MATCH}, 'data'),
+        Input('fft-window', 'value')
+    ],
+    [
+        State({'type': 'plot-tile-request', 'index': MATCH}, 'data'),
+        State({'type': 'plot-tile-request', 'index': MATCH}, 'id')
+    ],
+    prevent_initial_call=True
+)
 
 
 @callback(
+    Output({'type': 'plot-tile-figure', 'index': MATCH}, 'data'),
     [
-        Output('plot-tile-1-status', 'children'),
-        Output('plot-tile-2-status', 'children'),
-        Output('plot-tile-3-status', 'children'),
-        Output('plot-tile-4-status', 'children')
+        Input({'type': 'plot-tile-request', 'index': MATCH}, 'data')
     ],
     [
-        Input('active-tile-store', 'data'),
-        Input('tile-config-store', 'data')
-    ]
+        State({'type': 'plot-tile-request', 'index': MATCH}, 'id'),
+        State('parsed-data-store', 'data'),
+        State('xrange-store', 'data')
+    ],
+    prevent_initial_call=True
 )
-def update_tile_status_text(active_tile: Optional[str], 
-                           tile_config: Dict) -> Tuple[str, str, str, str]:
-    """
-    Update tile status text based on active tile and tile configuration.
-    
-    Args:
-        active_tile: ID of the currently active tile
-        tile_config: Configuration mapping tile IDs to signal names
-    
-    Returns:
-        Tuple of status text for all 4 tiles.
-    """
-    status_texts = []
+def update_plot_tile(request: Optional[Dict], request_id: Dict,
+                     parsed_data: Optional[Dict], window: Optional[Dict]) -> Dict[str, Any]:
+    """Build the figure payload requested by a tile near the viewport."""
+    if request is None:
+        return no_update
     
-    for i in range(1, 5):
-        tile_id = f'plot-tile-{i}'
-        is_active = (tile_id == active_tile)
-        signal_name = tile_config.get(tile_id) if tile_config else None
-        status_text = get_tile_status_text(signal_name, is_active)
-        status_texts.append(status_text)
+    # Analysis tiles (e.g. spectra) start on the linked time window
+    mode = request.get('mode') or DEFAULT_TILE_MODE
+    x_range = None
+    if mode not in TIME_AXIS_MODES and window and window.get('linked'):
+        x_range = window.get('range')
     
-    return tuple(status_texts)
+    return _update_tile_figure(get_tile_id(request_id['index']), request.get('signals'), parsed_data,
+                               x_range, mode, request.get('window') or DEFAULT_SPECTRUM_WINDOW)
 
 
-@callback(
-    Output('plot-tile-1', 'figure'),
+# Fill in each trace's x-axis from the shared axis-store on the client, so an
+# axis is transferred once no matter how many traces and tiles reference it;
+# the measurement cursors are drawn onto the assembled figure
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='assemble_tile_figure'),
+    Output({'type': 'plot-tile', 'index': MATCH}, 'figure'),
     [
-        Input('tile-config-store', 'data')
+        Input({'type': 'plot-tile-figure', 'index': MATCH}, 'data')
     ],
     [
-        State('parsed-data-store', 'data')
-    ]
+        State('axis-store', 'data'),
+        State('cursor-store', 'data')
+    ],
+    prevent_initial_call=True
 )
-def update_plot_tile_1(tile_config: Dict, parsed_data: Optional[Dict]) -> go.Figure:
-    """Update plot tile 1 figure."""
-    return _update_tile_figure('plot-tile-1', tile_config, parsed_data)
 
 
-@callback(
-    Output('plot-tile-2', 'figure'),
+# Zoom/pan: the clientside callback copies x-range changes to the other tiles
+# when axes are linked (instant, no server work) and publishes the window to
+# the xrange-store; the server then re-decimates every affected tile for
+# that window in one batched request.
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='sync_linked_xrange'),
+    Output('xrange-store', 'data'),
     [
-        Input('tile-config-store', 'data')
+        Input({'type': 'plot-tile', 'index': ALL}, 'relayoutData')
     ],
     [
-        State('parsed-data-store', 'data')
-    ]
+        State('link-axes-toggle', 'value'),
+        State({'type': 'plot-tile', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-signals', 'index': ALL}, 'data'),
+        State({'type': 'plot-tile-mode', 'index': ALL}, 'value'),
+        State('xrange-store', 'data')
+    ],
+    prevent_initial_call=True
 )
-def update_plot_tile_2(tile_config: Dict, parsed_data: Optional[Dict]) -> go.Figure:
-    """Update plot tile 2 figure."""
-    return _update_tile_figure('plot-tile-2', tile_config, parsed_data)
 
 
 @callback(
-    Output('plot-tile-3', 'figure'),
+    Output({'type': 'plot-tile-figure', 'index': ALL}, 'data', allow_duplicate=True),
     [
-        Input('tile-config-store', 'data')
+        Input('xrange-store', 'data')
     ],
     [
+        State({'type': 'plot-tile-signals', 'index': ALL}, 'id'),
+        State({'type': 'plot-tile-signals', 'index': ALL}, 'data'),
+        State({'type': 'plot-tile-mode', 'index': ALL}, 'value'),
+        State({'type': 'plot-tile-visibility', 'index': ALL}, 'data'),
+        State('fft-window', 'value'),
         State('parsed-data-store', 'data')
-    ]
+    ],
+    prevent_initial_call=True
 )
-def update_plot_tile_3(tile_config: Dict, parsed_data: Optional[Dict]) -> go.Figure:
-    """Update plot tile 3 figure."""
-    return _update_tile_figure('plot-tile-3', tile_config, parsed_data)
+def update_tiles_for_window(window: Optional[Dict], store_ids: List[Dict],
+                            tile_signals: List[Optional[List[str]]],
+                            tile_modes: List[Optional[str]],
+                            tile_visibility: List[Optional[str]],
+                            spectral_window: Optional[str],
+                            parsed_data: Optional[Dict]) -> List[Any]:
+    """
+    Re-decimate the visible tiles affected by a zoom/pan for the new window.
+    
+    Args:
+        window: {'range': [x0, x1] or None for autorange, 'tiles': [tile indices]}
+        store_ids: Pattern-matching IDs of all per-tile signal stores
+        tile_signals: Signal lists of all tiles
+        tile_modes: Display modes of all tiles
+        tile_visibility: Visibility of all tiles ('visible', 'hidden' or 'far')
+        spectral_window: Window function of spectrum and spectrogram tiles
+        parsed_data: Parsed SPICE data
+    
+    Returns:
+        List of figure payloads, with no_update for tiles outside the window event.
+    """
+    if not window:
+        return [no_update] * len(store_ids)
+    
+    affected = set(window.get('tiles') or [])
+    x_range = window.get('range')
+    
+    payloads = []
+    for store_id, signals, mode, visibility in zip(store_ids, tile_signals, tile_modes, tile_visibility):
+        if store_id['index'] in affected and signals and visibility == 'visible':
+            payloads.append(_update_tile_figure(get_tile_id(store_id['index']), signals,
+                                                parsed_data, x_range, mode or DEFAULT_TILE_MODE,
+                                                spectral_window or DEFAULT_SPECTRUM_WINDOW))
+        else:
+            payloads.append(no_update)
+    
+    return payloads
 
 
 @callback(
-    Output('plot-tile-4', 'figure'),
+    Output('plot-tiles-grid', 'children'),
     [
-        Input('tile-config-store', 'data')
+        Input('add-tile-button', 'n_clicks')
     ],
     [
-        State('parsed-data-store', 'data')
-    ]
+        State({'type': 'plot-tile-wrapper', 'index': ALL}, 'id')
+    ],
+    prevent_initial_call=True
 )
-def update_plot_tile_4(tile_config: Dict, parsed_data: Optional[Dict]) -> go.Figure:
-    """Update plot tile 4 figure."""
-    return _update_tile_figure('plot-tile-4', tile_config, parsed_data)
+def handle_add_tile(n_clicks: Optional[int], wrapper_ids: List[Dict]) -> Patch:
+    """
+    Append a new plot tile to the grid.
+    
+    Args:
+        n_clicks: Number of times the add tile button was clicked
+        wrapper_ids: Pattern-matching IDs of the existing tile wrappers
+    
+    Returns:
+        Patch appending the new tile, leaving existing tiles untouched.
+    """
+    if not n_clicks or len(wrapper_ids) >= MAX_TILE_COUNT:
+        return no_update
+    
+    next_index = max((wrapper_id['index'] for wrapper_id in wrapper_ids), default=0) + 1
+    
+    grid = Patch()
+    grid.append(create_plot_tile(next_index))
+    
+    return grid
+
+
+def _with_x_range(payload: Dict[str, Any], x_range: Optional[List[float]]) -> Dict[str, Any]:
+    """Return a copy of a figure payload showing exactly x_range (cached payloads stay untouched)."""
+    if x_range is None:
+        return payload
+    
+    layout = dict(payload.get('layout', {}))
+    layout['xaxis'] = {**layout.get('xaxis', {}), 'range': sorted(x_range), 'autorange': False}
+    return {**payload, 'layout': layout}
+
+
+def _changed_or_no_update(new_value: Any, current_value: Any) -> Any:
+    """Return new_value, or no_update if it equals the current value."""
+    return no_update if new_value == current_value else new_value
 
 
-def _update_tile_figure(tile_id: str, tile_config: Dict, 
-                       parsed_data: Optional[Dict]) -> go.Figure:
+def _update_tile_figure(tile_id: str, signal_config: Optional[Any],
+                       parsed_data: Optional[Dict],
+                       x_range: Optional[List[float]] = None,
+                       mode: str = DEFAULT_TILE_MODE,
+                       spectral_window: str = DEFAULT_SPECTRUM_WINDOW) -> Dict[str, Any]:
     """
-    Update a single tile figure based on configuration and data.
+    Update a single tile figure based on its signals and data.
+    
+    Figures of loaded datasets are served from the figure cache when the
+    same view was built before. Zoomed views are built for the x-range
+    bucket containing the window, so nearby windows share a cache entry.
     
     Args:
         tile_id: ID of the tile to update
-        tile_config: Configuration mapping tile IDs to signal names/lists
+        signal_config: Signal name(s) assigned to the tile (string or list)
         parsed_data: Parsed SPICE data
+        x_range: Visible [x0, x1] window, or None for the full range
+        mode: Tile display mode ('lines', 'density', 'fft', 'stft', 'xy',
+            'histogram' or 'envelope')
+        spectral_window: Window function of spectrum and spectrogram tiles
     
     Returns:
-        Updated Plotly figure with single or multiple signal traces.
+        Serialized Plotly figure with single or multiple signal traces.
     """
-    # Check if this tile has any signals assigned
-    if not tile_config or tile_id not in tile_config:
-        tile_number = tile_id.split('-')[-1]
-        return create_empty_plot_figure(f"Plot Tile {tile_number}")
+    tile_number = get_tile_index(tile_id)
+    signal_names = get_tile_signals(signal_config)
     
-    signal_config = tile_config[tile_id]
-    
-    # Convert to list format for consistent handling
-    if isinstance(signal_config, str):
-        signal_names = [signal_config]
-    elif isinstance(signal_config, list):
-        signal_names = signal_config
-    else:
-        tile_number = tile_id.split('-')[-1]
-        return create_empty_plot_figure(f"Plot Tile {tile_number}")
+    # Check if this tile has any signals assigned
+    if not signal_names:
+        return create_empty_plot_figure(f"Plot Tile {tile_number}").to_plotly_json()
     
     # Check if we have parsed data
     if not parsed_data or not parsed_data.get('data'):
-        tile_number = tile_id.split('-')[-1]
-        return create_empty_plot_figure(f"Plot Tile {tile_number}")
+        return create_empty_plot_figure(f"Plot Tile {tile_number}").to_plotly_json()
     
     try:
-        # Reconstruct DataFrame from stored data
-        df_data = parsed_data['data']
-        index_data = parsed_data['index']
         metadata = parsed_data.get('metadata', {})
+        dataset_id = parsed_data.get('dataset_id')
+        step = metadata.get('processed_step')
+        
+        build_range = bucket_x_range(x_range)
+        
+        # Serve repeated views from memory
+        cache_key = None
+        if dataset_id:
+            figure_mode = f"{mode}:{spectral_window}" if mode in ('fft', 'stft') else mode
+            cache_key = make_figure_key(dataset_id, signal_names, step, x_range, DEFAULT_PIXEL_WIDTH,
+                                        mode=figure_mode)
+            cached = get_figure_cache().get(cache_key)
+            if cached is not None:
+                return _with_x_range(cached, x_range) if mode in TIME_AXIS_MODES else cached
+        
+        # Slice signals (and evaluate derived ones) from the server-side
+        # dataset, rebuilt from the stored records if it is not loaded
+        dataset = resolve_dataset(parsed_data)
+        
+        # Only line and XY tiles plot the signals as a frame; the analysis
+        # modes read the dataset directly
+        df = None
+        
+        if mode == 'density':
+            # Bin every run (step) of the signals into one image
+            runs = [run for name in signal_names for run in dataset.get_runs(name)]
+            if not runs:
+                raise ValueError(f"Signal(s) not found in data: {', '.join(signal_names)}")
+            density = compute_density(runs, build_range)
+            fig = create_density_plot_figure(signal_names, density, metadata, build_range)
+        elif mode == 'fft':
+            # Spectra of the time window (x_range is not the plot's own axis)
+            spectrum = get_spectra(dataset, signal_names, step, build_range, spectral_window)
+            fig = create_spectrum_plot_figure(signal_names, spectrum)
+        elif mode == 'stft':
+            # Spectrogram of the first signal over the visible window
+            spectrogram = get_spectrogram(dataset, signal_names[0], step, build_range, spectral_window)
+            fig = create_spectrogram_plot_figure(signal_names, spectrogram, metadata, build_range)
+        elif mode == 'xy':
+            # Later signals against the first, over the linked time window
+            df = dataset.to_frame(signal_names, step)
+            fig = create_xy_plot_figure(signal_names, dataset.get_axis(step), df, build_range,
+                                        DEFAULT_PIXEL_WIDTH)
+        elif mode == 'histogram':
+            # Time-weighted value distributions over the linked time window
+            histograms = {name: dataset.get_histogram(name, build_range, step=step)
+                          for name in signal_names if dataset.has_signal(name, step)}
+            if not histograms:
+                raise ValueError(f"Signal(s) not found in data: {', '.join(signal_names)}")
+            fig = create_histogram_plot_figure(signal_names, histograms, build_range)
+        elif mode == 'envelope':
+            # Mean, sigma and min/max of every step, streamed onto one grid
+            envelopes = {name: dataset.get_envelope(name, build_range)
+                         for name in signal_names
+                         if any(dataset.has_signal(name, run_step) for run_step in dataset.steps)}
+            if not envelopes:
+                raise ValueError(f"Signal(s) not found in data: {', '.join(signal_names)}")
+            fig = create_envelope_plot_figure(signal_names, envelopes, metadata, build_range)
+        else:
+            # Reference the x-axis already shipped to the axis-store
+            axis_key = get_axis_key(dataset_id, step) if dataset_id else None
+            
+            # Create multi-signal plot
+            df = dataset.to_frame(signal_names, step)
+            fig = create_multi_signal_plot_figure(signal_names, dataset.get_axis(step), df, metadata, tile_id,
+                                                  axis_key=axis_key, x_range=build_range,
+                                                  pixel_width=DEFAULT_PIXEL_WIDTH)
+        payload = fig.to_plotly_json()
         
-        # Convert back to DataFrame
-        df = pd.DataFrame(df_data, index=index_data)
+        # Only complete figures are cached; missing-signal warnings are not
+        if df is not None:
+            complete = all(name in df.columns for name in signal_names)
+        else:
+            complete = all(dataset.has_signal(name, step) for name in signal_names)
+        if cache_key is not None and complete:
+            get_figure_cache().put(cache_key, payload)
         
-        # Create multi-signal plot
-        return create_multi_signal_plot_figure(signal_names, index_data, df, metadata, tile_id)
+        return _with_x_range(payload, x_range) if mode in TIME_AXIS_MODES else payload
         
     except Exception as e:
         # Create error plot
-        tile_number = tile_id.split('-')[-1]
         fig = create_empty_plot_figure(f"Plot Tile {tile_number}")
         fig.add_annotation(
             text=f"Error plotting signals: {str(e)}",
@@ -270,7 +444,7 @@ def _update_tile_figure(tile_id: str, tile_config: Dict,
             showarrow=False,
             font={'size': 14, 'color': '#ff0000'}
         )
-        return fig
+        return fig.to_plotly_json()
 
 
 def register_plot_callbacks(app):
@@ -0,0 +1,175 @@
+"""
+Power and energy callback handlers for WaveDash application.
+
+This module contains the callbacks that load the netlist, account the
+energy and power of every device over the cursor window and plot selected
+devices.
+"""
+
+import base64
+from dash import callback, Output, Input, State
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.components.power_panel import DEFAULT_PLOTTED_DEVICES, create_power_figure, create_power_table
+from src.data.datasets import resolve_dataset
+from src.utils.power import (compute_device_power, cumulative_energy, pair_device_terminals, parse_netlist,
+                             power_table)
+
+
+@callback(
+    [
+        Output('netlist-status', 'children'),
+        Output('netlist-store', 'data')
+    ],
+    [
+        Input('netlist-upload', 'contents')
+    ],
+    [
+        State('netlist-upload', 'filename')
+    ],
+    prevent_initial_call=True
+)
+def handle_netlist_upload(contents: Optional[str], filename: Optional[str]) -> Tuple[str, Optional[Dict]]:
+    """
+    Read the device connections of an uploaded netlist.
+
+    Args:
+        contents: Base64 encoded file contents from dcc.Upload
+        filename: Original filename of the uploaded file
+
+    Returns:
+        Tuple of (netlist status message, netlist-store data).
+    """
+    if contents is None:
+        return "No netlist loaded", None
+
+    try:
+        text = base64.b64decode(contents.split(',', 1)[1]).decode('utf-8', errors='replace')
+        connections = parse_netlist(text)
+    except Exception as e:
+        return f"Failed to read netlist: {e}", None
+
+    return (f"Netlist: {filename} ({len(connections)} devices)",
+            {'filename': filename, 'connections': connections})
+
+
+@callback(
+    [
+        Output('power-store', 'data'),
+        Output('power-devices', 'options'),
+        Output('power-devices', 'value'),
+        Output('power-detail', 'style')
+    ],
+    [
+        Input('power-button', 'n_clicks')
+    ],
+    [
+        State('parsed-data-store', 'data'),
+        State('netlist-store', 'data'),
+        State('cursor-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def compute_power(n_clicks: Optional[int], parsed_data: Optional[Dict], netlist: Optional[Dict],
+                  cursors: Optional[Dict]) -> Tuple[Optional[Dict], List[Dict], List[str], Dict]:
+    """
+    Account the energy and power of every device.
+
+    The window is between cursors A and B when both are placed, else the
+    whole record.
+
+    Args:
+        n_clicks: Number of times the compute button was clicked
+        parsed_data: Parsed SPICE data
+        netlist: Contents of netlist-store
+        cursors: Cursor positions {'a', 'b'}
+
+    Returns:
+        Tuple of (power-store data, device dropdown options, devices to
+        plot, detail section style).
+    """
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None:
+        return None, [], [], {'display': 'none'}
+
+    axis = dataset.get_axis()
+    cursors = cursors or {}
+    window = [cursors['a'], cursors['b']] if cursors.get('a') is not None and cursors.get('b') is not None \
+        else [float(axis[0]), float(axis[-1])]
+    window = sorted(min(max(float(value), float(axis[0])), float(axis[-1])) for value in window)
+
+    devices = pair_device_terminals(dataset.signal_names, (netlist or {}).get('connections'))
+    rows = power_table(dataset, devices, window)
+
+    by_energy = sorted(rows, key=lambda row: abs(row['energy']), reverse=True)
+    options = [{'label': row['device'], 'value': row['device']} for row in rows]
+    plotted = [row['device'] for row in by_energy[:DEFAULT_PLOTTED_DEVICES]]
+    return {'rows': rows, 'window': window}, options, plotted, {'display': 'block' if rows else 'none'}
+
+
+@callback(
+    Output('power-results', 'children'),
+    [
+        Input('power-store', 'data'),
+        Input('power-sort', 'value'),
+        Input('power-sort-order', 'value')
+    ],
+    prevent_initial_call=True
+)
+def update_power_table(power_data: Optional[Dict], sort_key: str,
+                       sort_order: Optional[List[str]]) -> List:
+    """
+    Show the device table in the chosen order.
+
+    Args:
+        power_data: Contents of power-store
+        sort_key: 'device' or a POWER_COLUMNS key
+        sort_order: ['desc'] to sort from largest to smallest
+
+    Returns:
+        Power table components.
+    """
+    return create_power_table(power_data, sort_key, 'desc' in (sort_order or []))
+
+
+@callback(
+    Output('power-graph', 'figure'),
+    [
+        Input('power-devices', 'value'),
+        Input('power-view', 'value')
+    ],
+    [
+        State('power-store', 'data'),
+        State('parsed-data-store', 'data'),
+        State('netlist-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def update_power_plot(device_names: Optional[List[str]], view: str, power_data: Optional[Dict],
+                      parsed_data: Optional[Dict], netlist: Optional[Dict]) -> Any:
+    """
+    Plot the instantaneous power or cumulative energy of the selected devices.
+
+    Args:
+        device_names: Devices selected in the dropdown
+        view: 'power' or 'energy'
+        power_data: Contents of power-store
+        parsed_data: Parsed SPICE data
+        netlist: Contents of netlist-store
+
+    Returns:
+        Power figure.
+    """
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None or not device_names or not power_data:
+        return create_power_figure(None, [], None, view)
+
+    devices = pair_device_terminals(dataset.signal_names, (netlist or {}).get('connections'))
+    selected = {name: devices[name] for name in device_names if name in devices}
+    axis = np.asarray(dataset.get_axis(), dtype=np.float64)
+    names, power = compute_device_power(axis, dataset.get_wave, selected)
+    values = cumulative_energy(axis, power) if view == 'energy' else power
+    return create_power_figure(axis, names, values, view, power_data.get('window'),
+                               dataset.metadata.get('independent_var', "Time"))
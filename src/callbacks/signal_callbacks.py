@@ -4,29 +4,52 @@ Signal selection callback handlers for WaveDash application.
 This module contains callbacks for handling signal selection and plot actions.
 """
 
-from dash import callback, Output, Input, State, ALL, ctx, no_update, html
+from dash import callback, clientside_callback, ClientsideFunction, Output, Input, State, ALL, ctx, no_update, html
 from typing import List, Dict, Any, Optional, Tuple
 import json
 
-from src.components.signal_list import create_signal_list_from_data, get_plot_button_style, get_clear_button_style
+import numpy as np
+
+from src.components.signal_list import SIMILARITY_SORT, create_signal_list_from_data
+from src.data.datasets import resolve_dataset
+from src.utils.expressions import ExpressionError, parse_expression
+from src.utils.signal_stats import filter_and_sort_signals
 
 
 @callback(
     Output('signal-list-display', 'children'),
     [
-        Input('signal-list-store', 'data')
+        Input('signal-list-store', 'data'),
+        Input('signal-filter', 'value'),
+        Input('signal-sort', 'value'),
+        Input('signal-sort-order', 'value'),
+        Input('similar-reference-store', 'data')
     ],
     [
-        State('selected-signal-store', 'data')
+        State('selected-signal-store', 'data'),
+        State('parsed-data-store', 'data')
     ]
 )
-def update_signal_list_display(signals: List[str], selected_signal: Optional[str]) -> List:
+def update_signal_list_display(signals: List[str], filter_text: Optional[str] = None,
+                               sort_key: Optional[str] = None, sort_order: Optional[List[str]] = None,
+                               similar_reference: Optional[str] = None,
+                               selected_signal: Optional[str] = None,
+                               parsed_data: Optional[Dict] = None) -> List:
     """
-    Update the signal list display when signals are loaded or selection changes.
+    Update the signal list display when signals are loaded or the filter or sort order changes.
+    
+    Sorting by similarity ranks the signals by shape correlation with the
+    "find similar" reference, most similar first; signals without a sketch
+    (e.g. derived signals) follow in name order.
     
     Args:
         signals: List of available signal names
+        filter_text: Filter by name and statistics, e.g. "out, pp > 100m"
+        sort_key: 'name', a statistic of SIGNAL_STATS or SIMILARITY_SORT
+        sort_order: ['desc'] to sort from largest to smallest
+        similar_reference: Reference signal of the similarity ranking
         selected_signal: Currently selected signal name
+        parsed_data: Parsed SPICE data holding the ingest statistics
     
     Returns:
         List of signal item components.
@@ -34,7 +57,114 @@ def update_signal_list_display(signals: List[str], selected_signal: Optional[str
     if not signals:
         return create_signal_list_from_data([])
     
-    return create_signal_list_from_data(signals, selected_signal)
+    signal_stats = ((parsed_data or {}).get('metadata') or {}).get('signal_stats') or {}
+    similar = sort_key == SIMILARITY_SORT
+    try:
+        shown = filter_and_sort_signals(signals, signal_stats, filter_text,
+                                        None if similar else sort_key, 'desc' in (sort_order or []))
+    except ValueError as e:
+        return [html.P(str(e), className='signal-filter-message')]
+    
+    similarities = None
+    dataset = resolve_dataset(parsed_data) if similar and similar_reference else None
+    if dataset is not None and dataset.has_signal(similar_reference):
+        similarities = dict(dataset.find_similar(similar_reference))
+        similarities[similar_reference] = 1.0
+        shown = sorted(shown, key=lambda name: -similarities.get(name, -np.inf))
+    
+    if not shown:
+        return [html.P("No signals match the filter", className='signal-filter-message')]
+    
+    return create_signal_list_from_data(shown, selected_signal, signal_stats, similarities)
+
+
+@callback(
+    [
+        Output('similar-reference-store', 'data'),
+        Output('signal-sort', 'value')
+    ],
+    [
+        Input('find-similar-button', 'n_clicks')
+    ],
+    [
+        State('selected-signal-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def handle_find_similar(n_clicks: Optional[int], selected_signal: Optional[str]) -> Tuple[Any, Any]:
+    """
+    Rank the signal list by similarity to the selected signal.
+    
+    Args:
+        n_clicks: Number of times the find similar button was clicked
+        selected_signal: Currently selected signal name
+    
+    Returns:
+        Tuple of (similarity reference, signal list sort key).
+    """
+    if not n_clicks or not selected_signal:
+        return no_update, no_update
+    
+    return selected_signal, SIMILARITY_SORT
+
+
+@callback(
+    [
+        Output('signal-list-store', 'data', allow_duplicate=True),
+        Output('expression-error', 'children'),
+        Output('expression-input', 'value')
+    ],
+    [
+        Input('add-expression-button', 'n_clicks'),
+        Input('expression-input', 'n_submit')
+    ],
+    [
+        State('expression-input', 'value'),
+        State('signal-list-store', 'data'),
+        State('parsed-data-store', 'data')
+    ],
+    prevent_initial_call=True
+)
+def handle_add_derived_signal(n_clicks: Optional[int], n_submit: Optional[int],
+                              expression: Optional[str], signals: Optional[List[str]],
+                              parsed_data: Optional[Dict]) -> Tuple[Any, str, Any]:
+    """
+    Add a derived signal (an expression over the loaded signals) to the signal list.
+    
+    The expression text is the derived signal's name, so it can be plotted,
+    measured and read out like a native signal.
+    
+    Args:
+        n_clicks: Number of times the add button was clicked
+        n_submit: Number of times Enter was pressed in the input
+        expression: Expression text
+        signals: Current signal names
+        parsed_data: Parsed SPICE data
+    
+    Returns:
+        Tuple of (updated signal list, error message, input value).
+    """
+    expression = (expression or '').strip()
+    if not expression:
+        return no_update, "", no_update
+    
+    dataset = resolve_dataset(parsed_data)
+    if dataset is None:
+        return no_update, "Upload a .raw file first", no_update
+    
+    try:
+        parse_expression(expression)
+    except ExpressionError as e:
+        return no_update, str(e), no_update
+    
+    if not dataset.has_signal(expression):
+        return no_update, "Expression uses unknown signals", no_update
+    
+    signals = list(signals or [])
+    if expression not in signals:
+        signals.append(expression)
+    
+    return signals, "", ""
 
 
 @callback(
@@ -110,13 +240,16 @@ def update_selected_signal_display(selected_signal: Optional[str]) -> html.P:
     )
 
 
-@callback(
+# Button enablement and labels only depend on UI state, so they are computed
+# on the client (see assets/wavedash_clientside.js); styling comes from the
+# :disabled CSS rules of the button classes.
+clientside_callback(
+    ClientsideFunction(namespace='wavedash', function_name='update_button_states'),
     [
         Output('plot-button', 'disabled'),
-        Output('plot-button', 'style'),
         Output('plot-button', 'children'),
         Output('clear-tile-button', 'disabled'),
-        Output('clear-tile-button', 'style')
+        Output('find-similar-button', 'disabled')
     ],
     [
         Input('selected-signal-store', 'data'),
@@ -124,45 +257,6 @@ def update_selected_signal_display(selected_signal: Optional[str]) -> html.P:
         Input('tile-config-store', 'data')
     ]
 )
-def update_button_states(selected_signal: Optional[str], 
-                        active_tile: Optional[str],
-                        tile_config: Dict) -> Tuple[bool, Dict[str, Any], str, bool, Dict[str, Any]]:
-    """
-    Update the plot and clear button states based on signal selection and active tile.
-    
-    Args:
-        selected_signal: Currently selected signal name
-        active_tile: Currently active tile ID
-        tile_config: Current tile configuration
-    
-    Returns:
-        Tuple of (plot_disabled, plot_style, plot_text, clear_disabled, clear_style).
-    """
-    # Plot button logic
-    plot_enabled = bool(selected_signal and active_tile)
-    
-    if plot_enabled:
-        plot_text = f"Add '{selected_signal}' to Tile {active_tile[-1] if active_tile else ''}"
-        plot_style = get_plot_button_style(True)
-    elif selected_signal and not active_tile:
-        plot_text = "Select a tile to plot to"
-        plot_style = get_plot_button_style(False)
-    elif not selected_signal and active_tile:
-        plot_text = "Select a signal to plot"
-        plot_style = get_plot_button_style(False)
-    else:
-        plot_text = "Plot to Active Tile"
-        plot_style = get_plot_button_style(False)
-    
-    # Clear button logic
-    clear_enabled = bool(active_tile and tile_config and active_tile in tile_config)
-    
-    if clear_enabled:
-        clear_style = get_clear_button_style(True)
-    else:
-        clear_style = get_clear_button_style(False)
-    
-    return not plot_enabled, plot_style, plot_text, not clear_enabled, clear_style
 
 
 @callback(
@@ -9,7 +9,10 @@ from typing import Tuple, Dict, Any, Optional
 import json
 
 from src.utils.spice_parser import parse_uploaded_raw_file
+from src.utils.plot_encoding import encode_typed_array
 from src.components.upload import get_upload_feedback, get_error_feedback
+from src.data.stores import get_axis_key
+from src.data.datasets import Dataset, get_dataset_registry
 
 
 @callback(
@@ -17,7 +20,8 @@ from src.components.upload import get_upload_feedback, get_error_feedback
         Output('upload-status', 'children'),
         Output('upload-status', 'style'),
         Output('parsed-data-store', 'data'),
-        Output('signal-list-store', 'data')
+        Output('signal-list-store', 'data'),
+        Output('axis-store', 'data')
     ],
     [
         Input('upload-data', 'contents')
@@ -26,7 +30,7 @@ from src.components.upload import get_upload_feedback, get_error_feedback
         State('upload-data', 'filename')
     ]
 )
-def handle_file_upload(contents: Optional[str], filename: Optional[str]) -> Tuple[str, Dict[str, Any], Optional[Dict], list]:
+def handle_file_upload(contents: Optional[str], filename: Optional[str]) -> Tuple[str, Dict[str, Any], Optional[Dict], list, Dict]:
     """
     Handle file upload and parse SPICE data.
     
@@ -40,18 +44,19 @@ def handle_file_upload(contents: Optional[str], filename: Optional[str]) -> Tupl
         - Status styling
         - Parsed data for storage
         - List of signal names
+        - Shared x-axis arrays keyed by axis key
     """
     if contents is None:
-        return "No file uploaded", {'margin': '10px 0', 'padding': '5px', 'fontSize': '14px', 'color': '#666'}, None, []
+        return "No file uploaded", {'margin': '10px 0', 'padding': '5px', 'fontSize': '14px', 'color': '#666'}, None, [], {}
     
     if filename is None:
         error_feedback = get_error_feedback("No filename provided")
-        return error_feedback['message'], error_feedback['style'], None, []
+        return error_feedback['message'], error_feedback['style'], None, [], {}
     
     # Check file extension
     if not filename.lower().endswith('.raw'):
         error_feedback = get_error_feedback("Please upload a .raw file")
-        return error_feedback['message'], error_feedback['style'], None, []
+        return error_feedback['message'], error_feedback['style'], None, [], {}
     
     try:
         # Parse the uploaded file
@@ -59,7 +64,7 @@ def handle_file_upload(contents: Optional[str], filename: Optional[str]) -> Tupl
         
         if not parsing_result['success']:
             error_feedback = get_error_feedback(f"Failed to parse file: {parsing_result['error']}")
-            return error_feedback['message'], error_feedback['style'], None, []
+            return error_feedback['message'], error_feedback['style'], None, [], {}
         
         # Calculate file size from base64 content for feedback
         content_type, content_string = contents.split(',')
@@ -68,25 +73,40 @@ def handle_file_upload(contents: Optional[str], filename: Optional[str]) -> Tupl
         # Prepare success feedback
         success_feedback = get_upload_feedback(filename, int(file_size))
         
+        # Keep a NumPy copy of every simulation step on the server for
+        # plotting and analysis
+        get_dataset_registry().register(Dataset(
+            parsing_result['dataset_id'], filename,
+            parsing_result['axes'], parsing_result['waves'], parsing_result['metadata'],
+            sketches=parsing_result['sketches']
+        ))
+        
         # Prepare data for storage
         # Store both the DataFrame records and metadata
         stored_data = {
             'data': parsing_result['data'],
             'index': parsing_result['index'],
             'metadata': parsing_result['metadata'],
+            'dataset_id': parsing_result['dataset_id'],
             'filename': filename
         }
         
+        # Ship the x-axis once; plot figures reference it by key
+        axis_key = get_axis_key(parsing_result['dataset_id'],
+                                parsing_result['metadata'].get('processed_step'))
+        axis_data = {axis_key: encode_typed_array(parsing_result['index'], is_axis=True)}
+        
         return (
             success_feedback['message'],
             success_feedback['style'],
             stored_data,
-            parsing_result['signals']
+            parsing_result['signals'],
+            axis_data
         )
         
     except Exception as e:
         error_feedback = get_error_feedback(f"Unexpected error: {str(e)}")
-        return error_feedback['message'], error_feedback['style'], None, []
+        return error_feedback['message'], error_feedback['style'], None, [], {}
 
 
 def register_upload_callbacks(app):
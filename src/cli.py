@@ -0,0 +1,176 @@
+"""
+Headless command line interface for WaveDash.
+
+Measures signals and derived-signal expressions in SPICE .raw files and
+writes the results as JSON or CSV, without starting (or importing) the Dash
+app, so it can run waveform checks in CI:
+
+    python -m src.cli sim1.raw sim2.raw -s "V(out)" -s "V(out)-V(in)" -o results.csv
+
+Files are processed in parallel by a pool of worker processes; each worker
+imports the parser and measurement code once and then only pays the cost
+of reading its files. The exit status is 1 if any file failed.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from src.data.datasets import Dataset
+from src.utils.measurements import DEFAULT_SETTLING_TOLERANCE, MEASUREMENTS, measure_dataset
+from src.utils.spice_parser import read_raw_file
+
+# Output formats by file suffix
+OUTPUT_FORMATS = {'.json': 'json', '.csv': 'csv'}
+
+# Result columns in CSV order
+RESULT_COLUMNS = ('file', 'signal', 'step') + MEASUREMENTS
+
+
+def measure_file(file_path: str, signal_names: Optional[Sequence[str]] = None,
+                 tolerance: float = DEFAULT_SETTLING_TOLERANCE) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Measure signals in every step of one .raw file.
+
+    Args:
+        file_path: Path of the .raw file
+        signal_names: Signals or derived-signal expressions (defaults to
+            every signal in the file)
+        tolerance: Settling band relative to the step size
+
+    Returns:
+        Tuple of (result rows {'file', 'signal', 'step', <quantity>: value},
+        error message or None).
+    """
+    try:
+        parsed = read_raw_file(file_path)
+        dataset = Dataset(file_path, os.path.basename(file_path), parsed['axes'], parsed['waves'],
+                          parsed['metadata'])
+        names = list(signal_names) if signal_names else parsed['signals']
+        missing = [name for name in names if not any(dataset.has_signal(name, step) for step in dataset.steps)]
+        if missing:
+            return [], f"Signal(s) not found: {', '.join(missing)}"
+        rows = measure_dataset(dataset, names, tolerance=tolerance)
+    except Exception as e:
+        return [], str(e)
+
+    return [{'file': file_path, **row} for row in rows], None
+
+
+def measure_files(file_paths: Sequence[str], signal_names: Optional[Sequence[str]] = None,
+                  tolerance: float = DEFAULT_SETTLING_TOLERANCE,
+                  workers: Optional[int] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
+    """
+    Measure signals in many .raw files, in parallel.
+
+    Args:
+        file_paths: Paths of the .raw files
+        signal_names: Signals or derived-signal expressions (defaults to
+            every signal of each file)
+        tolerance: Settling band relative to the step size
+        workers: Worker processes (defaults to the CPU count); 1 runs in
+            this process
+
+    Returns:
+        Tuple of (result rows in file order, errors [{'file', 'error'}]).
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, len(file_paths)))
+    arguments = ([signal_names] * len(file_paths), [tolerance] * len(file_paths))
+
+    if workers == 1:
+        results = list(map(measure_file, file_paths, *arguments))
+    else:
+        chunk_size = max(1, math.ceil(len(file_paths) / (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(measure_file, file_paths, *arguments, chunksize=chunk_size))
+
+    rows, errors = [], []
+    for file_path, (file_rows, error) in zip(file_paths, results):
+        rows.extend(file_rows)
+        if error is not None:
+            errors.append({'file': file_path, 'error': error})
+    return rows, errors
+
+
+def write_results(rows: List[Dict[str, Any]], errors: List[Dict[str, str]], output: TextIO,
+                  output_format: str) -> None:
+    """
+    Write measurement results.
+
+    Args:
+        rows: Result rows from measure_files()
+        errors: Per-file errors from measure_files()
+        output: Text stream to write to
+        output_format: 'json' ({'results': rows, 'errors': errors}) or 'csv'
+            (one line per row; errors are not written)
+    """
+    if output_format == 'json':
+        json.dump({'results': rows, 'errors': errors}, output, indent=2)
+        output.write('\n')
+        return
+
+    writer = csv.DictWriter(output, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({key: '' if row.get(key) is None else row[key] for key in RESULT_COLUMNS})
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the command line parser.
+
+    Returns:
+        Parser of the CLI arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description="Measure signals in SPICE .raw files without starting the WaveDash server."
+    )
+    parser.add_argument('files', nargs='+', help=".raw files to measure")
+    parser.add_argument('-s', '--signal', action='append', dest='signals', metavar='NAME',
+                        help="signal or expression to measure, e.g. 'V(out)-V(in)' "
+                             "(repeatable; default: every signal)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file, .json or .csv (default: stdout)")
+    parser.add_argument('-f', '--format', choices=sorted(set(OUTPUT_FORMATS.values())),
+                        help="output format (default: from the output suffix, else json)")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_SETTLING_TOLERANCE,
+                        help="settling band relative to the step size (default: %(default)s)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the CLI.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit status: 0 on success, 1 if any file failed.
+    """
+    args = create_parser().parse_args(argv)
+    output_format = args.format or OUTPUT_FORMATS.get(os.path.splitext(args.output)[1].lower(), 'json')
+
+    rows, errors = measure_files(args.files, args.signals, args.tolerance, args.workers)
+
+    if args.output == '-':
+        write_results(rows, errors, sys.stdout, output_format)
+    else:
+        with open(args.output, 'w', newline='') as output:
+            write_results(rows, errors, output, output_format)
+
+    for error in errors:
+        print(f"Error: {error['file']}: {error['error']}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
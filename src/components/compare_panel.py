@@ -0,0 +1,187 @@
+"""
+Regression compare panel component for WaveDash application.
+
+This module provides the golden-run upload, the ranked table of signals
+that differ from the golden run and a plot of one signal as an overlay of
+both runs or as their difference.
+"""
+
+import plotly.graph_objects as go
+from dash import dcc, html
+from typing import Any, Dict, List, Optional
+
+from src.components.cursor_panel import format_cursor_value
+from src.utils.decimation import reduce_for_display
+from src.utils.waveform_diff import DEFAULT_DIFF_GRID, difference_trace
+
+# Table columns: (result key, header label)
+COMPARE_COLUMNS = [
+    ('max_abs_error', "Max |Err|"),
+    ('rms_error', "RMS Err"),
+    ('relative_error', "Rel Err"),
+    ('first_divergence', "Diverges at")
+]
+
+# Ranked rows shown in the table
+MAX_COMPARE_ROWS = 50
+
+# Plot views of the selected signal
+COMPARE_VIEWS = [
+    {'label': "Overlay", 'value': 'overlay'},
+    {'label': "Difference", 'value': 'difference'}
+]
+DEFAULT_COMPARE_VIEW = 'overlay'
+
+
+def create_compare_panel_component() -> html.Div:
+    """
+    Create the regression compare panel.
+
+    Returns:
+        HTML div containing the golden upload, compare button, ranked
+        results table and signal plot.
+    """
+    compare_panel = html.Div(
+        id='compare-section',
+        children=[
+            html.Div(
+                children=[
+                    html.H3("Compare with Golden Run", className='compare-title'),
+                    dcc.Upload(
+                        id='golden-upload',
+                        children=html.Div(['Golden .raw: ', html.A('Select file')]),
+                        multiple=False,
+                        accept='.raw',
+                        className='golden-upload'
+                    ),
+                    html.Button("Compare", id='compare-button', className='compare-button')
+                ],
+                className='compare-header'
+            ),
+            html.Div(id='golden-status', children="No golden run loaded", className='golden-status'),
+            html.Div(
+                id='compare-results',
+                children=create_compare_table(None),
+                className='compare-results'
+            ),
+            html.Div(
+                id='compare-detail',
+                children=[
+                    dcc.Dropdown(
+                        id='compare-signal',
+                        options=[],
+                        value=None,
+                        placeholder="Signal to plot",
+                        className='compare-signal-dropdown'
+                    ),
+                    dcc.RadioItems(
+                        id='compare-view',
+                        options=COMPARE_VIEWS,
+                        value=DEFAULT_COMPARE_VIEW,
+                        inline=True,
+                        className='compare-view'
+                    ),
+                    dcc.Graph(
+                        id='compare-graph',
+                        figure=create_compare_figure(None, None, None, DEFAULT_COMPARE_VIEW),
+                        config={'displaylogo': False},
+                        style={'height': '300px'}
+                    )
+                ],
+                className='compare-detail',
+                style={'display': 'none'}
+            )
+        ],
+        className='compare-section'
+    )
+
+    return compare_panel
+
+
+def create_compare_table(results: Optional[List[Dict[str, Any]]]) -> List:
+    """
+    Create the ranked table of compared signals.
+
+    Args:
+        results: Result of compare_datasets(), or None before comparing
+
+    Returns:
+        List of components: a summary line and the table of the
+        MAX_COMPARE_ROWS most divergent signals, or a placeholder message.
+    """
+    if results is None:
+        return [html.P("Load a golden run and press Compare", className='compare-empty')]
+    if not results:
+        return [html.P("No common signals to compare", className='compare-empty')]
+
+    diverged = sum(result['diverged'] for result in results)
+    summary = f"{diverged} of {len(results)} signals diverge"
+    if len(results) > MAX_COMPARE_ROWS:
+        summary += f" (top {MAX_COMPARE_ROWS} shown)"
+
+    header = html.Tr([html.Th("Signal")] + [html.Th(label) for _, label in COMPARE_COLUMNS])
+    body = []
+    for result in results[:MAX_COMPARE_ROWS]:
+        cells = [html.Td(result['signal'], className='compare-signal-name')]
+        cells.extend(html.Td(format_cursor_value(result[key])) for key, _ in COMPARE_COLUMNS)
+        body.append(html.Tr(cells, className='compare-diverged' if result['diverged'] else None))
+
+    return [
+        html.P(summary, className='compare-summary'),
+        html.Table([html.Thead(header), html.Tbody(body)], className='measurement-table compare-table')
+    ]
+
+
+def create_compare_figure(dataset: Any, golden: Any, signal_name: Optional[str],
+                          view: str) -> go.Figure:
+    """
+    Plot one signal of a run against the golden run.
+
+    Args:
+        dataset: Dataset of the run, or None
+        golden: Golden dataset, or None
+        signal_name: Signal to plot, or None
+        view: 'overlay' (both runs) or 'difference' (run minus golden on the
+            aligned grid)
+
+    Returns:
+        Plotly figure reduced to plot resolution.
+    """
+    fig = go.Figure()
+    x_label = "Time"
+
+    if dataset is not None and golden is not None and signal_name:
+        x_label = dataset.metadata.get('independent_var', x_label)
+        if view == 'difference':
+            grid, difference = difference_trace(dataset, golden, signal_name, grid=DEFAULT_DIFF_GRID)
+            traces = [(f"{signal_name} - golden", grid, difference)]
+        else:
+            traces = [
+                (signal_name, dataset.get_axis(), dataset.get_wave(signal_name)),
+                (f"{signal_name} (golden)", golden.get_axis(), golden.get_wave(signal_name))
+            ]
+        for name, x_values, y_values in traces:
+            x_plot, (y_plot,), _ = reduce_for_display(x_values, [y_values])
+            fig.add_trace(go.Scattergl(
+                x=x_plot,
+                y=y_plot,
+                mode='lines',
+                name=name,
+                line={'dash': 'dash'} if name.endswith("(golden)") else None,
+                hovertemplate=f'<b>{name}</b><br>' +
+                             f'{x_label}: %{{x:.4g}}<br>' +
+                             'Value: %{y:.4g}<br>' +
+                             '<extra></extra>'
+            ))
+
+    fig.update_layout(
+        xaxis={'title': x_label, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        yaxis={'title': "Difference" if view == 'difference' else "Value",
+               'showgrid': True, 'gridcolor': '#e0e0e0'},
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 20, 'b': 50},
+        showlegend=True,
+        meta={'analysis': 'compare'}
+    )
+    return fig
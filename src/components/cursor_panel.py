@@ -0,0 +1,108 @@
+"""
+Cursor panel component for WaveDash application.
+
+This module provides the dual-cursor controls and the readout table that
+shows the exact value of every plotted signal at cursor A and B.
+"""
+
+from dash import html, dcc
+from typing import Dict, Any, List, Optional
+
+
+def create_cursor_panel_component() -> html.Div:
+    """
+    Create the cursor controls and readout panel.
+
+    Returns:
+        HTML div containing the cursor selector, clear button and readout.
+    """
+    cursor_panel = html.Div(
+        id='cursor-section',
+        children=[
+            html.H4("Cursors", className='cursor-title'),
+            html.P("Click a plot to place the selected cursor.", className='cursor-help'),
+
+            html.Div(
+                children=[
+                    dcc.RadioItems(
+                        id='cursor-target',
+                        options=[
+                            {'label': ' A', 'value': 'a'},
+                            {'label': ' B', 'value': 'b'}
+                        ],
+                        value='a',
+                        inline=True,
+                        className='cursor-target'
+                    ),
+                    html.Button("Clear", id='clear-cursors-button', className='clear-cursors-button')
+                ],
+                className='cursor-controls'
+            ),
+
+            # Readout of all plotted signals at the cursors
+            html.Div(
+                id='cursor-readout',
+                children=create_cursor_readout(None),
+                className='cursor-readout'
+            )
+        ],
+        className='cursor-section'
+    )
+
+    return cursor_panel
+
+
+def create_cursor_readout(measurement: Optional[Dict[str, Any]]) -> List:
+    """
+    Create the cursor readout from a cursor measurement.
+
+    Args:
+        measurement: Result of measure_cursors(), or None when no cursor is placed
+
+    Returns:
+        List of components: cursor summary and per-signal table.
+    """
+    if not measurement or (measurement['a'] is None and measurement['b'] is None):
+        return [html.P("No cursors placed", className='cursor-empty')]
+
+    summary = html.Div(
+        children=[
+            html.Span(f"A: {format_cursor_value(measurement['a'])}"),
+            html.Span(f"B: {format_cursor_value(measurement['b'])}"),
+            html.Span(f"Δt: {format_cursor_value(measurement['dt'])}"),
+            html.Span(f"1/Δt: {format_cursor_value(measurement['inv_dt'])}")
+        ],
+        className='cursor-summary'
+    )
+
+    if not measurement['signals']:
+        return [summary, html.P("No signals plotted", className='cursor-empty')]
+
+    header = html.Tr([html.Th(label) for label in ("Signal", "A", "B", "ΔV", "Slope")])
+    rows = [
+        html.Tr([
+            html.Td(name, className='cursor-signal-name'),
+            html.Td(format_cursor_value(values['a'])),
+            html.Td(format_cursor_value(values['b'])),
+            html.Td(format_cursor_value(values['dv'])),
+            html.Td(format_cursor_value(values['slope']))
+        ])
+        for name, values in measurement['signals'].items()
+    ]
+
+    return [summary, html.Table([html.Thead(header), html.Tbody(rows)], className='cursor-table')]
+
+
+def format_cursor_value(value: Optional[float]) -> str:
+    """
+    Format a cursor reading for display.
+
+    Args:
+        value: Reading, or None when it is not available
+
+    Returns:
+        Value in engineering-friendly scientific notation, or "—".
+    """
+    if value is None:
+        return "—"
+    return f"{value:.4g}"
@@ -0,0 +1,213 @@
+"""
+Period and jitter panel component for WaveDash application.
+
+This module provides the controls of the cycle-by-cycle analysis (signal,
+threshold, hysteresis and cycle edge), the table of period, duty cycle and
+jitter statistics per step and a plot of the period or TIE over time or
+of the period histogram.
+"""
+
+import plotly.graph_objects as go
+from dash import dcc, html
+from typing import Any, Dict, List, Optional
+
+from src.components.cursor_panel import format_cursor_value
+from src.utils.decimation import reduce_for_display
+from src.utils.jitter import DEFAULT_CYCLE_EDGE, JITTER_COLUMNS, concatenate_cycles, period_histogram
+
+# Step rows shown in the table
+MAX_JITTER_ROWS = 50
+
+# Steps drawn in the period and TIE views
+MAX_PLOTTED_STEPS = 10
+
+# Plot views
+JITTER_VIEWS = [
+    {'label': "Period", 'value': 'period'},
+    {'label': "Histogram", 'value': 'histogram'},
+    {'label': "TIE", 'value': 'tie'}
+]
+DEFAULT_JITTER_VIEW = 'period'
+
+
+def create_jitter_panel_component() -> html.Div:
+    """
+    Create the period and jitter panel.
+
+    Returns:
+        HTML div containing the analysis controls, the statistics table
+        and the jitter plot.
+    """
+    jitter_panel = html.Div(
+        id='jitter-section',
+        children=[
+            html.Div(
+                children=[
+                    html.H3("Period & Jitter", className='jitter-title'),
+                    html.Button("Analyze", id='jitter-button', className='jitter-button')
+                ],
+                className='jitter-header'
+            ),
+            html.Div(
+                children=[
+                    dcc.Dropdown(
+                        id='jitter-signal',
+                        options=[],
+                        value=None,
+                        placeholder="Signal",
+                        className='jitter-signal-dropdown'
+                    ),
+                    html.Label("Threshold", htmlFor='jitter-threshold', className='toolbar-label'),
+                    dcc.Input(
+                        id='jitter-threshold',
+                        type='number',
+                        placeholder="mid-level",
+                        className='jitter-input'
+                    ),
+                    html.Label("Hysteresis", htmlFor='jitter-hysteresis', className='toolbar-label'),
+                    dcc.Input(
+                        id='jitter-hysteresis',
+                        type='number',
+                        min=0,
+                        value=0,
+                        className='jitter-input'
+                    ),
+                    dcc.RadioItems(
+                        id='jitter-edge',
+                        options=[{'label': "Rise", 'value': 'rise'}, {'label': "Fall", 'value': 'fall'}],
+                        value=DEFAULT_CYCLE_EDGE,
+                        inline=True,
+                        className='jitter-edge'
+                    )
+                ],
+                className='jitter-controls'
+            ),
+            html.Div(
+                id='jitter-results',
+                children=create_jitter_table(None),
+                className='jitter-results'
+            ),
+            html.Div(
+                id='jitter-detail',
+                children=[
+                    dcc.RadioItems(
+                        id='jitter-view',
+                        options=JITTER_VIEWS,
+                        value=DEFAULT_JITTER_VIEW,
+                        inline=True,
+                        className='jitter-view'
+                    ),
+                    dcc.Graph(
+                        id='jitter-graph',
+                        figure=create_jitter_figure(None, DEFAULT_JITTER_VIEW),
+                        config={'displaylogo': False},
+                        style={'height': '300px'}
+                    )
+                ],
+                className='jitter-detail',
+                style={'display': 'none'}
+            )
+        ],
+        className='jitter-section'
+    )
+
+    return jitter_panel
+
+
+def create_jitter_table(analysis: Optional[Dict[str, Any]]) -> List:
+    """
+    Create the table of jitter statistics.
+
+    Args:
+        analysis: Result of analyze_jitter(), or None before analyzing
+
+    Returns:
+        List of components: a summary line and a table with one row per
+        step plus an "All" row for several steps, or a placeholder message.
+    """
+    if analysis is None:
+        return [html.P("Choose a signal and press Analyze", className='jitter-empty')]
+    if not analysis['total']['cycles']:
+        return [html.P(f"Fewer than two edges through {format_cursor_value(analysis['threshold'])}",
+                       className='jitter-empty')]
+
+    rows = analysis['rows']
+    summary = f"{analysis['total']['cycles']} cycles, threshold {format_cursor_value(analysis['threshold'])}"
+    if len(rows) > MAX_JITTER_ROWS:
+        summary += f" (first {MAX_JITTER_ROWS} steps shown)"
+
+    def table_row(label, statistics):
+        return html.Tr([html.Td(label, className='jitter-step')] +
+                       [html.Td(format_cursor_value(statistics[key])) for key, _ in JITTER_COLUMNS])
+
+    header = html.Tr([html.Th("Step")] + [html.Th(label) for _, label in JITTER_COLUMNS])
+    body = [table_row(str(row['step']), row) for row in rows[:MAX_JITTER_ROWS]]
+    if len(rows) > 1:
+        body.append(table_row("All", analysis['total']))
+    return [
+        html.P(summary, className='jitter-summary'),
+        html.Table([html.Thead(header), html.Tbody(body)], className='measurement-table jitter-table')
+    ]
+
+
+def create_jitter_figure(analysis: Optional[Dict[str, Any]], view: str,
+                         x_label: str = "Time") -> go.Figure:
+    """
+    Plot the period or TIE of each cycle over time, or the period histogram.
+
+    Per-cycle arrays are min/max decimated to plot resolution, so a
+    million-cycle run still sends a bounded trace; the histogram is binned
+    on the server.
+
+    Args:
+        analysis: Result of analyze_jitter(), or None
+        view: 'period', 'histogram' or 'tie'
+        x_label: Title of the time axis
+
+    Returns:
+        Plotly figure.
+    """
+    fig = go.Figure()
+    if view == 'histogram':
+        x_title, y_title = "Period", "Cycles"
+    else:
+        x_title, y_title = x_label, "Period" if view == 'period' else "TIE"
+
+    if analysis is not None and analysis['total']['cycles']:
+        if view == 'histogram':
+            histogram = period_histogram(concatenate_cycles(analysis['cycles'])['period'])
+            fig.add_trace(go.Bar(
+                x=histogram['centers'],
+                y=histogram['counts'],
+                marker={'color': '#1f77b4'},
+                hovertemplate='Period: %{x:.4g}<br>Cycles: %{y}<extra></extra>'
+            ))
+            fig.update_layout(bargap=0)
+        else:
+            steps = list(zip(analysis['steps'], analysis['cycles']))[:MAX_PLOTTED_STEPS]
+            for step, cycles in steps:
+                if not len(cycles['start']):
+                    continue
+                x_plot, (y_plot,), _ = reduce_for_display(cycles['start'], [cycles[view]])
+                fig.add_trace(go.Scattergl(
+                    x=x_plot,
+                    y=y_plot,
+                    mode='lines+markers' if len(x_plot) < 200 else 'lines',
+                    marker={'size': 4},
+                    name=f"Step {step}",
+                    hovertemplate=f'<b>Step {step}</b><br>' +
+                                 f'{x_label}: %{{x:.4g}}<br>' +
+                                 f'{y_title}: %{{y:.4g}}<br>' +
+                                 '<extra></extra>'
+                ))
+
+    fig.update_layout(
+        xaxis={'title': x_title, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        yaxis={'title': y_title, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 20, 'b': 50},
+        showlegend=view != 'histogram' and len(analysis['steps']) > 1 if analysis else False,
+        meta={'analysis': 'jitter'}
+    )
+    return fig
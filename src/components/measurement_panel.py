@@ -0,0 +1,184 @@
+"""
+Measurement panel component for WaveDash application.
+
+This module provides the results table of the ``.meas``-style waveform
+measurements of the plotted signals, one row per signal and step, and for
+stepped simulations a plot of one quantity against the swept parameter.
+"""
+
+import plotly.graph_objects as go
+from dash import dcc, html
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.components.cursor_panel import format_cursor_value
+
+# Table columns: (measurement key, header label)
+MEASUREMENT_COLUMNS = [
+    ('min', "Min"),
+    ('max', "Max"),
+    ('pp', "Pk-Pk"),
+    ('avg', "Avg"),
+    ('rms', "RMS"),
+    ('period', "Period"),
+    ('frequency', "Freq"),
+    ('duty', "Duty %"),
+    ('rise', "Rise 10-90"),
+    ('fall', "Fall 90-10"),
+    ('overshoot', "Overshoot %"),
+    ('settling', "Settled at")
+]
+
+# Quantity plotted against the sweep by default
+DEFAULT_SWEEP_QUANTITY = 'frequency'
+
+
+def create_measurement_panel_component() -> html.Div:
+    """
+    Create the measurement panel.
+
+    Returns:
+        HTML div containing the measure button and results table.
+    """
+    measurement_panel = html.Div(
+        id='measurement-section',
+        children=[
+            html.Div(
+                children=[
+                    html.H3("Measurements", className='measurement-title'),
+                    html.Button("Measure Plotted Signals", id='measure-button',
+                                className='measure-button')
+                ],
+                className='measurement-header'
+            ),
+            html.Div(
+                id='measurement-sweep',
+                children=[
+                    html.Label("Plot against sweep", className='toolbar-label'),
+                    dcc.Dropdown(
+                        id='sweep-quantity',
+                        options=[{'label': label, 'value': key} for key, label in MEASUREMENT_COLUMNS],
+                        value=DEFAULT_SWEEP_QUANTITY,
+                        clearable=False,
+                        searchable=False,
+                        className='sweep-quantity-dropdown'
+                    ),
+                    dcc.Graph(
+                        id='sweep-graph',
+                        figure=create_sweep_figure(None, DEFAULT_SWEEP_QUANTITY),
+                        config={'displaylogo': False},
+                        style={'height': '280px'}
+                    )
+                ],
+                className='measurement-sweep',
+                style={'display': 'none'}
+            ),
+            html.Div(
+                id='measurement-results',
+                children=create_measurement_table(None),
+                className='measurement-results'
+            )
+        ],
+        className='measurement-section'
+    )
+
+    return measurement_panel
+
+
+def create_measurement_table(rows: Optional[List[Dict[str, Any]]]) -> List:
+    """
+    Create the results table from measurement rows.
+
+    Args:
+        rows: Result of measure_dataset(), or None before measuring
+
+    Returns:
+        List of components: the results table, or a placeholder message.
+    """
+    if rows is None:
+        return [html.P("Plot signals and press Measure", className='measurement-empty')]
+    if not rows:
+        return [html.P("No signals plotted", className='measurement-empty')]
+
+    # The step column only matters for stepped simulations
+    show_step = len({row['step'] for row in rows}) > 1
+    labels = ["Signal"] + (["Step"] if show_step else []) + [label for _, label in MEASUREMENT_COLUMNS]
+    header = html.Tr([html.Th(label) for label in labels])
+
+    body = []
+    for row in rows:
+        cells = [html.Td(row['signal'], className='measurement-signal-name')]
+        if show_step:
+            cells.append(html.Td(str(row['step'])))
+        cells.extend(html.Td(format_cursor_value(row[key])) for key, _ in MEASUREMENT_COLUMNS)
+        body.append(html.Tr(cells))
+
+    return [html.Table([html.Thead(header), html.Tbody(body)], className='measurement-table')]
+
+
+def create_sweep_figure(measurements: Optional[Dict[str, Any]], quantity: str) -> go.Figure:
+    """
+    Plot one measured quantity of every signal against the step sweep.
+
+    Args:
+        measurements: Contents of measurement-store ({'rows', 'sweep_label',
+            'sweep_values'}), or None before measuring
+        quantity: Measurement key to plot
+
+    Returns:
+        Plotly figure with one line per signal.
+    """
+    fig = go.Figure()
+    label = dict(MEASUREMENT_COLUMNS).get(quantity, quantity)
+    sweep_label = "Step"
+
+    if measurements:
+        sweep_label = measurements.get('sweep_label') or sweep_label
+        sweep_values = measurements.get('sweep_values') or {}
+        series: Dict[str, List] = {}
+        for row in measurements.get('rows') or []:
+            x_values, y_values = series.setdefault(row['signal'], ([], []))
+            x_values.append(sweep_values.get(str(row['step']), row['step']))
+            y_values.append(row.get(quantity))
+        for signal_name, (x_values, y_values) in series.items():
+            fig.add_trace(go.Scatter(
+                x=x_values,
+                y=y_values,
+                mode='lines+markers',
+                name=signal_name,
+                hovertemplate=f'<b>{signal_name}</b><br>' +
+                             f'{sweep_label}: %{{x:.4g}}<br>' +
+                             f'{label}: %{{y:.4g}}<br>' +
+                             '<extra></extra>'
+            ))
+
+    fig.update_layout(
+        xaxis={'title': sweep_label, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        yaxis={'title': label, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 20, 'b': 50},
+        showlegend=True
+    )
+    return fig
+
+
+def create_sweep_data(rows: List[Dict[str, Any]], steps: Sequence[int], sweep_label: str,
+                      sweep_values: Sequence[float]) -> Dict[str, Any]:
+    """
+    Build the measurement-store contents for the sweep plot.
+
+    Args:
+        rows: Measurement rows
+        steps: Step numbers of the dataset
+        sweep_label: Name of the swept parameter
+        sweep_values: Value of the swept parameter per step
+
+    Returns:
+        Dictionary with 'rows', 'sweep_label' and 'sweep_values' (step
+        number as string -> value).
+    """
+    return {
+        'rows': rows,
+        'sweep_label': sweep_label,
+        'sweep_values': {str(step): value for step, value in zip(steps, sweep_values)}
+    }
@@ -1,59 +1,237 @@
 """
 Plot tiles component for WaveDash application.
 
-This module provides the main plotting area with 4 clickable plot tiles.
+This module provides the main plotting area with a variable number of
+clickable plot tiles addressed by pattern-matching IDs.
 """
 
+import re
 from dash import html, dcc
 import plotly.graph_objects as go
-from typing import List, Dict, Any, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
+import numpy as np
 
+from src.utils.plot_encoding import encode_typed_array
+from src.utils.decimation import decimate_xy, pack_nan_separated, reduce_for_display, select_window
+from src.utils.spectrum import SPECTRUM_WINDOWS, DEFAULT_SPECTRUM_WINDOW
 
-def create_plot_tiles_component() -> html.Div:
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Number of tiles created on startup and the upper bound for "Add Tile"
+DEFAULT_TILE_COUNT = 4
+MAX_TILE_COUNT = 32
+
+# Display modes of a tile: value -> label shown in the tile's mode selector
+TILE_MODES = {
+    'lines': 'Lines',
+    'density': 'Density',
+    'fft': 'Spectrum',
+    'stft': 'Spectrogram',
+    'xy': 'XY',
+    'histogram': 'Histogram',
+    'envelope': 'Envelope'
+}
+DEFAULT_TILE_MODE = 'lines'
+
+# Modes whose x-axis is the simulation's time axis; these take part in
+# linked zoom. Other modes analyze the linked time window instead.
+TIME_AXIS_MODES = ('lines', 'density', 'stft', 'envelope')
+
+# Tone metrics are listed for at most this many signals of a spectrum tile
+MAX_SPECTRUM_METRICS = 4
+
+# Mean, sigma and peak-to-peak are listed for at most this many signals of
+# a histogram tile
+MAX_HISTOGRAM_STATS = 4
+
+# Overlays with more signals than this are packed into one trace per group
+DENSE_OVERLAY_THRESHOLD = 20
+
+# Groups beyond this count are merged into a single "other" group
+MAX_OVERLAY_GROUPS = 10
+
+# Color palette for multiple signals and overlay groups
+SIGNAL_COLORS = [
+    '#1f77b4',  # Blue
+    '#ff7f0e',  # Orange  
+    '#2ca02c',  # Green
+    '#d62728',  # Red
+    '#9467bd',  # Purple
+    '#8c564b',  # Brown
+    '#e377c2',  # Pink
+    '#7f7f7f',  # Gray
+    '#bcbd22',  # Olive
+    '#17becf'   # Cyan
+]
+
+
+def get_tile_id(tile_index: int) -> str:
     """
-    Create the main plot tiles component with 4 clickable plot areas.
+    Get the tile ID used in the active-tile and tile-config stores.
+    
+    Args:
+        tile_index: Index of the tile (1-based)
     
     Returns:
-        HTML div containing 4 plot tiles arranged vertically.
+        Tile ID string (e.g., "plot-tile-3").
     """
-    plot_tiles = []
+    return f'plot-tile-{tile_index}'
+
+
+def get_tile_index(tile_id: Optional[str]) -> Optional[int]:
+    """
+    Get the tile index from a tile ID.
     
-    # Create 4 plot tiles
-    for i in range(1, 5):
-        tile_id = f'plot-tile-{i}'
-        
-        # Create a wrapper div that makes the tile clickable
-        tile_wrapper = html.Div(
-            id=f'{tile_id}-wrapper',
-            children=[
-                # Tile header with number and status
-                html.Div(
-                    id=f'{tile_id}-header',
-                    children=[
-                        html.Span(f"Tile {i}", className='tile-number'),
-                        html.Span("Empty", id=f'{tile_id}-status', className='tile-status')
-                    ],
-                    className='tile-header'
-                ),
-                
-                # The actual plot component
-                dcc.Graph(
-                    id=tile_id,
-                    figure=create_empty_plot_figure(f"Plot Tile {i}"),
-                    config={
-                        'displayModeBar': True,
-                        'displaylogo': False,
-                        'modeBarButtonsToRemove': ['pan2d', 'select2d', 'lasso2d']
-                    },
-                    style={'height': '300px'}
-                )
-            ],
-            className='plot-tile-wrapper',
-            style=get_tile_wrapper_style(False)  # Not active by default
-        )
-        
-        plot_tiles.append(tile_wrapper)
+    Args:
+        tile_id: Tile ID string (e.g., "plot-tile-3")
+    
+    Returns:
+        Tile index, or None if the ID is not a valid tile ID.
+    """
+    if not tile_id or not tile_id.startswith('plot-tile-'):
+        return None
+    
+    try:
+        return int(tile_id[len('plot-tile-'):])
+    except ValueError:
+        return None
+
+
+def get_tile_signals(signal_config: Optional[Any]) -> List[str]:
+    """
+    Normalize a tile-config-store entry to a list of signal names.
+    
+    Args:
+        signal_config: Signal name(s) assigned to a tile (string or list)
+    
+    Returns:
+        List of signal names (empty if nothing is assigned).
+    """
+    if isinstance(signal_config, str):
+        return [signal_config]
+    elif isinstance(signal_config, list):
+        return signal_config
+    
+    return []
+
+
+def get_plotted_signals(tile_config: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    List every signal plotted in any tile.
+    
+    Args:
+        tile_config: Configuration mapping tile IDs to signal names/lists
+    
+    Returns:
+        Signal names in tile order, without duplicates.
+    """
+    return list(dict.fromkeys(name for signal_config in (tile_config or {}).values()
+                              for name in get_tile_signals(signal_config)))
+
+
+def create_plot_tile(tile_index: int) -> html.Div:
+    """
+    Create a single clickable plot tile with pattern-matching IDs.
+    
+    Every element of the tile uses an ID of the form
+    ``{'type': <element type>, 'index': tile_index}`` so that callbacks can
+    address one tile with MATCH or every tile with ALL.
+    
+    Args:
+        tile_index: Index of the tile (1-based)
+    
+    Returns:
+        HTML div wrapping the tile header, graph and per-tile stores.
+    """
+    # Create a wrapper div that makes the tile clickable
+    tile_wrapper = html.Div(
+        id={'type': 'plot-tile-wrapper', 'index': tile_index},
+        children=[
+            # Tile header with number and status
+            html.Div(
+                id={'type': 'plot-tile-header', 'index': tile_index},
+                children=[
+                    html.Span(f"Tile {tile_index}", className='tile-number'),
+                    html.Span(
+                        get_tile_status_text(None, False),
+                        id={'type': 'plot-tile-status', 'index': tile_index},
+                        className='tile-status'
+                    ),
+                    dcc.Dropdown(
+                        id={'type': 'plot-tile-mode', 'index': tile_index},
+                        options=[{'label': label, 'value': value} for value, label in TILE_MODES.items()],
+                        value=DEFAULT_TILE_MODE,
+                        clearable=False,
+                        searchable=False,
+                        className='tile-mode-dropdown'
+                    )
+                ],
+                className=get_tile_header_class(False)
+            ),
+            
+            # The actual plot component
+            dcc.Graph(
+                id={'type': 'plot-tile', 'index': tile_index},
+                figure=create_empty_plot_figure(f"Plot Tile {tile_index}"),
+                config={
+                    'displayModeBar': True,
+                    'displaylogo': False,
+                    'modeBarButtonsToRemove': ['pan2d', 'select2d', 'lasso2d']
+                },
+                style={'height': '300px'}
+            ),
+            
+            # Signals assigned to this tile; only changed tiles get a new value,
+            # so only their figure callbacks run
+            dcc.Store(
+                id={'type': 'plot-tile-signals', 'index': tile_index},
+                storage_type='memory',
+                data=None
+            ),
+            
+            # Figure payload from the server; traces reference the shared
+            # x-axis in the axis-store and are assembled on the client
+            dcc.Store(
+                id={'type': 'plot-tile-figure', 'index': tile_index},
+                storage_type='memory',
+                data=None
+            ),
+            
+            # 'visible', 'hidden' or 'far', reported by an intersection
+            # observer on the client
+            dcc.Store(
+                id={'type': 'plot-tile-visibility', 'index': tile_index},
+                storage_type='memory',
+                data='hidden'
+            ),
+            
+            # Figure last requested from the server ({'signals', 'mode'});
+            # only set while the tile is near the viewport
+            dcc.Store(
+                id={'type': 'plot-tile-request', 'index': tile_index},
+                storage_type='memory',
+                data=None
+            )
+        ],
+        className=get_tile_wrapper_class(False)  # Not active by default
+    )
+    
+    return tile_wrapper
+
+
+def create_plot_tiles_component(num_tiles: int = DEFAULT_TILE_COUNT) -> html.Div:
+    """
+    Create the main plot tiles component with clickable plot areas.
+    
+    Args:
+        num_tiles: Number of tiles to create initially
+    
+    Returns:
+        HTML div containing the plot tiles arranged vertically.
+    """
+    plot_tiles = [create_plot_tile(i) for i in range(1, num_tiles + 1)]
     
     plot_tiles_component = html.Div(
         id='plot-tiles-container',
@@ -61,7 +239,29 @@ def create_plot_tiles_component() -> html.Div:
             html.H3("Plot Tiles", className='plot-tiles-title'),
             html.P("Click on a tile to make it active, then use 'Plot to Active Tile' to display signals.", 
                    className='plot-tiles-subtitle'),
-            html.Div(plot_tiles, className='plot-tiles-grid')
+            html.Div(
+                id='plot-tiles-toolbar',
+                children=[
+                    dcc.Checklist(
+                        id='link-axes-toggle',
+                        options=[{'label': ' Link time axes', 'value': 'linked'}],
+                        value=[],
+                        inline=True
+                    ),
+                    html.Label("Spectral window", htmlFor='fft-window', className='toolbar-label'),
+                    dcc.Dropdown(
+                        id='fft-window',
+                        options=[{'label': name.capitalize(), 'value': name} for name in SPECTRUM_WINDOWS],
+                        value=DEFAULT_SPECTRUM_WINDOW,
+                        clearable=False,
+                        searchable=False,
+                        className='fft-window-dropdown'
+                    )
+                ],
+                className='plot-tiles-toolbar'
+            ),
+            html.Div(plot_tiles, id='plot-tiles-grid', className='plot-tiles-grid'),
+            html.Button("+ Add Tile", id='add-tile-button', className='add-tile-button')
         ],
         className='plot-tiles-container'
     )
@@ -134,11 +334,11 @@ def create_signal_plot_figure(signal_name: str, time_data: List[float],
     """
     fig = go.Figure()
     
-    # Add the signal trace
+    # Add the signal trace, shipped as binary typed arrays
     fig.add_trace(
         go.Scattergl(
-            x=time_data,
-            y=signal_data,
+            x=encode_typed_array(time_data, is_axis=True),
+            y=encode_typed_array(signal_data),
             mode='lines',
             name=signal_name,
             line={'width': 2, 'color': '#1f77b4'},
@@ -180,7 +380,11 @@ def create_signal_plot_figure(signal_name: str, time_data: List[float],
 
 
 def create_multi_signal_plot_figure(signal_names: List[str], time_data: List[float], 
-                                   df: 'pd.DataFrame', metadata: Dict, tile_id: str) -> go.Figure:
+                                   df: 'pd.DataFrame', metadata: Dict, tile_id: str,
+                                   axis_key: Optional[str] = None,
+                                   x_range: Optional[List[float]] = None,
+                                   pixel_width: Optional[int] = None,
+                                   overlay_mode: str = 'auto') -> go.Figure:
     """
     Create a plot figure for multiple overlaid signals for comparison.
     
@@ -190,55 +394,71 @@ def create_multi_signal_plot_figure(signal_names: List[str], time_data: List[flo
         df: DataFrame containing the signal data
         metadata: Metadata about the simulation
         tile_id: ID of the tile for error handling
+        axis_key: Key of the x-axis in the axis-store. When given, traces carry
+            only their y data plus ``meta={'axis': axis_key}`` and the x-axis
+            is filled in on the client from the shared axis-store.
+        x_range: Visible [x0, x1] range, or None for the full range
+        pixel_width: Plot width in pixels; windows with more samples than
+            pixels are min/max decimated to this resolution. Decimated traces
+            embed their reduced x-axis instead of referencing axis_key.
+        overlay_mode: 'traces' for one trace per signal, 'dense' to pack the
+            signals into one NaN-separated trace per overlay group, or 'auto'
+            to pack when there are more than DENSE_OVERLAY_THRESHOLD signals
     
     Returns:
         Plotly figure with multiple signal traces overlaid.
     """
     fig = go.Figure()
-    
-    # Color palette for multiple signals
-    colors = [
-        '#1f77b4',  # Blue
-        '#ff7f0e',  # Orange  
-        '#2ca02c',  # Green
-        '#d62728',  # Red
-        '#9467bd',  # Purple
-        '#8c564b',  # Brown
-        '#e377c2',  # Pink
-        '#7f7f7f',  # Gray
-        '#bcbd22',  # Olive
-        '#17becf'   # Cyan
-    ]
+    colors = SIGNAL_COLORS
     
     # Track valid signals and missing signals
-    valid_signals = []
-    missing_signals = []
+    valid_signals = [name for name in signal_names if name in df.columns]
+    missing_signals = [name for name in signal_names if name not in df.columns]
     
-    # Add traces for each signal
-    for i, signal_name in enumerate(signal_names):
-        if signal_name not in df.columns:
-            missing_signals.append(signal_name)
-            continue
+    # Reduce the signals to the visible window at plot resolution
+    x_plot, values_plot, is_full_axis = reduce_for_display(
+        time_data, [df[name].to_numpy() for name in valid_signals], x_range, pixel_width
+    )
+    
+    use_dense = overlay_mode == 'dense' or (
+        overlay_mode == 'auto' and len(valid_signals) > DENSE_OVERLAY_THRESHOLD
+    )
+    
+    # Reference the shared full-resolution axis, or encode the reduced
+    # x-axis once for all traces
+    if axis_key is not None and is_full_axis:
+        x_data = None
+        trace_meta = {'axis': axis_key}
+    else:
+        x_data = encode_typed_array(x_plot, is_axis=True)
+        trace_meta = None
+    
+    if use_dense:
+        # Hundreds of overlays render as a handful of WebGL traces
+        fig.add_traces(_create_dense_overlay_traces(valid_signals, x_data, len(x_plot),
+                                                    values_plot, trace_meta))
+    else:
+        # Add traces for each signal
+        for signal_name, values in zip(valid_signals, values_plot):
+            # Encode signal data straight from the NumPy buffer
+            signal_data = encode_typed_array(values)
+            color = colors[signal_names.index(signal_name) % len(colors)]
             
-        # Extract signal data
-        signal_data = df[signal_name].tolist()
-        color = colors[i % len(colors)]
-        
-        # Add the signal trace
-        fig.add_trace(
-            go.Scattergl(
-                x=time_data,
-                y=signal_data,
-                mode='lines',
-                name=signal_name,
-                line={'width': 2, 'color': color},
-                hovertemplate=f'<b>{signal_name}</b><br>' +
-                             'Time: %{x:.3e}<br>' +
-                             'Value: %{y:.3e}<br>' +
-                             '<extra></extra>'
+            # Add the signal trace
+            fig.add_trace(
+                go.Scattergl(
+                    x=x_data,
+                    y=signal_data,
+                    meta=trace_meta,
+                    mode='lines',
+                    name=signal_name,
+                    line={'width': 2, 'color': color},
+                    hovertemplate=f'<b>{signal_name}</b><br>' +
+                                 'Time: %{x:.3e}<br>' +
+                                 'Value: %{y:.3e}<br>' +
+                                 '<extra></extra>'
+                )
             )
-        )
-        valid_signals.append(signal_name)
     
     # Handle case where no valid signals were found
     if not valid_signals:
@@ -312,6 +532,10 @@ def create_multi_signal_plot_figure(signal_names: List[str], time_data: List[flo
         }
     )
     
+    # Keep the requested window in view after re-decimation
+    if x_range is not None:
+        fig.update_xaxes(range=sorted(x_range))
+    
     # Add warning annotation for missing signals
     if missing_signals:
         missing_text = ', '.join(missing_signals)
@@ -330,6 +554,650 @@ def create_multi_signal_plot_figure(signal_names: List[str], time_data: List[flo
     return fig
 
 
+def create_density_plot_figure(signal_names: List[str], density: Dict[str, Any],
+                               metadata: Dict, x_range: Optional[List[float]] = None) -> go.Figure:
+    """
+    Create a density plot of many runs with percentile envelope lines.
+    
+    The run counts are drawn as one heatmap image; empty cells are left
+    blank. Envelope lines share the heatmap's column grid.
+    
+    Args:
+        signal_names: Signals whose runs were binned
+        density: Result of compute_density()
+        metadata: Metadata about the simulation
+        x_range: Visible [x0, x1] range, or None for the full range
+    
+    Returns:
+        Plotly figure with a heatmap trace and optional envelope traces.
+    """
+    fig = go.Figure()
+    
+    counts = density['counts'].astype(np.float64)
+    counts[counts == 0] = np.nan
+    
+    fig.add_trace(
+        go.Heatmap(
+            z=encode_typed_array(counts),
+            x0=density['x0'], dx=density['dx'],
+            y0=density['y0'], dy=density['dy'],
+            colorscale='Viridis',
+            colorbar={'title': 'Runs', 'thickness': 12},
+            hovertemplate='Time: %{x:.3e}<br>Value: %{y:.3e}<br>Runs: %{z}<extra></extra>'
+        )
+    )
+    
+    x_data = encode_typed_array(density['x'], is_axis=True)
+    for percentile, level in density['envelopes'].items():
+        fig.add_trace(
+            go.Scattergl(
+                x=x_data,
+                y=encode_typed_array(level),
+                mode='lines',
+                name=f'P{percentile:g}',
+                line={'width': 1, 'color': '#d62728' if percentile == 50 else '#ff7f0e'},
+                hovertemplate=f'<b>P{percentile:g}</b><br>' +
+                             'Time: %{x:.3e}<br>' +
+                             'Value: %{y:.3e}<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    if len(signal_names) == 1:
+        title_text = f"{signal_names[0]}: {density['runs']} runs"
+    else:
+        title_text = f"{len(signal_names)} signals: {density['runs']} runs"
+    
+    signal_types = {_get_signal_type_from_name(signal) for signal in signal_names}
+    y_label = _get_y_label_for_type(signal_types.pop()) if len(signal_types) == 1 else 'Amplitude (Mixed Units)'
+    
+    fig.update_layout(
+        title={
+            'text': title_text,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': metadata.get('independent_var', 'Time'),
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': y_label,
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 60, 'b': 60},
+        showlegend=False
+    )
+    
+    if x_range is not None:
+        fig.update_xaxes(range=sorted(x_range))
+    
+    return fig
+
+
+def create_envelope_plot_figure(signal_names: List[str], envelopes: Dict[str, Any],
+                                metadata: Dict, x_range: Optional[List[float]] = None) -> go.Figure:
+    """
+    Create a plot of the spread of signals across steps.
+    
+    Each signal is drawn as its mean line inside a ±σ band and a lighter
+    min/max band, all on the envelope's common grid.
+    
+    Args:
+        signal_names: Signals of the tile, in trace order
+        envelopes: Mapping of signal name to StepEnvelope
+        metadata: Metadata about the simulation
+        x_range: Visible [x0, x1] range, or None for the full range
+    
+    Returns:
+        Plotly figure with two band trace pairs and a mean trace per signal.
+    """
+    fig = go.Figure()
+    
+    names = [name for name in signal_names if name in envelopes]
+    x_label = metadata.get('independent_var', 'Time')
+    for i, signal_name in enumerate(names):
+        envelope = envelopes[signal_name]
+        color = SIGNAL_COLORS[i % len(SIGNAL_COLORS)]
+        x_data = encode_typed_array(envelope.grid, is_axis=True)
+        
+        # Each upper edge fills down to the trace before it (its lower edge)
+        bands = [
+            ('min', envelope.minimum, 'max', envelope.maximum, 0.12),
+            ('-σ', envelope.mean - envelope.std, '+σ', envelope.mean + envelope.std, 0.3)
+        ]
+        for lower_label, lower, upper_label, upper, opacity in bands:
+            for label, level, fill in ((lower_label, lower, 'none'), (upper_label, upper, 'tonexty')):
+                fig.add_trace(
+                    go.Scatter(
+                        x=x_data,
+                        y=encode_typed_array(level),
+                        mode='lines',
+                        name=f'{signal_name} {label}',
+                        legendgroup=signal_name,
+                        showlegend=False,
+                        fill=fill,
+                        fillcolor=_fill_color(color, opacity),
+                        line={'width': 0, 'color': color},
+                        hovertemplate=f'<b>{signal_name} {label}</b><br>' +
+                                     f'{x_label}: %{{x:.3e}}<br>' +
+                                     'Value: %{y:.3e}<br>' +
+                                     '<extra></extra>'
+                    )
+                )
+        fig.add_trace(
+            go.Scatter(
+                x=x_data,
+                y=encode_typed_array(envelope.mean),
+                mode='lines',
+                name=signal_name,
+                legendgroup=signal_name,
+                line={'width': 1.5, 'color': color},
+                hovertemplate=f'<b>{signal_name} mean</b><br>' +
+                             f'{x_label}: %{{x:.3e}}<br>' +
+                             'Value: %{y:.3e}<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    steps = max((envelopes[name].steps for name in names), default=0)
+    title_text = names[0] if len(names) == 1 else f"{len(names)} signals"
+    
+    signal_types = {_get_signal_type_from_name(signal) for signal in names}
+    y_label = _get_y_label_for_type(signal_types.pop()) if len(signal_types) == 1 else 'Amplitude (Mixed Units)'
+    
+    fig.update_layout(
+        title={
+            'text': f"{title_text}: envelope of {steps} steps",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': x_label,
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': y_label,
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 60, 'b': 60},
+        showlegend=len(names) > 1
+    )
+    
+    if x_range is not None:
+        fig.update_xaxes(range=sorted(x_range))
+    
+    return fig
+
+
+def create_spectrum_plot_figure(signal_names: List[str], spectrum: Dict[str, Any]) -> go.Figure:
+    """
+    Create an amplitude spectrum plot with tone metrics.
+    
+    Spectra are min/max decimated to plot resolution, so narrow tones and
+    spurs stay visible. SNR, THD and SFDR of the first signals are listed
+    in the top-right corner.
+    
+    Args:
+        signal_names: Signals of the tile, in trace order
+        spectrum: Result of compute_spectrum() or get_spectra()
+    
+    Returns:
+        Plotly figure with one Scattergl trace per signal.
+    """
+    fig = go.Figure()
+    
+    names = [name for name in signal_names if name in spectrum['magnitude']]
+    frequency, magnitudes, _ = reduce_for_display(spectrum['frequency'],
+                                                  [spectrum['magnitude'][name] for name in names])
+    x_data = encode_typed_array(frequency, is_axis=True)
+    
+    for i, (signal_name, magnitude) in enumerate(zip(names, magnitudes)):
+        fig.add_trace(
+            go.Scattergl(
+                x=x_data,
+                y=encode_typed_array(magnitude),
+                mode='lines',
+                name=signal_name,
+                line={'width': 1, 'color': SIGNAL_COLORS[i % len(SIGNAL_COLORS)]},
+                hovertemplate=f'<b>{signal_name}</b><br>' +
+                             'Frequency: %{x:.4e} Hz<br>' +
+                             'Magnitude: %{y:.2f} dB<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    metric_lines = []
+    for signal_name in names[:MAX_SPECTRUM_METRICS]:
+        metrics = spectrum['metrics'][signal_name]
+        if metrics['fundamental'] is None:
+            metric_lines.append(f"{signal_name}: no tone")
+            continue
+        metric_lines.append(
+            f"{signal_name}: f0 {metrics['fundamental']:.4g} Hz, "
+            f"SNR {_format_db(metrics['snr'])}, "
+            f"THD {_format_db(metrics['thd'])}c ({metrics['thd_percent']:.3g}%), "
+            f"SFDR {_format_db(metrics['sfdr'])}c"
+        )
+    if metric_lines:
+        fig.add_annotation(
+            text='<br>'.join(metric_lines),
+            x=1, y=1,
+            xref='paper', yref='paper',
+            xanchor='right', yanchor='top',
+            align='left',
+            showarrow=False,
+            font={'size': 10, 'family': 'monospace'},
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='#dee2e6',
+            borderwidth=1
+        )
+    
+    x0, x1 = spectrum['x_range']
+    title_text = names[0] if len(names) == 1 else f"{len(names)} signals"
+    # Decimated windows are low-pass filtered, so say where the band ends
+    band_text = f", ≤{spectrum['bandwidth']:.3g} Hz" if spectrum.get('decimation', 1) > 1 else ''
+    fig.update_layout(
+        title={
+            'text': f"Spectrum: {title_text} ({spectrum['window'].capitalize()}, "
+                    f"N={spectrum['n_points']}{band_text}, {x0:.3g}–{x1:.3g})",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': 'Frequency (Hz)',
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': 'Magnitude (dB)',
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 60, 'b': 60},
+        showlegend=len(names) > 1,
+        meta=_analysis_layout_meta('spectrum')
+    )
+    
+    return fig
+
+
+def create_spectrogram_plot_figure(signal_names: List[str], spectrogram: Dict[str, Any],
+                                   metadata: Dict, x_range: Optional[List[float]] = None) -> go.Figure:
+    """
+    Create a spectrogram plot: amplitude over time and frequency.
+    
+    The image shares the time axis with line and density tiles, so it
+    takes part in linked zoom and shows the measurement cursors.
+    
+    Args:
+        signal_names: Signals of the tile; the first one is analyzed
+        spectrogram: Result of compute_spectrogram() or get_spectrogram()
+        metadata: Metadata about the simulation
+        x_range: Visible [x0, x1] range, or None for the full range
+    
+    Returns:
+        Plotly figure with one heatmap trace.
+    """
+    fig = go.Figure()
+    
+    time = spectrogram['time']
+    frequency = spectrogram['frequency']
+    fig.add_trace(
+        go.Heatmap(
+            z=encode_typed_array(spectrogram['magnitude']),
+            x0=float(time[0]), dx=float(time[1] - time[0]) if len(time) > 1 else 1.0,
+            y0=float(frequency[0]), dy=float(frequency[1] - frequency[0]),
+            colorscale='Viridis',
+            colorbar={'title': 'dB', 'thickness': 12},
+            hovertemplate='Time: %{x:.3e}<br>Frequency: %{y:.4e} Hz<br>Magnitude: %{z:.1f} dB<extra></extra>'
+        )
+    )
+    
+    title_text = f"Spectrogram: {signal_names[0]} ({spectrogram['window'].capitalize()}, N={spectrogram['n_fft']})"
+    if len(signal_names) > 1:
+        title_text += f" – first of {len(signal_names)} signals"
+    
+    fig.update_layout(
+        title={
+            'text': title_text,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': metadata.get('independent_var', 'Time'),
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': 'Frequency (Hz)',
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 60, 'b': 60},
+        showlegend=False
+    )
+    
+    if x_range is not None:
+        fig.update_xaxes(range=sorted(x_range))
+    
+    return fig
+
+
+def create_xy_plot_figure(signal_names: List[str], time_data: np.ndarray, df: 'pd.DataFrame',
+                          x_range: Optional[List[float]] = None,
+                          pixel_width: Optional[int] = None) -> go.Figure:
+    """
+    Create an XY (parametric) plot: the other signals against the first.
+    
+    Each curve is reduced in 2-D with decimate_xy(), so V-vs-I curves,
+    Lissajous figures and hysteresis loops keep their shape within a
+    bounded number of points.
+    
+    Args:
+        signal_names: X signal followed by the Y signals
+        time_data: Time axis of the signals
+        df: DataFrame containing the signal data
+        x_range: [t0, t1] time window to plot, or None for the full record
+        pixel_width: Plot width in pixels of the reduction grid
+    
+    Returns:
+        Plotly figure with one Scattergl trace per Y signal.
+    
+    Raises:
+        ValueError: If fewer than two signals are given, the X signal is
+            missing or the signals are complex (AC analysis).
+    """
+    if len(signal_names) < 2:
+        raise ValueError("XY plot needs two signals: X first, then Y")
+    x_name = signal_names[0]
+    if x_name not in df.columns:
+        raise ValueError(f"Signal(s) not found in data: {x_name}")
+    
+    window = select_window(np.asarray(time_data), x_range)
+    x_values = df[x_name].to_numpy()[window]
+    y_names = [name for name in signal_names[1:] if name in df.columns]
+    if np.iscomplexobj(x_values) or any(np.iscomplexobj(df[name].to_numpy()) for name in y_names):
+        raise ValueError("XY plot needs real time-domain signals")
+    
+    fig = go.Figure()
+    for i, y_name in enumerate(y_names):
+        x_plot, y_plot, connected = decimate_xy(x_values, df[y_name].to_numpy()[window], pixel_width)
+        color = SIGNAL_COLORS[i % len(SIGNAL_COLORS)]
+        fig.add_trace(
+            go.Scattergl(
+                x=encode_typed_array(x_plot),
+                y=encode_typed_array(y_plot),
+                mode='lines' if connected else 'markers',
+                name=y_name,
+                line={'width': 1, 'color': color},
+                marker={'size': 2, 'color': color},
+                hovertemplate=f'<b>{y_name}</b><br>' +
+                             f'{x_name}: %{{x:.4g}}<br>' +
+                             f'{y_name}: %{{y:.4g}}<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    title_text = f"{y_names[0]} vs {x_name}" if len(y_names) == 1 else f"{len(y_names)} signals vs {x_name}"
+    if x_range is not None:
+        title_text += f" ({min(x_range):.3g}–{max(x_range):.3g})"
+    y_types = {_get_signal_type_from_name(name) for name in y_names}
+    
+    fig.update_layout(
+        title={
+            'text': title_text,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': _get_signal_y_label(x_name),
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': _get_y_label_for_type(y_types.pop()) if len(y_types) == 1 else 'Amplitude (Mixed Units)',
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 60, 'b': 60},
+        showlegend=len(y_names) > 1,
+        meta=_analysis_layout_meta('xy')
+    )
+    
+    return fig
+
+
+def create_histogram_plot_figure(signal_names: List[str], histograms: Dict[str, Any],
+                                 x_range: Optional[List[float]] = None) -> go.Figure:
+    """
+    Create a value histogram plot with cumulative distributions.
+    
+    Each signal is drawn as the fraction of time spent in each value bin
+    (left axis) and its CDF (dashed, right axis). Mean, sigma and
+    peak-to-peak of the first signals are listed in the top-left corner.
+    
+    Args:
+        signal_names: Signals of the tile, in trace order
+        histograms: Mapping of signal name to ValueHistogram
+        x_range: [t0, t1] time window the histograms cover, or None
+    
+    Returns:
+        Plotly figure with a histogram and a CDF trace per signal.
+    """
+    fig = go.Figure()
+    
+    names = [name for name in signal_names if name in histograms]
+    for i, signal_name in enumerate(names):
+        histogram = histograms[signal_name]
+        color = SIGNAL_COLORS[i % len(SIGNAL_COLORS)]
+        centers = encode_typed_array(histogram.centers, is_axis=True)
+        fig.add_trace(
+            go.Scatter(
+                x=centers,
+                y=encode_typed_array(histogram.fraction),
+                mode='lines',
+                name=signal_name,
+                legendgroup=signal_name,
+                line={'width': 1, 'color': color, 'shape': 'hvh'},
+                hovertemplate=f'<b>{signal_name}</b><br>' +
+                             'Value: %{x:.4g}<br>' +
+                             'Time fraction: %{y:.3g}<br>' +
+                             '<extra></extra>'
+            )
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=encode_typed_array(histogram.edges[1:], is_axis=True),
+                y=encode_typed_array(histogram.cdf),
+                mode='lines',
+                name=f'{signal_name} CDF',
+                legendgroup=signal_name,
+                showlegend=False,
+                yaxis='y2',
+                line={'width': 1, 'color': color, 'dash': 'dash'},
+                hovertemplate=f'<b>{signal_name}</b><br>' +
+                             'Value: %{x:.4g}<br>' +
+                             'CDF: %{y:.3f}<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    stat_lines = [
+        f"{name}: mean {histograms[name].mean:.4g}, σ {histograms[name].std:.3g}, "
+        f"p-p {histograms[name].maximum - histograms[name].minimum:.3g}"
+        for name in names[:MAX_HISTOGRAM_STATS]
+    ]
+    if stat_lines:
+        fig.add_annotation(
+            text='<br>'.join(stat_lines),
+            x=0, y=1,
+            xref='paper', yref='paper',
+            xanchor='left', yanchor='top',
+            align='left',
+            showarrow=False,
+            font={'size': 10, 'family': 'monospace'},
+            bgcolor='rgba(255,255,255,0.8)',
+            bordercolor='#dee2e6',
+            borderwidth=1
+        )
+    
+    title_text = names[0] if len(names) == 1 else f"{len(names)} signals"
+    if x_range is not None:
+        title_text += f" ({min(x_range):.3g}–{max(x_range):.3g})"
+    signal_types = {_get_signal_type_from_name(signal) for signal in names}
+    x_label = _get_y_label_for_type(signal_types.pop()) if len(signal_types) == 1 else 'Amplitude (Mixed Units)'
+    
+    fig.update_layout(
+        title={
+            'text': f"Histogram: {title_text}",
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 16, 'color': '#1976d2'}
+        },
+        xaxis={
+            'title': x_label,
+            'showgrid': True,
+            'gridcolor': '#e0e0e0'
+        },
+        yaxis={
+            'title': 'Time fraction',
+            'showgrid': True,
+            'gridcolor': '#e0e0e0',
+            'rangemode': 'tozero'
+        },
+        yaxis2={
+            'title': 'CDF',
+            'overlaying': 'y',
+            'side': 'right',
+            'range': [0, 1.02],
+            'showgrid': False
+        },
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 50, 't': 60, 'b': 60},
+        showlegend=len(names) > 1,
+        meta=_analysis_layout_meta('histogram')
+    )
+    
+    return fig
+
+
+def _analysis_layout_meta(kind: str) -> Dict[str, str]:
+    """
+    Layout meta marking a figure whose x-axis is not the time axis.
+    
+    The client (isAnalysisFigure in wavedash_clientside.js) draws no cursors
+    on such figures and leaves them out of linked zoom; they analyze the
+    linked time window instead.
+    
+    Args:
+        kind: Analysis shown, e.g. 'spectrum', 'xy' or 'histogram'
+    
+    Returns:
+        Value for the figure's layout.meta.
+    """
+    return {'analysis': kind}
+
+
+def _format_db(value: Optional[float]) -> str:
+    """Format a dB value for the metrics annotation."""
+    return "—" if value is None else f"{value:.1f} dB"
+
+
+def _fill_color(color: str, opacity: float) -> str:
+    """Translucent rgba() version of a '#rrggbb' palette color."""
+    red, green, blue = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgba({red},{green},{blue},{opacity})'
+
+
+def get_overlay_group(signal_name: str) -> str:
+    """
+    Get the overlay group of a signal: its name with every number replaced
+    by '#', so e.g. all stages of a bus (V(bus0) ... V(bus199)) share a group.
+    
+    Args:
+        signal_name: Name of the signal
+    
+    Returns:
+        Group name (e.g., "V(bus#)").
+    """
+    return re.sub(r'\d+', '#', signal_name)
+
+
+def _create_dense_overlay_traces(signal_names: List[str], x_data: Optional[Dict[str, str]],
+                                 x_length: int, values_list: List[np.ndarray],
+                                 trace_meta: Optional[Dict[str, Any]]) -> List[go.Scattergl]:
+    """
+    Pack overlaid signals into one NaN-separated Scattergl trace per group.
+    
+    Only the packed y values are sent; the x-axis is sent once (or
+    referenced from the axis-store) and the trace meta lists the group's
+    signals with ``'packed': x_length``. The client repeats the axis with
+    the same NaN separators and sets each point's customdata to its signal
+    name, indexed by point position, for hover.
+    
+    Args:
+        signal_names: Names of the signals, in overlay order
+        x_data: Encoded axis shared by all signals, or None when referenced
+            through trace_meta
+        x_length: Number of samples of the axis
+        values_list: Signal arrays on the axis
+        trace_meta: Shared axis reference ({'axis': key}) or None
+    
+    Returns:
+        One trace per overlay group.
+    """
+    groups: Dict[str, List[int]] = {}
+    for i, signal_name in enumerate(signal_names):
+        group = get_overlay_group(signal_name)
+        if group not in groups and len(groups) >= MAX_OVERLAY_GROUPS:
+            group = 'other'
+        groups.setdefault(group, []).append(i)
+    
+    traces = []
+    for group_number, (group, members) in enumerate(groups.items()):
+        values_packed = pack_nan_separated([values_list[i] for i in members])
+        meta = dict(trace_meta or {})
+        meta.update({'signals': [signal_names[i] for i in members], 'packed': x_length})
+        
+        traces.append(
+            go.Scattergl(
+                x=x_data,
+                y=encode_typed_array(values_packed),
+                meta=meta,
+                mode='lines',
+                name=f'{group} ({len(members)})',
+                line={'width': 1, 'color': SIGNAL_COLORS[group_number % len(SIGNAL_COLORS)]},
+                hovertemplate='<b>%{customdata}</b><br>' +
+                             'Time: %{x:.3e}<br>' +
+                             'Value: %{y:.3e}<br>' +
+                             '<extra></extra>'
+            )
+        )
+    
+    return traces
+
+
 def _get_signal_type_from_name(signal_name: str) -> str:
     """Get signal type from signal name."""
     signal_lower = signal_name.lower()
@@ -354,62 +1222,33 @@ def _get_y_label_for_type(signal_type: str) -> str:
     return type_labels.get(signal_type, 'Amplitude')
 
 
-def get_tile_wrapper_style(is_active: bool) -> Dict[str, Any]:
+def get_tile_wrapper_class(is_active: bool) -> str:
     """
-    Get styling for tile wrapper based on active state.
+    Get the CSS class name for a tile wrapper based on active state.
+    
+    The styling lives in assets/style.css; the clientside highlight callback
+    in assets/wavedash_clientside.js applies the same class names.
     
     Args:
         is_active: Whether this tile is currently active
     
     Returns:
-        Dictionary with wrapper styling.
-    """
-    base_style = {
-        'margin': '10px 0',
-        'borderRadius': '8px',
-        'padding': '10px',
-        'cursor': 'pointer',
-        'transition': 'all 0.2s ease'
-    }
-    
-    if is_active:
-        base_style.update({
-            'border': '3px solid #2196f3',
-            'backgroundColor': '#f3f8ff',
-            'boxShadow': '0 4px 8px rgba(33, 150, 243, 0.3)'
-        })
-    else:
-        base_style.update({
-            'border': '2px solid #dee2e6',
-            'backgroundColor': '#ffffff',
-            'boxShadow': '0 2px 4px rgba(0, 0, 0, 0.1)'
-        })
-    
-    return base_style
+        CSS class name string for the wrapper.
+    """
+    return 'plot-tile-wrapper active' if is_active else 'plot-tile-wrapper'
 
 
-def get_tile_header_style(is_active: bool) -> Dict[str, Any]:
+def get_tile_header_class(is_active: bool) -> str:
     """
-    Get styling for tile header based on active state.
+    Get the CSS class name for a tile header based on active state.
     
     Args:
         is_active: Whether this tile is currently active
     
     Returns:
-        Dictionary with header styling.
-    """
-    return {
-        'display': 'flex',
-        'justifyContent': 'space-between',
-        'alignItems': 'center',
-        'padding': '5px 10px',
-        'marginBottom': '5px',
-        'borderRadius': '4px',
-        'backgroundColor': '#2196f3' if is_active else '#f8f9fa',
-        'color': 'white' if is_active else '#495057',
-        'fontSize': '14px',
-        'fontWeight': 'bold' if is_active else 'normal'
-    }
+        CSS class name string for the header.
+    """
+    return 'tile-header active' if is_active else 'tile-header'
 
 
 def _get_signal_y_label(signal_name: str) -> str:
@@ -0,0 +1,207 @@
+"""
+Power and energy panel component for WaveDash application.
+
+This module provides the netlist upload, the sortable table of device
+energy and power over the cursor window and a plot of the instantaneous
+power or cumulative energy of selected devices.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+from dash import dcc, html
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.components.cursor_panel import format_cursor_value
+from src.utils.decimation import reduce_for_display
+from src.utils.power import POWER_COLUMNS, sort_power_rows
+
+# Rows shown in the table
+MAX_POWER_ROWS = 100
+
+# Devices plotted by default (largest energy first)
+DEFAULT_PLOTTED_DEVICES = 5
+
+# Plot views
+POWER_VIEWS = [
+    {'label': "Power", 'value': 'power'},
+    {'label': "Energy", 'value': 'energy'}
+]
+DEFAULT_POWER_VIEW = 'power'
+
+
+def create_power_panel_component() -> html.Div:
+    """
+    Create the power and energy panel.
+
+    Returns:
+        HTML div containing the netlist upload, compute button, sortable
+        device table and power plot.
+    """
+    power_panel = html.Div(
+        id='power-section',
+        children=[
+            html.Div(
+                children=[
+                    html.H3("Power & Energy", className='power-title'),
+                    dcc.Upload(
+                        id='netlist-upload',
+                        children=html.Div(['Netlist: ', html.A('Select .net/.cir file')]),
+                        multiple=False,
+                        accept='.net,.cir,.sp,.spice',
+                        className='netlist-upload'
+                    ),
+                    html.Button("Compute Power", id='power-button', className='power-button')
+                ],
+                className='power-header'
+            ),
+            html.Div(
+                id='netlist-status',
+                children="No netlist loaded: only subcircuit pins named after a node are paired",
+                className='netlist-status'
+            ),
+            html.Div(
+                children=[
+                    html.Label("Sort by", className='toolbar-label'),
+                    dcc.Dropdown(
+                        id='power-sort',
+                        options=[{'label': "Device", 'value': 'device'}] +
+                                [{'label': label, 'value': key} for key, label in POWER_COLUMNS],
+                        value='energy',
+                        clearable=False,
+                        searchable=False,
+                        className='power-sort-dropdown'
+                    ),
+                    dcc.Checklist(
+                        id='power-sort-order',
+                        options=[{'label': "Desc", 'value': 'desc'}],
+                        value=['desc'],
+                        className='power-sort-order'
+                    )
+                ],
+                className='power-controls'
+            ),
+            html.Div(
+                id='power-results',
+                children=create_power_table(None),
+                className='power-results'
+            ),
+            html.Div(
+                id='power-detail',
+                children=[
+                    dcc.Dropdown(
+                        id='power-devices',
+                        options=[],
+                        value=[],
+                        multi=True,
+                        placeholder="Devices to plot",
+                        className='power-devices-dropdown'
+                    ),
+                    dcc.RadioItems(
+                        id='power-view',
+                        options=POWER_VIEWS,
+                        value=DEFAULT_POWER_VIEW,
+                        inline=True,
+                        className='power-view'
+                    ),
+                    dcc.Graph(
+                        id='power-graph',
+                        figure=create_power_figure(None, [], None, DEFAULT_POWER_VIEW),
+                        config={'displaylogo': False},
+                        style={'height': '300px'}
+                    )
+                ],
+                className='power-detail',
+                style={'display': 'none'}
+            )
+        ],
+        className='power-section'
+    )
+
+    return power_panel
+
+
+def create_power_table(power_data: Optional[Dict[str, Any]], sort_key: str = 'energy',
+                       descending: bool = True) -> List:
+    """
+    Create the device power table.
+
+    Args:
+        power_data: Contents of power-store ({'rows', 'window'}), or None
+            before computing
+        sort_key: 'device' or a POWER_COLUMNS key
+        descending: Sort from largest to smallest
+
+    Returns:
+        List of components: a summary line and the table of the first
+        MAX_POWER_ROWS devices, or a placeholder message.
+    """
+    if power_data is None:
+        return [html.P("Load a netlist and press Compute Power", className='power-empty')]
+    rows = power_data.get('rows') or []
+    if not rows:
+        return [html.P("No device currents could be paired with node voltages", className='power-empty')]
+
+    t0, t1 = power_data['window']
+    summary = f"{len(rows)} devices, {format_cursor_value(t0)} to {format_cursor_value(t1)}"
+    if len(rows) > MAX_POWER_ROWS:
+        summary += f" (first {MAX_POWER_ROWS} shown)"
+
+    header = html.Tr([html.Th("Device")] + [html.Th(label) for _, label in POWER_COLUMNS])
+    body = [
+        html.Tr([html.Td(row['device'], className='power-device-name')] +
+                [html.Td(format_cursor_value(row[key])) for key, _ in POWER_COLUMNS])
+        for row in sort_power_rows(rows, sort_key, descending)[:MAX_POWER_ROWS]
+    ]
+    return [
+        html.P(summary, className='power-summary'),
+        html.Table([html.Thead(header), html.Tbody(body)], className='measurement-table power-table')
+    ]
+
+
+def create_power_figure(axis: Optional[np.ndarray], names: Sequence[str], values: Optional[np.ndarray],
+                        view: str, window: Optional[Sequence[float]] = None,
+                        x_label: str = "Time") -> go.Figure:
+    """
+    Plot the power or energy of devices.
+
+    Args:
+        axis: Axis array, or None
+        names: Device names, one per row of values
+        values: Array of shape (devices, len(axis)) of power or cumulative
+            energy, or None
+        view: 'power' or 'energy'
+        window: [t0, t1] accounting window to shade, or None
+        x_label: Axis title
+
+    Returns:
+        Plotly figure reduced to plot resolution.
+    """
+    fig = go.Figure()
+    unit = "Energy (J)" if view == 'energy' else "Power (W)"
+
+    if axis is not None and values is not None and len(names):
+        x_plot, rows_plot, _ = reduce_for_display(axis, list(values))
+        for name, y_plot in zip(names, rows_plot):
+            fig.add_trace(go.Scattergl(
+                x=x_plot,
+                y=y_plot,
+                mode='lines',
+                name=name,
+                hovertemplate=f'<b>{name}</b><br>' +
+                             f'{x_label}: %{{x:.4g}}<br>' +
+                             f'{unit}: %{{y:.4g}}<br>' +
+                             '<extra></extra>'
+            ))
+        if window is not None:
+            fig.add_vrect(x0=window[0], x1=window[1], fillcolor='#007bff', opacity=0.06, line_width=0)
+
+    fig.update_layout(
+        xaxis={'title': x_label, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        yaxis={'title': unit, 'showgrid': True, 'gridcolor': '#e0e0e0'},
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        margin={'l': 60, 'r': 20, 't': 20, 'b': 50},
+        showlegend=True,
+        meta={'analysis': 'power'}
+    )
+    return fig
@@ -7,6 +7,11 @@ This module provides components for displaying and selecting signals from parsed
 from dash import html, dcc
 from typing import List, Dict, Any, Optional
 
+from src.utils.signal_stats import SIGNAL_STATS, STAT_LABELS
+
+# Sort key of the "find similar" ranking
+SIMILARITY_SORT = 'similar'
+
 
 def create_signal_list_component() -> html.Div:
     """
@@ -20,6 +25,37 @@ def create_signal_list_component() -> html.Div:
         children=[
             html.H4("Signal Selection", className='signal-selection-title'),
             
+            # Filter and sort by name or summary statistics (e.g. "pp > 100m")
+            html.Div(
+                id='signal-list-controls',
+                children=[
+                    dcc.Input(
+                        id='signal-filter',
+                        type='text',
+                        placeholder="Filter, e.g. out, pp > 100m",
+                        debounce=True,
+                        className='signal-filter-input'
+                    ),
+                    dcc.Dropdown(
+                        id='signal-sort',
+                        options=[{'label': "Name", 'value': 'name'}] +
+                                [{'label': STAT_LABELS[stat], 'value': stat} for stat in SIGNAL_STATS] +
+                                [{'label': "Similarity", 'value': SIMILARITY_SORT}],
+                        value='name',
+                        clearable=False,
+                        searchable=False,
+                        className='signal-sort-dropdown'
+                    ),
+                    dcc.Checklist(
+                        id='signal-sort-order',
+                        options=[{'label': "Desc", 'value': 'desc'}],
+                        value=[],
+                        className='signal-sort-order'
+                    )
+                ],
+                className='signal-list-controls'
+            ),
+            
             # Signal list display area
             html.Div(
                 id='signal-list-display',
@@ -44,6 +80,23 @@ def create_signal_list_component() -> html.Div:
                 }
             ),
             
+            # Derived signal definition (e.g. V(out)-V(in), d/dt(V(out)))
+            html.Div(
+                id='derived-signal-section',
+                children=[
+                    dcc.Input(
+                        id='expression-input',
+                        type='text',
+                        placeholder="Derived signal, e.g. V(out)-V(in)",
+                        debounce=False,
+                        className='expression-input'
+                    ),
+                    html.Button("Add", id='add-expression-button', className='add-expression-button'),
+                    html.Div(id='expression-error', className='expression-error')
+                ],
+                className='derived-signal-section'
+            ),
+            
             # Selected signal display
             html.Div(
                 id='selected-signal-display',
@@ -67,17 +120,7 @@ def create_signal_list_component() -> html.Div:
                 "Plot to Active Tile",
                 id='plot-button',
                 disabled=True,
-                style={
-                    'width': '100%',
-                    'padding': '10px',
-                    'margin': '10px 0',
-                    'backgroundColor': '#007bff',
-                    'color': 'white',
-                    'border': 'none',
-                    'borderRadius': '4px',
-                    'fontSize': '16px',
-                    'cursor': 'not-allowed'
-                }
+                className='plot-action-button'
             ),
             
             # Clear tile button
@@ -85,17 +128,15 @@ def create_signal_list_component() -> html.Div:
                 "Clear Active Tile",
                 id='clear-tile-button',
                 disabled=True,
-                style={
-                    'width': '100%',
-                    'padding': '8px',
-                    'margin': '5px 0',
-                    'backgroundColor': '#dc3545',
-                    'color': 'white',
-                    'border': 'none',
-                    'borderRadius': '4px',
-                    'fontSize': '14px',
-                    'cursor': 'not-allowed'
-                }
+                className='clear-tile-button'
+            ),
+            
+            # Rank the signal list by shape similarity to the selected signal
+            html.Button(
+                "Find Similar Signals",
+                id='find-similar-button',
+                disabled=True,
+                className='find-similar-button'
             )
         ],
         className='signal-selection-section'
@@ -104,7 +145,9 @@ def create_signal_list_component() -> html.Div:
     return signal_list_component
 
 
-def create_signal_item(signal_name: str, signal_type: str = 'unknown', is_selected: bool = False) -> html.Div:
+def create_signal_item(signal_name: str, signal_type: str = 'unknown', is_selected: bool = False,
+                       stats: Optional[Dict[str, Any]] = None,
+                       similarity: Optional[float] = None) -> html.Div:
     """
     Create a clickable signal item for the signal list.
     
@@ -112,6 +155,8 @@ def create_signal_item(signal_name: str, signal_type: str = 'unknown', is_select
         signal_name: Name of the signal
         signal_type: Type of signal (voltage, current, power, unknown)
         is_selected: Whether this signal is currently selected
+        stats: Summary statistics from compute_signal_stats(), shown under the name
+        similarity: Shape correlation with the "find similar" reference, if ranked
     
     Returns:
         HTML div representing a clickable signal item.
@@ -156,7 +201,17 @@ def create_signal_item(signal_name: str, signal_type: str = 'unknown', is_select
     signal_item = html.Div(
         id={'type': 'signal-item', 'index': signal_name},
         children=[
-            html.Span(signal_name, style={'flex': '1', 'textAlign': 'left'}),
+            html.Div(
+                children=[html.Span(signal_name)] + (
+                    [html.Span(format_signal_stats(stats), className='signal-stats',
+                               title=format_signal_stats(stats, detailed=True))] if stats else []
+                ) + (
+                    [html.Span(f"similarity {similarity:.2f}", className='signal-similarity')]
+                    if similarity is not None else []
+                ),
+                style={'flex': '1', 'textAlign': 'left', 'display': 'flex', 'flexDirection': 'column',
+                       'minWidth': '0'}
+            ),
             html.Span(
                 signal_type.upper(),
                 style={
@@ -175,13 +230,17 @@ def create_signal_item(signal_name: str, signal_type: str = 'unknown', is_select
     return signal_item
 
 
-def create_signal_list_from_data(signals: List[str], selected_signal: Optional[str] = None) -> List[html.Div]:
+def create_signal_list_from_data(signals: List[str], selected_signal: Optional[str] = None,
+                                 signal_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+                                 similarities: Optional[Dict[str, float]] = None) -> List[html.Div]:
     """
     Create a list of signal items from signal data.
     
     Args:
         signals: List of signal names
         selected_signal: Currently selected signal name
+        signal_stats: Summary statistics per signal name
+        similarities: Shape correlation per signal name with the "find similar" reference
     
     Returns:
         List of signal item components.
@@ -205,12 +264,38 @@ def create_signal_list_from_data(signals: List[str], selected_signal: Optional[s
         signal_type = _classify_signal_type(signal)
         is_selected = signal == selected_signal
         
-        signal_item = create_signal_item(signal, signal_type, is_selected)
+        signal_item = create_signal_item(signal, signal_type, is_selected,
+                                         (signal_stats or {}).get(signal),
+                                         (similarities or {}).get(signal))
         signal_items.append(signal_item)
     
     return signal_items
 
 
+def format_signal_stats(stats: Dict[str, Any], detailed: bool = False) -> str:
+    """
+    Format a signal's summary statistics for the signal list.
+    
+    Args:
+        stats: Summary statistics from compute_signal_stats()
+        detailed: Include every statistic (for the tooltip)
+    
+    Returns:
+        One-line summary, e.g. "p-p 1.2 · rms 0.85 · 10 toggles"; flat
+        signals are marked as stuck.
+    """
+    def number(key: str) -> str:
+        value = stats.get(key)
+        return "—" if value is None else f"{value:.3g}"
+    
+    if detailed:
+        return " · ".join(f"{STAT_LABELS[key]} {number(key)}" for key in SIGNAL_STATS if key != 'toggles') + \
+            f" · {stats.get('toggles', 0)} toggles"
+    if stats.get('pp') == 0:
+        return f"stuck at {number('min')}"
+    return f"p-p {number('pp')} · rms {number('rms')} · {stats.get('toggles', 0)} toggles"
+
+
 def _classify_signal_type(signal_name: str) -> str:
     """
     Classify signal type based on naming conventions.
@@ -231,79 +316,3 @@ def _classify_signal_type(signal_name: str) -> str:
         return 'power'
     else:
         return 'unknown'
-
-
-def get_plot_button_style(enabled: bool) -> Dict[str, Any]:
-    """
-    Get styling for the plot button based on enabled state.
-    
-    Args:
-        enabled: Whether the button should be enabled
-    
-    Returns:
-        Dictionary with button styling.
-    """
-    if enabled:
-        return {
-            'width': '100%',
-            'padding': '10px',
-            'margin': '10px 0',
-            'backgroundColor': '#28a745',
-            'color': 'white',
-            'border': 'none',
-            'borderRadius': '4px',
-            'fontSize': '16px',
-            'cursor': 'pointer',
-            'transition': 'background-color 0.2s'
-        }
-    else:
-        return {
-            'width': '100%',
-            'padding': '10px',
-            'margin': '10px 0',
-            'backgroundColor': '#6c757d',
-            'color': 'white',
-            'border': 'none',
-            'borderRadius': '4px',
-            'fontSize': '16px',
-            'cursor': 'not-allowed',
-            'opacity': '0.6'
-        }
-
-
-def get_clear_button_style(enabled: bool) -> Dict[str, Any]:
-    """
-    Get styling for the clear button based on enabled state.
-    
-    Args:
-        enabled: Whether the button should be enabled
-    
-    Returns:
-        Dictionary with button styling.
-    """
-    if enabled:
-        return {
-            'width': '100%',
-            'padding': '8px',
-            'margin': '5px 0',
-            'backgroundColor': '#dc3545',
-            'color': 'white',
-            'border': 'none',
-            'borderRadius': '4px',
-            'fontSize': '14px',
-            'cursor': 'pointer',
-            'transition': 'background-color 0.2s'
-        }
-    else:
-        return {
-            'width': '100%',
-            'padding': '8px',
-            'margin': '5px 0',
-            'backgroundColor': '#6c757d',
-            'color': 'white',
-            'border': 'none',
-            'borderRadius': '4px',
-            'fontSize': '14px',
-            'cursor': 'not-allowed',
-            'opacity': '0.6'
-        } 
\ No newline at end of file
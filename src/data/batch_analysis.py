@@ -0,0 +1,242 @@
+"""
+Parallel per-step analysis for WaveDash application.
+
+Parameter sweeps can have hundreds of steps that each need the same
+measurement. The steps are split into batches that run in a process pool;
+workers receive only the step cache directory and step numbers, open the
+memory-mapped step files themselves (see step_cache) and send back a
+compact float array, so no waveform is pickled in either direction.
+"""
+
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.data.datasets import Dataset
+from src.data.step_cache import cached_steps, ensure_step_cache, open_step, read_manifest
+from src.utils.measurements import DEFAULT_SETTLING_TOLERANCE, MEASUREMENTS, measure_dataset
+
+# Stepped datasets with at least this many steps are analyzed in the pool;
+# below it, worker start-up costs more than it saves
+PARALLEL_MIN_STEPS = 8
+
+# Batches queued per worker (more batches balance uneven steps better,
+# fewer cost less scheduling)
+BATCHES_PER_WORKER = 4
+
+# Thread counts read by OpenMP, BLAS (OpenBLAS, MKL) and numexpr when they
+# load; the pool already runs one worker per core, so each gets one thread
+WORKER_THREAD_VARIABLES = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def analyze_steps(cache_dir: str, steps: Sequence[int], signal_names: Sequence[str],
+                  tolerance: float = DEFAULT_SETTLING_TOLERANCE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Measure signals over a batch of cached steps (runs in a worker process).
+
+    Args:
+        cache_dir: Step cache directory from ensure_step_cache()
+        steps: Steps of the batch
+        signal_names: Signals or derived-signal expressions to measure
+        tolerance: Settling band relative to the step size
+
+    Returns:
+        Tuple of (step per row, signal index per row, values) where values
+        has one column per quantity of MEASUREMENTS and NaN where a quantity
+        does not apply.
+    """
+    manifest = read_manifest(Path(cache_dir))
+    axes, waves = {}, {}
+    for step in steps:
+        axes[step], waves[step] = open_step(cache_dir, step, manifest)
+    dataset = Dataset(manifest['dataset_id'], '', axes, waves)
+
+    names = list(signal_names)
+    rows = measure_dataset(dataset, names, steps, tolerance)
+
+    step_column = np.array([row['step'] for row in rows], dtype=np.int64)
+    signal_column = np.array([names.index(row['signal']) for row in rows], dtype=np.int32)
+    values = np.array([[np.nan if row[key] is None else row[key] for key in MEASUREMENTS]
+                       for row in rows], dtype=np.float64).reshape(len(rows), len(MEASUREMENTS))
+    return step_column, signal_column, values
+
+
+def run_step_analysis(cache_dir: Path, signal_names: Sequence[str],
+                      steps: Optional[Sequence[int]] = None,
+                      tolerance: float = DEFAULT_SETTLING_TOLERANCE,
+                      max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Measure signals over every step of a step cache, in parallel.
+
+    Args:
+        cache_dir: Step cache directory from ensure_step_cache()
+        signal_names: Signals or derived-signal expressions to measure
+        steps: Steps to measure (defaults to all cached steps)
+        tolerance: Settling band relative to the step size
+        max_workers: Worker processes (defaults to the CPU count); 1 runs
+            in the calling process
+
+    Returns:
+        DataFrame with 'step', 'signal' and one column per quantity of
+        MEASUREMENTS, in step, then signal order.
+    """
+    steps = cached_steps(cache_dir) if steps is None else list(steps)
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(steps)))
+    batch_size = max(1, math.ceil(len(steps) / (workers * BATCHES_PER_WORKER)))
+    batches = [steps[start:start + batch_size] for start in range(0, len(steps), batch_size)]
+    names = list(signal_names)
+
+    if workers == 1 or len(batches) == 1:
+        results = [analyze_steps(str(cache_dir), batch, names, tolerance) for batch in batches]
+    else:
+        try:
+            pool = get_analysis_pool(workers)
+            futures = [pool.submit(analyze_steps, str(cache_dir), batch, names, tolerance)
+                       for batch in batches]
+            results = [future.result() for future in futures]
+        except BrokenProcessPool:
+            print("Warning: analysis worker pool failed; measuring in the server process.")
+            shutdown_analysis_pool()
+            results = [analyze_steps(str(cache_dir), batch, names, tolerance) for batch in batches]
+
+    step_column = np.concatenate([result[0] for result in results]) if results else np.empty(0, np.int64)
+    signal_column = np.concatenate([result[1] for result in results]) if results else np.empty(0, np.int32)
+    values = (np.vstack([result[2] for result in results]) if results
+              else np.empty((0, len(MEASUREMENTS))))
+
+    table = pd.DataFrame(values, columns=list(MEASUREMENTS))
+    table.insert(0, 'signal', pd.Categorical.from_codes(signal_column, categories=names)
+                 if names else pd.Categorical([]))
+    table.insert(0, 'step', step_column)
+    return table
+
+
+def analyze_dataset(dataset: Dataset, signal_names: Sequence[str],
+                    tolerance: float = DEFAULT_SETTLING_TOLERANCE,
+                    max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Measure signals over every step of a dataset, in the process pool for
+    large sweeps and in the calling process otherwise.
+
+    Args:
+        dataset: Dataset holding the signals
+        signal_names: Signals or derived-signal expressions to measure
+        tolerance: Settling band relative to the step size
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        List of rows {'signal', 'step', <quantity>: value}, as from
+        measure_dataset().
+    """
+    if len(dataset.steps) < PARALLEL_MIN_STEPS or not dataset.dataset_id:
+        return measure_dataset(dataset, signal_names, tolerance=tolerance)
+
+    cache_dir = ensure_step_cache(dataset)
+    return table_to_rows(run_step_analysis(cache_dir, signal_names, dataset.steps, tolerance, max_workers))
+
+
+def table_to_rows(table: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert an analysis table to JSON-friendly rows.
+
+    Args:
+        table: Result of run_step_analysis()
+
+    Returns:
+        List of rows {'signal', 'step', <quantity>: value} with None for NaN.
+    """
+    rows = []
+    for step, signal, *values in table.itertuples(index=False, name=None):
+        row = {'signal': str(signal), 'step': int(step)}
+        row.update((key, None if np.isnan(value) else float(value)) for key, value in zip(MEASUREMENTS, values))
+        rows.append(row)
+    return rows
+
+
+def get_step_sweep(dataset: Dataset) -> Tuple[str, List[float]]:
+    """
+    Get the swept value of every step, for plotting results against it.
+
+    Uses the first .STEP parameter that changes between steps; falls back
+    to the step numbers when the parameters are unknown.
+
+    Args:
+        dataset: Dataset with optional metadata['step_parameters']
+
+    Returns:
+        Tuple of (axis label, value per step in dataset.steps order).
+    """
+    parameters = dataset.metadata.get('step_parameters') or []
+    if len(parameters) == len(dataset.steps):
+        for name in parameters[0]:
+            values = [step_parameters.get(name) for step_parameters in parameters]
+            if None not in values and len(set(values)) > 1:
+                return name, values
+    return 'Step', [float(step) for step in dataset.steps]
+
+
+def get_analysis_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Get the process-wide analysis pool, starting it on first use.
+
+    Workers are spawned rather than forked: the server process runs threads,
+    which fork does not copy safely. The pool persists, so later analyses
+    skip worker start-up.
+
+    Args:
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        Shared ProcessPoolExecutor with max_workers workers.
+    """
+    global _pool, _pool_workers
+    workers = max_workers or os.cpu_count() or 1
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _limit_worker_threads()
+            _pool = ProcessPoolExecutor(max_workers=workers,
+                                        mp_context=multiprocessing.get_context('spawn'))
+            _pool_workers = workers
+        return _pool
+
+
+def _limit_worker_threads() -> None:
+    """
+    Limit the analysis workers to one OpenMP, BLAS and numexpr thread each.
+
+    These libraries size their thread pools from the environment once, when
+    a spawned worker imports them, before any pool initializer could run.
+    The variables are therefore set in the server's environment, which
+    workers inherit; the server's own libraries are already loaded and keep
+    their pools. Values the user has set are left alone.
+    """
+    for name in WORKER_THREAD_VARIABLES:
+        os.environ.setdefault(name, '1')
+
+
+def shutdown_analysis_pool() -> None:
+    """Stop the analysis pool's workers (a new pool starts on next use)."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_analysis_pool)
@@ -0,0 +1,499 @@
+"""
+Server-side dataset registry for WaveDash application.
+
+Parsed SPICE data is kept on the server as NumPy arrays keyed by dataset ID,
+so callbacks can slice signals directly instead of rebuilding a DataFrame
+from the JSON records in parsed-data-store. The registry is bounded; when a
+dataset is evicted or replaced by an updated upload of the same file, the
+registered eviction listeners (e.g. the figure cache) are notified.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.edges import EdgeIndex
+from src.utils.envelope import ENVELOPE_POINTS, StepEnvelope, accumulate_envelope, envelope_grid
+from src.utils.histogram import DEFAULT_HISTOGRAM_BINS, ValueHistogram, compute_histogram
+from src.utils.lru import ByteBoundedLRU
+from src.utils.signal_sketch import SignalSketches, sketch_block
+from src.utils.expressions import (ExpressionCache, ExpressionError, Node, evaluate_expression,
+                                   expression_signals, parse_expression)
+
+# Maximum number of datasets kept in memory at once
+MAX_DATASETS = 4
+
+# Golden (reference) runs kept for regression compare
+MAX_GOLDEN_DATASETS = 1
+
+# Memory bound of each dataset's edge indexes
+MAX_EDGE_BYTES = 64 * 1024 * 1024
+
+# Memory bound of each dataset's value histograms
+MAX_HISTOGRAM_BYTES = 8 * 1024 * 1024
+
+# Memory bound of each dataset's cross-step envelopes
+MAX_ENVELOPE_BYTES = 8 * 1024 * 1024
+
+
+class Dataset:
+    """
+    NumPy-backed copy of a parsed SPICE file.
+
+    Each simulation step has its own independent axis and one array per
+    signal, mirroring spicelib's ``get_axis(step)`` / ``get_wave(step)``.
+
+    Names that are not native signals are treated as derived-signal
+    expressions (e.g. ``V(a)-V(b)``): they are evaluated lazily on first use
+    and memoized per dataset. Edge indexes, value histograms and cross-step
+    envelopes are built and cached the same way.
+    """
+
+    def __init__(self, dataset_id: str, filename: str,
+                 axes: Dict[int, np.ndarray],
+                 waves: Dict[int, Dict[str, np.ndarray]],
+                 metadata: Optional[Dict] = None,
+                 sketches: Optional[SignalSketches] = None):
+        """
+        Args:
+            dataset_id: Unique ID of the dataset (content hash)
+            filename: Original filename of the uploaded file
+            axes: Mapping of step number to independent axis array
+            waves: Mapping of step number to {signal name: array}
+            metadata: Additional metadata about the simulation
+            sketches: Shape sketches of the first step's signals, if
+                computed at ingest (otherwise built on first use)
+        """
+        self.dataset_id = dataset_id
+        self.filename = filename
+        self.metadata = metadata or {}
+        self._axes = axes
+        self._waves = waves
+        self._derived_cache = ExpressionCache()
+        # Keyed by (step, signal, threshold, hysteresis)
+        self._edge_cache: ByteBoundedLRU[EdgeIndex] = ByteBoundedLRU(MAX_EDGE_BYTES)
+        # Keyed by (step, signal, time window, bins)
+        self._histogram_cache: ByteBoundedLRU[ValueHistogram] = ByteBoundedLRU(MAX_HISTOGRAM_BYTES)
+        # Keyed by (signal, time window, grid points)
+        self._envelope_cache: ByteBoundedLRU[StepEnvelope] = ByteBoundedLRU(MAX_ENVELOPE_BYTES)
+        self._sketches = sketches
+
+    @classmethod
+    def from_frame(cls, dataset_id: str, filename: str, frame: pd.DataFrame,
+                   metadata: Optional[Dict] = None) -> 'Dataset':
+        """
+        Create a single-step dataset from a DataFrame indexed by the axis.
+
+        Args:
+            dataset_id: Unique ID of the dataset
+            filename: Original filename of the uploaded file
+            frame: DataFrame with signals as columns and the axis as index
+            metadata: Additional metadata (uses 'processed_step' as the step)
+
+        Returns:
+            Dataset holding the frame's columns as arrays.
+        """
+        metadata = metadata or {}
+        step = metadata.get('processed_step') or 0
+        axis = np.asarray(frame.index, dtype=np.float64)
+        waves = {str(name): frame[name].to_numpy() for name in frame.columns}
+        return cls(dataset_id, filename, {step: axis}, {step: waves}, metadata)
+
+    @property
+    def steps(self) -> List[int]:
+        """Step numbers available in the dataset."""
+        return list(self._axes.keys())
+
+    @property
+    def signal_names(self) -> List[str]:
+        """Signal names of the first step."""
+        return list(self._waves[self.steps[0]].keys()) if self._axes else []
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the dataset's arrays."""
+        total = sum(axis.nbytes for axis in self._axes.values())
+        for waves in self._waves.values():
+            total += sum(wave.nbytes for wave in waves.values())
+        return total
+
+    def default_step(self) -> int:
+        """Step shown when no step is requested."""
+        return self.steps[0]
+
+    def get_axis(self, step: Optional[int] = None) -> np.ndarray:
+        """
+        Get the independent axis of a step.
+
+        Args:
+            step: Step number (defaults to the first step)
+
+        Returns:
+            Axis array.
+        """
+        return self._axes[self.default_step() if step is None else step]
+
+    def get_wave(self, signal_name: str, step: Optional[int] = None) -> np.ndarray:
+        """
+        Get the data of one signal or derived-signal expression for a step.
+
+        Args:
+            signal_name: Name of the signal, or an expression over signals
+            step: Step number (defaults to the first step)
+
+        Returns:
+            Signal array.
+
+        Raises:
+            KeyError: If the signal or step does not exist.
+        """
+        step = self.default_step() if step is None else step
+        waves = self._waves[step]
+        if signal_name in waves:
+            return waves[signal_name]
+
+        node = self._derived_node(signal_name)
+        if node is None:
+            raise KeyError(signal_name)
+        return evaluate_expression(node, self._axes[step], lambda name: self._native_wave(name, step),
+                                   self._derived_cache, step)
+
+    def get_runs(self, signal_name: str) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get a signal's (axis, wave) pair for every step that has it.
+
+        Args:
+            signal_name: Name of the signal or derived-signal expression
+
+        Returns:
+            List of (axis, wave) tuples in step order.
+        """
+        return [(self._axes[step], self.get_wave(signal_name, step))
+                for step in self.steps if self.has_signal(signal_name, step)]
+
+    def get_edges(self, signal_name: str, threshold: float, hysteresis: float = 0.0,
+                  step: Optional[int] = None) -> EdgeIndex:
+        """
+        Get the edge index of a signal, building it on first use.
+
+        Args:
+            signal_name: Name of the signal or derived-signal expression
+            threshold: Threshold level
+            hysteresis: Width of the hysteresis band around the threshold
+            step: Step number (defaults to the first step)
+
+        Returns:
+            EdgeIndex of the signal's crossings.
+
+        Raises:
+            KeyError: If the signal or step does not exist.
+        """
+        step = self.default_step() if step is None else step
+        key = (step, signal_name, float(threshold), float(hysteresis))
+        edges = self._edge_cache.get(key)
+        if edges is None:
+            edges = EdgeIndex.build(self._axes[step], self.get_wave(signal_name, step), threshold, hysteresis)
+            self._edge_cache.put(key, edges)
+        return edges
+
+    def get_histogram(self, signal_name: str, x_range: Optional[Tuple[float, float]] = None,
+                      bins: int = DEFAULT_HISTOGRAM_BINS, step: Optional[int] = None) -> ValueHistogram:
+        """
+        Get the time-weighted value histogram of a signal, computing it on first use.
+
+        Args:
+            signal_name: Name of the signal or derived-signal expression
+            x_range: [t0, t1] time window, or None for the whole step
+            bins: Number of value bins
+            step: Step number (defaults to the first step)
+
+        Returns:
+            ValueHistogram of the window.
+
+        Raises:
+            KeyError: If the signal or step does not exist.
+            ValueError: If the window holds no samples or the signal is complex.
+        """
+        step = self.default_step() if step is None else step
+        window = None if x_range is None else tuple(sorted(float(value) for value in x_range))
+        key = (step, signal_name, window, int(bins))
+        histogram = self._histogram_cache.get(key)
+        if histogram is None:
+            histogram = compute_histogram(self._axes[step], self.get_wave(signal_name, step), window, bins)
+            self._histogram_cache.put(key, histogram)
+        return histogram
+
+    def get_envelope(self, signal_name: str, x_range: Optional[Tuple[float, float]] = None,
+                     n_points: int = ENVELOPE_POINTS) -> StepEnvelope:
+        """
+        Get the mean, sigma and min/max of a signal across all steps, computing it on first use.
+
+        Steps are streamed one at a time, so only the grid-sized
+        accumulators are held regardless of the number of steps.
+
+        Args:
+            signal_name: Name of the signal or derived-signal expression
+            x_range: [t0, t1] time window, or None to span every step
+            n_points: Number of grid points
+
+        Returns:
+            StepEnvelope of the steps that have the signal.
+
+        Raises:
+            KeyError: If no step has the signal.
+            ValueError: If the signal is complex.
+        """
+        window = None if x_range is None else tuple(sorted(float(value) for value in x_range))
+        key = (signal_name, window, int(n_points))
+        envelope = self._envelope_cache.get(key)
+        if envelope is None:
+            steps = [step for step in self.steps if self.has_signal(signal_name, step)]
+            if not steps:
+                raise KeyError(signal_name)
+            extents = [(float(self._axes[step][0]), float(self._axes[step][-1])) for step in steps]
+            grid = envelope_grid(extents, window, n_points)
+            envelope = accumulate_envelope(grid, ((self._axes[step], self.get_wave(signal_name, step))
+                                                  for step in steps))
+            self._envelope_cache.put(key, envelope)
+        return envelope
+
+    def get_sketches(self) -> SignalSketches:
+        """Shape sketches of the first step's native signals, built on first use."""
+        if self._sketches is None:
+            step = self.default_step()
+            self._sketches = SignalSketches.build(self._axes[step], self._waves[step])
+        return self._sketches
+
+    def find_similar(self, signal_name: str, top: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank the native signals by shape correlation with one signal.
+
+        Args:
+            signal_name: Reference signal or derived-signal expression
+            top: Number of signals to return (defaults to all)
+
+        Returns:
+            List of (signal name, correlation in [-1, 1]), most similar
+            first, without the reference itself.
+
+        Raises:
+            KeyError: If the signal does not exist.
+        """
+        sketches = self.get_sketches()
+        if signal_name in sketches:
+            reference = sketches.sketch(signal_name)
+        else:
+            values = np.real(self.get_wave(signal_name)).astype(np.float64)
+            reference = sketch_block(self.get_axis(), values[np.newaxis], sketches.matrix.shape[1])[0]
+        return sketches.rank(reference, top, exclude=signal_name)
+
+    def has_signal(self, signal_name: str, step: Optional[int] = None) -> bool:
+        """Check whether a signal (or every signal of an expression) exists in a step."""
+        waves = self._waves[self.default_step() if step is None else step]
+        if signal_name in waves:
+            return True
+        node = self._derived_node(signal_name)
+        return node is not None and all(self._find_native(name, waves) is not None
+                                        for name in expression_signals(node))
+
+    def is_derived(self, signal_name: str) -> bool:
+        """Check whether a name is a derived-signal expression rather than a native signal."""
+        return not any(signal_name in waves for waves in self._waves.values())
+
+    @property
+    def derived_nbytes(self) -> int:
+        """Memory used by memoized derived-signal results."""
+        return self._derived_cache.nbytes
+
+    def _derived_node(self, signal_name: str) -> Optional[Node]:
+        """Parsed expression of a derived-signal name, or None if it does not parse."""
+        try:
+            return parse_expression(signal_name)
+        except ExpressionError:
+            return None
+
+    def _native_wave(self, signal_name: str, step: int) -> np.ndarray:
+        """Native signal referenced by an expression (raises KeyError if missing)."""
+        name = self._find_native(signal_name, self._waves[step])
+        if name is None:
+            raise KeyError(signal_name)
+        return self._waves[step][name]
+
+    @staticmethod
+    def _find_native(signal_name: str, waves: Dict[str, np.ndarray]) -> Optional[str]:
+        """Native name matching a reference, case-insensitively (SPICE names are)."""
+        if signal_name in waves:
+            return signal_name
+        lowered = signal_name.lower()
+        return next((name for name in waves if name.lower() == lowered), None)
+
+    def to_frame(self, signal_names: List[str], step: Optional[int] = None) -> pd.DataFrame:
+        """
+        Build a DataFrame view of selected signals without copying them.
+
+        Args:
+            signal_names: Signals to include (missing ones are skipped)
+            step: Step number (defaults to the first step)
+
+        Returns:
+            DataFrame with the selected signals as columns and the axis as index.
+        """
+        step = self.default_step() if step is None else step
+        columns = {name: self.get_wave(name, step) for name in signal_names if self.has_signal(name, step)}
+        return pd.DataFrame(columns, index=self._axes[step], copy=False)
+
+
+class DatasetRegistry:
+    """
+    Bounded LRU registry of datasets keyed by dataset ID.
+
+    Uploading a new version of an already loaded file replaces (evicts) the
+    old version. Eviction listeners are called with the evicted dataset ID.
+    """
+
+    def __init__(self, max_datasets: int = MAX_DATASETS):
+        self.max_datasets = max_datasets
+        self._datasets: 'OrderedDict[str, Dataset]' = OrderedDict()
+        self._eviction_listeners: List[Callable[[str], None]] = []
+        self._lock = threading.RLock()
+
+    def add_eviction_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a function called with each evicted dataset ID."""
+        self._eviction_listeners.append(listener)
+
+    def register(self, dataset: Dataset) -> None:
+        """
+        Add a dataset, evicting older versions of the same file and the
+        least recently used datasets beyond the size bound.
+
+        Args:
+            dataset: Dataset to register
+        """
+        evicted = []
+        with self._lock:
+            if dataset.dataset_id in self._datasets:
+                self._datasets.move_to_end(dataset.dataset_id)
+                return
+
+            # An upload of the same file with new content is an update
+            for dataset_id, existing in self._datasets.items():
+                if existing.filename == dataset.filename:
+                    evicted.append(dataset_id)
+            for dataset_id in evicted:
+                del self._datasets[dataset_id]
+
+            self._datasets[dataset.dataset_id] = dataset
+            while len(self._datasets) > self.max_datasets:
+                dataset_id, _ = self._datasets.popitem(last=False)
+                evicted.append(dataset_id)
+
+        for dataset_id in evicted:
+            self._notify_evicted(dataset_id)
+
+    def get(self, dataset_id: Optional[str]) -> Optional[Dataset]:
+        """
+        Look up a dataset and mark it as recently used.
+
+        Args:
+            dataset_id: ID of the dataset
+
+        Returns:
+            The dataset, or None if it is not loaded.
+        """
+        if dataset_id is None:
+            return None
+        with self._lock:
+            dataset = self._datasets.get(dataset_id)
+            if dataset is not None:
+                self._datasets.move_to_end(dataset_id)
+            return dataset
+
+    def evict(self, dataset_id: str) -> bool:
+        """
+        Remove a dataset from the registry.
+
+        Args:
+            dataset_id: ID of the dataset
+
+        Returns:
+            True if the dataset was loaded and has been removed.
+        """
+        with self._lock:
+            removed = self._datasets.pop(dataset_id, None) is not None
+        if removed:
+            self._notify_evicted(dataset_id)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all datasets."""
+        with self._lock:
+            dataset_ids = list(self._datasets.keys())
+            self._datasets.clear()
+        for dataset_id in dataset_ids:
+            self._notify_evicted(dataset_id)
+
+    def dataset_ids(self) -> List[str]:
+        """IDs of loaded datasets, least recently used first."""
+        with self._lock:
+            return list(self._datasets.keys())
+
+    def _notify_evicted(self, dataset_id: str) -> None:
+        for listener in self._eviction_listeners:
+            listener(dataset_id)
+
+
+# Process-wide registry used by the callbacks
+_registry = DatasetRegistry()
+
+# Golden runs live in their own registry: a golden file usually has the same
+# name as the run compared against it and must not replace that run
+_golden_registry = DatasetRegistry(MAX_GOLDEN_DATASETS)
+
+
+def get_dataset_registry() -> DatasetRegistry:
+    """
+    Get the process-wide dataset registry.
+
+    Returns:
+        Shared DatasetRegistry instance.
+    """
+    return _registry
+
+
+def get_golden_registry() -> DatasetRegistry:
+    """
+    Get the process-wide registry of golden (reference) runs.
+
+    Returns:
+        Shared DatasetRegistry instance, separate from the loaded runs.
+    """
+    return _golden_registry
+
+
+def resolve_dataset(parsed_data: Optional[Dict]) -> Optional[Dataset]:
+    """
+    Get the dataset behind parsed-data-store contents.
+
+    Falls back to a single-step dataset built from the JSON records when the
+    dataset is no longer in the registry (e.g. after a server restart).
+
+    Args:
+        parsed_data: Contents of parsed-data-store
+
+    Returns:
+        Dataset, or None if there is no parsed data.
+    """
+    if not parsed_data:
+        return None
+
+    dataset = get_dataset_registry().get(parsed_data.get('dataset_id'))
+    if dataset is not None:
+        return dataset
+
+    frame = pd.DataFrame(parsed_data.get('data') or [])
+    frame.index = np.asarray(parsed_data.get('index') or [], dtype=np.float64)
+    return Dataset.from_frame(parsed_data.get('dataset_id') or '', parsed_data.get('filename', ''),
+                              frame, parsed_data.get('metadata'))
@@ -0,0 +1,167 @@
+"""
+Server-side figure cache for WaveDash application.
+
+Serialized figure payloads are cached in a bounded LRU keyed by
+(dataset_id, signal tuple, step, x-range bucket, pixel width, precision,
+tile mode), so switching back to a dataset or re-adding the same overlay
+is served from memory instead of rebuilding the figure.
+"""
+
+import json
+import math
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from plotly.utils import PlotlyJSONEncoder
+
+from src.data.datasets import get_dataset_registry
+from src.utils.lru import ByteBoundedLRU
+
+# Bounds of the process-wide cache
+MAX_CACHE_ENTRIES = 256
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Number of buckets a visible x-range is snapped to
+X_RANGE_BUCKETS = 64
+
+
+class FigureKey(NamedTuple):
+    """Cache key of a figure payload."""
+    dataset_id: str
+    signals: Tuple[str, ...]
+    step: Optional[int]
+    x_range: Optional[Tuple[int, int, int]]
+    pixel_width: Optional[int]
+    precision: str
+    mode: str
+
+
+class FigureEntry(NamedTuple):
+    """Cached payload with its serialized size."""
+    payload: Dict[str, Any]
+    nbytes: int
+
+
+def bucket_x_range(x_range: Optional[Sequence[float]]) -> Optional[Tuple[float, float]]:
+    """
+    Snap an x-range outward to a power-of-two grid.
+
+    Nearby zoom windows snap to the same bucket, so they share one cache
+    entry. The bucket always covers the requested range.
+
+    Args:
+        x_range: Visible [x0, x1] range, or None for the full range
+
+    Returns:
+        Snapped (x0, x1) range, or None for the full range.
+    """
+    key = _x_range_bucket(x_range)
+    if key is None:
+        return None
+    start, end, exponent = key
+    quantum = math.ldexp(1.0, exponent)
+    return start * quantum, end * quantum
+
+
+def make_figure_key(dataset_id: str, signal_names: Sequence[str], step: Optional[int] = None,
+                    x_range: Optional[Sequence[float]] = None, pixel_width: Optional[int] = None,
+                    precision: str = 'auto', mode: str = 'lines') -> FigureKey:
+    """
+    Build the cache key of a figure payload.
+
+    Args:
+        dataset_id: ID of the dataset plotted
+        signal_names: Signals plotted, in trace order
+        step: Simulation step plotted
+        x_range: Visible [x0, x1] range, or None for the full range
+        pixel_width: Plot width in pixels the data was reduced for
+        precision: Float precision of the trace data ('auto', 'f4' or 'f8')
+        mode: Tile display mode the figure was built for
+
+    Returns:
+        Hashable cache key.
+    """
+    return FigureKey(dataset_id, tuple(signal_names), step, _x_range_bucket(x_range),
+                     pixel_width, precision, mode)
+
+
+class FigureCache(ByteBoundedLRU[FigureEntry]):
+    """
+    Bounded LRU cache of serialized figure payloads.
+
+    Entries are evicted when either the entry count or the total serialized
+    size exceeds its bound.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES, max_bytes: int = MAX_CACHE_BYTES):
+        super().__init__(max_bytes, max_entries)
+
+    def get(self, key: FigureKey) -> Optional[Dict[str, Any]]:
+        """
+        Look up a payload and mark it as recently used.
+
+        Args:
+            key: Cache key from make_figure_key()
+
+        Returns:
+            Cached payload, or None on a miss.
+        """
+        entry = super().get(key)
+        return None if entry is None else entry.payload
+
+    def put(self, key: FigureKey, payload: Dict[str, Any]) -> None:
+        """
+        Store a payload, evicting least recently used entries over the bounds.
+
+        Payloads larger than the byte bound on their own are not cached.
+
+        Args:
+            key: Cache key from make_figure_key()
+            payload: JSON-serializable figure payload (must not be mutated later)
+        """
+        super().put(key, FigureEntry(payload, len(json.dumps(payload, cls=PlotlyJSONEncoder))))
+
+    def invalidate_dataset(self, dataset_id: str) -> int:
+        """
+        Drop every entry of a dataset.
+
+        Args:
+            dataset_id: ID of the evicted or updated dataset
+
+        Returns:
+            Number of entries removed.
+        """
+        return self.discard(lambda key: key.dataset_id == dataset_id)
+
+
+def _x_range_bucket(x_range: Optional[Sequence[float]]) -> Optional[Tuple[int, int, int]]:
+    """Quantize an x-range to (start, end, exponent) on a power-of-two grid."""
+    if x_range is None:
+        return None
+
+    x0, x1 = float(x_range[0]), float(x_range[1])
+    if x1 < x0:
+        x0, x1 = x1, x0
+    span = x1 - x0
+    if span <= 0 or not math.isfinite(span):
+        return None
+
+    # Grid spacing: largest power of two not above span / X_RANGE_BUCKETS
+    exponent = math.floor(math.log2(span / X_RANGE_BUCKETS))
+    quantum = math.ldexp(1.0, exponent)
+    return math.floor(x0 / quantum), math.ceil(x1 / quantum), exponent
+
+
+# Process-wide cache used by the callbacks; dropped entries follow the
+# dataset registry so evicted or updated datasets are never served
+_figure_cache = FigureCache()
+get_dataset_registry().add_eviction_listener(_figure_cache.invalidate_dataset)
+
+
+def get_figure_cache() -> FigureCache:
+    """
+    Get the process-wide figure cache.
+
+    Returns:
+        Shared FigureCache instance.
+    """
+    return _figure_cache
@@ -0,0 +1,220 @@
+"""
+Server-side spectrum cache for WaveDash application.
+
+Spectra are cached per signal in a bounded LRU keyed by (dataset_id, step,
+signal, window, time range, FFT size), so tiles that share signals, or a
+tile returning to an earlier window, reuse earlier FFTs. Only the signals
+missing from the cache are transformed, together in one batch. Spectrogram
+images are cached the same way in a second LRU, keyed by (dataset_id, step,
+signal, window, time range, columns).
+"""
+
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.datasets import Dataset, get_dataset_registry
+from src.utils.spectrogram import SPECTROGRAM_COLUMNS, compute_spectrogram, spectrogram_axes, spectrogram_plan
+from src.utils.spectrum import (DEFAULT_SPECTRUM_WINDOW, compute_spectrum, decimation_factor, passband_bins,
+                                spectrum_size, window_samples)
+from src.utils.lru import ByteBoundedLRU
+
+# Memory bound of the process-wide cache
+MAX_SPECTRUM_BYTES = 128 * 1024 * 1024
+
+
+class SpectrumKey(NamedTuple):
+    """Cache key of one signal's spectrum."""
+    dataset_id: str
+    step: Optional[int]
+    signal: str
+    window: str
+    x_range: Optional[Tuple[float, float]]
+    n_points: int
+
+
+class SpectrogramKey(NamedTuple):
+    """Cache key of one signal's spectrogram."""
+    dataset_id: str
+    step: Optional[int]
+    signal: str
+    window: str
+    x_range: Optional[Tuple[float, float]]
+    n_columns: int
+
+
+class SpectrumEntry(NamedTuple):
+    """Cached dB magnitude (float32) and tone metrics of one signal."""
+    magnitude: np.ndarray
+    metrics: Optional[Dict[str, Any]] = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.magnitude.nbytes
+
+
+class SpectrumCache(ByteBoundedLRU[SpectrumEntry]):
+    """
+    Bounded LRU cache of per-signal spectra.
+
+    Each entry holds the magnitude and tone metrics of one signal (metrics
+    are None for spectrograms); entries are evicted when their total size
+    exceeds the bound.
+    """
+
+    def __init__(self, max_bytes: int = MAX_SPECTRUM_BYTES):
+        super().__init__(max_bytes)
+
+    def invalidate_dataset(self, dataset_id: str) -> int:
+        """
+        Drop every entry of a dataset.
+
+        Args:
+            dataset_id: ID of the evicted or updated dataset
+
+        Returns:
+            Number of entries removed.
+        """
+        return self.discard(lambda key: key.dataset_id == dataset_id)
+
+
+def get_spectra(dataset: Dataset, signal_names: Sequence[str], step: Optional[int] = None,
+                x_range: Optional[Sequence[float]] = None,
+                window: str = DEFAULT_SPECTRUM_WINDOW) -> Dict[str, Any]:
+    """
+    Get the spectra of signals in a time window, computing only cache misses.
+
+    Args:
+        dataset: Dataset holding the signals
+        signal_names: Signals to analyze (missing ones are skipped)
+        step: Simulation step
+        x_range: [x0, x1] time window, or None for the full axis
+        window: Window name
+
+    Returns:
+        Dictionary in the format of compute_spectrum().
+
+    Raises:
+        ValueError: If none of the signals exist or the window is empty.
+    """
+    axis = dataset.get_axis(step)
+    names = [name for name in signal_names if dataset.has_signal(name, step)]
+    if not names:
+        raise ValueError(f"Signal(s) not found in data: {', '.join(signal_names)}")
+
+    x0, x1 = float(axis[0]), float(axis[-1])
+    if x_range is not None:
+        x0, x1 = max(min(x_range), x0), min(max(x_range), x1)
+    if not x1 > x0:
+        raise ValueError("No data in the selected window")
+    n_points = spectrum_size(axis, (x0, x1))
+    range_key = None if x_range is None else (x0, x1)
+
+    keys = {name: SpectrumKey(dataset.dataset_id, step, name, window, range_key, n_points) for name in names}
+    entries = {name: _spectrum_cache.get(key) for name, key in keys.items()}
+
+    missing = [name for name, entry in entries.items() if entry is None]
+    if missing:
+        waves = {name: dataset.get_wave(name, step) for name in missing}
+        computed = compute_spectrum(axis, waves, (x0, x1), window, n_points)
+        for name in missing:
+            entries[name] = SpectrumEntry(computed['magnitude'][name].astype(np.float32), computed['metrics'][name])
+            _spectrum_cache.put(keys[name], entries[name])
+
+    # The band follows from the window, so only magnitudes and metrics are stored
+    sample_rate = n_points / (x1 - x0)
+    factor = decimation_factor(window_samples(axis, (x0, x1)), n_points)
+    frequency = np.fft.rfftfreq(n_points, d=1.0 / sample_rate)[:passband_bins(n_points, factor)]
+    return {
+        'frequency': frequency,
+        'magnitude': {name: entries[name].magnitude for name in names},
+        'metrics': {name: entries[name].metrics for name in names},
+        'n_points': n_points,
+        'window': window,
+        'x_range': (x0, x1),
+        'sample_rate': sample_rate,
+        'decimation': factor,
+        'bandwidth': float(frequency[-1])
+    }
+
+
+def get_spectrogram(dataset: Dataset, signal_name: str, step: Optional[int] = None,
+                    x_range: Optional[Sequence[float]] = None,
+                    window: str = DEFAULT_SPECTRUM_WINDOW,
+                    n_columns: int = SPECTROGRAM_COLUMNS) -> Dict[str, Any]:
+    """
+    Get the spectrogram of a signal in a time window, computing it on a miss.
+
+    Args:
+        dataset: Dataset holding the signal
+        signal_name: Signal to analyze
+        step: Simulation step
+        x_range: [x0, x1] time window, or None for the full axis
+        window: Window name
+        n_columns: Number of time columns
+
+    Returns:
+        Dictionary in the format of compute_spectrogram().
+
+    Raises:
+        ValueError: If the signal does not exist or the window is empty.
+    """
+    if not dataset.has_signal(signal_name, step):
+        raise ValueError(f"Signal(s) not found in data: {signal_name}")
+
+    axis = dataset.get_axis(step)
+    x0, x1 = float(axis[0]), float(axis[-1])
+    if x_range is not None:
+        x0, x1 = max(min(x_range), x0), min(max(x_range), x1)
+    if not x1 > x0:
+        raise ValueError("No data in the selected window")
+    range_key = None if x_range is None else (x0, x1)
+
+    key = SpectrogramKey(dataset.dataset_id, step, signal_name, window, range_key, n_columns)
+    entry = _spectrogram_cache.get(key)
+    if entry is None:
+        computed = compute_spectrogram(axis, dataset.get_wave(signal_name, step), (x0, x1), window, n_columns)
+        _spectrogram_cache.put(key, SpectrumEntry(computed['magnitude'].astype(np.float32)))
+        return computed
+
+    # The column and row layout follows from the window, so only the image is stored
+    samples = int(np.searchsorted(axis, x1, side='right') - np.searchsorted(axis, x0, side='left'))
+    plan = spectrogram_plan(samples, n_columns)
+    return {
+        'magnitude': entry.magnitude,
+        **spectrogram_axes(plan, x0, x1),
+        'n_fft': plan['n_fft'],
+        'frames_per_column': plan['frames_per_column'],
+        'window': window,
+        'x_range': (x0, x1)
+    }
+
+
+# Process-wide caches used by the callbacks; dropped entries follow the
+# dataset registry so evicted or updated datasets are never served
+_spectrum_cache = SpectrumCache()
+get_dataset_registry().add_eviction_listener(_spectrum_cache.invalidate_dataset)
+
+_spectrogram_cache = SpectrumCache()
+get_dataset_registry().add_eviction_listener(_spectrogram_cache.invalidate_dataset)
+
+
+def get_spectrum_cache() -> SpectrumCache:
+    """
+    Get the process-wide spectrum cache.
+
+    Returns:
+        Shared SpectrumCache instance.
+    """
+    return _spectrum_cache
+
+
+
+def get_spectrogram_cache() -> SpectrumCache:
+    """
+    Get the process-wide spectrogram cache.
+
+    Returns:
+        Shared SpectrumCache instance holding spectrogram images.
+    """
+    return _spectrogram_cache
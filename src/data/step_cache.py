@@ -0,0 +1,152 @@
+"""
+On-disk step cache for WaveDash application.
+
+A dataset's steps are written once as NumPy ``.npy`` files, one 2-D array
+per step (row 0 is the axis, then one row per signal), next to a JSON
+manifest of signal names and steps. Analysis worker processes open these
+files with ``mmap_mode='r'``, so they share the page cache with each other
+and no arrays are pickled between processes. Cache directories follow the
+dataset registry and are removed when their dataset is evicted.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.datasets import Dataset, get_dataset_registry
+
+# Directory holding one cache directory per dataset ID
+CACHE_ROOT = Path(tempfile.gettempdir()) / 'wavedash-step-cache'
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def get_cache_dir(dataset_id: str, root: Optional[Path] = None) -> Path:
+    """
+    Get the cache directory of a dataset.
+
+    Args:
+        dataset_id: ID of the dataset
+        root: Cache root (defaults to CACHE_ROOT)
+
+    Returns:
+        Path of the dataset's cache directory (may not exist yet).
+    """
+    return Path(root or CACHE_ROOT) / dataset_id
+
+
+def ensure_step_cache(dataset: Dataset, root: Optional[Path] = None) -> Path:
+    """
+    Write a dataset's steps to the step cache unless they are already there.
+
+    Files are written into a temporary directory that is renamed into place,
+    so readers never see a partially written cache.
+
+    Args:
+        dataset: Dataset to cache
+        root: Cache root (defaults to CACHE_ROOT)
+
+    Returns:
+        Path of the dataset's cache directory.
+
+    Raises:
+        ValueError: If the dataset has no ID to key the cache by.
+    """
+    if not dataset.dataset_id:
+        raise ValueError("Dataset has no ID")
+    cache_dir = get_cache_dir(dataset.dataset_id, root)
+    if (cache_dir / MANIFEST_NAME).exists():
+        return cache_dir
+
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f'{dataset.dataset_id}-', dir=cache_dir.parent))
+    try:
+        manifest = {'dataset_id': dataset.dataset_id, 'steps': {}}
+        for step in dataset.steps:
+            names = [name for name in dataset.signal_names if dataset.has_signal(name, step)]
+            rows = [dataset.get_axis(step)] + [dataset.get_wave(name, step) for name in names]
+            filename = f'step_{step}.npy'
+            np.save(staging / filename, np.vstack(rows))
+            manifest['steps'][str(step)] = {'file': filename, 'signals': names}
+        with open(staging / MANIFEST_NAME, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        try:
+            os.rename(staging, cache_dir)
+        except OSError:
+            # Another process cached the same dataset first
+            shutil.rmtree(staging, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    return cache_dir
+
+
+def read_manifest(cache_dir: Path) -> Dict:
+    """
+    Read the manifest of a step cache.
+
+    Args:
+        cache_dir: Cache directory from ensure_step_cache()
+
+    Returns:
+        Dictionary with 'dataset_id' and 'steps' (step number as string ->
+        {'file': file name, 'signals': signal names in row order}).
+    """
+    with open(Path(cache_dir) / MANIFEST_NAME) as manifest_file:
+        return json.load(manifest_file)
+
+
+def open_step(cache_dir: Path, step: int,
+              manifest: Optional[Dict] = None) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Memory-map one step of a step cache.
+
+    Args:
+        cache_dir: Cache directory from ensure_step_cache()
+        step: Step number
+        manifest: Manifest from read_manifest(), read from disk if None
+
+    Returns:
+        Tuple of (axis, {signal name: array}); the arrays are read-only
+        views of the memory-mapped file.
+
+    Raises:
+        KeyError: If the step is not in the cache.
+    """
+    entry = (manifest or read_manifest(cache_dir))['steps'][str(step)]
+    data = np.load(Path(cache_dir) / entry['file'], mmap_mode='r')
+    return data[0], dict(zip(entry['signals'], data[1:]))
+
+
+def cached_steps(cache_dir: Path) -> List[int]:
+    """Step numbers available in a step cache."""
+    return [int(step) for step in read_manifest(cache_dir)['steps']]
+
+
+def remove_step_cache(dataset_id: str, root: Optional[Path] = None) -> bool:
+    """
+    Delete the step cache of a dataset.
+
+    Args:
+        dataset_id: ID of the evicted or updated dataset
+        root: Cache root (defaults to CACHE_ROOT)
+
+    Returns:
+        True if a cache directory was removed.
+    """
+    cache_dir = get_cache_dir(dataset_id, root)
+    if not dataset_id or not cache_dir.exists():
+        return False
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    return True
+
+
+# Evicted or updated datasets take their step cache with them
+get_dataset_registry().add_eviction_listener(remove_step_cache)
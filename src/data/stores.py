@@ -50,6 +50,71 @@ def create_data_stores() -> List[dcc.Store]:
             id='tile-config-store',
             storage_type='session',
             data={}
+        ),
+        
+        # Shared x-axis arrays (typed arrays keyed by axis key), sent once
+        # and referenced by every trace and tile that plots against them
+        dcc.Store(
+            id='axis-store',
+            storage_type='memory',
+            data={}
+        ),
+        
+        # Last zoom/pan window: {'range': [x0, x1] or None, 'tiles': [indices], 'linked': bool}
+        dcc.Store(
+            id='xrange-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Measurement cursor positions on the x-axis
+        dcc.Store(
+            id='cursor-store',
+            storage_type='memory',
+            data={'a': None, 'b': None}
+        ),
+        
+        # Last measurement results for the sweep plot:
+        # {'rows': [...], 'sweep_label': str, 'sweep_values': {step: value}}
+        dcc.Store(
+            id='measurement-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Reference signal of the "find similar" signal list ranking
+        dcc.Store(
+            id='similar-reference-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Golden run of the regression compare: {'dataset_id', 'filename'}
+        dcc.Store(
+            id='golden-data-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Device connections of the uploaded netlist: {'filename', 'connections'}
+        dcc.Store(
+            id='netlist-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Last power accounting: {'rows': [...], 'window': [t0, t1]}
+        dcc.Store(
+            id='power-store',
+            storage_type='memory',
+            data=None
+        ),
+        
+        # Settings of the last jitter analysis: {'signal', 'threshold', 'hysteresis', 'edge'}
+        dcc.Store(
+            id='jitter-store',
+            storage_type='memory',
+            data=None
         )
     ]
     
@@ -68,5 +133,28 @@ def get_initial_store_data() -> Dict[str, Any]:
         'signal-list-store': [],
         'selected-signal-store': None,
         'active-tile-store': None,
-        'tile-config-store': {}
-    } 
\ No newline at end of file
+        'tile-config-store': {},
+        'axis-store': {},
+        'xrange-store': None,
+        'cursor-store': {'a': None, 'b': None},
+        'measurement-store': None,
+        'similar-reference-store': None,
+        'golden-data-store': None,
+        'netlist-store': None,
+        'power-store': None,
+        'jitter-store': None
+    }
+
+
+def get_axis_key(dataset_id: Optional[str], step: Optional[int]) -> str:
+    """
+    Get the axis-store key for the independent axis of a dataset step.
+    
+    Args:
+        dataset_id: ID of the dataset the axis belongs to
+        step: Simulation step number
+    
+    Returns:
+        Key under which the axis is stored in the axis-store.
+    """
+    return f"{dataset_id}:{step if step is not None else 0}" 
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Cursor measurement utilities for WaveDash application.
+
+This module reads exact signal values at cursor positions. The axis is
+searched once per cursor (O(log N)) and every signal is then linearly
+interpolated at the same indices, so the cost of a readout grows with the
+number of signals, not with their length.
+"""
+
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+def locate(axis: np.ndarray, positions: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the interpolation interval of each position on a sorted axis.
+
+    Args:
+        axis: Sorted axis array
+        positions: Positions to locate
+
+    Returns:
+        Tuple of (left indices, interpolation weights, in-range mask). The
+        value at a position is values[left] + weight * (values[left + 1] - values[left]).
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    n = len(axis)
+    if n == 0:
+        empty = np.zeros(len(positions), dtype=np.intp)
+        return empty, np.zeros(len(positions)), np.zeros(len(positions), dtype=bool)
+    if n == 1:
+        return (np.zeros(len(positions), dtype=np.intp), np.zeros(len(positions)),
+                positions == axis[0])
+
+    right = np.clip(np.searchsorted(axis, positions, side='right'), 1, n - 1)
+    left = right - 1
+    span = axis[right] - axis[left]
+
+    # Repeated axis values (SPICE breakpoints) give zero-width intervals
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weights = np.where(span > 0, (positions - axis[left]) / span, 0.0)
+    weights = np.clip(weights, 0.0, 1.0)
+    in_range = (positions >= axis[0]) & (positions <= axis[-1])
+
+    return left, weights, in_range
+
+
+def interpolate_at(values: np.ndarray, left: np.ndarray, weights: np.ndarray,
+                   in_range: np.ndarray) -> np.ndarray:
+    """
+    Interpolate a signal at located positions.
+
+    Args:
+        values: Signal array on the axis passed to locate()
+        left: Left indices from locate()
+        weights: Interpolation weights from locate()
+        in_range: In-range mask from locate()
+
+    Returns:
+        Interpolated values, NaN for positions outside the axis.
+    """
+    right = np.minimum(left + 1, len(values) - 1)
+    y_left = values[left].astype(np.float64)
+    result = y_left + weights * (values[right] - y_left)
+    return np.where(in_range, result, np.nan)
+
+
+def measure_cursors(axis: np.ndarray, waves: Dict[str, np.ndarray],
+                    cursor_a: Optional[float], cursor_b: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Measure every signal at cursor A and (optionally) cursor B.
+
+    Args:
+        axis: Sorted axis array shared by the signals
+        waves: Mapping of signal name to array on the axis
+        cursor_a: Position of cursor A, or None
+        cursor_b: Position of cursor B, or None
+
+    Returns:
+        Dictionary containing:
+        - 'a', 'b': Cursor positions (None when not placed)
+        - 'dt': b - a, or None
+        - 'inv_dt': 1 / (b - a), or None when dt is missing or zero
+        - 'signals': {name: {'a', 'b', 'dv', 'slope'}}, None for values
+          that cannot be computed
+    """
+    cursors = [c for c in (cursor_a, cursor_b) if c is not None]
+    left, weights, in_range = locate(axis, cursors)
+
+    dt = cursor_b - cursor_a if cursor_a is not None and cursor_b is not None else None
+    inv_dt = 1.0 / dt if dt else None
+
+    signals = {}
+    for name, values in waves.items():
+        sampled = interpolate_at(values, left, weights, in_range) if cursors else []
+        readings = iter(_finite_or_none(value) for value in sampled)
+        value_a = next(readings) if cursor_a is not None else None
+        value_b = next(readings) if cursor_b is not None else None
+
+        dv = value_b - value_a if value_a is not None and value_b is not None else None
+        signals[name] = {
+            'a': value_a,
+            'b': value_b,
+            'dv': dv,
+            'slope': dv / dt if dv is not None and dt else None
+        }
+
+    return {
+        'a': cursor_a,
+        'b': cursor_b,
+        'dt': dt,
+        'inv_dt': inv_dt,
+        'signals': signals
+    }
+
+
+def _finite_or_none(value: float) -> Optional[float]:
+    """Convert a NumPy value to a float, or None if it is not finite."""
+    return float(value) if np.isfinite(value) else None
@@ -0,0 +1,219 @@
+"""
+Waveform decimation utilities for WaveDash application.
+
+This module reduces signals to what a plot of a given pixel width can show:
+the samples inside the visible x-range, reduced to one min/max pair per
+pixel bucket when there are more samples than pixels. XY (parametric)
+curves are reduced in 2-D instead, on a pixel grid over the plotted domain.
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+# Plot width assumed when the client does not report one
+DEFAULT_PIXEL_WIDTH = 1200
+
+# Windows with at most this many samples per pixel are sent as-is
+MAX_POINTS_PER_PIXEL = 2
+
+# Plot height assumed for the 2-D grid of XY curves
+DEFAULT_PIXEL_HEIGHT = 400
+
+# Point budget of one reduced XY curve
+MAX_XY_POINTS = 20000
+
+# Coarsest grid (cells per side) an XY curve is reduced on before its
+# points are no longer connected
+MIN_XY_GRID = 32
+
+
+def select_window(x: np.ndarray, x_range: Optional[Sequence[float]]) -> slice:
+    """
+    Find the samples of a sorted axis inside an x-range.
+
+    One sample on each side of the range is included so lines reach the
+    plot edges.
+
+    Args:
+        x: Sorted axis array
+        x_range: Visible [x0, x1] range, or None for the full range
+
+    Returns:
+        Slice of the axis (and of every signal on it) to plot.
+    """
+    if x_range is None:
+        return slice(0, len(x))
+
+    x0, x1 = sorted((float(x_range[0]), float(x_range[1])))
+    start = max(int(np.searchsorted(x, x0, side='left')) - 1, 0)
+    stop = min(int(np.searchsorted(x, x1, side='right')) + 1, len(x))
+    return slice(start, max(start, stop))
+
+
+def minmax_decimate(x: np.ndarray, signals: Sequence[np.ndarray],
+                    n_buckets: int) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Reduce signals to one min/max pair per equal-width x bucket.
+
+    All signals share the bucket boundaries, so they also share the reduced
+    x array. Within each bucket the pair is ordered so the trace enters
+    from the side closest to the bucket's first sample.
+
+    Args:
+        x: Sorted axis array
+        signals: Signal arrays of the same length as x
+        n_buckets: Number of buckets (typically the plot width in pixels)
+
+    Returns:
+        Tuple of (reduced x, list of reduced signals), each 2 points per
+        non-empty bucket.
+    """
+    n = len(x)
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[1:-1]
+    starts = np.unique(np.concatenate(([0], np.searchsorted(x, edges, side='left'))))
+    starts = starts[starts < n]
+    ends = np.append(starts[1:], n)
+
+    x_reduced = np.empty(2 * len(starts))
+    x_reduced[0::2] = x[starts]
+    x_reduced[1::2] = x[ends - 1]
+
+    reduced = []
+    for values in signals:
+        mins = np.minimum.reduceat(values, starts)
+        maxs = np.maximum.reduceat(values, starts)
+        first = values[starts]
+        falling = (first - mins) > (maxs - first)
+
+        values_reduced = np.empty(2 * len(starts), dtype=np.float64)
+        values_reduced[0::2] = np.where(falling, maxs, mins)
+        values_reduced[1::2] = np.where(falling, mins, maxs)
+        reduced.append(values_reduced)
+
+    return x_reduced, reduced
+
+
+def reduce_for_display(x: np.ndarray, signals: Sequence[np.ndarray],
+                       x_range: Optional[Sequence[float]] = None,
+                       pixel_width: Optional[int] = None) -> Tuple[np.ndarray, List[np.ndarray], bool]:
+    """
+    Reduce signals to the visible window at plot resolution.
+
+    Args:
+        x: Sorted axis array
+        signals: Signal arrays of the same length as x
+        x_range: Visible [x0, x1] range, or None for the full range
+        pixel_width: Plot width in pixels (defaults to DEFAULT_PIXEL_WIDTH)
+
+    Returns:
+        Tuple of (x, signals, is_full_axis). is_full_axis is True when x is
+        the unmodified input axis, so it can be shared with other traces.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    pixel_width = pixel_width or DEFAULT_PIXEL_WIDTH
+
+    window = select_window(x, x_range)
+    x_window = x[window]
+    signals_window = [np.asarray(values)[window] for values in signals]
+
+    if len(x_window) > MAX_POINTS_PER_PIXEL * pixel_width:
+        x_reduced, signals_reduced = minmax_decimate(x_window, signals_window, pixel_width)
+        return x_reduced, signals_reduced, False
+
+    is_full_axis = len(x_window) == len(x)
+    return (x if is_full_axis else x_window), signals_window, is_full_axis
+
+
+def pack_nan_separated(signals: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Concatenate equal-length signals into one array with NaN separators.
+
+    Plotly breaks a line at NaN values, so a trace with the packed values
+    (and its axis repeated with the same separators) draws one separate line
+    per signal while being a single trace.
+
+    Args:
+        signals: Signal arrays of equal length n
+
+    Returns:
+        Packed array of length len(signals) * (n + 1) - 1.
+    """
+    n = len(signals[0]) if len(signals) else 0
+    packed = np.empty((len(signals), n + 1))
+    for row, values in zip(packed, signals):
+        row[:n] = values
+    packed[:, n] = np.nan
+
+    # The last separator is not needed
+    return packed.ravel()[:-1]
+
+
+def decimate_xy(x: np.ndarray, y: np.ndarray, pixel_width: Optional[int] = None,
+                pixel_height: Optional[int] = None,
+                max_points: int = MAX_XY_POINTS) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Reduce an XY curve to the points a pixel grid over its domain can show.
+
+    Time-bucket min/max decimation distorts curves whose x is not sorted,
+    so the curve is walked in sample order and a point is kept only when it
+    enters a different grid cell than the previous sample (plus the first
+    and last point). The path's shape is kept to the cell size. When a
+    curve retraces itself so often that this exceeds max_points, the grid
+    is coarsened by powers of two down to MIN_XY_GRID; beyond that, the
+    occupied cells are returned as unconnected points.
+
+    Args:
+        x: X signal array (any order)
+        y: Y signal array of the same length
+        pixel_width: Grid columns (defaults to DEFAULT_PIXEL_WIDTH)
+        pixel_height: Grid rows (defaults to DEFAULT_PIXEL_HEIGHT)
+        max_points: Point budget
+
+    Returns:
+        Tuple of (x, y, connected). connected is False when the points are
+        occupied cell centers to be drawn as markers.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if len(x) <= max_points:
+        return x, y, True
+
+    columns = pixel_width or DEFAULT_PIXEL_WIDTH
+    rows = pixel_height or DEFAULT_PIXEL_HEIGHT
+    x_min, y_min = x.min(), y.min()
+    x_span = max(x.max() - x_min, np.finfo(np.float64).tiny)
+    y_span = max(y.max() - y_min, np.finfo(np.float64).tiny)
+    column = np.minimum(((x - x_min) * (columns / x_span)).astype(np.int64), columns - 1)
+    row = np.minimum(((y - y_min) * (rows / y_span)).astype(np.int64), rows - 1)
+
+    # A sample in the same fine cell as its predecessor is also in the same
+    # coarse cell, so each coarser pass only walks the points kept so far
+    while True:
+        cell = column * rows + row
+        keep = np.empty(len(cell), dtype=bool)
+        keep[0] = keep[-1] = True
+        np.not_equal(cell[1:-1], cell[:-2], out=keep[1:-1])
+        x, y, column, row = x[keep], y[keep], column[keep], row[keep]
+        if len(x) <= max_points:
+            return x, y, True
+
+        # The kept count scales with the cell size, so jump to the grid
+        # that should fit the budget
+        factor = 1 << max(int(np.ceil(np.log2(len(x) / max_points))), 1)
+        while factor > 1 and min(columns, rows) // factor < MIN_XY_GRID:
+            factor //= 2
+        if factor == 1:
+            break
+        columns, rows = -(-columns // factor), -(-rows // factor)
+        column //= factor
+        row //= factor
+
+    # Occupancy of the finest grid within budget, drawn at cell centers
+    scale = max(int(np.ceil(np.sqrt(columns * rows / max_points))), 1)
+    columns, rows = -(-columns // scale), -(-rows // scale)
+    cell = np.unique((column // scale) * rows + row // scale)
+    return (x_min + (cell // rows + 0.5) * (x_span / columns),
+            y_min + (cell % rows + 0.5) * (y_span / rows), False)
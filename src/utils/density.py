@@ -0,0 +1,167 @@
+"""
+Waveform density utilities for WaveDash application.
+
+This module rasterizes many runs of a signal (stepped or Monte Carlo
+simulations) into a 2-D (x, value) histogram on the server, so a tile shows
+one image whose size depends on the pixel grid instead of on the number of
+runs and points.
+"""
+
+import warnings
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Number of x columns and value rows of a density image (about two screen
+# pixels per cell on a typical tile)
+DENSITY_COLUMNS = 600
+DENSITY_ROWS = 150
+
+# Percentile envelope lines drawn over a density plot
+DEFAULT_ENVELOPE_PERCENTILES = (5.0, 50.0, 95.0)
+
+
+def resample_runs(runs: Sequence[Tuple[np.ndarray, np.ndarray]], x_grid: np.ndarray) -> np.ndarray:
+    """
+    Resample runs with individual axes onto one common grid.
+
+    Each run is linearly interpolated at the grid points; grid points
+    outside a run's axis are NaN.
+
+    Args:
+        runs: (axis, values) pairs, each axis sorted
+        x_grid: Common grid to resample onto
+
+    Returns:
+        Array of shape (len(runs), len(x_grid)).
+    """
+    resampled = np.empty((len(runs), len(x_grid)))
+    for row, (x, values) in zip(resampled, runs):
+        row[:] = np.interp(x_grid, x, values, left=np.nan, right=np.nan)
+    return resampled
+
+
+def column_spans(runs: Sequence[Tuple[np.ndarray, np.ndarray]], x0: float, dx: float,
+                 n_columns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the value range each run covers in each equal-width x column.
+
+    The range spans every sample inside the column and the run's linear
+    interpolation at both column edges, so a trace crossing a column
+    without a sample in it still covers the values it passes through, and
+    a glitch narrower than a column is kept. Samples are reduced with one
+    reduceat per run, as in minmax_decimate().
+
+    Args:
+        runs: (axis, values) pairs, each axis sorted
+        x0: Left edge of the first column
+        dx: Column width
+        n_columns: Number of columns
+
+    Returns:
+        Tuple of (minima, maxima), each of shape (len(runs), n_columns);
+        NaN where a column lies outside a run's axis.
+    """
+    edges = x0 + np.arange(n_columns + 1) * dx
+    minima = np.empty((len(runs), n_columns))
+    maxima = np.empty((len(runs), n_columns))
+    for low, high, (x, values) in zip(minima, maxima, runs):
+        at_edges = np.interp(edges, x, values, left=np.nan, right=np.nan)
+        low[:] = np.fmin(at_edges[:-1], at_edges[1:])
+        high[:] = np.fmax(at_edges[:-1], at_edges[1:])
+
+        # Columns holding samples; reduceat segments run to the next one
+        starts = np.searchsorted(x, edges, side='left')
+        occupied = np.nonzero(starts[:-1] < starts[1:])[0]
+        if len(occupied):
+            inside = values[starts[0]:starts[-1]]
+            offsets = starts[occupied] - starts[0]
+            low[occupied] = np.fmin(low[occupied], np.minimum.reduceat(inside, offsets))
+            high[occupied] = np.fmax(high[occupied], np.maximum.reduceat(inside, offsets))
+    return minima, maxima
+
+
+def compute_density(runs: Sequence[Tuple[np.ndarray, np.ndarray]],
+                    x_range: Optional[Sequence[float]] = None,
+                    n_columns: int = DENSITY_COLUMNS,
+                    n_rows: int = DENSITY_ROWS,
+                    percentiles: Optional[Sequence[float]] = DEFAULT_ENVELOPE_PERCENTILES) -> Dict[str, Any]:
+    """
+    Bin runs into a 2-D histogram of run counts per (x column, value row).
+
+    Each run adds one count to every cell between its minimum and maximum
+    in a column (see column_spans()), so the histogram reads as "runs
+    passing through this cell" and narrow glitches stay visible. Binning
+    is one bincount of span starts and ends, summed down the rows.
+
+    Args:
+        runs: (axis, values) pairs, each axis sorted
+        x_range: [x0, x1] window, or None for the union of the run axes
+        n_columns: Number of x columns
+        n_rows: Number of value rows
+        percentiles: Percentiles to compute per column, or None
+
+    Returns:
+        Dictionary containing:
+        - 'counts': Array of shape (n_rows, n_columns)
+        - 'x0', 'dx': Center of the first column and column width
+        - 'y0', 'dy': Center of the first row and row height
+        - 'x': Column centers
+        - 'envelopes': {percentile: array of n_columns values}
+        - 'runs': Number of runs binned
+
+    Raises:
+        ValueError: If there are no runs or no finite values in the window.
+    """
+    if not runs:
+        raise ValueError("No runs to bin")
+
+    if x_range is None:
+        x0 = min(float(x[0]) for x, _ in runs)
+        x1 = max(float(x[-1]) for x, _ in runs)
+    else:
+        x0, x1 = sorted((float(x_range[0]), float(x_range[1])))
+    dx = (x1 - x0) / n_columns if x1 > x0 else 1.0
+    x_grid = x0 + (np.arange(n_columns) + 0.5) * dx
+
+    minima, maxima = column_spans(runs, x0, dx, n_columns)
+    finite = np.isfinite(minima)
+    if not finite.any():
+        raise ValueError("No data in the selected window")
+
+    y_min = minima[finite].min()
+    y_max = maxima[finite].max()
+    if y_max == y_min:
+        # Flat signals still get a visible band
+        y_min, y_max = y_min - 0.5, y_max + 0.5
+    dy = (y_max - y_min) / n_rows
+
+    # +1 where a span enters a row and -1 past its last row; a running
+    # sum down each column then counts the spans covering every cell
+    first_rows = np.minimum(((minima[finite] - y_min) / dy).astype(np.intp), n_rows - 1)
+    last_rows = np.minimum(((maxima[finite] - y_min) / dy).astype(np.intp), n_rows - 1)
+    columns = np.nonzero(finite)[1]
+    size = (n_rows + 1) * n_columns
+    changes = (np.bincount(first_rows * n_columns + columns, minlength=size)
+               - np.bincount((last_rows + 1) * n_columns + columns, minlength=size))
+    counts = changes.reshape(n_rows + 1, n_columns)[:-1].cumsum(axis=0)
+
+    envelopes = {}
+    if percentiles:
+        # Envelopes follow the runs at the column centers; columns outside
+        # every run are all-NaN, so their envelope is NaN too
+        values = resample_runs(runs, x_grid)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            levels = np.nanpercentile(values, percentiles, axis=0)
+        envelopes = {float(p): level for p, level in zip(percentiles, levels)}
+
+    return {
+        'counts': counts,
+        'x0': x0 + dx / 2,
+        'dx': dx,
+        'y0': y_min + dy / 2,
+        'dy': dy,
+        'x': x_grid,
+        'envelopes': envelopes,
+        'runs': len(runs)
+    }
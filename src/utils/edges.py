@@ -0,0 +1,203 @@
+"""
+Edge (threshold-crossing) index for WaveDash application.
+
+Timing features (period, frequency, jitter, delay, logic views) all start
+from the same crossings of a signal through a threshold. An EdgeIndex finds
+them once with vectorized sign-change detection and keeps only the crossing
+times and directions, so later queries are ``searchsorted`` lookups instead
+of rescans of the samples.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# Edge directions as stored in EdgeIndex.directions
+RISING = 1
+FALLING = -1
+
+_DIRECTIONS = {'rise': RISING, 'fall': FALLING, 'both': None, None: None}
+
+
+def find_edges(axis: np.ndarray, values: np.ndarray, threshold: float,
+               hysteresis: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the edges of a signal through a threshold.
+
+    With hysteresis, an edge only counts once the signal has moved from one
+    side of the band [threshold - h/2, threshold + h/2] to the other, so
+    noise around the threshold does not create extra edges. The edge time
+    is the linearly interpolated threshold crossing that led there.
+
+    Args:
+        axis: Sorted axis array
+        values: Real signal array on the axis
+        threshold: Threshold level
+        hysteresis: Width of the hysteresis band (0 for plain crossings)
+
+    Returns:
+        Tuple of (edge times as float64, directions as int8: RISING or
+        FALLING), in time order.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return np.empty(0), np.empty(0, dtype=np.int8)
+
+    above = values >= threshold
+    if hysteresis <= 0:
+        # Every sign change is an edge; it lies between the sample before and the change
+        after = np.flatnonzero(above[1:] != above[:-1]) + 1
+        directions = np.where(above[after], RISING, FALLING).astype(np.int8)
+        before = after - 1
+    else:
+        is_high = values >= threshold + hysteresis / 2
+        is_low = values <= threshold - hysteresis / 2
+
+        # Entering the high or low band is an event; an edge is an event of the
+        # other kind than the previous event
+        entered = is_high.copy()
+        entered[1:] &= ~is_high[:-1]
+        entered_low = is_low.copy()
+        entered_low[1:] &= ~is_low[:-1]
+        entered |= entered_low
+        events = np.flatnonzero(entered)
+        kinds = is_high[events]
+        changed = np.flatnonzero(kinds[1:] != kinds[:-1]) + 1
+        events, kinds = events[changed], kinds[changed]
+        directions = np.where(kinds, RISING, FALLING).astype(np.int8)
+
+        # Edge time: the last threshold crossing in the edge's direction
+        # before the band was entered
+        crossings = np.flatnonzero(above[1:] != above[:-1])
+        rising_crossings = crossings[above[crossings + 1]]
+        falling_crossings = crossings[~above[crossings + 1]]
+        before = np.empty(len(events), dtype=np.int64)
+        for direction, direction_crossings in ((True, rising_crossings), (False, falling_crossings)):
+            selected = kinds == direction
+            position = np.searchsorted(direction_crossings, events[selected] - 1, side='right') - 1
+            before[selected] = direction_crossings[position]
+        after = before + 1
+
+    x0, x1 = axis[before], axis[after]
+    y0, y1 = values[before], values[after]
+    times = x0 + (threshold - y0) * (x1 - x0) / (y1 - y0)
+    return times, directions
+
+
+class EdgeIndex:
+    """
+    Crossing times and directions of one signal through one threshold.
+
+    Attributes:
+        threshold: Threshold level
+        hysteresis: Width of the hysteresis band
+        times: Edge times (float64), sorted
+        directions: RISING or FALLING per edge (int8)
+    """
+
+    def __init__(self, times: np.ndarray, directions: np.ndarray, threshold: float,
+                 hysteresis: float = 0.0):
+        self.threshold = threshold
+        self.hysteresis = hysteresis
+        self.times = times
+        self.directions = directions
+        self._rising = times[directions == RISING]
+        self._falling = times[directions == FALLING]
+
+    @classmethod
+    def build(cls, axis: np.ndarray, values: np.ndarray, threshold: float,
+              hysteresis: float = 0.0) -> 'EdgeIndex':
+        """
+        Build the index of a signal (see find_edges()).
+
+        Args:
+            axis: Sorted axis array
+            values: Real signal array on the axis
+            threshold: Threshold level
+            hysteresis: Width of the hysteresis band
+
+        Returns:
+            EdgeIndex of the signal.
+        """
+        times, directions = find_edges(axis, values, threshold, hysteresis)
+        return cls(times, directions, threshold, hysteresis)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the index arrays."""
+        return self.times.nbytes + self.directions.nbytes + self._rising.nbytes + self._falling.nbytes
+
+    def edge_times(self, direction: Optional[str] = None) -> np.ndarray:
+        """
+        Get the times of every edge of a direction.
+
+        Args:
+            direction: 'rise', 'fall', or None/'both' for every edge
+
+        Returns:
+            Sorted edge times (a view; do not modify).
+        """
+        wanted = _DIRECTIONS[direction]
+        if wanted is None:
+            return self.times
+        return self._rising if wanted == RISING else self._falling
+
+    def between(self, t0: float, t1: float,
+                direction: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the edges in a time window.
+
+        Args:
+            t0: Window start (inclusive)
+            t1: Window end (inclusive)
+            direction: 'rise', 'fall', or None/'both'
+
+        Returns:
+            Tuple of (edge times, directions) in the window.
+        """
+        times = self.edge_times(direction)
+        start = int(np.searchsorted(times, t0, side='left'))
+        stop = int(np.searchsorted(times, t1, side='right'))
+        if _DIRECTIONS[direction] is None:
+            return times[start:stop], self.directions[start:stop]
+        return times[start:stop], np.full(stop - start, _DIRECTIONS[direction], dtype=np.int8)
+
+    def count(self, t0: float, t1: float, direction: Optional[str] = None) -> int:
+        """Count the edges in [t0, t1]."""
+        times = self.edge_times(direction)
+        return int(np.searchsorted(times, t1, side='right') - np.searchsorted(times, t0, side='left'))
+
+    def nth_after(self, t: float, n: int = 1, direction: Optional[str] = None) -> Optional[float]:
+        """
+        Get the Nth edge strictly after a time.
+
+        Args:
+            t: Reference time
+            n: 1 for the next edge, 2 for the one after, ...
+            direction: 'rise', 'fall', or None/'both'
+
+        Returns:
+            Edge time, or None if there are fewer than n edges after t.
+        """
+        times = self.edge_times(direction)
+        position = int(np.searchsorted(times, t, side='right')) + n - 1
+        return float(times[position]) if n >= 1 and position < len(times) else None
+
+    def nth_before(self, t: float, n: int = 1, direction: Optional[str] = None) -> Optional[float]:
+        """
+        Get the Nth edge strictly before a time.
+
+        Args:
+            t: Reference time
+            n: 1 for the previous edge, 2 for the one before, ...
+            direction: 'rise', 'fall', or None/'both'
+
+        Returns:
+            Edge time, or None if there are fewer than n edges before t.
+        """
+        times = self.edge_times(direction)
+        position = int(np.searchsorted(times, t, side='left')) - n
+        return float(times[position]) if n >= 1 and position >= 0 else None
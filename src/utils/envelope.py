@@ -0,0 +1,123 @@
+"""
+Statistical envelope utilities for WaveDash application.
+
+This module summarizes the spread of a signal across the steps of a
+corner or Monte Carlo sweep: per grid point the mean, standard deviation,
+minimum and maximum over all steps. Steps are streamed once; each step is
+interpolated onto the common grid and folded into running min/max and
+Welford mean/variance accumulators, so memory is O(grid) no matter how
+many steps there are.
+"""
+
+import numpy as np
+from typing import Iterable, Optional, Sequence, Tuple
+
+from src.utils.decimation import DEFAULT_PIXEL_WIDTH
+
+# Grid points of an envelope (one per pixel of a typical plot)
+ENVELOPE_POINTS = DEFAULT_PIXEL_WIDTH
+
+
+class StepEnvelope:
+    """
+    Mean, sigma and min/max of a signal over steps on a common grid.
+
+    Grid points outside every step's axis are NaN.
+
+    Attributes:
+        grid: Common x grid
+        mean: Mean over the steps covering each grid point
+        std: Population standard deviation over those steps
+        minimum: Smallest value over the steps
+        maximum: Largest value over the steps
+        count: Number of steps covering each grid point
+        steps: Number of steps folded in
+    """
+
+    def __init__(self, grid: np.ndarray, mean: np.ndarray, std: np.ndarray, minimum: np.ndarray,
+                 maximum: np.ndarray, count: np.ndarray, steps: int):
+        self.grid = grid
+        self.mean = mean
+        self.std = std
+        self.minimum = minimum
+        self.maximum = maximum
+        self.count = count
+        self.steps = steps
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the envelope arrays."""
+        return sum(array.nbytes for array in (self.grid, self.mean, self.std, self.minimum, self.maximum,
+                                              self.count))
+
+
+def envelope_grid(runs_extent: Sequence[Tuple[float, float]], x_range: Optional[Sequence[float]] = None,
+                  n_points: int = ENVELOPE_POINTS) -> np.ndarray:
+    """
+    Build the common grid of an envelope.
+
+    Args:
+        runs_extent: (first, last) axis value of each step
+        x_range: [x0, x1] window, or None to span every step
+        n_points: Number of grid points
+
+    Returns:
+        Uniform grid over the window.
+
+    Raises:
+        ValueError: If there are no steps.
+    """
+    if not runs_extent:
+        raise ValueError("No steps to summarize")
+    if x_range is None:
+        x0, x1 = min(first for first, _ in runs_extent), max(last for _, last in runs_extent)
+    else:
+        x0, x1 = sorted(map(float, x_range))
+    return np.linspace(x0, x1, n_points)
+
+
+def accumulate_envelope(grid: np.ndarray, runs: Iterable[Tuple[np.ndarray, np.ndarray]]) -> StepEnvelope:
+    """
+    Fold steps into an envelope in one pass.
+
+    Args:
+        grid: Common x grid (from envelope_grid())
+        runs: (axis, values) pairs, consumed one at a time
+
+    Returns:
+        StepEnvelope over the grid.
+
+    Raises:
+        ValueError: If a step is complex (AC analysis).
+    """
+    count = np.zeros(len(grid), dtype=np.int64)
+    mean = np.zeros(len(grid))
+    m2 = np.zeros(len(grid))
+    minimum = np.full(len(grid), np.inf)
+    maximum = np.full(len(grid), -np.inf)
+    steps = 0
+
+    for axis, values in runs:
+        if np.iscomplexobj(values):
+            raise ValueError("Envelope needs real time-domain signals")
+        resampled = np.interp(grid, axis, values, left=np.nan, right=np.nan)
+        covered = ~np.isnan(resampled)
+        sample = resampled[covered]
+
+        # Welford update of the covered grid points
+        count[covered] += 1
+        delta = sample - mean[covered]
+        mean[covered] += delta / count[covered]
+        m2[covered] += delta * (sample - mean[covered])
+
+        # fmin/fmax skip the NaNs of uncovered grid points
+        np.fmin(minimum, resampled, out=minimum)
+        np.fmax(maximum, resampled, out=maximum)
+        steps += 1
+
+    empty = count == 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(m2 / count)
+    for array in (mean, std, minimum, maximum):
+        array[empty] = np.nan
+    return StepEnvelope(grid, mean, std, minimum, maximum, count, steps)
@@ -0,0 +1,407 @@
+"""
+Derived-signal expressions for WaveDash application.
+
+This module parses expressions such as ``V(a)-V(b)``, ``V(out)*I(R1)``,
+``d/dt(V(out))`` or ``db(V(out))`` into a DAG of immutable nodes. Equal
+sub-expressions are equal nodes, so they are evaluated once and shared
+through an ExpressionCache.
+
+Evaluation is lazy and vectorized. Runs of element-wise operators are
+evaluated chunk by chunk into one output array, so an expression never
+allocates a full-size temporary per operator. When numexpr is installed,
+those runs are handed to numexpr instead (multi-threaded, also chunked).
+Only operators that need the whole signal (``d/dt``, ``integ``) produce
+intermediate full-size arrays, and those are memoized.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Hashable, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from src.utils.lru import ByteBoundedLRU
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Samples per chunk of element-wise evaluation (small enough for the CPU cache)
+CHUNK_SIZE = 1 << 16
+
+# Memory budget of memoized intermediate results per dataset
+MAX_MEMO_BYTES = 256 * 1024 * 1024
+
+# Bare names that refer to the independent axis
+AXIS_NAMES = ('time', 'frequency', 'x')
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed."""
+
+
+class Node(NamedTuple):
+    """
+    Immutable expression node.
+
+    ``op`` is 'const' (args: value), 'signal' (args: name), 'axis' (no args),
+    an operator ('neg', 'add', 'sub', 'mul', 'div', 'pow') or a function name;
+    operator and function args are child nodes.
+    """
+    op: str
+    args: Tuple
+
+
+def _db(values):
+    with np.errstate(divide='ignore'):
+        return 20 * np.log10(np.abs(values))
+
+
+# Element-wise operators and functions: name -> (arity, NumPy implementation)
+ELEMENTWISE = {
+    'neg': (1, np.negative),
+    'add': (2, np.add),
+    'sub': (2, np.subtract),
+    'mul': (2, np.multiply),
+    'div': (2, np.divide),
+    'pow': (2, np.power),
+    'abs': (1, np.abs),
+    'sqrt': (1, np.sqrt),
+    'exp': (1, np.exp),
+    'ln': (1, np.log),
+    'log': (1, np.log),
+    'log10': (1, np.log10),
+    'sin': (1, np.sin),
+    'cos': (1, np.cos),
+    'tan': (1, np.tan),
+    'db': (1, _db),
+    'min': (2, np.minimum),
+    'max': (2, np.maximum)
+}
+
+# Operators that need the whole signal; aliases map to the canonical name
+WHOLE_SIGNAL = {'deriv': 'deriv', 'd': 'deriv', 'd/dt': 'deriv', 'integ': 'integ', 'idt': 'integ'}
+
+# numexpr spelling of the element-wise operators on real inputs. min and max
+# are left out: comparisons drop NaN (np.minimum propagates it) and older
+# numexpr releases have no minimum/maximum, so they are evaluated chunked
+_NUMEXPR_TEMPLATES = {
+    'neg': '(-{0})', 'add': '({0} + {1})', 'sub': '({0} - {1})', 'mul': '({0} * {1})',
+    'div': '({0} / {1})', 'pow': '({0} ** {1})', 'abs': 'abs({0})', 'sqrt': 'sqrt({0})',
+    'exp': 'exp({0})', 'ln': 'log({0})', 'log': 'log({0})', 'log10': 'log10({0})',
+    'sin': 'sin({0})', 'cos': 'cos({0})', 'tan': 'tan({0})', 'db': '(20 * log10(abs({0})))'
+}
+
+_TOKEN = re.compile(r'\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)'
+                    r'|(?P<ddt>d/dt)(?=\s*\()'
+                    r'|(?P<name>[A-Za-z_][A-Za-z0-9_.:#]*)'
+                    r'|(?P<quoted>"[^"]*")'
+                    r'|(?P<op>\*\*|[-+*/^(),]))')
+
+
+@lru_cache(maxsize=1024)
+def parse_expression(text: str) -> Node:
+    """
+    Parse an expression into its DAG root node.
+
+    Supported syntax: numbers, signal references (``V(out)``, ``I(R1)``,
+    bare names, or any name in double quotes), ``time``/``frequency``,
+    ``+ - * /``, ``^`` or ``**``, parentheses, and the functions abs, sqrt,
+    exp, ln/log, log10, sin, cos, tan, db, min, max, d/dt (or d, deriv) and
+    integ (or idt).
+
+    Args:
+        text: Expression text
+
+    Returns:
+        Root node of the expression.
+
+    Raises:
+        ExpressionError: If the expression is not valid.
+    """
+    parser = _Parser(text)
+    node = parser.parse_sum()
+    if parser.peek() is not None:
+        raise ExpressionError(f"Unexpected '{parser.peek()[1]}' at position {parser.position + 1}")
+    return node
+
+
+def expression_signals(node: Node) -> Set[str]:
+    """
+    Collect the signal names an expression reads.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        Set of referenced signal names.
+    """
+    if node.op == 'signal':
+        return {node.args[0]}
+    if node.op in ('const', 'axis'):
+        return set()
+    return set().union(*(expression_signals(child) for child in node.args))
+
+
+class _Parser:
+    """Recursive-descent parser over the expression text."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.position = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        """Next (kind, token) without consuming it, or None at the end."""
+        if not self.text[self.position:].strip():
+            return None
+        match = _TOKEN.match(self.text, self.position)
+        if match is None:
+            raise ExpressionError(f"Invalid character at position {self.position + 1}")
+        return match.lastgroup, match.group(match.lastgroup)
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise ExpressionError("Unexpected end of expression")
+        self.position = _TOKEN.match(self.text, self.position).end()
+        return token
+
+    def expect(self, op: str) -> None:
+        kind, token = self.take()
+        if token != op:
+            raise ExpressionError(f"Expected '{op}' but found '{token}'")
+
+    def accept(self, *ops: str) -> Optional[str]:
+        token = self.peek()
+        if token is not None and token[0] == 'op' and token[1] in ops:
+            self.take()
+            return token[1]
+        return None
+
+    def parse_sum(self) -> Node:
+        node = self.parse_product()
+        while True:
+            op = self.accept('+', '-')
+            if op is None:
+                return node
+            node = Node('add' if op == '+' else 'sub', (node, self.parse_product()))
+
+    def parse_product(self) -> Node:
+        node = self.parse_unary()
+        while True:
+            op = self.accept('*', '/')
+            if op is None:
+                return node
+            node = Node('mul' if op == '*' else 'div', (node, self.parse_unary()))
+
+    def parse_unary(self) -> Node:
+        op = self.accept('-', '+')
+        if op == '-':
+            return Node('neg', (self.parse_unary(),))
+        if op == '+':
+            return self.parse_unary()
+        return self.parse_power()
+
+    def parse_power(self) -> Node:
+        node = self.parse_atom()
+        if self.accept('^', '**'):
+            # Right-associative, binds tighter than unary minus on the left
+            return Node('pow', (node, self.parse_unary()))
+        return node
+
+    def parse_atom(self) -> Node:
+        kind, token = self.take()
+        if kind == 'number':
+            return Node('const', (float(token),))
+        if kind == 'quoted':
+            return Node('signal', (token[1:-1],))
+        if kind == 'op' and token == '(':
+            node = self.parse_sum()
+            self.expect(')')
+            return node
+        if kind == 'ddt' or (kind == 'name' and self.accept('(')):
+            if kind == 'ddt':
+                self.expect('(')
+            return self.parse_call(token)
+        if kind == 'name':
+            if token.lower() in AXIS_NAMES:
+                return Node('axis', ())
+            return Node('signal', (token,))
+        raise ExpressionError(f"Unexpected '{token}'")
+
+    def parse_call(self, name: str) -> Node:
+        """Parse a function call or a SPICE signal reference after '('."""
+        function = name.lower()
+        if function in WHOLE_SIGNAL:
+            node = Node(WHOLE_SIGNAL[function], (self.parse_sum(),))
+            self.expect(')')
+            return node
+        if function in ELEMENTWISE:
+            args = [self.parse_sum()]
+            while self.accept(','):
+                args.append(self.parse_sum())
+            self.expect(')')
+            arity = ELEMENTWISE[function][0]
+            if len(args) != arity:
+                raise ExpressionError(f"{name}() takes {arity} argument(s), got {len(args)}")
+            return Node(function, tuple(args))
+
+        # Anything else is a signal such as V(out), I(R1) or Ix(U1:OUT):
+        # the name is the raw text up to the matching parenthesis
+        end = self.text.find(')', self.position)
+        if end < 0:
+            raise ExpressionError(f"Missing ')' after '{name}('")
+        signal_name = f"{name}({self.text[self.position:end].strip()})"
+        self.position = end + 1
+        return Node('signal', (signal_name,))
+
+
+class ExpressionCache(ByteBoundedLRU[np.ndarray]):
+    """
+    Bounded LRU memo of evaluated expression nodes.
+
+    Keys are (scope, node) pairs, where the scope identifies the data the
+    node was evaluated on (e.g. the simulation step).
+    """
+
+    def __init__(self, max_bytes: int = MAX_MEMO_BYTES):
+        super().__init__(max_bytes)
+
+
+def evaluate_expression(node: Node, axis: np.ndarray, get_signal: Callable[[str], np.ndarray],
+                        cache: Optional[ExpressionCache] = None, scope: Hashable = None,
+                        chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """
+    Evaluate an expression over one axis.
+
+    Args:
+        node: Expression root from parse_expression()
+        axis: Independent axis array
+        get_signal: Returns the array of a signal name (raises KeyError if missing)
+        cache: Memo for evaluated nodes, or None
+        scope: Memo scope of this axis and its signals (e.g. the step)
+        chunk_size: Samples per chunk of element-wise evaluation
+
+    Returns:
+        Result array with one value per axis sample.
+
+    Raises:
+        KeyError: If the expression reads a missing signal.
+    """
+    return _Evaluator(axis, get_signal, cache, scope, chunk_size).evaluate(node)
+
+
+class _Evaluator:
+    """Evaluates nodes of one (axis, signals) scope with memoization."""
+
+    def __init__(self, axis, get_signal, cache, scope, chunk_size):
+        self.axis = np.asarray(axis)
+        self.get_signal = get_signal
+        self.cache = cache
+        self.scope = scope
+        self.chunk_size = max(1, chunk_size)
+
+    def evaluate(self, node: Node) -> np.ndarray:
+        """Full-length result of a node."""
+        if node.op == 'signal':
+            return self.get_signal(node.args[0])
+        if node.op == 'axis':
+            return self.axis
+        if node.op == 'const':
+            return np.full(len(self.axis), node.args[0])
+
+        cached = self.cache.get((self.scope, node)) if self.cache is not None else None
+        if cached is not None:
+            return cached
+
+        if node.op == 'deriv':
+            result = self._derivative(self.evaluate(node.args[0]))
+        elif node.op == 'integ':
+            result = self._integral(self.evaluate(node.args[0]))
+        elif numexpr is not None:
+            result = self._evaluate_numexpr(node)
+        else:
+            result = self._evaluate_chunked(node)
+
+        if self.cache is not None:
+            self.cache.put((self.scope, node), result)
+        return result
+
+    def _materialized(self, node: Node) -> Optional[np.ndarray]:
+        """Full-length array of a node if it is available without element-wise work."""
+        if node.op in ('signal', 'axis') or node.op in ('deriv', 'integ'):
+            return self.evaluate(node)
+        if self.cache is not None:
+            return self.cache.get((self.scope, node))
+        return None
+
+    def _evaluate_slice(self, node: Node, start: int, stop: int):
+        """Element-wise evaluation of a node on samples [start, stop)."""
+        if node.op == 'const':
+            return node.args[0]
+        values = self._materialized(node)
+        if values is not None:
+            return values[start:stop]
+        args = [self._evaluate_slice(child, start, stop) for child in node.args]
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return ELEMENTWISE[node.op][1](*args)
+
+    def _evaluate_chunked(self, node: Node) -> np.ndarray:
+        n = len(self.axis)
+        result = None
+        for start in range(0, max(n, 1), self.chunk_size):
+            stop = min(start + self.chunk_size, n)
+            part = np.asarray(self._evaluate_slice(node, start, stop))
+            if result is None:
+                result = np.empty(n, dtype=np.result_type(part.dtype, np.float64))
+            result[start:stop] = part
+        return result
+
+    def _evaluate_numexpr(self, node: Node) -> np.ndarray:
+        variables = {}
+
+        def to_source(current: Node) -> str:
+            if current.op == 'const':
+                return repr(current.args[0])
+            values = self._materialized(current)
+            if values is None and current.op not in _NUMEXPR_TEMPLATES:
+                values = self._evaluate_chunked(current)
+            if values is not None:
+                name = f"v{len(variables)}"
+                variables[name] = values
+                return name
+            return _NUMEXPR_TEMPLATES[current.op].format(*(to_source(child) for child in current.args))
+
+        source = to_source(node)
+        # numexpr keeps abs() and db() of complex (AC) data complex
+        if any(np.iscomplexobj(values) for values in variables.values()):
+            return self._evaluate_chunked(node)
+        result = numexpr.evaluate(source, local_dict=variables)
+        return np.broadcast_to(result, self.axis.shape).copy() if result.ndim == 0 else result
+
+    def _derivative(self, values: np.ndarray) -> np.ndarray:
+        """d/dt over the (possibly non-uniform) axis, chunked with a one-sample halo."""
+        n = len(values)
+        if n < 2:
+            return np.zeros(n, dtype=np.result_type(values.dtype, np.float64))
+        result = np.empty(n, dtype=np.result_type(values.dtype, np.float64))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, n, self.chunk_size):
+                stop = min(start + self.chunk_size, n)
+                low, high = max(start - 1, 0), min(stop + 1, n)
+                gradient = np.gradient(values[low:high], self.axis[low:high])
+                result[start:stop] = gradient[start - low:start - low + stop - start]
+        return result
+
+    def _integral(self, values: np.ndarray) -> np.ndarray:
+        """Running trapezoidal integral from the start of the axis, chunked with a carry."""
+        n = len(values)
+        result = np.zeros(n, dtype=np.result_type(values.dtype, np.float64))
+        total = 0.0
+        for start in range(1, n, self.chunk_size):
+            stop = min(start + self.chunk_size, n)
+            areas = (values[start:stop] + values[start - 1:stop - 1]) * np.diff(self.axis[start - 1:stop]) / 2
+            result[start:stop] = np.cumsum(areas) + total
+            total = result[stop - 1]
+        return result
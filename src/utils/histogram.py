@@ -0,0 +1,141 @@
+"""
+Amplitude histogram utilities for WaveDash application.
+
+This module bins the values of a signal over a time window into a
+histogram and cumulative distribution. SPICE timesteps are adaptive, so
+each sample is weighted by the time it stands for (its trapezoidal weight:
+half of each adjacent interval) and the histogram reads as the fraction of
+time spent at each value. The window is streamed in chunks with
+``np.bincount``, so memory stays constant for memory-mapped records of any
+length.
+"""
+
+import numpy as np
+from typing import Optional, Sequence
+
+from src.utils.integration import trapezoid_weights
+
+# Default number of value bins
+DEFAULT_HISTOGRAM_BINS = 200
+
+# Samples per chunk of the streaming pass
+HISTOGRAM_CHUNK_SIZE = 1 << 18
+
+
+class ValueHistogram:
+    """
+    Time-weighted histogram of one signal over one window.
+
+    Attributes:
+        edges: Bin edges (bins + 1 values)
+        time: Time spent in each bin
+        duration: Total time of the window
+        mean: Time-weighted mean
+        std: Time-weighted standard deviation
+        minimum: Smallest value in the window
+        maximum: Largest value in the window
+    """
+
+    def __init__(self, edges: np.ndarray, time: np.ndarray, duration: float, mean: float, std: float,
+                 minimum: float, maximum: float):
+        self.edges = edges
+        self.time = time
+        self.duration = duration
+        self.mean = mean
+        self.std = std
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the histogram arrays."""
+        return self.edges.nbytes + self.time.nbytes
+
+    @property
+    def centers(self) -> np.ndarray:
+        """Bin centers."""
+        return (self.edges[:-1] + self.edges[1:]) / 2
+
+    @property
+    def fraction(self) -> np.ndarray:
+        """Fraction of the window's time spent in each bin."""
+        return self.time / self.duration if self.duration > 0 else self.time
+
+    @property
+    def cdf(self) -> np.ndarray:
+        """Fraction of time at or below each bin's upper edge."""
+        return np.cumsum(self.fraction)
+
+
+def compute_histogram(axis: np.ndarray, values: np.ndarray, x_range: Optional[Sequence[float]] = None,
+                      bins: int = DEFAULT_HISTOGRAM_BINS,
+                      chunk_size: int = HISTOGRAM_CHUNK_SIZE) -> ValueHistogram:
+    """
+    Compute the time-weighted value histogram of a signal in a time window.
+
+    The bins span the window's value range; a flat signal gets one bin
+    around its value.
+
+    Args:
+        axis: Sorted time axis
+        values: Real signal array on the axis (may be memory-mapped)
+        x_range: [t0, t1] time window, or None for the full axis
+        bins: Number of value bins
+        chunk_size: Samples per chunk of the streaming pass
+
+    Returns:
+        ValueHistogram of the window.
+
+    Raises:
+        ValueError: If the signal is complex (AC analysis) or the window
+            holds no samples.
+    """
+    if np.iscomplexobj(values):
+        raise ValueError("Histogram needs a real time-domain signal")
+
+    start, stop = 0, len(axis)
+    if x_range is not None:
+        t0, t1 = sorted(map(float, x_range))
+        start = int(np.searchsorted(axis, t0, side='left'))
+        stop = int(np.searchsorted(axis, t1, side='right'))
+    if stop <= start:
+        raise ValueError("No data in the selected window")
+
+    # Reductions over a slice read the samples once without copying them
+    minimum, maximum = float(np.min(values[start:stop])), float(np.max(values[start:stop]))
+    if maximum > minimum:
+        edges = np.linspace(minimum, maximum, bins + 1)
+    else:
+        edges = np.array([minimum - 0.5, minimum + 0.5]) if minimum == 0 else \
+            minimum + abs(minimum) * np.array([-1e-3, 1e-3])
+    scale = (len(edges) - 1) / (edges[-1] - edges[0])
+
+    # Moments are taken about the mid-range, so the variance does not cancel
+    center = (minimum + maximum) / 2
+    time = np.zeros(len(edges) - 1)
+    first_moment = second_moment = 0.0
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        chunk = np.asarray(values[chunk_start:chunk_stop], dtype=np.float64)
+        weights = trapezoid_weights(axis, chunk_start, chunk_stop, start, stop)
+
+        index = ((chunk - edges[0]) * scale).astype(np.intp)
+        np.clip(index, 0, len(time) - 1, out=index)
+        time += np.bincount(index, weights=weights, minlength=len(time))
+
+        deviation = chunk - center
+        first_moment += float(np.dot(deviation, weights))
+        second_moment += float(np.dot(deviation * deviation, weights))
+
+    duration = float(axis[stop - 1] - axis[start])
+    if duration > 0:
+        offset = first_moment / duration
+        mean = center + offset
+        std = float(np.sqrt(max(second_moment / duration - offset * offset, 0.0)))
+    else:
+        # A single sample: all of the (zero) time is at its value
+        time[min(int((minimum - edges[0]) * scale), len(time) - 1)] = 1.0
+        mean, std = minimum, 0.0
+
+    return ValueHistogram(edges, time, duration, mean, std, minimum, maximum)
+
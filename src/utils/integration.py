@@ -0,0 +1,59 @@
+"""
+Trapezoid-rule integration utilities for WaveDash application.
+
+SPICE transient timesteps are adaptive, so time averages, RMS values and
+energies weight each sample by the time it stands for rather than counting
+samples. These helpers hold the trapezoid rule in one place: per-sample
+weights (also for one chunk of a streamed window) and the running integral.
+"""
+
+import numpy as np
+from typing import Optional
+
+
+def trapezoid_weights(axis: np.ndarray, chunk_start: int = 0, chunk_stop: Optional[int] = None,
+                      start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+    """
+    Compute the trapezoid-rule weights of samples chunk_start..chunk_stop of
+    the window start..stop.
+
+    Each sample owns half of the interval on either side of it inside the
+    window, so ``values @ weights`` integrates the chunk's share and the
+    weights of consecutive chunks add up to those of the whole window.
+
+    Args:
+        axis: Sorted axis array
+        chunk_start: First sample of the chunk
+        chunk_stop: End of the chunk (defaults to stop)
+        start: First sample of the window
+        stop: End of the window (defaults to len(axis))
+
+    Returns:
+        Array of chunk_stop - chunk_start weights.
+    """
+    stop = len(axis) if stop is None else stop
+    chunk_stop = stop if chunk_stop is None else chunk_stop
+    lo, hi = max(chunk_start - 1, start), min(chunk_stop + 1, stop)
+    intervals = np.diff(np.asarray(axis[lo:hi], dtype=np.float64))
+
+    # padded[j] is the interval before sample lo + j and padded[j + 1] the one after
+    padded = np.concatenate(([0.0], intervals, [0.0]))
+    offset, n = chunk_start - lo, chunk_stop - chunk_start
+    return (padded[offset:offset + n] + padded[offset + 1:offset + n + 1]) / 2
+
+
+def cumulative_trapezoid(axis: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Integrate signals from the start of the axis (cumulative trapezoid rule).
+
+    Args:
+        axis: Sorted axis array
+        values: Array whose last dimension runs along the axis
+
+    Returns:
+        Array of the same shape with the integral since axis[0].
+    """
+    integral = np.zeros(values.shape)
+    if values.shape[-1] > 1:
+        np.cumsum((values[..., 1:] + values[..., :-1]) * (np.diff(axis) / 2), axis=-1, out=integral[..., 1:])
+    return integral
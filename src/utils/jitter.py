@@ -0,0 +1,230 @@
+"""
+Period and jitter analysis for WaveDash application.
+
+Cycle-by-cycle quantities of a clock or oscillator come from the edges of
+its EdgeIndex: the period is the time between consecutive edges of one
+direction, the duty cycle places the opposite edge inside each cycle with
+``searchsorted``, and the time interval error (TIE) is each edge's offset
+from an ideal clock fitted to all edges by least squares. Every step is
+handled with whole-array operations, so millions of cycles cost a few
+array passes and only the steps are looped over.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+# Summary statistics of an analysis: (key, header label)
+JITTER_COLUMNS = [
+    ('cycles', "Cycles"),
+    ('mean_period', "Period"),
+    ('frequency', "Frequency"),
+    ('period_jitter_rms', "Period RMS"),
+    ('period_jitter_pp', "Period p-p"),
+    ('cycle_jitter_rms', "C2C RMS"),
+    ('cycle_jitter_pp', "C2C p-p"),
+    ('tie_rms', "TIE RMS"),
+    ('tie_pp', "TIE p-p"),
+    ('mean_duty', "Duty")
+]
+
+# Per-cycle arrays of an analysis
+CYCLE_ARRAYS = ('start', 'period', 'duty', 'tie', 'cycle_jitter')
+
+# Number of bins of the period histogram
+JITTER_HISTOGRAM_BINS = 100
+
+# Cycles start on this edge direction unless told otherwise
+DEFAULT_CYCLE_EDGE = 'rise'
+
+
+def cycle_arrays(rising: np.ndarray, falling: np.ndarray, edge: str = DEFAULT_CYCLE_EDGE) -> Dict[str, np.ndarray]:
+    """
+    Derive the per-cycle arrays of one run from its edge times.
+
+    A cycle runs from one edge of the chosen direction to the next. Its
+    duty cycle is the fraction spent high, taken from the first opposite
+    edge inside the cycle; cycles without one get NaN.
+
+    Args:
+        rising: Sorted rising edge times
+        falling: Sorted falling edge times
+        edge: 'rise' or 'fall': the edge that starts a cycle
+
+    Returns:
+        Dictionary of float64 arrays with one value per cycle: 'start',
+        'period', 'duty', 'tie' (the starting edge's time interval error)
+        and 'cycle_jitter' (the period minus the previous period, NaN for
+        the first cycle).
+    """
+    starts, opposite = (rising, falling) if edge == 'rise' else (falling, rising)
+    starts = np.asarray(starts, dtype=np.float64)
+    opposite = np.asarray(opposite, dtype=np.float64)
+    if len(starts) < 2:
+        return {name: np.empty(0) for name in CYCLE_ARRAYS}
+
+    period = np.diff(starts)
+    start = starts[:-1]
+
+    # First opposite edge after each cycle start, if it falls inside the cycle
+    position = np.searchsorted(opposite, start, side='right')
+    inside = position < len(opposite)
+    inside[inside] = opposite[position[inside]] < starts[1:][inside]
+    first_part = np.full(len(start), np.nan)
+    first_part[inside] = opposite[position[inside]] - start[inside]
+    duty = first_part / period if edge == 'rise' else 1.0 - first_part / period
+
+    cycle_jitter = np.empty(len(period))
+    cycle_jitter[0] = np.nan
+    cycle_jitter[1:] = np.diff(period)
+
+    return {
+        'start': start,
+        'period': period,
+        'duty': duty,
+        'tie': time_interval_error(starts)[:-1],
+        'cycle_jitter': cycle_jitter
+    }
+
+
+def time_interval_error(edge_times: np.ndarray) -> np.ndarray:
+    """
+    Offset of each edge from the least-squares ideal clock through all edges.
+
+    Args:
+        edge_times: Sorted times of consecutive edges of one direction
+
+    Returns:
+        TIE of every edge (float64, zero-mean).
+    """
+    edge_times = np.asarray(edge_times, dtype=np.float64)
+    if len(edge_times) < 2:
+        return np.zeros(len(edge_times))
+
+    # Centered fit of time against cycle number keeps the sums well-conditioned
+    cycle = np.arange(len(edge_times), dtype=np.float64)
+    cycle -= cycle.mean()
+    centered = edge_times - edge_times.mean()
+    ideal_period = np.dot(cycle, centered) / np.dot(cycle, cycle)
+    return centered - ideal_period * cycle
+
+
+def jitter_statistics(cycles: Dict[str, np.ndarray]) -> Dict[str, Optional[float]]:
+    """
+    Summarize per-cycle arrays.
+
+    Args:
+        cycles: Per-cycle arrays (from cycle_arrays(), or several runs'
+            arrays concatenated)
+
+    Returns:
+        Dictionary with a value per JITTER_COLUMNS key; None where there
+        are too few cycles.
+    """
+    period = cycles['period']
+    if not len(period):
+        return {'cycles': 0, **{key: None for key, _ in JITTER_COLUMNS[1:]}}
+
+    mean_period = float(period.mean())
+    cycle_jitter = cycles['cycle_jitter'][~np.isnan(cycles['cycle_jitter'])]
+    duty = cycles['duty'][~np.isnan(cycles['duty'])]
+    tie = cycles['tie']
+    return {
+        'cycles': int(len(period)),
+        'mean_period': mean_period,
+        'frequency': 1.0 / mean_period if mean_period > 0 else None,
+        'period_jitter_rms': float(period.std()),
+        'period_jitter_pp': float(period.max() - period.min()),
+        'cycle_jitter_rms': float(np.sqrt(np.mean(cycle_jitter ** 2))) if len(cycle_jitter) else None,
+        'cycle_jitter_pp': float(cycle_jitter.max() - cycle_jitter.min()) if len(cycle_jitter) else None,
+        'tie_rms': float(np.sqrt(np.mean(tie ** 2))),
+        'tie_pp': float(tie.max() - tie.min()),
+        'mean_duty': float(duty.mean()) if len(duty) else None
+    }
+
+
+def concatenate_cycles(runs: Sequence[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatenate the per-cycle arrays of several runs."""
+    return {name: np.concatenate([run[name] for run in runs]) if runs else np.empty(0)
+            for name in CYCLE_ARRAYS}
+
+
+def default_threshold(dataset: Any, signal_name: str) -> float:
+    """
+    Get the mid-level threshold of a signal: halfway between its extremes over all steps.
+
+    Args:
+        dataset: Dataset holding the signal
+        signal_name: Signal to analyze
+
+    Returns:
+        Threshold level.
+    """
+    levels = [(float(np.min(values)), float(np.max(values))) for _, values in dataset.get_runs(signal_name)]
+    return (min(low for low, _ in levels) + max(high for _, high in levels)) / 2
+
+
+def analyze_jitter(dataset: Any, signal_name: str, threshold: Optional[float] = None,
+                   hysteresis: float = 0.0, edge: str = DEFAULT_CYCLE_EDGE) -> Dict[str, Any]:
+    """
+    Analyze the periods, duty cycle and jitter of a signal in every step.
+
+    Edges come from the dataset's cached edge index, so changing the view
+    or analyzing again with the same threshold does not rescan samples.
+
+    Args:
+        dataset: Dataset holding the signal
+        signal_name: Signal to analyze
+        threshold: Threshold level, or None for default_threshold()
+        hysteresis: Width of the hysteresis band around the threshold
+        edge: 'rise' or 'fall': the edge that starts a cycle
+
+    Returns:
+        Dictionary containing:
+        - 'threshold': Threshold used
+        - 'steps': Step numbers with the signal, in order
+        - 'cycles': Per-cycle arrays of each step (same order)
+        - 'rows': One statistics row per step, with a 'step' key
+        - 'total': Statistics of all steps together
+
+    Raises:
+        KeyError: If the signal does not exist.
+    """
+    steps = [step for step in dataset.steps if dataset.has_signal(signal_name, step)]
+    if not steps:
+        raise KeyError(f"Signal not found: {signal_name}")
+    if threshold is None:
+        threshold = default_threshold(dataset, signal_name)
+
+    cycles: List[Dict[str, np.ndarray]] = []
+    rows = []
+    for step in steps:
+        edges = dataset.get_edges(signal_name, threshold, hysteresis, step)
+        run = cycle_arrays(edges.edge_times('rise'), edges.edge_times('fall'), edge)
+        cycles.append(run)
+        rows.append({'step': step, **jitter_statistics(run)})
+
+    return {
+        'threshold': threshold,
+        'steps': steps,
+        'cycles': cycles,
+        'rows': rows,
+        'total': jitter_statistics(concatenate_cycles(cycles))
+    }
+
+
+def period_histogram(period: np.ndarray, bins: int = JITTER_HISTOGRAM_BINS) -> Dict[str, np.ndarray]:
+    """
+    Bin cycle periods for the histogram view.
+
+    Args:
+        period: Periods of any number of cycles
+        bins: Number of bins
+
+    Returns:
+        Dictionary with 'counts' and bin 'centers' (empty without cycles).
+    """
+    if not len(period):
+        return {'counts': np.empty(0, dtype=np.int64), 'centers': np.empty(0)}
+
+    counts, edges = np.histogram(period, bins=bins)
+    return {'counts': counts, 'centers': (edges[:-1] + edges[1:]) / 2}
@@ -0,0 +1,121 @@
+"""
+Byte-bounded LRU cache for WaveDash application.
+
+Per-dataset memos (derived-signal arrays, edge indexes, value histograms,
+cross-step envelopes) and the process-wide figure and spectrum caches are
+bounded by the memory their values use. ByteBoundedLRU holds any value
+exposing ``nbytes`` and evicts least recently used entries once the total
+exceeds its bound (or, optionally, once there are too many entries).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Protocol, TypeVar
+
+
+class SizedValue(Protocol):
+    """Any value reporting its memory use (NumPy arrays, EdgeIndex, ...)."""
+
+    @property
+    def nbytes(self) -> int:
+        ...
+
+
+V = TypeVar('V', bound=SizedValue)
+
+
+class ByteBoundedLRU(Generic[V]):
+    """
+    Thread-safe LRU cache bounded by the total ``nbytes`` of its values.
+
+    Values larger than the bound are not cached. Hit, miss and eviction
+    counters are kept for reporting.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, V]' = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Look up a value and mark it as recently used (None on a miss)."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting least recently used entries over the bounds."""
+        if value.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = value
+            self._bytes += value.nbytes
+            while self._bytes > self.max_bytes or (self.max_entries is not None
+                                                   and len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._evictions += 1
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Drop every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; True drops the entry
+
+        Returns:
+            Number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).nbytes
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report cache usage.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, evictions, entries and bytes.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.0,
+                'evictions': self._evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the cached values."""
+        return self._bytes
@@ -0,0 +1,251 @@
+"""
+Waveform measurement utilities for WaveDash application.
+
+This module computes SPICE ``.meas``-style quantities (extrema, average,
+RMS, period, duty cycle, rise/fall time, overshoot and settling time) for
+many signals at once. Signals are processed in 2-D blocks; the 10%/90%
+crossings of rise and fall times are found from sign changes of
+``y - level`` over the whole block and located by linear interpolation, so
+there are no per-sample Python loops. Period, frequency and duty cycle
+come from the mid-level EdgeIndex of each signal, which datasets cache and
+share with the other timing features.
+"""
+
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.edges import EdgeIndex
+from src.utils.integration import trapezoid_weights
+
+# Quantities reported for every signal, in display order
+MEASUREMENTS = ('min', 'max', 'pp', 'avg', 'rms', 'period', 'frequency',
+                'duty', 'rise', 'fall', 'overshoot', 'settling')
+
+# Reference levels as fractions of each signal's min..max range
+LOW_LEVEL = 0.1
+MID_LEVEL = 0.5
+HIGH_LEVEL = 0.9
+
+# Settling band, relative to the step size
+DEFAULT_SETTLING_TOLERANCE = 0.02
+
+# Steps smaller than this fraction of the range are not step responses
+MIN_STEP_FRACTION = 0.1
+
+# Memory budget of one block of signals
+BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def find_crossings(x: np.ndarray, y: np.ndarray, level: float,
+                   direction: str = 'both') -> np.ndarray:
+    """
+    Find the times at which a signal crosses a level.
+
+    Args:
+        x: Sorted axis array
+        y: Signal array on the axis
+        level: Threshold level
+        direction: 'rise', 'fall' or 'both'
+
+    Returns:
+        Sorted array of linearly interpolated crossing times.
+    """
+    return EdgeIndex.build(x, y, level).edge_times(direction)
+
+
+def measure_waves(axis: np.ndarray, waves: Dict[str, np.ndarray],
+                  tolerance: float = DEFAULT_SETTLING_TOLERANCE,
+                  get_edges: Optional[Callable[[str, float], EdgeIndex]] = None
+                  ) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Measure every signal on a shared axis.
+
+    Args:
+        axis: Sorted axis array
+        waves: Mapping of signal name to array on the axis
+        tolerance: Settling band relative to the step size
+        get_edges: Returns the EdgeIndex of a signal through a level (e.g.
+            a dataset's cached get_edges()); by default it is built from
+            the wave
+
+    Returns:
+        Mapping of signal name to {quantity: value}, None where a quantity
+        does not apply (e.g. no period for a non-periodic signal).
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    names = list(waves.keys())
+    if len(axis) < 2:
+        return {name: dict.fromkeys(MEASUREMENTS) for name in names}
+
+    if get_edges is None:
+        def get_edges(name, level):
+            return EdgeIndex.build(axis, waves[name], level)
+
+    block_size = max(1, BLOCK_BYTES // (len(axis) * 8))
+    results = {}
+    for start in range(0, len(names), block_size):
+        block_names = names[start:start + block_size]
+        block = np.vstack([np.asarray(waves[name], dtype=np.float64) for name in block_names])
+        results.update(zip(block_names, _measure_block(axis, block, block_names, tolerance, get_edges)))
+
+    return results
+
+
+def measure_dataset(dataset: Any, signal_names: Sequence[str],
+                    steps: Optional[Sequence[int]] = None,
+                    tolerance: float = DEFAULT_SETTLING_TOLERANCE) -> List[Dict[str, Any]]:
+    """
+    Measure signals of a dataset for every requested step.
+
+    Args:
+        dataset: Dataset providing steps, get_axis(), get_wave() and
+            get_edges()
+        signal_names: Signals to measure (missing ones are skipped)
+        steps: Steps to measure (defaults to all steps)
+        tolerance: Settling band relative to the step size
+
+    Returns:
+        List of rows {'signal', 'step', <quantity>: value} in step, then
+        signal order.
+    """
+    rows = []
+    for step in (dataset.steps if steps is None else steps):
+        axis = dataset.get_axis(step)
+        waves = {}
+        for name in signal_names:
+            try:
+                waves[name] = dataset.get_wave(name, step)
+            except KeyError:
+                continue
+        def get_edges(name, level):
+            return dataset.get_edges(name, level, step=step)
+
+        for name, values in measure_waves(axis, waves, tolerance, get_edges).items():
+            rows.append({'signal': name, 'step': step, **values})
+    return rows
+
+
+def _block_crossings(x: np.ndarray, block: np.ndarray,
+                     levels: np.ndarray) -> Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Find rising and falling crossings of per-row levels in a block.
+
+    Returns:
+        ((rise rows, rise times), (fall rows, fall times)), sorted by row
+        and then by time.
+    """
+    above = (block >= levels[:, np.newaxis]).view(np.int8)
+    edges = np.diff(above, axis=1)
+    flat = np.flatnonzero(edges)
+    rows, cols = np.divmod(flat, edges.shape[1])
+    rising = edges.ravel()[flat] > 0
+
+    y0 = block[rows, cols]
+    y1 = block[rows, cols + 1]
+    times = x[cols] + (levels[rows] - y0) / (y1 - y0) * (x[cols + 1] - x[cols])
+    return (rows[rising], times[rising]), (rows[~rising], times[~rising])
+
+
+def _row_slices(rows: np.ndarray, n_rows: int) -> np.ndarray:
+    """Boundaries of each row's entries in a row-sorted array."""
+    return np.searchsorted(rows, np.arange(n_rows + 1))
+
+
+def _mean_or_nan(values: np.ndarray) -> float:
+    return float(values.mean()) if values.size else np.nan
+
+
+def _measure_block(axis: np.ndarray, block: np.ndarray, names: Sequence[str], tolerance: float,
+                   get_edges: Callable[[str, float], EdgeIndex]) -> List[Dict[str, Optional[float]]]:
+    """Measure every row of a (signals x samples) block; names are the rows' signals."""
+    n_rows, n = block.shape
+    y_min = block.min(axis=1)
+    y_max = block.max(axis=1)
+    span = y_max - y_min
+
+    # Time-weighted average and RMS (adaptive time steps are not uniform);
+    # the trapezoid rule as one matrix-vector product per block
+    duration = axis[-1] - axis[0]
+    if duration > 0:
+        weights = trapezoid_weights(axis)
+        avg = block @ weights / duration
+        rms = np.sqrt(np.maximum((block * block) @ weights / duration, 0.0))
+    else:
+        avg = block.mean(axis=1)
+        rms = np.sqrt((block * block).mean(axis=1))
+
+    crossings = {
+        fraction: _block_crossings(axis, block, y_min + fraction * span)
+        for fraction in (LOW_LEVEL, HIGH_LEVEL)
+    }
+    mid_level = y_min + MID_LEVEL * span
+
+    # Step response: overshoot and settling relative to the first and last values
+    initial = block[:, 0]
+    final = block[:, -1]
+    step = final - initial
+    is_step = np.abs(step) > MIN_STEP_FRACTION * span
+    with np.errstate(divide='ignore', invalid='ignore'):
+        overshoot = np.where(step > 0, (y_max - final) / step, (final - y_min) / -step) * 100
+    outside = np.abs(block - final[:, np.newaxis]) > (tolerance * np.abs(step))[:, np.newaxis]
+    last_outside = n - 1 - np.argmax(outside[:, ::-1], axis=1)
+    settling = np.where(outside.any(axis=1), axis[np.minimum(last_outside + 1, n - 1)], axis[0])
+    overshoot = np.where(is_step, overshoot, np.nan)
+    settling = np.where(is_step, settling, np.nan)
+
+    # Edge pairing needs only each row's (few) crossings
+    (low_rise_rows, low_rise), (low_fall_rows, low_fall) = crossings[LOW_LEVEL]
+    (high_rise_rows, high_rise), (high_fall_rows, high_fall) = crossings[HIGH_LEVEL]
+    slices = {
+        name: _row_slices(rows, n_rows)
+        for name, rows in (('low_rise', low_rise_rows), ('low_fall', low_fall_rows),
+                           ('high_rise', high_rise_rows), ('high_fall', high_fall_rows))
+    }
+
+    results = []
+    for row in range(n_rows):
+        def row_times(name, times):
+            return times[slices[name][row]:slices[name][row + 1]]
+
+        # Rise: each high crossing paired with the last low crossing before it
+        lows, highs = row_times('low_rise', low_rise), row_times('high_rise', high_rise)
+        index = np.searchsorted(lows, highs, side='right') - 1
+        rise = _mean_or_nan(highs[index >= 0] - lows[index[index >= 0]])
+
+        # Fall: each low crossing paired with the last high crossing before it
+        highs, lows = row_times('high_fall', high_fall), row_times('low_fall', low_fall)
+        index = np.searchsorted(highs, lows, side='right') - 1
+        fall = _mean_or_nan(lows[index >= 0] - highs[index[index >= 0]])
+
+        # Period: mean spacing of mid-level rising edges
+        edges = get_edges(names[row], float(mid_level[row]))
+        rises, falls = edges.edge_times('rise'), edges.edge_times('fall')
+        period = (rises[-1] - rises[0]) / (len(rises) - 1) if len(rises) > 1 else np.nan
+
+        # Duty: high time of each complete cycle over its length
+        duty = np.nan
+        if len(rises) > 1 and len(falls):
+            index = np.searchsorted(falls, rises[:-1])
+            valid = index < len(falls)
+            valid[valid] &= falls[index[valid]] < rises[1:][valid]
+            high_time = falls[index[valid]] - rises[:-1][valid]
+            duty = _mean_or_nan(high_time / np.diff(rises)[valid]) * 100
+
+        values = {
+            'min': y_min[row],
+            'max': y_max[row],
+            'pp': span[row],
+            'avg': avg[row],
+            'rms': rms[row],
+            'period': period,
+            'frequency': 1.0 / period if period > 0 else np.nan,
+            'duty': duty,
+            'rise': rise,
+            'fall': fall,
+            'overshoot': overshoot[row],
+            'settling': settling[row]
+        }
+        results.append({name: float(value) if np.isfinite(value) else None
+                        for name, value in values.items()})
+
+    return results
@@ -0,0 +1,110 @@
+"""
+Plot payload encoding utilities for WaveDash application.
+
+This module converts NumPy arrays into Plotly's base64 typed-array format
+(``{'dtype': 'f4', 'bdata': ...}``) so trace data is shipped to the browser
+as raw binary instead of JSON number lists.
+"""
+
+import base64
+import numpy as np
+from typing import Dict, Any, Sequence, Union
+
+# Largest magnitude representable as float32
+FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+# Max float32 rounding error for signal values, relative to the signal span
+FLOAT32_VALUE_TOLERANCE = 1e-5
+
+# Max float32 rounding error for axis values, relative to the smallest step
+FLOAT32_AXIS_TOLERANCE = 0.1
+
+
+def can_use_float32(values: np.ndarray, is_axis: bool = False) -> bool:
+    """
+    Check whether an array survives conversion to float32 without visible loss.
+
+    Signal values are allowed to round by a small fraction of their span.
+    Axis values must round by well under their smallest step so that sample
+    order and spacing are preserved (adaptive SPICE timesteps on long
+    transients usually need float64).
+
+    Args:
+        values: Array of float values
+        is_axis: Whether the array is an independent (x) axis
+
+    Returns:
+        True if float32 is precise enough for plotting these values.
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return True
+
+    if np.abs(finite).max() > FLOAT32_MAX:
+        return False
+
+    error = np.abs(finite.astype(np.float32).astype(np.float64) - finite).max()
+    if error == 0:
+        return True
+
+    if is_axis:
+        steps = np.diff(finite)
+        steps = steps[steps > 0]
+        if steps.size == 0:
+            return False
+        return error <= FLOAT32_AXIS_TOLERANCE * steps.min()
+
+    span = finite.max() - finite.min()
+    return error <= FLOAT32_VALUE_TOLERANCE * span
+
+
+def encode_typed_array(values: Union[np.ndarray, Sequence[float]], is_axis: bool = False,
+                       allow_float32: bool = True) -> Dict[str, str]:
+    """
+    Encode an array as a Plotly base64 typed array.
+
+    2-D arrays (e.g. heatmap z) are encoded row-major with a 'shape' entry.
+
+    Args:
+        values: Array or sequence of float values
+        is_axis: Whether the array is an independent (x) axis
+        allow_float32: Whether float32 may be used when precise enough
+
+    Returns:
+        Dictionary with 'dtype' ('f4' or 'f8'), base64 'bdata' and, for
+        2-D arrays, 'shape'.
+    """
+    array = np.asarray(values, dtype=np.float64)
+
+    if allow_float32 and can_use_float32(array, is_axis):
+        dtype = 'f4'
+    else:
+        dtype = 'f8'
+
+    # Typed arrays are little-endian and must be contiguous
+    buffer = np.ascontiguousarray(array, dtype=f'<{dtype}')
+
+    spec = {
+        'dtype': dtype,
+        'bdata': base64.b64encode(buffer.data).decode('ascii')
+    }
+    if array.ndim > 1:
+        spec['shape'] = ', '.join(str(size) for size in array.shape)
+
+    return spec
+
+
+def decode_typed_array(spec: Dict[str, Any]) -> np.ndarray:
+    """
+    Decode a Plotly base64 typed array back into a NumPy array.
+
+    Args:
+        spec: Dictionary with 'dtype' and base64 'bdata'
+
+    Returns:
+        Decoded array (2-D when the spec has a 'shape').
+    """
+    array = np.frombuffer(base64.b64decode(spec['bdata']), dtype=f"<{spec['dtype']}")
+    if 'shape' in spec:
+        array = array.reshape([int(size) for size in spec['shape'].split(',')])
+    return array
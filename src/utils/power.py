@@ -0,0 +1,337 @@
+"""
+Device power and energy accounting for WaveDash application.
+
+A .raw file holds device currents (``I(R1)``, ``Id(M1)``, ``Ix(x1:PIN)``)
+and node voltages but not which node each terminal connects to, so the
+pairing comes from the circuit's SPICE netlist. The power absorbed by a
+device is the sum over its terminals of the terminal voltage times the
+current into the terminal; by KCL any one terminal can serve as the
+voltage reference, which also covers devices with one terminal current
+missing from the file.
+
+Every device is computed in one batched pass: the terminal currents and
+node voltages are stacked into 2-D arrays, the per-terminal products are
+summed per device with ``np.add.reduceat``, and energy comes from a
+cumulative trapezoid integral evaluated at the window ends.
+"""
+
+import re
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.integration import cumulative_trapezoid
+from src.utils.waveform_diff import interpolate_block, interpolation_plan
+
+# Columns of the power table: (result key, header label)
+POWER_COLUMNS = [
+    ('energy', "Energy"),
+    ('average_power', "Avg Power"),
+    ('peak_power', "Peak Power"),
+    ('min_power', "Min Power")
+]
+
+# Node names of the reference node
+GROUND_NODES = {'0', 'gnd', 'gnd!'}
+
+# Terminal order of semiconductor devices and their LTspice current prefixes
+DEVICE_TERMINALS = {
+    'M': ('d', 'g', 's', 'b'),
+    'Q': ('c', 'b', 'e', 's'),
+    'J': ('d', 'g', 's'),
+    'Z': ('d', 'g', 's')
+}
+
+# Memory budget of one block of devices
+POWER_BLOCK_BYTES = 64 * 1024 * 1024
+
+_CURRENT_SIGNAL = re.compile(r'^I([a-z]?)\((.+)\)$', re.IGNORECASE)
+
+
+def parse_netlist(text: str) -> Dict[str, Dict[str, str]]:
+    """
+    Read the terminal connections of the top-level devices of a SPICE netlist.
+
+    Args:
+        text: Netlist text (e.g. LTspice's .net file)
+
+    Returns:
+        Mapping of upper-case device name to {terminal: node}. Terminals
+        are '+'/'-' for two-terminal elements, the lower-case terminal
+        letters of DEVICE_TERMINALS for semiconductors and the upper-case
+        pin names for subcircuit instances.
+    """
+    lines: List[str] = []
+    for line in text.splitlines():
+        line = re.split(r';|\s\$\s', line, maxsplit=1)[0].strip()
+        if not line or line.startswith('*'):
+            continue
+        if line.startswith('+') and lines:
+            lines[-1] += ' ' + line[1:]
+        else:
+            lines.append(line)
+
+    subckt_pins: Dict[str, List[str]] = {}
+    elements: List[List[str]] = []
+    depth = 0
+    for line in lines:
+        tokens = line.split()
+        keyword = tokens[0].lower()
+        if keyword == '.subckt':
+            subckt_pins[tokens[1].upper()] = _node_tokens(tokens[2:])
+            depth += 1
+        elif keyword == '.ends':
+            depth = max(depth - 1, 0)
+        elif depth == 0 and not keyword.startswith('.'):
+            elements.append(tokens)
+
+    connections = {}
+    for tokens in elements:
+        name, kind = tokens[0].upper(), tokens[0][0].upper()
+        if kind == 'X':
+            nodes = _node_tokens(tokens[1:])
+            if len(nodes) < 2:
+                continue
+            pins = subckt_pins.get(nodes[-1].upper())
+            nodes = nodes[:-1]
+            if pins is None or len(pins) != len(nodes):
+                pins = [str(position + 1) for position in range(len(nodes))]
+            connections[name] = {pin.upper(): node for pin, node in zip(pins, nodes)}
+        elif kind in DEVICE_TERMINALS:
+            terminals = DEVICE_TERMINALS[kind]
+            nodes = tokens[1:1 + len(terminals)]
+            connections[name] = dict(zip(terminals, nodes))
+        elif len(tokens) >= 3:
+            connections[name] = {'+': tokens[1], '-': tokens[2]}
+    return connections
+
+
+def pair_device_terminals(signal_names: Sequence[str],
+                          connections: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, List[Tuple[str, Optional[str], Optional[str]]]]:
+    """
+    Pair device currents with the voltages of the nodes they flow between.
+
+    Without a netlist only subcircuit pins named like an existing node are
+    paired.
+
+    Args:
+        signal_names: Signal names of the dataset
+        connections: Result of parse_netlist(), or None
+
+    Returns:
+        Mapping of device name to terms (current signal, node voltage
+        signal, reference node voltage signal); None stands for ground. The
+        device's power is the sum of (V(node) - V(reference)) * current
+        over its terms. Devices with unknown nodes, missing node voltages
+        or more than one missing terminal current are left out.
+    """
+    connections = connections or {}
+    voltages = _voltage_nodes(signal_names)
+
+    currents: Dict[str, Dict[str, str]] = {}
+    for signal_name in signal_names:
+        match = _CURRENT_SIGNAL.match(signal_name)
+        if match is None:
+            continue
+        prefix, reference = match.group(1).lower(), match.group(2)
+        if prefix == 'x' and ':' in reference:
+            device, terminal = reference.split(':', 1)
+            currents.setdefault(device.upper(), {})[terminal.upper()] = signal_name
+        elif prefix:
+            currents.setdefault(reference.upper(), {})[prefix] = signal_name
+        else:
+            currents.setdefault(reference.upper(), {})['+'] = signal_name
+
+    devices = {}
+    for device, terminal_currents in currents.items():
+        # LTspice drops the X prefix of subcircuit instances in Ix() names
+        terminals = connections.get(device) or connections.get('X' + device)
+        if terminals is None and connections:
+            continue
+        if terminals is None:
+            # No netlist: pins named after a node connect to that node
+            terminals = {terminal: terminal for terminal in terminal_currents if terminal.lower() in voltages}
+            if len(terminals) != len(terminal_currents):
+                continue
+
+        keys = {terminal: _node_key(node) for terminal, node in terminals.items()}
+        if any(key is not None and key not in voltages for key in keys.values()):
+            continue
+        nodes = {terminal: voltages.get(key) for terminal, key in keys.items()}
+
+        if set(terminal_currents) == {'+'} and '-' in nodes:
+            devices[device] = [(terminal_currents['+'], nodes['+'], nodes['-'])]
+            continue
+        if not set(terminal_currents) <= set(nodes):
+            continue
+        missing = [terminal for terminal in nodes if terminal not in terminal_currents]
+        if len(missing) > 1:
+            continue
+        reference = nodes[missing[0]] if missing else None
+        devices[device] = [(current, nodes[terminal], reference)
+                           for terminal, current in terminal_currents.items()]
+    return devices
+
+
+def compute_device_power(axis: np.ndarray, get_wave: Callable[[str], np.ndarray],
+                         devices: Dict[str, List[Tuple[str, Optional[str], Optional[str]]]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Compute the instantaneous power of devices in one batch.
+
+    Args:
+        axis: Axis array
+        get_wave: Callable returning the array of a signal name
+        devices: Result of pair_device_terminals() (or a subset)
+
+    Returns:
+        Tuple of (device names, array of shape (devices, len(axis)) of the
+        absorbed power).
+    """
+    names = list(devices)
+    terms = [term for name in names for term in devices[name]]
+    if not terms:
+        return names, np.zeros((len(names), len(axis)))
+
+    nodes = sorted({node for _, plus, minus in terms for node in (plus, minus) if node is not None})
+    row = {node: position for position, node in enumerate(nodes)}
+    row[None] = len(nodes)
+    # The last row is ground
+    voltages = np.vstack([np.real(get_wave(node)).astype(np.float64) for node in nodes] +
+                         [np.zeros(len(axis))])
+    currents = np.vstack([np.real(get_wave(current)).astype(np.float64) for current, _, _ in terms])
+
+    plus = np.array([row[node] for _, node, _ in terms])
+    minus = np.array([row[node] for _, _, node in terms])
+    term_power = (voltages[plus] - voltages[minus]) * currents
+    starts = np.cumsum([0] + [len(devices[name]) for name in names[:-1]])
+    return names, np.add.reduceat(term_power, starts, axis=0)
+
+
+def cumulative_energy(axis: np.ndarray, power: np.ndarray) -> np.ndarray:
+    """
+    Integrate power over time (cumulative trapezoid rule).
+
+    Args:
+        axis: Axis array
+        power: Array of shape (devices, len(axis))
+
+    Returns:
+        Array of the same shape with the energy absorbed since axis[0].
+    """
+    return cumulative_trapezoid(axis, power)
+
+
+def summarize_power(axis: np.ndarray, power: np.ndarray,
+                    window: Optional[Sequence[float]] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute energy and power figures of devices over a window.
+
+    Args:
+        axis: Axis array
+        power: Array of shape (devices, len(axis))
+        window: [t0, t1] (clipped to the axis), or None for the full axis
+
+    Returns:
+        Mapping of 'energy', 'average_power', 'peak_power' and 'min_power'
+        to arrays with one value per device.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    t0, t1 = _clip_window(axis, window)
+    edges = np.array([t0, t1])
+    energy = np.diff(interpolate_block(cumulative_energy(axis, power), *interpolation_plan(axis, edges)), axis=1)[:, 0]
+
+    inside = (axis >= t0) & (axis <= t1)
+    if not inside.any():
+        inside[np.searchsorted(axis, t0).clip(0, len(axis) - 1)] = True
+    duration = t1 - t0
+    return {
+        'energy': energy,
+        'average_power': energy / duration if duration > 0 else power[:, inside][:, 0],
+        'peak_power': power[:, inside].max(axis=1),
+        'min_power': power[:, inside].min(axis=1)
+    }
+
+
+def power_table(dataset: Any, devices: Dict[str, List[Tuple[str, Optional[str], Optional[str]]]],
+                window: Optional[Sequence[float]] = None, step: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Account energy and power of every device of a dataset step.
+
+    Devices are processed in blocks, so memory stays bounded for many
+    devices and long records.
+
+    Args:
+        dataset: Dataset providing get_axis() and get_wave()
+        devices: Result of pair_device_terminals()
+        window: [t0, t1], or None for the full record
+        step: Step number (defaults to the first step)
+
+    Returns:
+        Rows {'device', 'terminals', <POWER_COLUMNS key>: value} in device
+        order.
+    """
+    axis = np.asarray(dataset.get_axis(step), dtype=np.float64)
+    names = list(devices)
+    terms_per_device = max([len(terms) for terms in devices.values()] or [1])
+    block_size = max(1, POWER_BLOCK_BYTES // (8 * max(len(axis), 1) * (2 * terms_per_device + 2)))
+
+    rows = []
+    for start in range(0, len(names), block_size):
+        block = {name: devices[name] for name in names[start:start + block_size]}
+        block_names, power = compute_device_power(axis, lambda name: dataset.get_wave(name, step), block)
+        summary = summarize_power(axis, power, window)
+        for position, name in enumerate(block_names):
+            row = {'device': name, 'terminals': len(block[name])}
+            row.update({key: float(summary[key][position]) for key, _ in POWER_COLUMNS})
+            rows.append(row)
+    return rows
+
+
+def sort_power_rows(rows: List[Dict[str, Any]], sort_key: str = 'energy',
+                    descending: bool = True) -> List[Dict[str, Any]]:
+    """
+    Sort power table rows by a column (the device name or a POWER_COLUMNS key).
+
+    Args:
+        rows: Result of power_table()
+        sort_key: 'device' or a POWER_COLUMNS key
+        descending: Sort from largest to smallest
+
+    Returns:
+        New sorted list of rows.
+    """
+    if sort_key == 'device':
+        return sorted(rows, key=lambda row: row['device'], reverse=descending)
+    return sorted(rows, key=lambda row: row[sort_key], reverse=descending)
+
+
+def _node_tokens(tokens: Sequence[str]) -> List[str]:
+    """Tokens of a node list, up to the first parameter."""
+    nodes = []
+    for token in tokens:
+        if '=' in token or token.lower() in ('params:', 'param:'):
+            break
+        nodes.append(token)
+    return nodes
+
+
+def _node_key(node: str) -> Optional[str]:
+    """Lower-case node name, or None for ground."""
+    node = node.lower()
+    return None if node in GROUND_NODES else node
+
+
+def _voltage_nodes(signal_names: Sequence[str]) -> Dict[str, str]:
+    """Mapping of lower-case node name to its voltage signal name."""
+    nodes = {}
+    for signal_name in signal_names:
+        if signal_name[:2].lower() == 'v(' and signal_name.endswith(')') and ',' not in signal_name:
+            nodes[signal_name[2:-1].lower()] = signal_name
+    return nodes
+
+
+def _clip_window(axis: np.ndarray, window: Optional[Sequence[float]]) -> Tuple[float, float]:
+    """Window [t0, t1] in order and clipped to the axis span."""
+    if window is None or len(axis) == 0:
+        return (float(axis[0]), float(axis[-1])) if len(axis) else (0.0, 0.0)
+    t0, t1 = sorted(float(value) for value in window)
+    return min(max(t0, axis[0]), axis[-1]), min(max(t1, axis[0]), axis[-1])
@@ -0,0 +1,258 @@
+"""
+Per-signal summary statistics for WaveDash application.
+
+Statistics are computed once at ingest so the signal list can flag stuck,
+railed or toggling nodes without plotting them. Signals are processed as
+2-D blocks and streamed over the axis in chunks, so memory stays bounded
+for long records with thousands of traces. Averages are time-weighted
+(trapezoidal), matching the measurement engine, because SPICE timesteps
+are adaptive.
+"""
+
+import re
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.utils.integration import trapezoid_weights
+
+# Statistics per signal, in display order
+SIGNAL_STATS = ('min', 'max', 'mean', 'rms', 'pp', 'toggles')
+
+# Short labels used in the signal list and the sort menu
+STAT_LABELS = {
+    'min': "Min",
+    'max': "Max",
+    'mean': "Mean",
+    'rms': "RMS",
+    'pp': "Pk-Pk",
+    'toggles': "Toggles"
+}
+
+# A toggle is a transition between the low and high reference levels
+# (fractions of the signal's min..max range), so noise around one level
+# does not count
+TOGGLE_LOW_LEVEL = 0.1
+TOGGLE_HIGH_LEVEL = 0.9
+
+# Samples per chunk of the streaming pass
+STATS_CHUNK_SIZE = 1 << 16
+
+# Memory budget of one block of signals
+STATS_BLOCK_BYTES = 64 * 1024 * 1024
+
+# SPICE scale suffixes accepted in filters (case-insensitive)
+SCALE_SUFFIXES = {
+    'f': 1e-15, 'p': 1e-12, 'n': 1e-9, 'u': 1e-6, 'µ': 1e-6, 'm': 1e-3,
+    'k': 1e3, 'meg': 1e6, 'g': 1e9, 't': 1e12
+}
+
+_CONDITION = re.compile(
+    r'^(?P<stat>[a-z\-]+)\s*(?P<op><=|>=|==|!=|<|>|=)\s*'
+    r'(?P<number>[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)(?P<suffix>meg|[fpnuµmkgt])?[a-z]*$',
+    re.IGNORECASE
+)
+
+_STAT_ALIASES = {
+    'min': 'min', 'max': 'max', 'mean': 'mean', 'avg': 'mean', 'rms': 'rms',
+    'pp': 'pp', 'p-p': 'pp', 'pkpk': 'pp', 'toggles': 'toggles', 'toggle': 'toggles'
+}
+
+_OPERATORS = {
+    '<': np.less, '<=': np.less_equal, '>': np.greater, '>=': np.greater_equal,
+    '=': np.equal, '==': np.equal, '!=': np.not_equal
+}
+
+
+def compute_signal_stats(axes: Dict[int, np.ndarray], waves: Dict[int, Dict[str, np.ndarray]],
+                         chunk_size: int = STATS_CHUNK_SIZE) -> Dict[str, Dict[str, float]]:
+    """
+    Compute summary statistics of every signal over every simulation step.
+
+    Args:
+        axes: Mapping of step number to axis array
+        waves: Mapping of step number to {signal name: array}
+        chunk_size: Samples per chunk of the streaming pass
+
+    Returns:
+        Mapping of signal name to {statistic: value} for SIGNAL_STATS; mean
+        and RMS are time-weighted over all steps and toggles are summed.
+    """
+    totals: Dict[str, np.ndarray] = {}
+    for step, axis in axes.items():
+        axis = np.asarray(axis, dtype=np.float64)
+        names = [name for name, values in waves[step].items() if len(values) == len(axis)]
+        block_size = max(1, STATS_BLOCK_BYTES // (max(len(axis), 1) * 8))
+        for start in range(0, len(names), block_size):
+            block_names = names[start:start + block_size]
+            block = np.vstack([np.asarray(waves[step][name], dtype=np.float64) for name in block_names])
+            for name, row in zip(block_names, _accumulate_block(axis, block, chunk_size)):
+                totals[name] = row if name not in totals else _combine(totals[name], row)
+
+    stats = {}
+    for name, (minimum, maximum, integral, square_integral, duration, toggles) in totals.items():
+        if duration > 0:
+            mean, rms = integral / duration, np.sqrt(square_integral / duration)
+        else:
+            # Operating points have one sample and no duration
+            mean, rms = (minimum, abs(minimum)) if minimum == maximum else (None, None)
+        stats[name] = {
+            'min': float(minimum),
+            'max': float(maximum),
+            'mean': None if mean is None else float(mean),
+            'rms': None if rms is None else float(rms),
+            'pp': float(maximum - minimum),
+            'toggles': int(toggles)
+        }
+    return stats
+
+
+def parse_stat_filter(text: Optional[str]) -> Tuple[List[str], List[Tuple[str, str, float]]]:
+    """
+    Parse a signal list filter.
+
+    Terms are separated by commas or "and". A term like ``pp > 100m`` or
+    ``toggles>=2`` is a condition on a statistic (SPICE scale suffixes and
+    trailing units are accepted); any other term matches signal names.
+
+    Args:
+        text: Filter text
+
+    Returns:
+        Tuple of (lower-case name substrings, [(statistic, operator, value)]).
+
+    Raises:
+        ValueError: If a term compares an unknown statistic.
+    """
+    name_terms, conditions = [], []
+    for term in re.split(r',|\s+and\s+', text or '', flags=re.IGNORECASE):
+        term = term.strip()
+        if not term:
+            continue
+        match = _CONDITION.match(term)
+        if match is None:
+            name_terms.append(term.lower())
+            continue
+        stat = _STAT_ALIASES.get(match.group('stat').lower())
+        if stat is None:
+            raise ValueError(f"Unknown statistic: {match.group('stat')}")
+        scale = SCALE_SUFFIXES[match.group('suffix').lower()] if match.group('suffix') else 1.0
+        conditions.append((stat, match.group('op'), float(match.group('number')) * scale))
+    return name_terms, conditions
+
+
+def filter_and_sort_signals(signals: Sequence[str], stats: Optional[Dict[str, Dict[str, float]]],
+                            filter_text: Optional[str] = None, sort_key: Optional[str] = None,
+                            descending: bool = False) -> List[str]:
+    """
+    Select and order signals by name and summary statistics.
+
+    Signals without statistics (e.g. derived signals) never match a
+    statistic condition and sort last.
+
+    Args:
+        signals: Signal names in their original order
+        stats: Result of compute_signal_stats()
+        filter_text: Filter in parse_stat_filter() syntax
+        sort_key: Statistic to sort by, or None/'name' for the original order
+        descending: Sort from largest to smallest
+
+    Returns:
+        Matching signal names in display order.
+
+    Raises:
+        ValueError: If the filter compares an unknown statistic.
+    """
+    stats = stats or {}
+    name_terms, conditions = parse_stat_filter(filter_text)
+
+    selected = []
+    for name in signals:
+        lowered = name.lower()
+        if not all(term in lowered for term in name_terms):
+            continue
+        values = stats.get(name)
+        if conditions and (values is None or not all(
+                values.get(stat) is not None and _OPERATORS[op](values[stat], value)
+                for stat, op, value in conditions)):
+            continue
+        selected.append(name)
+
+    if sort_key in SIGNAL_STATS:
+        known = [name for name in selected if (stats.get(name) or {}).get(sort_key) is not None]
+        unknown = [name for name in selected if (stats.get(name) or {}).get(sort_key) is None]
+        known.sort(key=lambda name: stats[name][sort_key], reverse=descending)
+        selected = known + unknown
+    elif descending:
+        selected.reverse()
+    return selected
+
+
+def _accumulate_block(axis: np.ndarray, block: np.ndarray, chunk_size: int) -> np.ndarray:
+    """
+    Stream one block of signals in chunks.
+
+    Returns:
+        Array of shape (signals, 6): min, max, time integral, integral of
+        the square, duration and toggle count.
+    """
+    n_rows, n_points = block.shape
+    result = np.zeros((n_rows, 6))
+    if n_points == 0:
+        result[:, 0], result[:, 1] = np.inf, -np.inf
+        return result
+
+    # The toggle levels depend on the range, so the extrema come first
+    minimum, maximum = block.min(axis=1), block.max(axis=1)
+    span = maximum - minimum
+    low = (minimum + TOGGLE_LOW_LEVEL * span)[:, np.newaxis]
+    high = (minimum + TOGGLE_HIGH_LEVEL * span)[:, np.newaxis]
+
+    integral = np.zeros(n_rows)
+    square_integral = np.zeros(n_rows)
+    toggles = np.zeros(n_rows, dtype=np.int64)
+    # Last level reached per row (1 high, 0 low, -1 neither yet) and
+    # whether the previous sample was at/above high or at/below low
+    state = np.full(n_rows, -1, dtype=np.int8)
+    was_high = np.zeros((n_rows, 1), dtype=bool)
+    was_low = np.zeros((n_rows, 1), dtype=bool)
+
+    for start in range(0, n_points, chunk_size):
+        # Each sample's share of the segments on either side of it
+        values = block[:, start:start + chunk_size]
+        weights = trapezoid_weights(axis, start, start + values.shape[1])
+        integral += values @ weights
+        square_integral += np.einsum('ij,ij,j->i', values, values, weights)
+
+        # Entering the high or low band is an event; a toggle is an event
+        # of the other kind than the row's previous one
+        is_high, is_low = values >= high, values <= low
+        entered = ((is_high & ~np.concatenate((was_high, is_high[:, :-1]), axis=1)) |
+                   (is_low & ~np.concatenate((was_low, is_low[:, :-1]), axis=1)))
+        was_high, was_low = is_high[:, -1:], is_low[:, -1:]
+
+        events = np.flatnonzero(entered)
+        if not len(events):
+            continue
+        rows = events // values.shape[1]
+        kinds = is_high.ravel()[events].astype(np.int8)
+        same_row = rows[1:] == rows[:-1]
+        changed = same_row & (kinds[1:] != kinds[:-1])
+        toggles += np.bincount(rows[1:][changed], minlength=n_rows)
+
+        first_event = np.concatenate(([True], ~same_row))
+        first_rows, first_kinds = rows[first_event], kinds[first_event]
+        toggles[first_rows] += (state[first_rows] >= 0) & (state[first_rows] != first_kinds)
+        last_event = np.concatenate((~same_row, [True]))
+        state[rows[last_event]] = kinds[last_event]
+
+    result[:, 0], result[:, 1] = minimum, maximum
+    result[:, 2], result[:, 3] = integral, square_integral
+    result[:, 4] = axis[-1] - axis[0]
+    result[:, 5] = toggles
+    return result
+
+
+def _combine(total: np.ndarray, row: np.ndarray) -> np.ndarray:
+    """Combine the accumulators of one signal over two steps."""
+    return np.array([min(total[0], row[0]), max(total[1], row[1]),
+                     total[2] + row[2], total[3] + row[3], total[4] + row[4], total[5] + row[5]])
@@ -0,0 +1,173 @@
+"""
+Short-time spectrum (spectrogram) utilities for WaveDash application.
+
+This module computes the spectrogram of a transient signal at the
+resolution of a tile: one column per pair of screen pixels and one row per
+frequency bin. The signal is resampled onto a uniform grid chunk by chunk,
+framed with a strided view of each chunk (frames share memory with the
+chunk, nothing is copied per frame) and transformed one chunk of frames at
+a time, so memory stays bounded on 100M-sample records. Columns whose span
+holds more samples than one frame average the power of several frames.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Any, Dict, Optional, Sequence
+
+from src.utils.spectrum import DEFAULT_SPECTRUM_WINDOW, MIN_DB, MIN_FFT_POINTS, SPECTRUM_WINDOWS
+
+# Number of time columns of a spectrogram image (about two screen pixels
+# per column on a typical tile)
+SPECTROGRAM_COLUMNS = 600
+
+# Largest frame (FFT) size; its frequency bins are the rows of the image
+SPECTROGRAM_FFT_POINTS = 256
+
+# Upper bound of the frames averaged into one column; it bounds the work
+# (and the resampled grid) to SPECTROGRAM_COLUMNS x this x the FFT size
+MAX_FRAMES_PER_COLUMN = 16
+
+# Frames resampled and transformed together in one chunk
+SPECTROGRAM_CHUNK_FRAMES = 1 << 11
+
+
+def spectrogram_plan(samples: int, n_columns: int = SPECTROGRAM_COLUMNS,
+                     max_fft: int = SPECTROGRAM_FFT_POINTS) -> Dict[str, int]:
+    """
+    Lay out the frames of a spectrogram for a window of the given length.
+
+    The frame size is the largest power of two up to max_fft that leaves
+    room for several frames. Long windows average up to
+    MAX_FRAMES_PER_COLUMN adjacent frames per column; short ones overlap
+    frames so every column still gets its own frame.
+
+    Args:
+        samples: Number of native samples in the window
+        n_columns: Requested number of time columns
+        max_fft: Upper bound of the frame size
+
+    Returns:
+        Dictionary with 'n_fft', 'hop' (grid points between frame starts),
+        'frames_per_column', 'n_columns' and 'n_grid' (uniform grid points
+        spanning the window).
+    """
+    samples = max(int(samples), MIN_FFT_POINTS)
+    n_fft = 1 << max((samples // 8).bit_length() - 1, 0)
+    n_fft = int(min(max(n_fft, MIN_FFT_POINTS), max_fft))
+
+    frames_per_column = int(min(max(samples // (n_columns * n_fft), 1), MAX_FRAMES_PER_COLUMN))
+    n_grid = min(samples, n_columns * frames_per_column * n_fft)
+
+    # Fewer columns than requested when the window has too few samples
+    n_columns = int(min(n_columns, max(n_grid - n_fft + 1, 1)))
+    n_frames = n_columns * frames_per_column
+    hop = max((n_grid - n_fft) // max(n_frames - 1, 1), 1)
+
+    return {
+        'n_fft': n_fft,
+        'hop': int(hop),
+        'frames_per_column': frames_per_column,
+        'n_columns': n_columns,
+        'n_grid': int((n_frames - 1) * hop + n_fft)
+    }
+
+
+def spectrogram_axes(plan: Dict[str, int], x0: float, x1: float) -> Dict[str, Any]:
+    """
+    Get the column times and row frequencies of a planned spectrogram.
+
+    Args:
+        plan: Result of spectrogram_plan()
+        x0: Start of the window
+        x1: End of the window
+
+    Returns:
+        Dictionary with 'time' (center of each column), 'frequency' (each
+        row) and 'sample_rate' of the uniform grid.
+    """
+    dt = (x1 - x0) / (plan['n_grid'] - 1)
+    frames_per_column = plan['frames_per_column']
+    centers = (np.arange(plan['n_columns']) * frames_per_column + (frames_per_column - 1) / 2) * plan['hop']
+    return {
+        'time': x0 + (centers + (plan['n_fft'] - 1) / 2) * dt,
+        'frequency': np.fft.rfftfreq(plan['n_fft'], d=dt),
+        'sample_rate': 1.0 / dt
+    }
+
+
+def compute_spectrogram(axis: np.ndarray, values: np.ndarray,
+                        x_range: Optional[Sequence[float]] = None,
+                        window: str = DEFAULT_SPECTRUM_WINDOW,
+                        n_columns: int = SPECTROGRAM_COLUMNS,
+                        chunk_frames: int = SPECTROGRAM_CHUNK_FRAMES) -> Dict[str, Any]:
+    """
+    Compute the amplitude spectrogram of a signal in a time window.
+
+    Args:
+        axis: Sorted (possibly non-uniform) time axis
+        values: Real-valued signal array on the axis
+        x_range: [x0, x1] time window, or None for the full axis
+        window: Window name (a key of SPECTRUM_WINDOWS)
+        n_columns: Requested number of time columns
+        chunk_frames: Frames resampled and transformed per chunk
+
+    Returns:
+        Dictionary containing:
+        - 'magnitude': float32 array of shape (frequencies, columns) in dB
+        - 'time', 'frequency', 'sample_rate': see spectrogram_axes()
+        - 'n_fft', 'frames_per_column', 'window', 'x_range'
+
+    Raises:
+        ValueError: If the window is unknown, the signal is complex (AC
+            analysis) or the time window is empty.
+    """
+    if window not in SPECTRUM_WINDOWS:
+        raise ValueError(f"Unknown window: {window}")
+    if np.iscomplexobj(values):
+        raise ValueError("Spectrogram needs a real time-domain signal")
+
+    axis = np.asarray(axis, dtype=np.float64)
+    x0, x1 = (float(axis[0]), float(axis[-1])) if x_range is None else sorted(map(float, x_range))
+    x0, x1 = max(x0, float(axis[0])), min(x1, float(axis[-1]))
+    if not x1 > x0:
+        raise ValueError("No data in the selected window")
+
+    samples = int(np.searchsorted(axis, x1, side='right') - np.searchsorted(axis, x0, side='left'))
+    plan = spectrogram_plan(samples, n_columns)
+    n_fft, hop, frames_per_column = plan['n_fft'], plan['hop'], plan['frames_per_column']
+    dt = (x1 - x0) / (plan['n_grid'] - 1)
+
+    taper = SPECTRUM_WINDOWS[window](n_fft)
+    gain = 2.0 / taper.sum()
+    magnitude = np.empty((n_fft // 2 + 1, plan['n_columns']), dtype=np.float32)
+
+    columns_per_chunk = max(chunk_frames // frames_per_column, 1)
+    for first in range(0, plan['n_columns'], columns_per_chunk):
+        last = min(first + columns_per_chunk, plan['n_columns'])
+        frame0, frame1 = first * frames_per_column, last * frames_per_column
+
+        # Resample only the grid points this chunk's frames cover, from the
+        # native samples around them
+        grid = x0 + np.arange(frame0 * hop, (frame1 - 1) * hop + n_fft) * dt
+        lo = max(int(np.searchsorted(axis, grid[0], side='right')) - 1, 0)
+        hi = int(np.searchsorted(axis, grid[-1], side='left')) + 1
+        segment = np.interp(grid, axis[lo:hi], values[lo:hi])
+
+        frames = sliding_window_view(segment, n_fft)[::hop]
+        power = np.abs(np.fft.rfft(frames * taper, axis=1)) ** 2
+        power = power.reshape(last - first, frames_per_column, -1).mean(axis=1)
+
+        # Single-sided amplitude, corrected for the window's coherent gain
+        amplitude = np.sqrt(power) * gain
+        amplitude[:, 0] /= 2
+        with np.errstate(divide='ignore'):
+            magnitude[:, first:last] = np.maximum(20 * np.log10(amplitude), MIN_DB).T
+
+    return {
+        'magnitude': magnitude,
+        **spectrogram_axes(plan, x0, x1),
+        'n_fft': n_fft,
+        'frames_per_column': frames_per_column,
+        'window': window,
+        'x_range': (x0, x1)
+    }
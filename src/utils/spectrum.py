@@ -0,0 +1,333 @@
+"""
+Spectrum analysis utilities for WaveDash application.
+
+This module computes windowed amplitude spectra of time-domain signals.
+SPICE transient timesteps are adaptive, so the selected window is first
+resampled onto a uniform grid; all signals are then transformed with one
+``rfft`` call over a 2-D array. Tone metrics (SNR, THD, SFDR) are computed
+from the full-resolution power spectrum, vectorized across signals.
+
+Windows holding more samples than MAX_FFT_POINTS are low-pass filtered
+before they are decimated onto the FFT grid, so content above the new
+Nyquist frequency does not fold back as false spurs; the spectrum is then
+band-limited to the filter's passband.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.utils.cursors import _finite_or_none
+
+
+def _periodic(window_function):
+    """DFT-even (periodic) form of a symmetric NumPy window, which does not leak DC."""
+    return lambda n_points: window_function(n_points + 1)[:-1]
+
+
+# Analysis windows: name -> window function of the FFT size
+SPECTRUM_WINDOWS = {
+    'hann': _periodic(np.hanning),
+    'hamming': _periodic(np.hamming),
+    'blackman': _periodic(np.blackman),
+    'rectangular': np.ones
+}
+DEFAULT_SPECTRUM_WINDOW = 'hann'
+
+# Half-width in bins of each window's main lobe: the bins that belong to one tone
+WINDOW_LOBE_BINS = {
+    'hann': 2,
+    'hamming': 2,
+    'blackman': 3,
+    'rectangular': 1
+}
+
+# Upper bound of the FFT size (keeps 16M-point records interactive)
+MAX_FFT_POINTS = 1 << 20
+
+# Anti-alias low-pass applied before decimating: a Kaiser-windowed sinc with
+# ANTI_ALIAS_TAPS taps per unit of decimation whose stopband (about 85 dB
+# down) starts at the decimated Nyquist frequency
+ANTI_ALIAS_TAPS = 32
+ANTI_ALIAS_BETA = 8.6
+
+# Transition band of the low-pass as a fraction of the decimated sample
+# rate (Kaiser's estimate); bins above the passband are not reported
+_ANTI_ALIAS_TRANSITION = (ANTI_ALIAS_BETA / 0.1102 + 8.7 - 7.95) / (2.285 * 2 * np.pi * ANTI_ALIAS_TAPS)
+
+# Memory bound of the filter input gathered per chunk of output points
+RESAMPLE_CHUNK_BYTES = 32 * 1024 * 1024
+
+# Smallest useful FFT size
+MIN_FFT_POINTS = 16
+
+# Harmonics 2..MAX_HARMONIC count towards THD
+MAX_HARMONIC = 10
+
+# Floor of the dB scale (avoids -inf for empty bins)
+MIN_DB = -300.0
+
+# A signal has a tone only if its strongest non-DC bin holds at least this
+# fraction of its total power (otherwise it is DC plus rounding noise)
+MIN_TONE_RATIO = 1e-10
+
+
+def window_samples(axis: np.ndarray, x_range: Optional[Sequence[float]] = None) -> int:
+    """
+    Count the samples of an axis inside a window.
+
+    Args:
+        axis: Sorted axis array
+        x_range: [x0, x1] window, or None for the full axis
+
+    Returns:
+        Number of samples in the window.
+    """
+    if x_range is None:
+        return len(axis)
+    x0, x1 = sorted(x_range)
+    return int(np.searchsorted(axis, x1, side='right') - np.searchsorted(axis, x0, side='left'))
+
+
+def spectrum_size(axis: np.ndarray, x_range: Optional[Sequence[float]] = None,
+                  max_points: int = MAX_FFT_POINTS) -> int:
+    """
+    Choose the FFT size for a window: the power of two covering the
+    window's samples, capped at max_points.
+
+    Args:
+        axis: Sorted axis array
+        x_range: [x0, x1] window, or None for the full axis
+        max_points: Upper bound of the FFT size
+
+    Returns:
+        FFT size (a power of two).
+    """
+    size = 1 << max(window_samples(axis, x_range) - 1, 1).bit_length()
+    return int(min(max(size, MIN_FFT_POINTS), max_points))
+
+
+def decimation_factor(samples: int, n_points: int) -> int:
+    """
+    Choose how many fine grid points are filtered into each FFT point.
+
+    Args:
+        samples: Samples of the window
+        n_points: FFT size
+
+    Returns:
+        Power of two such that n_points * factor covers the samples (1 if
+        the FFT grid already does).
+    """
+    return 1 << max(-(-int(samples) // int(n_points)) - 1, 0).bit_length()
+
+
+def passband_bins(n_points: int, factor: int) -> int:
+    """
+    Number of rfft bins inside the anti-alias filter's passband.
+
+    Args:
+        n_points: FFT size
+        factor: Decimation factor from decimation_factor()
+
+    Returns:
+        n_points // 2 + 1 without decimation, fewer bins otherwise.
+    """
+    if factor == 1:
+        return n_points // 2 + 1
+    return int(np.floor((0.5 - _ANTI_ALIAS_TRANSITION) * n_points)) + 1
+
+
+def anti_alias_filter(factor: int) -> np.ndarray:
+    """
+    Design the low-pass applied before decimating by a factor.
+
+    Args:
+        factor: Decimation factor (> 1)
+
+    Returns:
+        Odd-length, unit-gain FIR taps.
+    """
+    length = ANTI_ALIAS_TAPS * factor + 1
+    cutoff = (0.5 - _ANTI_ALIAS_TRANSITION / 2) / factor
+    offsets = np.arange(length) - (length - 1) / 2
+    taps = np.sinc(2 * cutoff * offsets) * np.kaiser(length, ANTI_ALIAS_BETA)
+    return taps / taps.sum()
+
+
+def resample_uniform(axis: np.ndarray, waves: Sequence[np.ndarray], x0: float, x1: float,
+                     n_points: int, factor: int = 1) -> np.ndarray:
+    """
+    Resample signals onto a uniform grid of n_points over [x0, x1).
+
+    With factor 1 the signals are linearly interpolated at the grid points.
+    Otherwise they are interpolated onto a grid factor times finer,
+    low-pass filtered with anti_alias_filter() and decimated, in chunks so
+    the fine grid is never held whole.
+
+    Args:
+        axis: Sorted (possibly non-uniform) axis array
+        waves: Signal arrays on the axis
+        x0: Start of the window
+        x1: End of the window
+        n_points: Number of grid points
+        factor: Decimation factor from decimation_factor()
+
+    Returns:
+        Array of shape (len(waves), n_points).
+    """
+    resampled = np.empty((len(waves), n_points))
+    if factor == 1:
+        grid = x0 + (x1 - x0) * np.arange(n_points) / n_points
+        for row, values in zip(resampled, waves):
+            row[:] = np.interp(grid, axis, values)
+        return resampled
+
+    taps = anti_alias_filter(factor)
+    half = (len(taps) - 1) // 2
+    step = (x1 - x0) / (n_points * factor)
+    chunk = max(RESAMPLE_CHUNK_BYTES // (8 * len(taps)), 1)
+    for start in range(0, n_points, chunk):
+        stop = min(start + chunk, n_points)
+        # Fine points centred on each output point, reaching past the window
+        # edges where the record continues (np.interp holds the end values)
+        fine = x0 + step * np.arange(start * factor - half, (stop - 1) * factor + half + 1)
+        for row, values in zip(resampled, waves):
+            frames = sliding_window_view(np.interp(fine, axis, values), len(taps))[::factor]
+            # einsum reads the strided frames in place (matmul would copy them)
+            row[start:stop] = np.einsum('ij,j->i', frames, taps)
+    return resampled
+
+
+def compute_spectrum(axis: np.ndarray, waves: Dict[str, np.ndarray],
+                     x_range: Optional[Sequence[float]] = None,
+                     window: str = DEFAULT_SPECTRUM_WINDOW,
+                     n_points: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Compute windowed amplitude spectra and tone metrics of signals.
+
+    Args:
+        axis: Sorted time axis shared by the signals
+        waves: Mapping of signal name to real-valued array on the axis
+        x_range: [x0, x1] time window, or None for the full axis
+        window: Window name (a key of SPECTRUM_WINDOWS)
+        n_points: FFT size, or None to choose one with spectrum_size()
+
+    Returns:
+        Dictionary containing:
+        - 'frequency': Bin frequencies (n_points // 2 + 1 values, or only
+          those in the passband when the window was decimated)
+        - 'magnitude': {name: amplitude spectrum in dB}
+        - 'metrics': {name: metrics from tone_metrics()}
+        - 'n_points', 'window', 'x_range', 'sample_rate'
+        - 'decimation': Decimation factor (1 if every sample was used)
+        - 'bandwidth': Highest reported frequency
+
+    Raises:
+        ValueError: If the window is unknown, the signals are complex (AC
+            analysis) or the time window is empty.
+    """
+    if window not in SPECTRUM_WINDOWS:
+        raise ValueError(f"Unknown window: {window}")
+    if any(np.iscomplexobj(values) for values in waves.values()):
+        raise ValueError("Spectrum needs real time-domain signals")
+
+    axis = np.asarray(axis, dtype=np.float64)
+    x0, x1 = (float(axis[0]), float(axis[-1])) if x_range is None else sorted(map(float, x_range))
+    x0, x1 = max(x0, float(axis[0])), min(x1, float(axis[-1]))
+    if not x1 > x0:
+        raise ValueError("No data in the selected window")
+
+    n_points = n_points or spectrum_size(axis, (x0, x1))
+    factor = decimation_factor(window_samples(axis, (x0, x1)), n_points)
+    names = list(waves.keys())
+    resampled = resample_uniform(axis, [waves[name] for name in names], x0, x1, n_points, factor)
+
+    taper = SPECTRUM_WINDOWS[window](n_points)
+    # Bins past the anti-alias passband are attenuated, so they are dropped
+    spectra = np.fft.rfft(resampled * taper, axis=1)[:, :passband_bins(n_points, factor)]
+
+    # Single-sided amplitude, corrected for the window's coherent gain
+    amplitude = np.abs(spectra) * (2.0 / taper.sum())
+    amplitude[:, 0] /= 2
+    with np.errstate(divide='ignore'):
+        magnitude = np.maximum(20 * np.log10(amplitude), MIN_DB)
+
+    sample_rate = n_points / (x1 - x0)
+    frequency = np.fft.rfftfreq(n_points, d=1.0 / sample_rate)[:spectra.shape[1]]
+    metrics = tone_metrics(amplitude * amplitude, frequency, WINDOW_LOBE_BINS[window])
+
+    return {
+        'frequency': frequency,
+        'magnitude': dict(zip(names, magnitude)),
+        'metrics': dict(zip(names, metrics)),
+        'n_points': n_points,
+        'window': window,
+        'x_range': (x0, x1),
+        'sample_rate': sample_rate,
+        'decimation': factor,
+        'bandwidth': float(frequency[-1])
+    }
+
+
+def tone_metrics(power: np.ndarray, frequency: np.ndarray, lobe_bins: int) -> List[Dict[str, Optional[float]]]:
+    """
+    Compute tone metrics from single-sided power spectra.
+
+    The fundamental is the strongest bin above DC. Tone powers are summed
+    over the window's main lobe around each tone; noise is everything that
+    is not DC, the fundamental or one of its harmonics.
+
+    Args:
+        power: Array of shape (signals, bins)
+        frequency: Bin frequencies
+        lobe_bins: Half-width of the window's main lobe in bins
+
+    Returns:
+        List of dicts per signal with 'fundamental' (Hz), 'fundamental_db',
+        'snr', 'thd' (dBc), 'thd_percent' and 'sfdr' (dBc); None where a
+        value is undefined (e.g. a DC-only signal).
+    """
+    n_signals, n_bins = power.shape
+    bins = np.arange(n_bins)
+    dc = bins <= lobe_bins
+
+    fundamental = np.where(dc, 0.0, power).argmax(axis=1)
+
+    def lobe(centers: np.ndarray) -> np.ndarray:
+        return np.abs(bins[np.newaxis, :] - centers[:, np.newaxis]) <= lobe_bins
+
+    fundamental_lobe = lobe(fundamental)
+    harmonic_lobes = np.zeros_like(fundamental_lobe)
+    for harmonic in range(2, MAX_HARMONIC + 1):
+        centers = fundamental * harmonic
+        harmonic_lobes |= lobe(centers) & (centers < n_bins)[:, np.newaxis]
+    harmonic_lobes &= ~fundamental_lobe & ~dc
+
+    fundamental_power = np.where(fundamental_lobe, power, 0.0).sum(axis=1)
+    harmonic_power = np.where(harmonic_lobes, power, 0.0).sum(axis=1)
+    noise_power = np.where(fundamental_lobe | harmonic_lobes | dc, 0.0, power).sum(axis=1)
+    peak = power[np.arange(n_signals), fundamental]
+    total_power = power.sum(axis=1)
+    spur = np.where(fundamental_lobe | dc, 0.0, power).max(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fundamental_db = 10 * np.log10(peak)
+        snr = 10 * np.log10(fundamental_power / noise_power)
+        thd_ratio = harmonic_power / fundamental_power
+        thd = 10 * np.log10(thd_ratio)
+        sfdr = 10 * np.log10(peak / spur)
+
+    results = []
+    for row in range(n_signals):
+        has_tone = peak[row] > MIN_TONE_RATIO * total_power[row]
+        results.append({
+            'fundamental': float(frequency[fundamental[row]]) if has_tone else None,
+            'fundamental_db': _finite_or_none(fundamental_db[row]) if has_tone else None,
+            'snr': _finite_or_none(snr[row]) if has_tone else None,
+            'thd': _finite_or_none(thd[row]) if has_tone else None,
+            'thd_percent': _finite_or_none(100 * np.sqrt(thd_ratio[row])) if has_tone else None,
+            'sfdr': _finite_or_none(sfdr[row]) if has_tone else None
+        })
+    return results
+
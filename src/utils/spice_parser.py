@@ -6,11 +6,13 @@ them to structured data formats suitable for plotting.
 """
 
 import base64
-import io
+import hashlib
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 from spicelib import RawRead
+from src.utils.signal_stats import compute_signal_stats
+from src.utils.signal_sketch import SignalSketches
 import tempfile
 import os
 
@@ -28,12 +30,17 @@ def parse_uploaded_raw_file(contents: str, filename: str) -> Dict[str, Any]:
         - 'success': Boolean indicating if parsing was successful
         - 'data': Pandas DataFrame with signals as columns, time/sweep as index
         - 'signals': List of signal names
+        - 'dataset_id': Content hash identifying the uploaded file
+        - 'axes': Axis array of every simulation step (server-side use)
+        - 'waves': {signal name: array} of every simulation step (server-side use)
+        - 'sketches': SignalSketches of the first step (server-side use)
         - 'error': Error message if parsing failed
     """
     try:
         # Decode the base64 content
         content_type, content_string = contents.split(',')
         decoded = base64.b64decode(content_string)
+        dataset_id = hashlib.sha1(decoded).hexdigest()[:16]
         
         # Create a temporary file to work with spicelib
         with tempfile.NamedTemporaryFile(delete=False, suffix='.raw') as tmp_file:
@@ -46,6 +53,12 @@ def parse_uploaded_raw_file(contents: str, filename: str) -> Dict[str, Any]:
             
             # Extract data and convert to DataFrame
             result = extract_signals_to_dataframe(raw_data)
+            axes, waves = extract_all_steps(raw_data, result['signals'])
+            result['metadata']['steps'] = list(axes.keys())
+            result['metadata']['step_parameters'] = get_step_parameters(raw_data)
+            result['metadata']['signal_stats'] = compute_signal_stats(axes, waves)
+            first_step = next(iter(axes))
+            sketches = SignalSketches.build(axes[first_step], waves[first_step])
             
             return {
                 'success': True,
@@ -53,6 +66,10 @@ def parse_uploaded_raw_file(contents: str, filename: str) -> Dict[str, Any]:
                 'index': result['index'],
                 'signals': result['signals'],
                 'metadata': result['metadata'],
+                'dataset_id': dataset_id,
+                'axes': axes,
+                'waves': waves,
+                'sketches': sketches,
                 'error': None
             }
             
@@ -67,10 +84,58 @@ def parse_uploaded_raw_file(contents: str, filename: str) -> Dict[str, Any]:
             'index': None,
             'signals': [],
             'metadata': {},
+            'dataset_id': None,
+            'axes': {},
+            'waves': {},
+            'sketches': None,
             'error': str(e)
         }
 
 
+def read_raw_file(file_path: str) -> Dict[str, Any]:
+    """
+    Read a .raw file from disk into per-step NumPy arrays.
+    
+    Unlike parse_uploaded_raw_file(), no DataFrame or JSON records are
+    built, which keeps batch (headless) processing fast.
+    
+    Args:
+        file_path: Path of the .raw file
+    
+    Returns:
+        Dictionary containing:
+        - 'signals': List of signal names
+        - 'axes': Axis array of every simulation step
+        - 'waves': {signal name: array} of every simulation step
+        - 'metadata': Additional metadata about the simulation
+    
+    Raises:
+        ValueError: If the file has no traces.
+    """
+    raw_data = RawRead(file_path)
+    traces = list(raw_data.get_trace_names())
+    if not traces:
+        raise ValueError("No traces found in the raw file")
+    
+    axes, waves = extract_all_steps(raw_data, traces[1:])
+    steps = list(axes.keys())
+    metadata = {
+        'title': getattr(raw_data, 'title', 'Unknown'),
+        'plot_name': getattr(raw_data, 'plot_name', 'Unknown'),
+        'independent_var': traces[0],
+        'processed_step': steps[0],
+        'steps': steps,
+        'step_parameters': get_step_parameters(raw_data)
+    }
+    
+    return {
+        'signals': list(waves[steps[0]].keys()),
+        'axes': axes,
+        'waves': waves,
+        'metadata': metadata
+    }
+
+
 def extract_signals_to_dataframe(raw_data: RawRead) -> Dict[str, Any]:
     """
     Extract signal data from RawRead object and convert to DataFrame.
@@ -110,7 +175,7 @@ def extract_signals_to_dataframe(raw_data: RawRead) -> Dict[str, Any]:
     
     # Use get_axis(step) for the independent variable, as recommended by spicelib docs
     # This often includes workarounds for LTSpice issues.
-    index_data = raw_data.get_axis(step_to_process)
+    index_data = _get_step_axis(raw_data, step_to_process)
     if index_data is None:
         raise ValueError(f"Could not retrieve axis data for step {step_to_process} using get_axis().")
 
@@ -184,6 +249,89 @@ def extract_signals_to_dataframe(raw_data: RawRead) -> Dict[str, Any]:
     }
 
 
+def extract_all_steps(raw_data: RawRead, signal_names: List[str]) -> Tuple[Dict[int, np.ndarray], Dict[int, Dict[str, np.ndarray]]]:
+    """
+    Extract the axis and signals of every simulation step.
+    
+    Stepped and Monte Carlo runs store one independent axis and one wave per
+    signal for each step; steps may have different lengths.
+    
+    Args:
+        raw_data: Parsed RawRead object from spicelib
+        signal_names: Signals to extract (e.g., from extract_signals_to_dataframe)
+    
+    Returns:
+        Tuple of ({step: axis array}, {step: {signal name: array}}).
+    """
+    axes = {}
+    waves = {}
+    
+    for step in raw_data.get_steps() or [0]:
+        axis = np.asarray(_get_step_axis(raw_data, step), dtype=np.float64)
+        step_waves = {}
+        for signal_name in signal_names:
+            wave = raw_data.get_trace(signal_name).get_wave(step)
+            if wave is None or len(wave) != len(axis):
+                continue
+            step_waves[signal_name] = np.abs(wave) if np.iscomplexobj(wave) else np.asarray(wave)
+        axes[step] = axis
+        waves[step] = step_waves
+    
+    return axes, waves
+
+
+def get_step_parameters(raw_data: RawRead) -> Optional[List[Dict[str, float]]]:
+    """
+    Get the swept parameter values of every simulation step.
+    
+    spicelib reads the .STEP values from the .log file next to the .raw
+    file; without one (e.g. a lone upload) they are unknown.
+    
+    Args:
+        raw_data: Parsed RawRead object from spicelib
+    
+    Returns:
+        List of {parameter name: value} per step, or None if unknown.
+    """
+    try:
+        steps = raw_data.steps
+    except Exception:
+        return None
+    if not steps:
+        return None
+    
+    parameters = []
+    for step in steps:
+        values = {}
+        for name, value in dict(step).items():
+            try:
+                values[str(name)] = float(value)
+            except (TypeError, ValueError):
+                continue
+        parameters.append(values)
+    return parameters
+
+
+def _get_step_axis(raw_data: RawRead, step: int) -> np.ndarray:
+    """
+    Get the independent axis of a step.
+    
+    spicelib's get_axis() raises for files whose header does not flag an
+    axis (including operating-point files); the first trace is used then.
+    
+    Args:
+        raw_data: Parsed RawRead object from spicelib
+        step: Step number
+    
+    Returns:
+        Axis array.
+    """
+    try:
+        return raw_data.get_axis(step)
+    except RuntimeError:
+        return raw_data.get_trace(0).get_wave(step)
+
+
 def get_signal_info(signals: List[str]) -> List[Dict[str, Any]]:
     """
     Generate signal information for display purposes.
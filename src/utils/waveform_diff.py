@@ -0,0 +1,277 @@
+"""
+Waveform regression diff for WaveDash application.
+
+Compares the signals of a run against a golden run. Both runs are
+interpolated onto one aligned grid (the union of their time points, or a
+uniform grid) and every common signal gets its maximum absolute error,
+time-weighted RMS error and first divergence time. The interpolation plan
+(indices and weights) is computed once per grid chunk and applied to 2-D
+blocks of signals, so thousands of signals are compared without per-signal
+Python loops over the samples.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.integration import trapezoid_weights
+
+# Grid alignment modes
+DIFF_GRIDS = ('union', 'uniform')
+DEFAULT_DIFF_GRID = 'union'
+
+# A signal diverges where |error| exceeds
+# DEFAULT_ABS_TOLERANCE + DEFAULT_REL_TOLERANCE * (golden peak-to-peak)
+DEFAULT_ABS_TOLERANCE = 1e-6
+DEFAULT_REL_TOLERANCE = 1e-3
+
+# Grid points per chunk
+DIFF_CHUNK_SIZE = 1 << 10
+
+# Memory budget of one block of signals (both runs); small enough that the
+# per-chunk temporaries stay in cache
+DIFF_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def align_axes(axis: np.ndarray, golden_axis: np.ndarray, grid: str = DEFAULT_DIFF_GRID,
+               n_points: Optional[int] = None) -> np.ndarray:
+    """
+    Build the grid both runs are compared on, over their common span.
+
+    Args:
+        axis: Axis of the run
+        golden_axis: Axis of the golden run
+        grid: 'union' (every time point of either run) or 'uniform'
+        n_points: Points of a uniform grid (defaults to the longer axis)
+
+    Returns:
+        Sorted grid array (empty if the axes do not overlap).
+
+    Raises:
+        ValueError: If the grid mode is unknown.
+    """
+    if grid not in DIFF_GRIDS:
+        raise ValueError(f"Unknown grid: {grid}")
+    axis = np.asarray(axis, dtype=np.float64)
+    golden_axis = np.asarray(golden_axis, dtype=np.float64)
+    if not len(axis) or not len(golden_axis):
+        return np.empty(0)
+
+    start, stop = max(axis[0], golden_axis[0]), min(axis[-1], golden_axis[-1])
+    if stop < start:
+        return np.empty(0)
+    if grid == 'uniform':
+        return np.linspace(start, stop, n_points or max(len(axis), len(golden_axis)))
+
+    merged = np.union1d(axis, golden_axis)
+    return merged[(merged >= start) & (merged <= stop)]
+
+
+def interpolation_plan(axis: np.ndarray, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the linear interpolation indices and weights of a grid.
+
+    Args:
+        axis: Sorted axis (may repeat time points)
+        grid: Points to interpolate at, within the axis span
+
+    Returns:
+        Tuple of (index of the sample at or before each grid point, weight
+        of the sample after it).
+    """
+    if len(axis) < 2:
+        return np.zeros(len(grid), dtype=np.intp), np.zeros(len(grid))
+    lower = np.clip(np.searchsorted(axis, grid, side='right') - 1, 0, len(axis) - 2)
+    step = axis[lower + 1] - axis[lower]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weight = np.where(step > 0, (grid - axis[lower]) / step, 0.0)
+    return lower, weight
+
+
+def interpolate_block(block: np.ndarray, lower: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolate every row of a block with a plan.
+
+    Args:
+        block: Array of shape (signals, samples)
+        lower: Sample indices from interpolation_plan()
+        weight: Weights from interpolation_plan()
+
+    Returns:
+        Array of shape (signals, len(lower)).
+    """
+    if block.shape[1] < 2:
+        return np.repeat(block[:, :1], len(lower), axis=1)
+    values = block[:, lower]
+    upper = block[:, lower + 1]
+    upper -= values
+    upper *= weight
+    values += upper
+    return values
+
+
+def compare_waves(axis: np.ndarray, waves: Dict[str, np.ndarray], golden_axis: np.ndarray,
+                  golden_waves: Dict[str, np.ndarray], grid: str = DEFAULT_DIFF_GRID,
+                  n_points: Optional[int] = None, abs_tolerance: float = DEFAULT_ABS_TOLERANCE,
+                  rel_tolerance: float = DEFAULT_REL_TOLERANCE,
+                  chunk_size: int = DIFF_CHUNK_SIZE) -> List[Dict[str, Any]]:
+    """
+    Compare the signals two runs have in common.
+
+    Args:
+        axis: Axis of the run
+        waves: Mapping of signal name to array of the run
+        golden_axis: Axis of the golden run
+        golden_waves: Mapping of signal name to array of the golden run
+        grid: Grid alignment mode (see align_axes())
+        n_points: Points of a uniform grid
+        abs_tolerance: Absolute part of the divergence threshold
+        rel_tolerance: Part of the divergence threshold relative to the
+            golden signal's peak-to-peak
+        chunk_size: Grid points per chunk
+
+    Returns:
+        List of dicts per common signal (in run order) with 'signal',
+        'max_abs_error', 'rms_error', 'relative_error' (max error over the
+        golden peak-to-peak), 'first_divergence' (time, or None) and
+        'diverged'.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    golden_axis = np.asarray(golden_axis, dtype=np.float64)
+    names = [name for name in waves if name in golden_waves]
+    grid_points = align_axes(axis, golden_axis, grid, n_points)
+    if not names or not len(grid_points):
+        return []
+
+    weights = trapezoid_weights(grid_points)
+    duration = grid_points[-1] - grid_points[0]
+    plan = interpolation_plan(axis, grid_points)
+    golden_plan = interpolation_plan(golden_axis, grid_points)
+    chunk_size = min(chunk_size, len(grid_points))
+    block_size = max(1, DIFF_BLOCK_BYTES // (8 * (len(axis) + len(golden_axis) + 2 * chunk_size)))
+
+    results = []
+    for start in range(0, len(names), block_size):
+        block_names = names[start:start + block_size]
+        block = np.vstack([np.asarray(waves[name], dtype=np.float64) for name in block_names])
+        golden = np.vstack([np.asarray(golden_waves[name], dtype=np.float64) for name in block_names])
+
+        span = golden.max(axis=1) - golden.min(axis=1)
+        threshold = (abs_tolerance + rel_tolerance * span)[:, np.newaxis]
+        max_error = np.zeros(len(block_names))
+        square_integral = np.zeros(len(block_names))
+        first_divergence = np.full(len(block_names), np.nan)
+
+        for chunk_start in range(0, len(grid_points), chunk_size):
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            error = interpolate_block(block, plan[0][chunk], plan[1][chunk])
+            error -= interpolate_block(golden, golden_plan[0][chunk], golden_plan[1][chunk])
+            np.abs(error, out=error)
+            np.maximum(max_error, error.max(axis=1), out=max_error)
+            square_integral += np.einsum('ij,ij,j->i', error, error, weights[chunk])
+
+            pending = np.isnan(first_divergence)
+            if pending.any():
+                beyond = error[pending] > threshold[pending]
+                found = beyond.any(axis=1)
+                rows = np.flatnonzero(pending)[found]
+                first_divergence[rows] = grid_points[chunk][beyond[found].argmax(axis=1)]
+
+        rms_error = np.sqrt(square_integral / duration) if duration > 0 else max_error
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_error = np.where(span > 0, max_error / span, np.where(max_error > 0, np.inf, 0.0))
+
+        for row, name in enumerate(block_names):
+            diverged = not np.isnan(first_divergence[row])
+            results.append({
+                'signal': name,
+                'max_abs_error': float(max_error[row]),
+                'rms_error': float(rms_error[row]),
+                'relative_error': float(relative_error[row]),
+                'first_divergence': float(first_divergence[row]) if diverged else None,
+                'diverged': diverged
+            })
+    return results
+
+
+def rank_differences(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order comparison results from most to least divergent.
+
+    Diverged signals come first, by relative error and then by the earliest
+    divergence; the others follow by relative error.
+
+    Args:
+        results: Result of compare_waves()
+
+    Returns:
+        New list of the results in rank order.
+    """
+    return sorted(results, key=lambda result: (
+        not result['diverged'],
+        -result['relative_error'],
+        result['first_divergence'] if result['first_divergence'] is not None else np.inf
+    ))
+
+
+def compare_datasets(dataset: Any, golden: Any, signal_names: Optional[Sequence[str]] = None,
+                     step: Optional[int] = None, golden_step: Optional[int] = None,
+                     grid: str = DEFAULT_DIFF_GRID, **options: Any) -> List[Dict[str, Any]]:
+    """
+    Compare one step of a dataset against a step of a golden dataset.
+
+    Args:
+        dataset: Dataset providing get_axis(), get_wave() and signal_names
+        golden: Golden dataset
+        signal_names: Signals or expressions to compare (defaults to every
+            signal both datasets have)
+        step: Step of the dataset (defaults to its first step)
+        golden_step: Step of the golden dataset (defaults to its first step)
+        grid: Grid alignment mode (see align_axes())
+        **options: Further arguments of compare_waves()
+
+    Returns:
+        Ranked results (see rank_differences()).
+    """
+    if signal_names is None:
+        golden_names = set(golden.signal_names)
+        signal_names = [name for name in dataset.signal_names if name in golden_names]
+
+    waves, golden_waves = {}, {}
+    for name in signal_names:
+        if dataset.has_signal(name, step) and golden.has_signal(name, golden_step):
+            waves[name] = dataset.get_wave(name, step)
+            golden_waves[name] = golden.get_wave(name, golden_step)
+
+    return rank_differences(compare_waves(dataset.get_axis(step), waves, golden.get_axis(golden_step),
+                                          golden_waves, grid, **options))
+
+
+def difference_trace(dataset: Any, golden: Any, signal_name: str, step: Optional[int] = None,
+                     golden_step: Optional[int] = None,
+                     grid: str = DEFAULT_DIFF_GRID) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the difference of one signal between a run and the golden run.
+
+    Args:
+        dataset: Dataset of the run
+        golden: Golden dataset
+        signal_name: Signal or expression both datasets have
+        step: Step of the dataset
+        golden_step: Step of the golden dataset
+        grid: Grid alignment mode (see align_axes())
+
+    Returns:
+        Tuple of (aligned grid, run minus golden on the grid).
+
+    Raises:
+        KeyError: If either dataset lacks the signal.
+    """
+    axis = np.asarray(dataset.get_axis(step), dtype=np.float64)
+    golden_axis = np.asarray(golden.get_axis(golden_step), dtype=np.float64)
+    grid_points = align_axes(axis, golden_axis, grid)
+    values = np.asarray(dataset.get_wave(signal_name, step), dtype=np.float64)[np.newaxis]
+    golden_values = np.asarray(golden.get_wave(signal_name, golden_step), dtype=np.float64)[np.newaxis]
+
+    difference = interpolate_block(values, *interpolation_plan(axis, grid_points))
+    difference -= interpolate_block(golden_values, *interpolation_plan(golden_axis, grid_points))
+    return grid_points, difference[0]
@@ -0,0 +1,47 @@
+"""
+Shared fixtures for the WaveDash tests.
+"""
+
+import pytest
+import pandas as pd
+from src.data.datasets import get_dataset_registry
+from src.data.figure_cache import get_figure_cache
+from src.data.spectrum_cache import get_spectrogram_cache, get_spectrum_cache
+
+
+def clear_server_caches():
+    """Drop every cached figure, spectrum and spectrogram."""
+    get_figure_cache().clear()
+    get_spectrum_cache().clear()
+    get_spectrogram_cache().clear()
+
+
+@pytest.fixture
+def register_tile_dataset():
+    """
+    Register datasets for tile-callback tests, with empty server-side caches.
+    
+    Yields a function taking a Dataset and the signal held by the stored
+    records. It registers the dataset and returns parsed data as the
+    parsed-data store holds it: the first records of the signal in the
+    dataset's processed step. Registered datasets are evicted afterwards.
+    """
+    registered = []
+    clear_server_caches()
+    
+    def register(dataset, signal_name, records=10):
+        step = dataset.metadata.get('processed_step')
+        get_dataset_registry().register(dataset)
+        registered.append(dataset.dataset_id)
+        return {
+            'data': pd.DataFrame({signal_name: dataset.get_wave(signal_name, step)[:records]}).to_dict('records'),
+            'index': dataset.get_axis(step)[:records].tolist(),
+            'metadata': dataset.metadata,
+            'dataset_id': dataset.dataset_id
+        }
+    
+    yield register
+    
+    for dataset_id in registered:
+        get_dataset_registry().evict(dataset_id)
+    clear_server_caches()
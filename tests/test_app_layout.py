@@ -100,7 +100,16 @@ def test_data_stores_in_layout():
         'signal-list-store',
         'selected-signal-store', 
         'active-tile-store',
-        'tile-config-store'
+        'tile-config-store',
+        'axis-store',
+        'xrange-store',
+        'cursor-store',
+        'measurement-store',
+        'similar-reference-store',
+        'golden-data-store',
+        'netlist-store',
+        'power-store',
+        'jitter-store'
     ]
     
     for store_id in expected_stores:
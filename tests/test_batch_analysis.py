@@ -0,0 +1,112 @@
+"""
+Tests for the step cache and the parallel per-step analysis.
+"""
+
+import os
+import pytest
+import numpy as np
+from src.data.batch_analysis import (WORKER_THREAD_VARIABLES, analyze_steps, get_analysis_pool, get_step_sweep,
+                                     run_step_analysis, shutdown_analysis_pool, table_to_rows)
+from src.data.datasets import Dataset
+from src.data.step_cache import cached_steps, ensure_step_cache, open_step, remove_step_cache
+from src.utils.measurements import MEASUREMENTS, measure_dataset
+
+
+def make_sweep(steps=12, points=5001, metadata=None):
+    """Create a sweep whose oscillation frequency grows with the step."""
+    time_data = np.linspace(0, 1e-3, points)
+    axes = {step: time_data for step in range(steps)}
+    waves = {step: {'V(out)': np.sin(2 * np.pi * (10e3 + 1e3 * step) * time_data),
+                    'I(R1)': np.full(points, 1e-3 * step)} for step in range(steps)}
+    return Dataset('sweep', 'sweep.raw', axes, waves, metadata)
+
+
+def worker_thread_settings():
+    """Read the thread-count variables inside a worker process."""
+    return {name: os.environ.get(name) for name in WORKER_THREAD_VARIABLES}
+
+
+class TestStepCache:
+    """Test the memory-mapped step cache."""
+    
+    def test_steps_round_trip(self, tmp_path):
+        """Test that cached steps are memory-mapped copies of the dataset."""
+        dataset = make_sweep(steps=3)
+        cache_dir = ensure_step_cache(dataset, tmp_path)
+        
+        assert cached_steps(cache_dir) == [0, 1, 2]
+        axis, waves = open_step(cache_dir, 2)
+        assert isinstance(axis, np.memmap)
+        np.testing.assert_array_equal(axis, dataset.get_axis(2))
+        np.testing.assert_array_equal(waves['V(out)'], dataset.get_wave('V(out)', 2))
+        
+        # A second call reuses the existing cache
+        assert ensure_step_cache(dataset, tmp_path) == cache_dir
+    
+    def test_remove_step_cache(self, tmp_path):
+        """Test that an evicted dataset's cache is deleted."""
+        cache_dir = ensure_step_cache(make_sweep(steps=2), tmp_path)
+        
+        assert remove_step_cache('sweep', tmp_path)
+        assert not cache_dir.exists()
+        assert not remove_step_cache('sweep', tmp_path)
+
+
+class TestBatchAnalysis:
+    """Test per-step analysis over the step cache."""
+    
+    def test_matches_in_process_measurements(self, tmp_path):
+        """Test that batched results equal measuring the dataset directly."""
+        dataset = make_sweep()
+        cache_dir = ensure_step_cache(dataset, tmp_path)
+        signals = ['V(out)', 'V(out)*2', 'missing']
+        
+        rows = table_to_rows(run_step_analysis(cache_dir, signals, max_workers=1))
+        
+        assert rows == measure_dataset(dataset, signals)
+    
+    def test_worker_returns_compact_arrays(self, tmp_path):
+        """Test the worker result: step and signal index columns plus a value matrix."""
+        cache_dir = ensure_step_cache(make_sweep(steps=4), tmp_path)
+        
+        steps, signals, values = analyze_steps(str(cache_dir), [1, 3], ['I(R1)', 'V(out)'])
+        
+        assert steps.tolist() == [1, 1, 3, 3]
+        assert signals.tolist() == [0, 1, 0, 1]
+        assert values.shape == (4, len(MEASUREMENTS))
+        assert np.isnan(values[0, MEASUREMENTS.index('period')])
+    
+    def test_process_pool(self, tmp_path):
+        """Test that steps measured in worker processes give the same table."""
+        cache_dir = ensure_step_cache(make_sweep(), tmp_path)
+        
+        serial = run_step_analysis(cache_dir, ['V(out)'], max_workers=1)
+        parallel = run_step_analysis(cache_dir, ['V(out)'], max_workers=2)
+        
+        assert parallel.equals(serial)
+        assert parallel['frequency'].to_numpy() == pytest.approx(10e3 + 1e3 * np.arange(12), rel=1e-3)
+    
+    def test_workers_run_single_threaded(self, monkeypatch):
+        """Test that spawned workers start with one OpenMP, BLAS and numexpr thread."""
+        for name in WORKER_THREAD_VARIABLES:
+            monkeypatch.delenv(name, raising=False)
+        shutdown_analysis_pool()
+        
+        try:
+            settings = get_analysis_pool(2).submit(worker_thread_settings).result()
+        finally:
+            shutdown_analysis_pool()
+        
+        assert settings == {name: '1' for name in WORKER_THREAD_VARIABLES}
+    
+    def test_step_sweep(self):
+        """Test the sweep axis: the varying .STEP parameter, else step numbers."""
+        parameters = [{'temp': 27.0, 'Rload': 100.0 * (step + 1)} for step in range(3)]
+        
+        assert get_step_sweep(make_sweep(steps=3, metadata={'step_parameters': parameters})) == \
+            ('Rload', [100.0, 200.0, 300.0])
+        assert get_step_sweep(make_sweep(steps=3)) == ('Step', [0.0, 1.0, 2.0])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,97 @@
+"""
+Tests for the headless command line interface.
+"""
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+from src.cli import main, measure_file, measure_files, write_results
+from src.utils.measurements import MEASUREMENTS
+
+SAMPLE_FILE = "raw_data/Ring_Oscillator_7stage.raw"
+
+
+@pytest.fixture
+def sample_file():
+    """Path of the sample .raw file."""
+    if not os.path.exists(SAMPLE_FILE):
+        pytest.skip(f"Sample file {SAMPLE_FILE} not available")
+    return SAMPLE_FILE
+
+
+class TestMeasureFiles:
+    """Test measuring .raw files without the app."""
+    
+    def test_measure_file(self, sample_file):
+        """Test measuring a native signal and an expression."""
+        rows, error = measure_file(sample_file, ['V(bus06)', 'V(bus06)-V(bus05)'])
+        
+        assert error is None
+        assert [row['signal'] for row in rows] == ['V(bus06)', 'V(bus06)-V(bus05)']
+        assert rows[0]['file'] == sample_file
+        assert rows[0]['frequency'] > 0
+        assert set(MEASUREMENTS) <= set(rows[0])
+    
+    def test_errors_are_reported_per_file(self, sample_file):
+        """Test that bad files and unknown signals are errors, not crashes."""
+        rows, errors = measure_files([sample_file, 'missing.raw'], ['V(bus06)'], workers=1)
+        
+        assert len(rows) == 1
+        assert errors[0]['file'] == 'missing.raw'
+        
+        rows, error = measure_file(sample_file, ['V(nothing)'])
+        assert rows == [] and "V(nothing)" in error
+    
+    def test_worker_pool(self, sample_file):
+        """Test that the worker pool gives the same rows in file order."""
+        files = [sample_file] * 3
+        
+        serial, _ = measure_files(files, ['V(bus06)'], workers=1)
+        parallel, _ = measure_files(files, ['V(bus06)'], workers=2)
+        
+        assert parallel == serial
+
+
+class TestOutput:
+    """Test JSON/CSV output and the entry point."""
+    
+    def test_csv_output(self):
+        """Test that CSV rows leave missing values empty."""
+        output = io.StringIO()
+        rows = [{'file': 'a.raw', 'signal': 'V(x)', 'step': 0, **dict.fromkeys(MEASUREMENTS, 1.0), 'period': None}]
+        
+        write_results(rows, [], output, 'csv')
+        
+        records = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert records[0]['signal'] == 'V(x)'
+        assert records[0]['period'] == ''
+        assert records[0]['max'] == '1.0'
+    
+    def test_main_writes_json(self, sample_file, tmp_path):
+        """Test the entry point with a JSON output file."""
+        output = tmp_path / 'results.json'
+        
+        status = main([sample_file, '-s', 'V(bus06)', '-o', str(output), '-j', '1'])
+        
+        results = json.loads(output.read_text())
+        assert status == 0
+        assert results['errors'] == []
+        assert results['results'][0]['signal'] == 'V(bus06)'
+        
+        assert main(['missing.raw', '-o', str(tmp_path / 'results.csv')]) == 1
+    
+    def test_cli_does_not_import_dash(self):
+        """Test that the CLI stays independent of dash and plotly."""
+        code = "import sys, src.cli; print(any(m.split('.')[0] in ('dash', 'plotly') for m in sys.modules))"
+        
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        
+        assert result.stdout.strip() == 'False'
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
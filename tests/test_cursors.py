@@ -0,0 +1,128 @@
+"""
+Tests for cursor measurements and the cursor readout.
+"""
+
+import pytest
+import numpy as np
+from dash import html
+from src.utils.cursors import locate, interpolate_at, measure_cursors
+from src.components.cursor_panel import create_cursor_readout, format_cursor_value
+from src.callbacks.cursor_callbacks import update_cursor_readout
+from src.data.datasets import Dataset, get_dataset_registry
+
+
+class TestInterpolation:
+    """Test exact value lookup at cursor positions."""
+    
+    def test_values_between_samples(self):
+        """Test linear interpolation between neighbouring samples."""
+        axis = np.array([0.0, 1.0, 3.0])
+        values = np.array([0.0, 2.0, 6.0])
+        left, weights, in_range = locate(axis, [0.5, 2.0, 3.0])
+        
+        assert interpolate_at(values, left, weights, in_range).tolist() == [1.0, 4.0, 6.0]
+    
+    def test_out_of_range_is_nan(self):
+        """Test that positions outside the axis have no value."""
+        axis = np.array([0.0, 1.0])
+        left, weights, in_range = locate(axis, [-1.0, 2.0])
+        
+        assert np.isnan(interpolate_at(np.array([1.0, 2.0]), left, weights, in_range)).all()
+    
+    def test_repeated_axis_values(self):
+        """Test that zero-width intervals at SPICE breakpoints do not divide by zero."""
+        axis = np.array([0.0, 1.0, 1.0, 2.0])
+        values = np.array([0.0, 1.0, 5.0, 5.0])
+        left, weights, in_range = locate(axis, [1.0, 1.5])
+        
+        result = interpolate_at(values, left, weights, in_range)
+        assert np.isfinite(result).all()
+        assert result[1] == 5.0
+
+
+class TestMeasureCursors:
+    """Test dual-cursor measurements."""
+    
+    def setup_method(self):
+        self.axis = np.linspace(0, 1e-6, 1001)
+        self.waves = {
+            'V(ramp)': self.axis * 1e6,
+            'V(flat)': np.full_like(self.axis, 0.9)
+        }
+    
+    def test_deltas_and_slope(self):
+        """Test Δt, 1/Δt, ΔV and slope between the cursors."""
+        measurement = measure_cursors(self.axis, self.waves, 0.2e-6, 0.7e-6)
+        
+        assert measurement['dt'] == pytest.approx(0.5e-6)
+        assert measurement['inv_dt'] == pytest.approx(2e6)
+        ramp = measurement['signals']['V(ramp)']
+        assert ramp['a'] == pytest.approx(0.2)
+        assert ramp['b'] == pytest.approx(0.7)
+        assert ramp['dv'] == pytest.approx(0.5)
+        assert ramp['slope'] == pytest.approx(1e6)
+        assert measurement['signals']['V(flat)']['dv'] == pytest.approx(0.0)
+    
+    def test_single_cursor(self):
+        """Test that only cursor A gives values but no deltas."""
+        measurement = measure_cursors(self.axis, self.waves, 0.5e-6)
+        
+        assert measurement['dt'] is None and measurement['inv_dt'] is None
+        assert measurement['signals']['V(ramp)']['a'] == pytest.approx(0.5)
+        assert measurement['signals']['V(ramp)']['b'] is None
+        assert measurement['signals']['V(ramp)']['slope'] is None
+    
+    def test_cursor_outside_data(self):
+        """Test that a cursor outside the axis reads no value."""
+        measurement = measure_cursors(self.axis, self.waves, 2e-6, 0.5e-6)
+        
+        assert measurement['signals']['V(ramp)']['a'] is None
+        assert measurement['signals']['V(ramp)']['dv'] is None
+
+
+class TestCursorReadout:
+    """Test the cursor readout component."""
+    
+    def test_no_cursors(self):
+        """Test the readout before any cursor is placed."""
+        readout = create_cursor_readout(None)
+        
+        assert readout[0].children == "No cursors placed"
+    
+    def test_table_rows(self):
+        """Test that the readout has one row per signal."""
+        axis = np.linspace(0, 1, 11)
+        measurement = measure_cursors(axis, {'V(a)': axis, 'V(b)': 2 * axis}, 0.1, 0.6)
+        summary, table = create_cursor_readout(measurement)
+        
+        assert isinstance(table, html.Table)
+        rows = table.children[1].children
+        assert [row.children[0].children for row in rows] == ['V(a)', 'V(b)']
+        assert rows[1].children[3].children == format_cursor_value(1.0)
+    
+    def test_signals_of_processed_step(self):
+        """Test that the readout takes signals from the processed step, not the first one."""
+        axis = np.linspace(0, 1, 11)
+        dataset = Dataset('cursor-steps', 'steps.raw', {0: axis, 1: axis},
+                          {0: {'V(a)': axis, 'V(early)': axis}, 1: {'V(a)': 2 * axis, 'V(late)': 3 * axis}})
+        get_dataset_registry().register(dataset)
+        parsed_data = {'dataset_id': 'cursor-steps', 'metadata': {'processed_step': 1}}
+        tile_config = {'plot-tile-1': ['V(a)', 'V(early)'], 'plot-tile-2': ['V(late)']}
+        
+        try:
+            summary, table = update_cursor_readout({'a': 0.5, 'b': None}, tile_config, parsed_data)
+        finally:
+            get_dataset_registry().evict('cursor-steps')
+        
+        rows = table.children[1].children
+        assert [row.children[0].children for row in rows] == ['V(a)', 'V(late)']
+        assert rows[1].children[1].children == format_cursor_value(1.5)
+    
+    def test_format_missing_value(self):
+        """Test that missing readings are shown as a dash."""
+        assert format_cursor_value(None) == "—"
+        assert format_cursor_value(2.5e-9) == "2.5e-09"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -18,7 +18,16 @@ def test_data_store_definitions():
         'signal-list-store', 
         'selected-signal-store',
         'active-tile-store',
-        'tile-config-store'
+        'tile-config-store',
+        'axis-store',
+        'xrange-store',
+        'cursor-store',
+        'measurement-store',
+        'similar-reference-store',
+        'golden-data-store',
+        'netlist-store',
+        'power-store',
+        'jitter-store'
     ]
     
     assert len(stores) == len(expected_store_ids)
@@ -36,6 +45,16 @@ def test_data_store_definitions():
     # UI state stores can be session-based
     assert store_dict['selected-signal-store'].storage_type == 'session'
     assert store_dict['active-tile-store'].storage_type == 'session'
+    
+    # Shared axis arrays are large and session-only
+    assert store_dict['axis-store'].storage_type == 'memory'
+    assert store_dict['xrange-store'].storage_type == 'memory'
+    assert store_dict['cursor-store'].storage_type == 'memory'
+    assert store_dict['measurement-store'].storage_type == 'memory'
+    assert store_dict['similar-reference-store'].storage_type == 'memory'
+    assert store_dict['golden-data-store'].storage_type == 'memory'
+    assert store_dict['netlist-store'].storage_type == 'memory'
+    assert store_dict['power-store'].storage_type == 'memory'
 
 
 def test_store_initialization_data():
@@ -56,4 +75,22 @@ def test_store_initialization_data():
     assert initial_data['signal-list-store'] == []   # Empty signal list
     assert initial_data['selected-signal-store'] is None  # No signal selected
     assert initial_data['active-tile-store'] is None      # No active tile
-    assert initial_data['tile-config-store'] == {}        # Empty tile config 
\ No newline at end of file
+    assert initial_data['tile-config-store'] == {}        # Empty tile config
+    assert initial_data['axis-store'] == {}               # No shared axes
+    assert initial_data['xrange-store'] is None           # Full x-range
+    assert initial_data['cursor-store'] == {'a': None, 'b': None}  # No cursors placed
+    assert initial_data['measurement-store'] is None      # Nothing measured
+    assert initial_data['similar-reference-store'] is None  # No similarity ranking
+    assert initial_data['golden-data-store'] is None      # No golden run
+    assert initial_data['netlist-store'] is None          # No netlist
+    assert initial_data['power-store'] is None            # No power accounted
+    assert initial_data['jitter-store'] is None           # No jitter analyzed
+
+
+def test_axis_key():
+    """Test axis-store keys for dataset steps."""
+    from src.data.stores import get_axis_key
+    
+    assert get_axis_key('abc123', 0) == 'abc123:0'
+    assert get_axis_key('abc123', None) == 'abc123:0'
+    assert get_axis_key('abc123', 2) != get_axis_key('def456', 2) 
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Tests for the server-side dataset registry.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.data.datasets import Dataset, DatasetRegistry, get_dataset_registry, resolve_dataset
+
+
+def make_dataset(dataset_id, filename='test.raw', points=100):
+    """Create a small single-step dataset."""
+    time_data = np.linspace(0, 1e-6, points)
+    frame = pd.DataFrame({
+        'V(out)': np.sin(time_data * 1e7),
+        'I(R1)': np.cos(time_data * 1e7) * 1e-3
+    }, index=time_data)
+    return Dataset.from_frame(dataset_id, filename, frame, {'processed_step': 0})
+
+
+class TestDataset:
+    """Test NumPy-backed datasets."""
+    
+    def test_from_frame(self):
+        """Test creating a dataset from a DataFrame."""
+        dataset = make_dataset('abc')
+        
+        assert dataset.steps == [0]
+        assert dataset.signal_names == ['V(out)', 'I(R1)']
+        assert len(dataset.get_axis()) == 100
+        assert np.array_equal(dataset.get_axis(0), dataset.get_axis())
+        assert dataset.has_signal('V(out)')
+        assert not dataset.has_signal('V(missing)')
+        assert dataset.nbytes == 3 * 100 * 8
+    
+    def test_to_frame_skips_missing_signals(self):
+        """Test building a DataFrame of selected signals."""
+        dataset = make_dataset('abc')
+        df = dataset.to_frame(['V(out)', 'V(missing)'])
+        
+        assert list(df.columns) == ['V(out)']
+        assert np.array_equal(df.index.to_numpy(), dataset.get_axis())
+        assert np.array_equal(df['V(out)'].to_numpy(), dataset.get_wave('V(out)'))
+
+
+class TestDatasetRegistry:
+    """Test the bounded dataset registry."""
+    
+    def test_register_and_get(self):
+        """Test registering and looking up a dataset."""
+        registry = DatasetRegistry()
+        dataset = make_dataset('abc')
+        registry.register(dataset)
+        
+        assert registry.get('abc') is dataset
+        assert registry.get('missing') is None
+        assert registry.get(None) is None
+    
+    def test_lru_eviction(self):
+        """Test that the least recently used dataset is evicted."""
+        registry = DatasetRegistry(max_datasets=2)
+        evicted = []
+        registry.add_eviction_listener(evicted.append)
+        
+        registry.register(make_dataset('a', 'a.raw'))
+        registry.register(make_dataset('b', 'b.raw'))
+        registry.get('a')  # Mark 'a' as recently used
+        registry.register(make_dataset('c', 'c.raw'))
+        
+        assert evicted == ['b']
+        assert registry.dataset_ids() == ['a', 'c']
+    
+    def test_updated_file_replaces_old_version(self):
+        """Test that re-uploading a changed file evicts the old version."""
+        registry = DatasetRegistry()
+        evicted = []
+        registry.add_eviction_listener(evicted.append)
+        
+        registry.register(make_dataset('v1', 'osc.raw'))
+        registry.register(make_dataset('v2', 'osc.raw'))
+        
+        assert evicted == ['v1']
+        assert registry.dataset_ids() == ['v2']
+    
+    def test_reregister_same_dataset_is_noop(self):
+        """Test that re-uploading identical content keeps the dataset."""
+        registry = DatasetRegistry()
+        evicted = []
+        registry.add_eviction_listener(evicted.append)
+        
+        registry.register(make_dataset('v1', 'osc.raw'))
+        registry.register(make_dataset('v1', 'osc.raw'))
+        
+        assert evicted == []
+        assert registry.dataset_ids() == ['v1']
+
+    
+    def test_resolve_dataset(self):
+        """Test resolving parsed-data-store contents to a dataset."""
+        dataset = make_dataset('resolve-test')
+        get_dataset_registry().register(dataset)
+        
+        assert resolve_dataset(None) is None
+        assert resolve_dataset({'dataset_id': 'resolve-test'}) is dataset
+        get_dataset_registry().evict('resolve-test')
+        
+        # Falls back to the JSON records when the dataset is gone
+        rebuilt = resolve_dataset({
+            'dataset_id': 'resolve-test',
+            'data': [{'V(out)': 1.0}, {'V(out)': 2.0}],
+            'index': [0.0, 1e-6],
+            'metadata': {}
+        })
+        assert rebuilt.get_wave('V(out)').tolist() == [1.0, 2.0]
+        assert rebuilt.get_axis().tolist() == [0.0, 1e-6]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,167 @@
+"""
+Tests for waveform decimation utilities.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.utils.decimation import (
+    DEFAULT_PIXEL_WIDTH,
+    MAX_XY_POINTS,
+    decimate_xy,
+    minmax_decimate,
+    pack_nan_separated,
+    reduce_for_display,
+    select_window
+)
+from src.components.plot_tiles import create_xy_plot_figure
+from src.utils.plot_encoding import decode_typed_array
+
+
+class TestSelectWindow:
+    """Test visible-window selection."""
+    
+    def test_full_range(self):
+        """Test that no range selects every sample."""
+        x = np.arange(10.0)
+        assert select_window(x, None) == slice(0, 10)
+    
+    def test_window_is_padded(self):
+        """Test that one sample outside each edge is included."""
+        x = np.arange(10.0)
+        window = select_window(x, [2.5, 5.5])
+        
+        assert x[window].tolist() == [2.0, 3.0, 4.0, 5.0, 6.0]
+    
+    def test_reversed_range(self):
+        """Test that a reversed range selects the same samples."""
+        x = np.arange(10.0)
+        assert select_window(x, [5.5, 2.5]) == select_window(x, [2.5, 5.5])
+
+
+class TestMinMaxDecimate:
+    """Test min/max bucket decimation."""
+    
+    def test_extremes_are_kept(self):
+        """Test that every bucket keeps its minimum and maximum."""
+        x = np.linspace(0, 1, 10000)
+        y = np.sin(2 * np.pi * 50 * x)
+        y[1234] = 5.0  # Single-sample spike
+        
+        x_reduced, (y_reduced,) = minmax_decimate(x, [y], 100)
+        
+        assert len(x_reduced) == len(y_reduced) <= 200
+        assert y_reduced.max() == 5.0
+        assert y_reduced.min() == y.min()
+    
+    def test_shared_x_is_monotonic(self):
+        """Test that the reduced axis is shared and non-decreasing."""
+        x = np.cumsum(np.random.default_rng(0).uniform(0.5, 1.5, 5000))
+        x_reduced, reduced = minmax_decimate(x, [np.sin(x), np.cos(x)], 50)
+        
+        assert np.all(np.diff(x_reduced) >= 0)
+        assert all(len(values) == len(x_reduced) for values in reduced)
+
+
+class TestReduceForDisplay:
+    """Test window-and-decimate reduction."""
+    
+    def test_small_signal_is_unchanged(self):
+        """Test that signals below the pixel budget keep the full axis."""
+        x = np.linspace(0, 1, 100)
+        x_out, (y_out,), is_full_axis = reduce_for_display(x, [x ** 2])
+        
+        assert is_full_axis
+        assert np.array_equal(x_out, x)
+        assert np.array_equal(y_out, x ** 2)
+    
+    def test_large_signal_is_decimated(self):
+        """Test that long signals are reduced to the pixel budget."""
+        x = np.linspace(0, 1, 100000)
+        x_out, (y_out,), is_full_axis = reduce_for_display(x, [np.sin(x)])
+        
+        assert not is_full_axis
+        assert len(x_out) <= 2 * DEFAULT_PIXEL_WIDTH
+    
+    def test_zoom_window_keeps_full_resolution(self):
+        """Test that a narrow window is sent at full resolution."""
+        x = np.linspace(0, 1, 100001)
+        x_out, (y_out,), is_full_axis = reduce_for_display(x, [np.sin(x)], [0.5, 0.501], 800)
+        
+        assert not is_full_axis
+        assert x_out[0] <= 0.5 and x_out[-1] >= 0.501
+        assert np.all(np.diff(x_out) == pytest.approx(1e-5))
+
+
+
+class TestPackNanSeparated:
+    """Test NaN-separated signal packing."""
+    
+    def test_packing(self):
+        """Test that signals are concatenated with one NaN between them."""
+        packed = pack_nan_separated([np.array([1.0, 2.0]), np.array([3.0, 4.0])])
+        
+        assert np.array_equal(packed, [1.0, 2.0, np.nan, 3.0, 4.0], equal_nan=True)
+
+
+
+class TestDecimateXY:
+    """Test 2-D reduction of XY curves."""
+    
+    def test_small_curve_is_unchanged(self):
+        """Test that curves within the budget are sent as-is."""
+        x = np.array([0.0, 1.0, 0.5])
+        y = np.array([1.0, 0.0, 2.0])
+        
+        x_plot, y_plot, connected = decimate_xy(x, y)
+        
+        assert connected
+        np.testing.assert_array_equal(x_plot, x)
+        np.testing.assert_array_equal(y_plot, y)
+    
+    def test_loop_keeps_its_shape(self):
+        """Test that a hysteresis-like loop keeps its ends and stays on the curve."""
+        t = np.linspace(0, 1, 1_000_000)
+        x = np.cos(2 * np.pi * t)
+        y = np.tanh(4 * x + 2 * np.sin(2 * np.pi * t))
+        
+        x_plot, y_plot, connected = decimate_xy(x, y)
+        
+        assert connected
+        assert len(x_plot) <= MAX_XY_POINTS
+        assert (x_plot[0], x_plot[-1]) == (x[0], x[-1])
+        # Kept points are original samples reaching the extremes to within a pixel
+        assert np.isin(x_plot, x).all()
+        assert x_plot.min() - x.min() < 2.0 / DEFAULT_PIXEL_WIDTH
+        assert y.max() - y_plot.max() < 2.0 / 400
+    
+    def test_retracing_curve_stays_within_budget(self):
+        """Test that a retracing Lissajous figure falls back to distinct occupied cells within budget."""
+        t = np.linspace(0, 1, 1_000_000)
+        x = np.sin(2 * np.pi * 3000 * t)
+        y = np.sin(2 * np.pi * 4110 * t + 0.3)
+        
+        x_plot, y_plot, connected = decimate_xy(x, y)
+        
+        assert not connected
+        assert len(x_plot) <= MAX_XY_POINTS
+        assert len(set(zip(x_plot.tolist(), y_plot.tolist()))) == len(x_plot)
+        assert x_plot.min() >= -1 and x_plot.max() <= 1
+    
+    def test_xy_figure(self):
+        """Test the XY tile figure and its signal checks."""
+        t = np.linspace(0, 1e-3, 1001)
+        df = pd.DataFrame({'V(in)': np.sin(2 * np.pi * 1e3 * t), 'I(R1)': np.cos(2 * np.pi * 1e3 * t)})
+        
+        fig = create_xy_plot_figure(['V(in)', 'I(R1)'], t, df, [0, 5e-4])
+        
+        assert fig.layout.meta == {'analysis': 'xy'}
+        assert fig.layout.xaxis.title.text == 'Voltage (V)'
+        # The window and one sample past its end
+        assert len(decode_typed_array(fig.data[0].x)) == 502
+        with pytest.raises(ValueError):
+            create_xy_plot_figure(['V(in)'], t, df)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
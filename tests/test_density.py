@@ -0,0 +1,143 @@
+"""
+Tests for waveform density rasterization.
+"""
+
+import pytest
+import numpy as np
+from src.utils.density import column_spans, compute_density, resample_runs
+from src.utils.plot_encoding import decode_typed_array
+from src.data.datasets import Dataset
+from src.data.figure_cache import get_figure_cache
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_runs(n_runs, n_points=500, seed=0):
+    """Create runs with individual adaptive-looking axes and random offsets."""
+    rng = np.random.default_rng(seed)
+    runs = []
+    for offset in rng.normal(0, 0.1, n_runs):
+        x = np.sort(rng.uniform(0, 1, n_points))
+        x[0], x[-1] = 0.0, 1.0
+        runs.append((x, np.sin(2 * np.pi * x) + offset))
+    return runs
+
+
+class TestResampleRuns:
+    """Test resampling runs onto a common grid."""
+    
+    def test_outside_run_is_nan(self):
+        """Test that grid points outside a run's axis are NaN."""
+        runs = [(np.array([0.0, 1.0]), np.array([0.0, 2.0]))]
+        resampled = resample_runs(runs, np.array([-1.0, 0.5, 2.0]))
+        
+        assert np.isnan(resampled[0, 0]) and np.isnan(resampled[0, 2])
+        assert resampled[0, 1] == 1.0
+
+    
+    def test_column_spans_include_edges_and_samples(self):
+        """Test that spans cover the samples in a column and the trace at its edges."""
+        runs = [(np.array([0.0, 0.25, 0.3, 0.7, 1.0]), np.array([0.0, 5.0, 1.0, 1.0, 2.0]))]
+        
+        minima, maxima = column_spans(runs, 0.0, 0.5, 4)
+        
+        np.testing.assert_allclose(minima[0, :3], [0.0, 1.0, 2.0])
+        np.testing.assert_allclose(maxima[0, :3], [5.0, 2.0, 2.0])
+        assert np.isnan(minima[0, 3]) and np.isnan(maxima[0, 3])
+
+
+class TestComputeDensity:
+    """Test 2-D run-count histograms."""
+    
+    def test_each_run_counts_once_per_cell(self):
+        """Test that every run passes through each column and counts at most once per cell."""
+        density = compute_density(make_runs(50), n_columns=100, n_rows=40)
+        
+        assert density['counts'].shape == (40, 100)
+        assert (density['counts'].sum(axis=0) >= 50).all()
+        assert density['counts'].max() <= 50
+        assert density['runs'] == 50
+    
+    def test_glitch_narrower_than_a_column(self):
+        """Test that a 10 us, 1 V glitch in a 1 ms window reaches the top rows."""
+        runs = []
+        for run in range(5):
+            x = np.linspace(0, 1e-3, 100001)
+            values = 0.01 * run * np.ones_like(x)
+            values[(x >= 5e-4) & (x < 5.1e-4)] = 1.0
+            runs.append((x, values))
+        
+        density = compute_density(runs, n_columns=600, n_rows=150)
+        
+        top = density['y0'] + density['dy'] * (density['counts'].shape[0] - 0.5)
+        assert top == pytest.approx(1.0)
+        glitch_columns = np.nonzero(density['counts'][-1])[0]
+        assert len(glitch_columns) > 0
+        assert (density['counts'][-1, glitch_columns] == 5).all()
+    
+    def test_output_size_does_not_depend_on_runs(self):
+        """Test that the image size depends only on the pixel grid."""
+        small = compute_density(make_runs(5), n_columns=80, n_rows=30)
+        large = compute_density(make_runs(500), n_columns=80, n_rows=30)
+        
+        assert small['counts'].shape == large['counts'].shape
+    
+    def test_percentile_envelopes(self):
+        """Test that envelopes are ordered and follow the signal."""
+        density = compute_density(make_runs(200), n_columns=50)
+        envelopes = density['envelopes']
+        
+        assert (envelopes[5.0] <= envelopes[50.0]).all()
+        assert (envelopes[50.0] <= envelopes[95.0]).all()
+        assert np.allclose(envelopes[50.0], np.sin(2 * np.pi * density['x']), atol=0.05)
+    
+    def test_window(self):
+        """Test binning only a window of the runs."""
+        density = compute_density(make_runs(10), x_range=[0.5, 0.25], n_columns=25)
+        
+        assert density['x'][0] == pytest.approx(0.255)
+        assert density['x'][-1] == pytest.approx(0.495)
+    
+    def test_no_runs(self):
+        """Test that binning nothing is an error."""
+        with pytest.raises(ValueError):
+            compute_density([])
+
+
+class TestDensityTile:
+    """Test the density mode of the tile figure callback."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        runs = make_runs(20)
+        self.dataset = Dataset(
+            'density-test', 'density_test.raw',
+            {step: x for step, (x, _) in enumerate(runs)},
+            {step: {'V(out)': values} for step, (_, values) in enumerate(runs)},
+            {'processed_step': 0, 'independent_var': 'time'}
+        )
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(out)')
+    
+    def test_density_figure_bins_all_steps(self):
+        """Test that the density figure holds every step as a heatmap."""
+        payload = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, mode='density')
+        heatmap = payload['data'][0]
+        
+        assert heatmap['type'] == 'heatmap'
+        counts = decode_typed_array(heatmap['z'])
+        assert np.nanmax(counts) <= 20
+        assert (np.nansum(counts, axis=0) >= 20).all()
+        assert [trace['name'] for trace in payload['data'][1:]] == ['P5', 'P50', 'P95']
+        assert payload['layout']['title']['text'] == 'V(out): 20 runs'
+    
+    def test_modes_are_cached_separately(self):
+        """Test that the line and density views do not share a cache entry."""
+        lines = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data)
+        density = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, mode='density')
+        
+        assert lines['data'][0]['type'] == 'scattergl'
+        assert density['data'][0]['type'] == 'heatmap'
+        assert get_figure_cache().stats()['entries'] == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
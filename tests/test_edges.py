@@ -0,0 +1,89 @@
+"""
+Tests for the edge index and its per-dataset cache.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset
+from src.utils.edges import FALLING, RISING, EdgeIndex, find_edges
+from src.utils.measurements import find_crossings
+
+
+def make_clock(points=20001, frequency=10.0, noise=0.0):
+    """Create a 1 s -cos 'clock' starting low, optionally with noise around the threshold."""
+    time_data = np.linspace(0, 1, points)
+    values = -np.cos(2 * np.pi * frequency * time_data)
+    values += noise * np.random.default_rng(0).standard_normal(points)
+    return time_data, values
+
+
+class TestFindEdges:
+    """Test vectorized edge detection."""
+    
+    def test_edges_match_crossings(self):
+        """Test that plain edges are the interpolated threshold crossings."""
+        time_data, values = make_clock()
+        
+        times, directions = find_edges(time_data, values, 0.5)
+        
+        np.testing.assert_allclose(times, find_crossings(time_data, values, 0.5))
+        assert times.dtype == np.float64 and directions.dtype == np.int8
+        assert directions[0] == RISING
+        assert np.all(directions[1:] != directions[:-1])
+    
+    def test_interpolated_edge_time(self):
+        """Test linear interpolation between the samples around an edge."""
+        times, directions = find_edges(np.array([0.0, 1.0, 2.0]), np.array([0.0, 1.0, 0.0]), 0.25)
+        
+        np.testing.assert_allclose(times, [0.25, 1.75])
+        assert directions.tolist() == [RISING, FALLING]
+    
+    def test_hysteresis_rejects_noise(self):
+        """Test that noise around the threshold only creates edges without hysteresis."""
+        time_data, values = make_clock(noise=0.05)
+        
+        plain, _ = find_edges(time_data, values, 0.0)
+        times, directions = find_edges(time_data, values, 0.0, hysteresis=0.5)
+        
+        assert len(plain) > 20
+        assert len(times) == 20
+        assert directions[0] == RISING
+        # Rising zero crossings of -cos(2*pi*10*t) are at 0.025 + k/10
+        np.testing.assert_allclose(times[::2], 0.025 + np.arange(10) / 10, atol=2e-3)
+
+
+class TestEdgeIndex:
+    """Test edge queries."""
+    
+    def test_queries(self):
+        """Test window and Nth-edge lookups."""
+        time_data, values = make_clock()
+        edges = EdgeIndex.build(time_data, values, 0.0, hysteresis=0.2)
+        
+        assert edges.count(0, 1, 'rise') == 10
+        assert edges.count(0.3, 0.5) == 4
+        times, directions = edges.between(0.3, 0.5, 'fall')
+        np.testing.assert_allclose(times, [0.375, 0.475], atol=1e-4)
+        assert directions.tolist() == [FALLING, FALLING]
+        
+        assert edges.nth_after(0.5, 1, 'rise') == pytest.approx(0.525, abs=1e-4)
+        assert edges.nth_after(0.5, 3, 'rise') == pytest.approx(0.725, abs=1e-4)
+        assert edges.nth_before(0.5, 1) == pytest.approx(0.475, abs=1e-4)
+        assert edges.nth_after(0.95, 1, 'rise') is None
+    
+    def test_dataset_caches_edges(self):
+        """Test that the dataset builds an index once per signal and threshold."""
+        time_data, values = make_clock()
+        dataset = Dataset('edges', 'edges.raw', {0: time_data}, {0: {'V(clk)': values}})
+        
+        edges = dataset.get_edges('V(clk)', 0.0)
+        
+        assert dataset.get_edges('V(clk)', 0.0) is edges
+        assert dataset.get_edges('V(clk)', 0.5) is not edges
+        assert len(dataset.get_edges('-V(clk)', 0.0)) == len(edges)
+        with pytest.raises(KeyError):
+            dataset.get_edges('V(missing)', 0.0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,98 @@
+"""
+Tests for statistical envelopes across steps and the envelope tile.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset
+from src.utils.envelope import accumulate_envelope, envelope_grid
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_sweep(steps=20, points=2001, seed=0):
+    """Create Monte Carlo steps of a decaying sine with random gain, each on its own time axis."""
+    rng = np.random.default_rng(seed)
+    axes, waves = {}, {}
+    for step in range(steps):
+        axis = np.sort(rng.uniform(0, 1e-3, points))
+        axis[0], axis[-1] = 0.0, 1e-3
+        gain = 1.0 + 0.1 * rng.standard_normal()
+        axes[step] = axis
+        waves[step] = {'V(out)': gain * np.exp(-axis / 5e-4) * np.sin(2 * np.pi * 5e3 * axis)}
+    return axes, waves
+
+
+class TestEnvelope:
+    """Test one-pass envelope accumulation."""
+    
+    def test_matches_stacked_statistics(self):
+        """Test that the streamed statistics equal NumPy's over the stacked, resampled steps."""
+        axes, waves = make_sweep()
+        grid = envelope_grid([(0.0, 1e-3)])
+        stacked = np.array([np.interp(grid, axes[step], waves[step]['V(out)']) for step in axes])
+        
+        envelope = accumulate_envelope(grid, ((axes[step], waves[step]['V(out)']) for step in axes))
+        
+        assert envelope.steps == 20
+        np.testing.assert_allclose(envelope.mean, stacked.mean(axis=0), atol=1e-12)
+        np.testing.assert_allclose(envelope.std, stacked.std(axis=0), atol=1e-12)
+        np.testing.assert_array_equal(envelope.minimum, stacked.min(axis=0))
+        np.testing.assert_array_equal(envelope.maximum, stacked.max(axis=0))
+    
+    def test_partial_coverage(self):
+        """Test that each grid point only counts the steps whose axis covers it."""
+        grid = envelope_grid([(0.0, 1.0), (0.5, 2.0)], [0.0, 3.0], n_points=7)
+        runs = [(np.array([0.0, 1.0]), np.array([1.0, 1.0])),
+                (np.array([0.5, 2.0]), np.array([3.0, 3.0]))]
+        
+        envelope = accumulate_envelope(grid, iter(runs))
+        
+        np.testing.assert_array_equal(envelope.count, [1, 2, 2, 1, 1, 0, 0])
+        np.testing.assert_allclose(envelope.mean[:5], [1.0, 2.0, 2.0, 3.0, 3.0])
+        np.testing.assert_allclose(envelope.std[:5], [0.0, 1.0, 1.0, 0.0, 0.0])
+        assert np.isnan(envelope.mean[-1]) and np.isnan(envelope.maximum[-1])
+    
+    def test_errors(self):
+        """Test that complex steps and empty sweeps are rejected."""
+        grid = envelope_grid([(0.0, 1.0)])
+        with pytest.raises(ValueError):
+            accumulate_envelope(grid, [(np.array([0.0, 1.0]), np.ones(2, dtype=complex))])
+        with pytest.raises(ValueError):
+            envelope_grid([])
+
+
+class TestEnvelopeTile:
+    """Test the cached envelope tile."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        axes, waves = make_sweep()
+        self.dataset = Dataset('envelope-test', 'mc.raw', axes, waves, {'processed_step': 0})
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(out)')
+    
+    def test_cached_per_signal_and_window(self):
+        """Test that envelopes are cached by signal and window and need the signal in some step."""
+        first = self.dataset.get_envelope('V(out)', [0.0, 5e-4])
+        
+        assert self.dataset.get_envelope('V(out)', (5e-4, 0.0)) is first
+        assert self.dataset.get_envelope('V(out)') is not first
+        assert self.dataset.get_envelope('V(out)*2').steps == 20
+        with pytest.raises(KeyError):
+            self.dataset.get_envelope('V(missing)')
+    
+    def test_envelope_tile_figure(self):
+        """Test the envelope tile payload: min/max and sigma bands around a mean line."""
+        payload = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, [0.0, 5e-4],
+                                      mode='envelope')
+        
+        assert [trace['name'] for trace in payload['data']] == [
+            'V(out) min', 'V(out) max', 'V(out) -σ', 'V(out) +σ', 'V(out)']
+        assert [trace.get('fill') for trace in payload['data']] == [
+            'none', 'tonexty', 'none', 'tonexty', None]
+        assert payload['layout']['xaxis']['range'] == [0.0, 5e-4]
+        assert 'meta' not in payload['layout']
+        assert '20 steps' in payload['layout']['title']['text']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,169 @@
+"""
+Tests for derived-signal expressions.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset
+from src.utils import expressions
+from src.utils.expressions import (ExpressionCache, ExpressionError, Node, evaluate_expression,
+                                   expression_signals, parse_expression)
+
+
+def signal(name):
+    """Signal reference node."""
+    return Node('signal', (name,))
+
+
+class TestParser:
+    """Test expression parsing into DAG nodes."""
+    
+    def test_spice_signal_references(self):
+        """Test that V(...), I(...) and quoted names are signal references."""
+        assert parse_expression('V(out)') == signal('V(out)')
+        assert parse_expression('Ix(U1:OUT)') == signal('Ix(U1:OUT)')
+        assert parse_expression('"my signal"') == signal('my signal')
+        assert parse_expression('time') == Node('axis', ())
+    
+    def test_precedence(self):
+        """Test operator precedence and associativity."""
+        a, b, c = signal('V(a)'), signal('V(b)'), signal('V(c)')
+        
+        assert parse_expression('V(a)-V(b)*V(c)') == Node('sub', (a, Node('mul', (b, c))))
+        assert parse_expression('-V(a)^2') == Node('neg', (Node('pow', (a, Node('const', (2.0,)))),))
+        assert parse_expression('V(a)-V(b)-V(c)') == Node('sub', (Node('sub', (a, b)), c))
+    
+    def test_functions(self):
+        """Test function calls and their aliases."""
+        out = signal('V(out)')
+        
+        assert parse_expression('d/dt(V(out))') == Node('deriv', (out,))
+        assert parse_expression('deriv(V(out))') == Node('deriv', (out,))
+        assert parse_expression('integ(I(R1))') == Node('integ', (signal('I(R1)'),))
+        assert parse_expression('db(V(out))') == Node('db', (out,))
+        assert parse_expression('max(V(out), 0)') == Node('max', (out, Node('const', (0.0,))))
+    
+    def test_shared_subexpressions(self):
+        """Test that equal sub-expressions are equal nodes."""
+        node = parse_expression('abs(V(a)-V(b)) + (V(a)-V(b))')
+        
+        assert node.args[0].args[0] == node.args[1]
+        assert expression_signals(node) == {'V(a)', 'V(b)'}
+    
+    @pytest.mark.parametrize('text', ['V(a)-', 'abs(V(a)', 'V(a) V(b)', 'max(V(a))', '$'])
+    def test_invalid_expressions(self, text):
+        """Test that malformed expressions raise ExpressionError."""
+        with pytest.raises(ExpressionError):
+            parse_expression(text)
+
+
+class TestEvaluation:
+    """Test lazy, chunked expression evaluation."""
+    
+    def setup_method(self):
+        """Set up a non-uniform axis and two signals."""
+        self.axis = np.sort(np.random.default_rng(0).uniform(0, 1, 1000))
+        self.waves = {'V(a)': np.sin(6 * self.axis), 'V(b)': np.cos(6 * self.axis),
+                      'V(nan)': np.where(self.axis < 0.5, 0.25, np.nan),
+                      'V(ac)': np.exp(6j * self.axis)}
+    
+    def evaluate(self, text, **kwargs):
+        return evaluate_expression(parse_expression(text), self.axis, self.waves.__getitem__, **kwargs)
+    
+    def test_elementwise_chunks_match_numpy(self):
+        """Test that chunked element-wise evaluation matches whole-array NumPy."""
+        expected = np.abs(self.waves['V(a)'] - self.waves['V(b)']) * 2 + 1
+        
+        result = self.evaluate('abs(V(a)-V(b))*2+1', chunk_size=7)
+        
+        np.testing.assert_allclose(result, expected)
+    
+    def test_derivative_and_integral(self):
+        """Test chunked d/dt and running integral on a non-uniform axis."""
+        np.testing.assert_allclose(self.evaluate('d/dt(V(a))', chunk_size=13),
+                                   np.gradient(self.waves['V(a)'], self.axis))
+        
+        integral = self.evaluate('integ(V(b))', chunk_size=13)
+        assert integral[0] == 0.0
+        np.testing.assert_allclose(integral[-1], np.trapezoid(self.waves['V(b)'], self.axis))
+    
+    def test_db_and_constants(self):
+        """Test db() and constant-only expressions."""
+        np.testing.assert_allclose(self.evaluate('db(10)'), np.full(len(self.axis), 20.0))
+        np.testing.assert_allclose(self.evaluate('db(V(a))'), 20 * np.log10(np.abs(self.waves['V(a)'])))
+    
+    @pytest.mark.parametrize('text', ['db(V(a))', 'min(V(a), V(b)) * 2', 'max(V(nan), V(b))',
+                                      'min(V(a), V(nan)) + d/dt(V(b))', 'db(V(ac))',
+                                      'abs(V(ac)) + max(V(a), V(b))', 'V(ac) * V(a) + 1', 'db(10)'])
+    def test_numexpr_matches_chunked(self, text, monkeypatch):
+        """Test that numexpr evaluation matches the chunked NumPy path, including NaN and complex inputs."""
+        pytest.importorskip('numexpr')
+        accelerated = self.evaluate(text)
+        
+        monkeypatch.setattr(expressions, 'numexpr', None)
+        reference = self.evaluate(text, chunk_size=7)
+        
+        assert accelerated.dtype == reference.dtype
+        np.testing.assert_allclose(accelerated, reference, equal_nan=True)
+    
+    def test_memoized_intermediates(self):
+        """Test that whole-signal intermediates are evaluated once and reused."""
+        cache = ExpressionCache()
+        first = self.evaluate('d/dt(V(a))', cache=cache, scope=0)
+        second = self.evaluate('d/dt(V(a)) * 2', cache=cache, scope=0)
+        
+        assert cache.get((0, parse_expression('d/dt(V(a))'))) is first
+        np.testing.assert_allclose(second, first * 2)
+    
+    def test_cache_eviction(self):
+        """Test that the memo stays within its byte budget."""
+        cache = ExpressionCache(max_bytes=self.axis.nbytes * 2)
+        for text in ('V(a)+1', 'V(a)+2', 'V(a)+3'):
+            self.evaluate(text, cache=cache, scope=0)
+        
+        assert cache.nbytes <= cache.max_bytes
+        assert cache.get((0, parse_expression('V(a)+1'))) is None
+    
+    def test_missing_signal(self):
+        """Test that unknown signals raise KeyError."""
+        with pytest.raises(KeyError):
+            self.evaluate('V(a)-V(missing)')
+
+
+class TestDerivedSignals:
+    """Test derived signals in datasets."""
+    
+    def setup_method(self):
+        """Set up a two-step dataset."""
+        axes = {0: np.linspace(0, 1, 11), 1: np.linspace(0, 2, 21)}
+        waves = {step: {'V(in)': axis, 'V(out)': 2 * axis} for step, axis in axes.items()}
+        self.dataset = Dataset('derived', 'test.raw', axes, waves)
+    
+    def test_derived_wave(self):
+        """Test that expressions are served like native signals."""
+        np.testing.assert_allclose(self.dataset.get_wave('V(out)-V(in)'), self.dataset.get_wave('V(in)'))
+        assert self.dataset.has_signal('v(out)/v(in)')
+        assert self.dataset.is_derived('V(out)-V(in)')
+        assert not self.dataset.is_derived('V(out)')
+    
+    def test_unknown_signals(self):
+        """Test that expressions over unknown signals are not available."""
+        assert not self.dataset.has_signal('V(out)-V(nope)')
+        assert not self.dataset.has_signal('V(out)-')
+        with pytest.raises(KeyError):
+            self.dataset.get_wave('V(nope)*2')
+    
+    def test_runs_and_frame(self):
+        """Test derived signals across steps and in DataFrame views."""
+        runs = self.dataset.get_runs('V(out)+V(in)')
+        
+        assert [len(axis) for axis, _ in runs] == [11, 21]
+        np.testing.assert_allclose(runs[1][1], 3 * runs[1][0])
+        
+        frame = self.dataset.to_frame(['V(out)', 'V(out)*V(in)'])
+        assert list(frame.columns) == ['V(out)', 'V(out)*V(in)']
+        assert self.dataset.derived_nbytes > 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
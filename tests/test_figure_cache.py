@@ -0,0 +1,154 @@
+"""
+Tests for the server-side figure cache.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from src.data.datasets import Dataset, get_dataset_registry
+from src.data.figure_cache import (
+    FigureCache,
+    bucket_x_range,
+    get_figure_cache,
+    make_figure_key
+)
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_payload(size=100):
+    """Create a figure-like payload of roughly the given size."""
+    return {'data': [{'y': 'x' * size}], 'layout': {}}
+
+
+class TestFigureKey:
+    """Test cache key construction."""
+    
+    def test_key_fields(self):
+        """Test that every key component distinguishes entries."""
+        key = make_figure_key('abc', ['V(a)', 'V(b)'], 0, None, 800, 'auto')
+        
+        assert key == make_figure_key('abc', ('V(a)', 'V(b)'), 0, None, 800, 'auto')
+        assert key != make_figure_key('abc', ['V(b)', 'V(a)'], 0, None, 800, 'auto')
+        assert key != make_figure_key('abc', ['V(a)', 'V(b)'], 1, None, 800, 'auto')
+        assert key != make_figure_key('abc', ['V(a)', 'V(b)'], 0, None, 1600, 'auto')
+        assert key != make_figure_key('abc', ['V(a)', 'V(b)'], 0, None, 800, 'f8')
+        assert key != make_figure_key('def', ['V(a)', 'V(b)'], 0, None, 800, 'auto')
+    
+    def test_nearby_ranges_share_bucket(self):
+        """Test that slightly different zoom windows map to the same key."""
+        key_a = make_figure_key('abc', ['V(a)'], x_range=[1.0e-6, 2.0e-6])
+        key_b = make_figure_key('abc', ['V(a)'], x_range=[1.0e-6 + 1e-12, 2.0e-6 - 1e-12])
+        key_c = make_figure_key('abc', ['V(a)'], x_range=[1.5e-6, 2.0e-6])
+        
+        assert key_a == key_b
+        assert key_a != key_c
+    
+    def test_bucket_covers_range(self):
+        """Test that a snapped range always covers the requested range."""
+        x0, x1 = bucket_x_range([1.23e-6, 4.56e-6])
+        
+        assert x0 <= 1.23e-6 and x1 >= 4.56e-6
+        assert (x1 - x0) < 1.1 * (4.56e-6 - 1.23e-6)
+        assert bucket_x_range(None) is None
+
+
+class TestFigureCache:
+    """Test the LRU figure cache."""
+    
+    def test_hit_and_miss_counters(self):
+        """Test that hits and misses are counted."""
+        cache = FigureCache()
+        key = make_figure_key('abc', ['V(a)'])
+        
+        assert cache.get(key) is None
+        cache.put(key, make_payload())
+        assert cache.get(key) == make_payload()
+        
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['entries'] == 1
+        assert stats['bytes'] > 100
+    
+    def test_entry_bound(self):
+        """Test that the least recently used entry is evicted."""
+        cache = FigureCache(max_entries=2)
+        keys = [make_figure_key('abc', [f'V({i})']) for i in range(3)]
+        
+        cache.put(keys[0], make_payload())
+        cache.put(keys[1], make_payload())
+        cache.get(keys[0])  # Mark as recently used
+        cache.put(keys[2], make_payload())
+        
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.stats()['evictions'] == 1
+    
+    def test_byte_bound(self):
+        """Test that memory use stays below the byte bound."""
+        cache = FigureCache(max_bytes=1000)
+        for i in range(10):
+            cache.put(make_figure_key('abc', [f'V({i})']), make_payload(300))
+        
+        stats = cache.stats()
+        assert stats['bytes'] <= 1000
+        assert stats['entries'] == 2
+    
+    def test_invalidate_dataset(self):
+        """Test dropping all entries of one dataset."""
+        cache = FigureCache()
+        cache.put(make_figure_key('abc', ['V(a)']), make_payload())
+        cache.put(make_figure_key('abc', ['V(b)']), make_payload())
+        cache.put(make_figure_key('def', ['V(a)']), make_payload())
+        
+        assert cache.invalidate_dataset('abc') == 2
+        assert cache.stats()['entries'] == 1
+        assert cache.get(make_figure_key('def', ['V(a)'])) is not None
+
+
+class TestTileFigureCaching:
+    """Test figure caching in the tile figure callback."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        time_data = np.linspace(0, 1e-6, 200)
+        frame = pd.DataFrame({'V(out)': np.sin(time_data * 1e7)}, index=time_data)
+        self.dataset = Dataset.from_frame('cache-test', 'cache_test.raw', frame,
+                                          {'processed_step': 0, 'independent_var': 'time'})
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(out)')
+    
+    def test_repeated_view_is_served_from_cache(self):
+        """Test that building the same view twice hits the cache."""
+        first = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data)
+        second = _update_tile_figure('plot-tile-2', ['V(out)'], self.parsed_data)
+        
+        assert second is first
+        assert get_figure_cache().stats()['hits'] == 1
+    
+    def test_dataset_eviction_invalidates_cache(self):
+        """Test that evicting a dataset drops its cached figures."""
+        _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data)
+        assert get_figure_cache().stats()['entries'] == 1
+        
+        get_dataset_registry().evict('cache-test')
+        assert get_figure_cache().stats()['entries'] == 0
+    
+    def test_incomplete_figure_is_not_cached(self):
+        """Test that figures with missing signals are not cached."""
+        _update_tile_figure('plot-tile-1', ['V(out)', 'V(missing)'], self.parsed_data)
+        assert get_figure_cache().stats()['entries'] == 0
+    
+    def test_zoom_window_shares_bucket_entry(self):
+        """Test that nearby zoom windows reuse one entry but show their own range."""
+        first = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, [2e-7, 4e-7])
+        second = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, [2.001e-7, 4e-7])
+        
+        assert get_figure_cache().stats()['hits'] == 1
+        assert first['layout']['xaxis']['range'] == [2e-7, 4e-7]
+        assert second['layout']['xaxis']['range'] == [2.001e-7, 4e-7]
+        assert first['data'] is second['data']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
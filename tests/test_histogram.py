@@ -0,0 +1,113 @@
+"""
+Tests for time-weighted value histograms and the histogram tile.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset
+from src.utils.histogram import compute_histogram
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_ripple(points=100001, seed=0):
+    """Create a 3 V supply with a 0.1 V sine ripple on an adaptive (random) time axis."""
+    rng = np.random.default_rng(seed)
+    time_data = np.sort(rng.uniform(0, 1e-3, points))
+    time_data[0], time_data[-1] = 0.0, 1e-3
+    return time_data, 3.0 + 0.1 * np.sin(2 * np.pi * 5e3 * time_data)
+
+
+class TestHistogram:
+    """Test histogram computation."""
+    
+    def test_time_weighting(self):
+        """Test that dense sampling of one level does not outweigh time spent at another."""
+        # 1 s at 0 V in 2 samples, then 1 s at 1 V in 1001 samples
+        axis = np.concatenate(([0.0, 1.0], np.linspace(1.0 + 1e-9, 2.0, 1001)))
+        values = np.concatenate(([0.0, 0.0], np.ones(1001)))
+        
+        histogram = compute_histogram(axis, values, bins=2)
+        
+        np.testing.assert_allclose(histogram.fraction, [0.5, 0.5], atol=1e-6)
+        assert histogram.mean == pytest.approx(0.5, abs=1e-6)
+        assert histogram.std == pytest.approx(0.5, abs=1e-6)
+    
+    def test_sine_distribution(self):
+        """Test mean, sigma, CDF and the arcsine shape of a sine's distribution."""
+        axis, values = make_ripple()
+        
+        histogram = compute_histogram(axis, values)
+        
+        assert histogram.mean == pytest.approx(3.0, abs=1e-6)
+        assert histogram.std == pytest.approx(0.1 / np.sqrt(2), rel=1e-4)
+        assert histogram.cdf[-1] == pytest.approx(1.0)
+        assert histogram.fraction[0] > 5 * histogram.fraction[len(histogram.fraction) // 2]
+        assert histogram.edges[0] == values.min() and histogram.edges[-1] == values.max()
+    
+    def test_chunks_match_single_pass(self):
+        """Test that streaming in small chunks gives the same histogram."""
+        axis, values = make_ripple()
+        
+        single = compute_histogram(axis, values, [2e-4, 7e-4])
+        chunked = compute_histogram(axis, values, [2e-4, 7e-4], chunk_size=7)
+        
+        np.testing.assert_allclose(chunked.time, single.time, rtol=1e-9, atol=1e-18)
+        assert chunked.mean == pytest.approx(single.mean)
+        assert chunked.duration == pytest.approx(single.duration)
+    
+    def test_memory_mapped_input(self, tmp_path):
+        """Test that memory-mapped arrays are read without being modified."""
+        axis, values = make_ripple()
+        np.save(tmp_path / 'wave.npy', values)
+        mapped = np.load(tmp_path / 'wave.npy', mmap_mode='r')
+        
+        histogram = compute_histogram(axis, mapped, chunk_size=1000)
+        
+        assert histogram.mean == pytest.approx(3.0, abs=1e-6)
+        np.testing.assert_array_equal(mapped, values)
+    
+    def test_edge_cases(self):
+        """Test flat signals, single samples, empty windows and complex signals."""
+        flat = compute_histogram(np.linspace(0, 1, 11), np.full(11, 1.8))
+        single = compute_histogram(np.array([0.0]), np.array([2.0]))
+        
+        assert flat.fraction.sum() == pytest.approx(1.0)
+        assert flat.std == 0.0
+        assert single.fraction.sum() == 1.0 and single.mean == 2.0
+        with pytest.raises(ValueError):
+            compute_histogram(np.linspace(0, 1, 11), np.ones(11), [2.0, 3.0])
+        with pytest.raises(ValueError):
+            compute_histogram(np.linspace(0, 1, 11), np.ones(11, dtype=complex))
+
+
+class TestHistogramTile:
+    """Test the cached histogram tile."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        time_data, values = make_ripple()
+        self.dataset = Dataset('histogram-test', 'supply.raw', {0: time_data},
+                               {0: {'V(vdd)': values, 'V(out)': values - 1.5}}, {'processed_step': 0})
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(vdd)')
+    
+    def test_cached_per_signal_window_and_bins(self):
+        """Test that histograms are cached by signal, window and bins."""
+        first = self.dataset.get_histogram('V(vdd)', [0.0, 5e-4])
+        
+        assert self.dataset.get_histogram('V(vdd)', (5e-4, 0.0)) is first
+        assert self.dataset.get_histogram('V(vdd)', [0.0, 5e-4], bins=50) is not first
+        assert len(self.dataset.get_histogram('V(vdd)-V(out)').time) == 1
+    
+    def test_histogram_tile_figure(self):
+        """Test the histogram tile payload: a histogram and CDF per signal with statistics."""
+        payload = _update_tile_figure('plot-tile-1', ['V(vdd)', 'V(out)'], self.parsed_data, [0.0, 5e-4],
+                                      mode='histogram')
+        
+        assert [trace['name'] for trace in payload['data']] == ['V(vdd)', 'V(vdd) CDF', 'V(out)', 'V(out) CDF']
+        assert payload['data'][1]['yaxis'] == 'y2'
+        assert payload['layout']['meta'] == {'analysis': 'histogram'}
+        assert 'mean 3' in payload['layout']['annotations'][0]['text']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,50 @@
+"""
+Tests for the trapezoid-rule integration helpers.
+"""
+
+import pytest
+import numpy as np
+from src.utils.integration import cumulative_trapezoid, trapezoid_weights
+
+
+class TestTrapezoidWeights:
+    """Test per-sample trapezoid weights of whole windows and chunks."""
+    
+    def test_weights_integrate_signals(self):
+        """Test that weights reproduce np.trapezoid on a non-uniform axis."""
+        axis = np.sort(np.random.default_rng(0).uniform(0, 1, 500))
+        values = np.sin(6 * axis)
+        
+        assert values @ trapezoid_weights(axis) == pytest.approx(np.trapezoid(values, axis))
+        assert trapezoid_weights(axis).sum() == pytest.approx(axis[-1] - axis[0])
+    
+    def test_chunks_add_up_to_window(self):
+        """Test that chunk weights inside a window match the window's own weights."""
+        axis = np.sort(np.random.default_rng(1).uniform(0, 1, 100))
+        window = trapezoid_weights(axis[20:80])
+        
+        chunks = np.concatenate([trapezoid_weights(axis, chunk_start, min(chunk_start + 7, 80), 20, 80)
+                                 for chunk_start in range(20, 80, 7)])
+        
+        np.testing.assert_allclose(chunks, window)
+    
+    def test_short_axes(self):
+        """Test that a single sample has zero weight and an empty chunk has none."""
+        assert trapezoid_weights(np.array([1.0])).tolist() == [0.0]
+        assert len(trapezoid_weights(np.array([0.0, 1.0]), 1, 1)) == 0
+
+
+class TestCumulativeTrapezoid:
+    """Test the running trapezoid integral."""
+    
+    def test_rows_integrate_from_start(self):
+        """Test every row's running integral, starting at zero."""
+        axis = np.array([0.0, 1.0, 3.0])
+        values = np.array([[1.0, 1.0, 1.0], [0.0, 2.0, 0.0]])
+        
+        np.testing.assert_allclose(cumulative_trapezoid(axis, values), [[0.0, 1.0, 3.0], [0.0, 1.0, 3.0]])
+        assert cumulative_trapezoid(axis[:1], values[:, :1]).tolist() == [[0.0], [0.0]]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,159 @@
+"""
+Tests for cycle-by-cycle period, duty cycle and jitter analysis.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset, get_dataset_registry
+from src.utils.jitter import (analyze_jitter, concatenate_cycles, cycle_arrays, jitter_statistics,
+                              period_histogram, time_interval_error)
+from src.components.jitter_panel import create_jitter_figure, create_jitter_table
+from src.callbacks.jitter_callbacks import run_jitter_analysis, update_jitter_signals
+
+
+def make_clock(period=1e-6, duty=0.3, cycles=50, jitter=0.0, points_per_cycle=200, seed=0):
+    """Create a square clock of a given duty cycle with random period jitter."""
+    rng = np.random.default_rng(seed)
+    periods = period + jitter * rng.standard_normal(cycles)
+    starts = np.concatenate(([0.0], np.cumsum(periods)))
+    axis = np.linspace(0, starts[-1], cycles * points_per_cycle + 1)
+    cycle = np.clip(np.searchsorted(starts, axis, side='right') - 1, 0, cycles - 1)
+    phase = (axis - starts[cycle]) / periods[cycle]
+    return axis, np.where(phase < duty, 1.8, 0.0)
+
+
+class TestCycleArrays:
+    """Test per-cycle arrays and statistics."""
+    
+    def test_periods_and_duty(self):
+        """Test periods, duty cycles and cycle-to-cycle jitter from edge times."""
+        rising = np.array([0.0, 1.0, 2.5, 3.5])
+        falling = np.array([0.25, 1.5, 3.0])
+        
+        cycles = cycle_arrays(rising, falling)
+        
+        np.testing.assert_allclose(cycles['period'], [1.0, 1.5, 1.0])
+        np.testing.assert_allclose(cycles['duty'], [0.25, 1 / 3, 0.5])
+        np.testing.assert_allclose(cycles['cycle_jitter'], [np.nan, 0.5, -0.5])
+        np.testing.assert_allclose(cycles['start'], rising[:-1])
+    
+    def test_falling_edge_cycles(self):
+        """Test that cycles starting on falling edges report the same duty cycle."""
+        rising = np.array([0.0, 1.0, 2.0])
+        falling = np.array([0.25, 1.25, 2.25])
+        
+        cycles = cycle_arrays(rising, falling, edge='fall')
+        
+        np.testing.assert_allclose(cycles['duty'], [0.25, 0.25])
+    
+    def test_missing_opposite_edge(self):
+        """Test that a cycle without an opposite edge has no duty cycle."""
+        cycles = cycle_arrays(np.array([0.0, 1.0, 2.0]), np.array([0.5]))
+        
+        assert cycles['duty'][0] == pytest.approx(0.5)
+        assert np.isnan(cycles['duty'][1])
+        assert cycle_arrays(np.array([0.0]), np.array([]))['period'].size == 0
+    
+    def test_time_interval_error(self):
+        """Test that an ideal clock has no TIE and a shifted edge shows up."""
+        edges = 5.0 + 2.0 * np.arange(11)
+        np.testing.assert_allclose(time_interval_error(edges), 0.0, atol=1e-12)
+        
+        edges[5] += 0.1
+        tie = time_interval_error(edges)
+        assert np.argmax(tie) == 5
+        assert tie.mean() == pytest.approx(0.0, abs=1e-12)
+    
+    def test_statistics(self):
+        """Test summary statistics, including runs without cycles."""
+        cycles = cycle_arrays(np.array([0.0, 1.0, 2.5, 3.5]), np.array([0.25, 1.5, 3.0]))
+        
+        statistics = jitter_statistics(cycles)
+        
+        assert statistics['cycles'] == 3
+        assert statistics['mean_period'] == pytest.approx(3.5 / 3)
+        assert statistics['period_jitter_pp'] == pytest.approx(0.5)
+        assert statistics['cycle_jitter_pp'] == pytest.approx(1.0)
+        assert statistics['cycle_jitter_rms'] == pytest.approx(0.5)
+        assert jitter_statistics(concatenate_cycles([]))['mean_period'] is None
+
+
+class TestAnalysis:
+    """Test the analysis of datasets."""
+    
+    def test_clock_with_jitter(self):
+        """Test period, duty and RMS jitter of a jittery clock over several steps."""
+        steps = [make_clock(jitter=1e-9, cycles=400, seed=seed) for seed in range(3)]
+        dataset = Dataset('jitter', 'clk.raw', {step: axis for step, (axis, _) in enumerate(steps)},
+                          {step: {'V(clk)': values} for step, (_, values) in enumerate(steps)})
+        
+        analysis = analyze_jitter(dataset, 'V(clk)')
+        
+        assert analysis['threshold'] == pytest.approx(0.9)
+        assert len(analysis['rows']) == 3
+        total = analysis['total']
+        assert total['cycles'] == sum(row['cycles'] for row in analysis['rows'])
+        assert total['mean_period'] == pytest.approx(1e-6, rel=1e-3)
+        assert total['mean_duty'] == pytest.approx(0.3, abs=0.01)
+        # Sampling quantizes edges to 5 ns, so measured jitter is at least the true 1 ns
+        assert 1e-9 < total['period_jitter_rms'] < 1e-8
+        with pytest.raises(KeyError):
+            analyze_jitter(dataset, 'V(missing)')
+    
+    def test_long_clock(self):
+        """Test that every cycle of a long, ideal clock gets the same period and duty cycle."""
+        axis = np.arange(40_001, dtype=np.float64) * 0.25e-9
+        values = np.where((np.arange(len(axis)) % 4) < 2, 1.0, 0.0)
+        dataset = Dataset('long', 'long.raw', {0: axis}, {0: {'V(clk)': values}})
+        
+        analysis = analyze_jitter(dataset, 'V(clk)', threshold=0.5)
+        cycles = analysis['cycles'][0]
+        
+        assert analysis['total']['cycles'] == 9_999
+        np.testing.assert_allclose(cycles['period'], 1e-9, rtol=1e-9)
+        np.testing.assert_allclose(cycles['duty'], 0.5, rtol=1e-9)
+        assert period_histogram(cycles['period'])['counts'].sum() == 9_999
+
+
+class TestJitterPanel:
+    """Test the jitter table, plots and callbacks."""
+    
+    def setup_method(self):
+        axis, values = make_clock(jitter=2e-9, cycles=100)
+        self.dataset = Dataset('jitter-test', 'clk.raw', {0: axis}, {0: {'V(clk)': values}})
+        get_dataset_registry().register(self.dataset)
+    
+    def teardown_method(self):
+        get_dataset_registry().evict('jitter-test')
+    
+    def test_table_and_figures(self):
+        """Test the placeholder, the statistics table and every plot view."""
+        analysis = analyze_jitter(self.dataset, 'V(clk)')
+        
+        assert "Analyze" in create_jitter_table(None)[0].children
+        summary, table = create_jitter_table(analysis)
+        assert summary.children.startswith("98 cycles")
+        assert len(table.children[1].children) == 1
+        
+        for view in ('period', 'histogram', 'tie'):
+            fig = create_jitter_figure(analysis, view)
+            assert len(fig.data) == 1
+            assert fig.layout.meta == {'analysis': 'jitter'}
+    
+    def test_callbacks(self):
+        """Test choosing the selected signal and running the analysis."""
+        options, value = update_jitter_signals(['V(clk)', 'V(out)'], 'V(clk)', None)
+        assert value == 'V(clk)' and len(options) == 2
+        
+        results, settings, style = run_jitter_analysis(1, 'V(clk)', None, 0, 'rise',
+                                                       {'dataset_id': 'jitter-test'})
+        assert settings == {'signal': 'V(clk)', 'threshold': pytest.approx(0.9), 'hysteresis': 0, 'edge': 'rise'}
+        assert style == {'display': 'block'}
+        
+        results, settings, style = run_jitter_analysis(1, 'V(clk)', 5.0, 0, 'rise', {'dataset_id': 'jitter-test'})
+        assert "Fewer than two edges" in results[0].children
+        assert style == {'display': 'none'}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,77 @@
+"""
+Tests for the byte-bounded LRU cache.
+"""
+
+import pytest
+import numpy as np
+from src.utils.edges import EdgeIndex
+from src.utils.lru import ByteBoundedLRU
+
+
+class TestByteBoundedLRU:
+    """Test byte-bounded LRU caching of values with nbytes."""
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused entries are evicted once the byte bound is exceeded."""
+        cache = ByteBoundedLRU(max_bytes=3 * 800)
+        for key in 'abc':
+            cache.put(key, np.zeros(100))
+        cache.get('a')
+        
+        cache.put('d', np.zeros(100))
+        
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('d') is not None
+        assert len(cache) == 3 and cache.nbytes == 3 * 800
+    
+    def test_replace_and_oversized_values(self):
+        """Test that replacing a key updates the byte count and oversized values are not cached."""
+        cache = ByteBoundedLRU(max_bytes=1000)
+        cache.put('a', np.zeros(100))
+        cache.put('a', np.zeros(50))
+        
+        cache.put('big', np.zeros(1000))
+        
+        assert cache.nbytes == 400
+        assert cache.get('big') is None
+    
+    def test_any_value_with_nbytes(self):
+        """Test caching objects other than arrays, sized by their nbytes."""
+        axis = np.linspace(0, 1, 101)
+        edges = EdgeIndex.build(axis, np.sin(2 * np.pi * 3 * axis), 0.0)
+        cache = ByteBoundedLRU(max_bytes=1 << 20)
+        
+        cache.put(('V(out)', 0.0), edges)
+        
+        assert cache.get(('V(out)', 0.0)) is edges
+        assert cache.nbytes == edges.nbytes
+    
+    def test_entry_bound_and_counters(self):
+        """Test the optional entry bound and the hit, miss and eviction counters."""
+        cache = ByteBoundedLRU(max_bytes=1 << 20, max_entries=2)
+        for key in 'abc':
+            cache.put(key, np.zeros(10))
+        
+        assert cache.get('a') is None
+        assert cache.get('c') is not None
+        
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 1, 1)
+        assert stats['entries'] == 2 and stats['hit_rate'] == 0.5
+    
+    def test_discard_and_clear(self):
+        """Test dropping entries by key and resetting the cache."""
+        cache = ByteBoundedLRU(max_bytes=1 << 20)
+        for key in [('abc', 1), ('abc', 2), ('def', 1)]:
+            cache.put(key, np.zeros(10))
+        
+        assert cache.discard(lambda key: key[0] == 'abc') == 2
+        assert len(cache) == 1 and cache.nbytes == 80
+        
+        cache.get(('def', 1))
+        cache.clear()
+        assert cache.stats()['hits'] == 0 and len(cache) == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
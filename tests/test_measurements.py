@@ -0,0 +1,148 @@
+"""
+Tests for the vectorized waveform measurements and the results table.
+"""
+
+import pytest
+import numpy as np
+from dash import html
+from src.data.datasets import Dataset
+from src.utils.measurements import find_crossings, measure_waves, measure_dataset, MEASUREMENTS
+from src.components.measurement_panel import create_measurement_table
+
+
+class TestCrossings:
+    """Test threshold-crossing detection."""
+    
+    def test_interpolated_crossings(self):
+        """Test that crossings are located between samples by linear interpolation."""
+        x = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+        y = np.array([0.0, 2.0, 2.0, 0.0, 0.0])
+        
+        assert find_crossings(x, y, 1.0, 'rise').tolist() == [0.5]
+        assert find_crossings(x, y, 1.0, 'fall').tolist() == [2.5]
+        assert find_crossings(x, y, 1.0).tolist() == [0.5, 2.5]
+    
+    def test_no_crossings(self):
+        """Test that a signal that never reaches the level has no crossings."""
+        x = np.linspace(0, 1, 10)
+        
+        assert len(find_crossings(x, np.zeros(10), 1.0)) == 0
+
+
+class TestMeasureWaves:
+    """Test the .meas-style quantities."""
+    
+    def setup_method(self):
+        """Set up a 1 kHz time axis."""
+        self.t = np.linspace(0, 10e-3, 100001)
+    
+    def test_square_wave(self):
+        """Test period, frequency, duty cycle and edge times of a pulse train."""
+        square = (np.sin(2 * np.pi * 1e3 * self.t) > 0.5).astype(float)
+        values = measure_waves(self.t, {'sq': square})['sq']
+        
+        assert values['period'] == pytest.approx(1e-3, rel=1e-3)
+        assert values['frequency'] == pytest.approx(1e3, rel=1e-3)
+        assert values['duty'] == pytest.approx(100 / 3, rel=1e-2)
+        assert values['pp'] == 1.0
+        assert values['rise'] == pytest.approx(0.8e-7, rel=1e-2)
+        assert values['fall'] == pytest.approx(0.8e-7, rel=1e-2)
+    
+    def test_sine_average_and_rms(self):
+        """Test time-weighted average and RMS."""
+        sine = np.sin(2 * np.pi * 1e3 * self.t)
+        values = measure_waves(self.t, {'sin': sine})['sin']
+        
+        assert values['avg'] == pytest.approx(0.0, abs=1e-9)
+        assert values['rms'] == pytest.approx(1 / np.sqrt(2), rel=1e-6)
+        assert values['duty'] == pytest.approx(50.0, rel=1e-3)
+        assert values['overshoot'] is None
+    
+    def test_step_response(self):
+        """Test overshoot and settling of an underdamped step."""
+        t = np.linspace(0, 1e-3, 100001)
+        step = 1 - np.exp(-t / 1e-4) * np.cos(2 * np.pi * 5e3 * t)
+        values = measure_waves(t, {'step': step})['step']
+        
+        expected_overshoot = (step.max() - step[-1]) / (step[-1] - step[0]) * 100
+        assert values['overshoot'] == pytest.approx(expected_overshoot)
+        outside = np.abs(step - step[-1]) > 0.02 * (step[-1] - step[0])
+        assert values['settling'] == pytest.approx(t[np.nonzero(outside)[0][-1] + 1])
+        assert values['period'] is None
+    
+    def test_flat_signal(self):
+        """Test that edge quantities of a flat signal are None."""
+        values = measure_waves(self.t, {'flat': np.ones_like(self.t)})['flat']
+        
+        assert set(values) == set(MEASUREMENTS)
+        assert values['pp'] == 0.0
+        assert values['period'] is None
+        assert values['rise'] is None
+    
+    def test_blocks_match_single_signals(self, monkeypatch):
+        """Test that splitting signals into blocks does not change results."""
+        import src.utils.measurements as measurements
+        waves = {f's{i}': np.sin(2 * np.pi * (1e3 + 100 * i) * self.t) for i in range(5)}
+        expected = measure_waves(self.t, waves)
+        
+        monkeypatch.setattr(measurements, 'BLOCK_BYTES', 1)
+        for name, values in measure_waves(self.t, waves).items():
+            for quantity, value in values.items():
+                assert value == pytest.approx(expected[name][quantity], abs=1e-12)
+
+
+class TestMeasureDataset:
+    """Test measuring signals across simulation steps."""
+    
+    def test_all_steps(self):
+        """Test that every step is measured on its own axis."""
+        axes = {0: np.linspace(0, 1, 101), 1: np.linspace(0, 2, 51)}
+        waves = {step: {'V(out)': axis * (step + 1)} for step, axis in axes.items()}
+        dataset = Dataset('id', 'file.raw', axes, waves)
+        
+        rows = measure_dataset(dataset, ['V(out)', 'V(missing)'])
+        
+        assert [(row['signal'], row['step']) for row in rows] == [('V(out)', 0), ('V(out)', 1)]
+        assert rows[0]['max'] == 1.0
+        assert rows[1]['max'] == 4.0
+    
+    def test_timing_uses_cached_edge_index(self, monkeypatch):
+        """Test that period and duty come from the dataset's cached mid-level edge index."""
+        axis = np.arange(4000) * 1e-9
+        clock = np.where((np.arange(4000) % 1000) < 250, 1.0, 0.0)
+        dataset = Dataset('id', 'clk.raw', {0: axis}, {0: {'V(clk)': clock}})
+        queries = []
+        get_edges = dataset.get_edges
+        monkeypatch.setattr(dataset, 'get_edges',
+                            lambda *args, **kwargs: queries.append(args) or get_edges(*args, **kwargs))
+        
+        row = measure_dataset(dataset, ['V(clk)'])[0]
+        
+        assert queries == [('V(clk)', 0.5)]
+        assert get_edges('V(clk)', 0.5, step=0) is get_edges('V(clk)', 0.5)
+        assert row['period'] == pytest.approx(1e-6, rel=1e-6)
+        assert row['duty'] == pytest.approx(25.0, rel=1e-3)
+
+
+class TestMeasurementTable:
+    """Test the measurement results table."""
+    
+    def test_placeholder(self):
+        """Test the messages before measuring and without plotted signals."""
+        assert isinstance(create_measurement_table(None)[0], html.P)
+        assert isinstance(create_measurement_table([])[0], html.P)
+    
+    def test_step_column_only_for_stepped_runs(self):
+        """Test that the step column appears only with several steps."""
+        row = {'signal': 'V(out)', 'step': 0, **dict.fromkeys(MEASUREMENTS, 1.0)}
+        
+        single = create_measurement_table([row])[0]
+        stepped = create_measurement_table([row, {**row, 'step': 1}])[0]
+        
+        single_header = single.children[0].children.children
+        stepped_header = stepped.children[0].children.children
+        assert len(stepped_header) == len(single_header) + 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
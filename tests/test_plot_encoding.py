@@ -0,0 +1,114 @@
+"""
+Tests for binary typed-array encoding of plot data.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from src.utils.plot_encoding import (
+    can_use_float32,
+    encode_typed_array,
+    decode_typed_array
+)
+from src.components.plot_tiles import create_multi_signal_plot_figure
+
+
+class TestFloat32Selection:
+    """Test the float32 precision check."""
+    
+    def test_signal_values_use_float32(self):
+        """Test that ordinary signal values are downcast to float32."""
+        values = np.sin(np.linspace(0, 10, 1000)) * 1.8
+        assert can_use_float32(values)
+    
+    def test_small_ripple_on_large_offset_keeps_float64(self):
+        """Test that microvolt ripple on a 5 V rail keeps float64."""
+        values = 5.0 + 1e-6 * np.sin(np.linspace(0, 10, 1000))
+        assert not can_use_float32(values)
+    
+    def test_fine_time_axis_keeps_float64(self):
+        """Test that picosecond steps late in a long transient keep float64."""
+        time_axis = 1e-3 + np.arange(1000) * 1e-12
+        assert not can_use_float32(time_axis, is_axis=True)
+    
+    def test_coarse_time_axis_uses_float32(self):
+        """Test that a coarse, short time axis is downcast to float32."""
+        time_axis = np.linspace(0, 1e-6, 1001)
+        assert can_use_float32(time_axis, is_axis=True)
+    
+    def test_out_of_range_values_keep_float64(self):
+        """Test that values beyond float32 range keep float64."""
+        assert not can_use_float32(np.array([0.0, 1e300]))
+
+
+class TestTypedArrayEncoding:
+    """Test typed-array encoding and decoding."""
+    
+    def test_round_trip(self):
+        """Test encoding and decoding an array."""
+        values = np.array([0.0, 1.5, 3.0, 1.5, 0.0])
+        spec = encode_typed_array(values)
+        
+        assert spec['dtype'] == 'f4'
+        assert np.array_equal(decode_typed_array(spec), values)
+    
+    def test_2d_round_trip(self):
+        """Test that 2-D arrays carry their shape."""
+        values = np.arange(12.0).reshape(3, 4)
+        spec = encode_typed_array(values)
+        
+        assert spec['shape'] == '3, 4'
+        assert np.array_equal(decode_typed_array(spec), values)
+    
+    def test_float32_disallowed(self):
+        """Test forcing float64 encoding."""
+        spec = encode_typed_array([0.1, 0.2, 0.3], allow_float32=False)
+        
+        assert spec['dtype'] == 'f8'
+        assert decode_typed_array(spec).tolist() == [0.1, 0.2, 0.3]
+    
+    def test_multi_signal_figure_payload_is_binary(self):
+        """Test that multi-signal figures serialize trace data as typed arrays."""
+        time_data = np.linspace(0, 1e-6, 500)
+        df = pd.DataFrame({
+            'V(a)': np.sin(time_data * 1e7),
+            'V(b)': np.cos(time_data * 1e7)
+        }, index=time_data)
+        
+        fig = create_multi_signal_plot_figure(['V(a)', 'V(b)'], time_data, df, {}, 'plot-tile-1')
+        fig_json = pio.to_json(fig)
+        
+        assert '"bdata"' in fig_json
+        for trace in fig.data:
+            assert np.allclose(decode_typed_array(trace.x), time_data)
+            assert np.allclose(decode_typed_array(trace.y), df[trace.name].to_numpy(), atol=1e-6)
+
+    
+    def test_shared_axis_reference(self):
+        """Test that traces reference a shared axis instead of embedding it."""
+        time_data = np.linspace(0, 1e-6, 500)
+        df = pd.DataFrame({
+            'V(a)': np.sin(time_data * 1e7),
+            'V(b)': np.cos(time_data * 1e7)
+        }, index=time_data)
+        
+        fig = create_multi_signal_plot_figure(['V(a)', 'V(b)'], time_data, df, {}, 'plot-tile-1',
+                                              axis_key='abc123:0')
+        
+        assert len(fig.data) == 2
+        for trace in fig.data:
+            assert trace.x is None
+            assert trace.meta == {'axis': 'abc123:0'}
+            assert trace.y is not None
+        
+        # N overlays ship N arrays, not 2N
+        shared_size = len(pio.to_json(fig))
+        embedded_size = len(pio.to_json(
+            create_multi_signal_plot_figure(['V(a)', 'V(b)'], time_data, df, {}, 'plot-tile-1')
+        ))
+        assert shared_size < embedded_size
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -3,15 +3,26 @@ Tests for plot tiles functionality.
 """
 
 import pytest
+import numpy as np
+import pandas as pd
 import plotly.graph_objects as go
 from dash import html, dcc
+from src.utils.plot_encoding import decode_typed_array
 from src.components.plot_tiles import (
+    DEFAULT_TILE_COUNT,
     create_plot_tiles_component,
+    create_plot_tile,
     create_empty_plot_figure,
     create_signal_plot_figure,
-    get_tile_wrapper_style,
-    get_tile_header_style,
+    create_multi_signal_plot_figure,
+    get_overlay_group,
+    get_tile_wrapper_class,
+    get_tile_header_class,
     get_tile_status_text,
+    get_tile_id,
+    get_tile_index,
+    get_tile_signals,
+    get_plotted_signals,
     _get_signal_y_label
 )
 
@@ -24,7 +35,14 @@ class TestPlotTilesComponent:
         component = create_plot_tiles_component()
         
         assert component.id == 'plot-tiles-container'
-        assert len(component.children) == 3  # Title, subtitle, grid
+        assert len(component.children) == 5  # Title, subtitle, toolbar, grid, add tile button
+        
+        toolbar = component.children[2]
+        assert toolbar.id == 'plot-tiles-toolbar'
+        assert toolbar.children[0].id == 'link-axes-toggle'
+        assert toolbar.children[0].value == []  # Axes are independent by default
+        assert toolbar.children[-1].id == 'fft-window'
+        assert toolbar.children[-1].value == 'hann'
         
         # Find the grid containing the tiles
         plot_grid = None
@@ -34,22 +52,60 @@ class TestPlotTilesComponent:
                 break
         
         assert plot_grid is not None
-        assert len(plot_grid.children) == 4  # 4 plot tiles
+        assert plot_grid.id == 'plot-tiles-grid'
+        assert len(plot_grid.children) == DEFAULT_TILE_COUNT
         
         # Check that each tile has the right structure
         for i, tile_wrapper in enumerate(plot_grid.children, 1):
-            assert tile_wrapper.id == f'plot-tile-{i}-wrapper'
-            assert len(tile_wrapper.children) == 2  # Header and Graph
+            assert tile_wrapper.id == {'type': 'plot-tile-wrapper', 'index': i}
+            assert len(tile_wrapper.children) == 6  # Header, Graph and four per-tile stores
             
             # Check header
             header = tile_wrapper.children[0]
-            assert header.id == f'plot-tile-{i}-header'
-            assert len(header.children) == 2  # Tile number and status
+            assert header.id == {'type': 'plot-tile-header', 'index': i}
+            assert len(header.children) == 3  # Tile number, status and mode selector
+            assert header.children[1].id == {'type': 'plot-tile-status', 'index': i}
+            assert header.children[2].id == {'type': 'plot-tile-mode', 'index': i}
+            assert header.children[2].value == 'lines'
             
             # Check graph
             graph = tile_wrapper.children[1]
             assert isinstance(graph, dcc.Graph)
-            assert graph.id == f'plot-tile-{i}'
+            assert graph.id == {'type': 'plot-tile', 'index': i}
+            
+            # Check per-tile signal store
+            store = tile_wrapper.children[2]
+            assert isinstance(store, dcc.Store)
+            assert store.id == {'type': 'plot-tile-signals', 'index': i}
+            
+            # Check per-tile figure payload store
+            figure_store = tile_wrapper.children[3]
+            assert isinstance(figure_store, dcc.Store)
+            assert figure_store.id == {'type': 'plot-tile-figure', 'index': i}
+            
+            # Check lazy-rendering stores: tiles start hidden with no request
+            visibility_store = tile_wrapper.children[4]
+            assert visibility_store.id == {'type': 'plot-tile-visibility', 'index': i}
+            assert visibility_store.data == 'hidden'
+            request_store = tile_wrapper.children[5]
+            assert request_store.id == {'type': 'plot-tile-request', 'index': i}
+            assert request_store.data is None
+    
+    def test_create_plot_tiles_component_many_tiles(self):
+        """Test that the tile count is configurable."""
+        component = create_plot_tiles_component(num_tiles=24)
+        plot_grid = component.children[3]
+        
+        assert len(plot_grid.children) == 24
+        assert plot_grid.children[-1].id == {'type': 'plot-tile-wrapper', 'index': 24}
+    
+    def test_create_plot_tile(self):
+        """Test creating a single tile with pattern-matching IDs."""
+        tile_wrapper = create_plot_tile(17)
+        
+        assert tile_wrapper.id == {'type': 'plot-tile-wrapper', 'index': 17}
+        assert tile_wrapper.children[0].children[0].children == "Tile 17"
+        assert tile_wrapper.children[1].figure.layout.title.text == "Plot Tile 17"
     
     def test_create_empty_plot_figure(self):
         """Test empty plot figure creation."""
@@ -80,44 +136,38 @@ class TestPlotTilesComponent:
         trace = fig.data[0]
         assert trace.name == signal_name
         assert trace.mode == "lines"
-        assert len(trace.x) == len(time_data)
-        assert len(trace.y) == len(signal_data)
+        
+        # Trace data is shipped as binary typed arrays
+        assert np.allclose(decode_typed_array(trace.x), time_data, rtol=1e-6, atol=0)
+        assert np.allclose(decode_typed_array(trace.y), signal_data, rtol=1e-6, atol=0)
 
 
 class TestPlotStyling:
     """Test plot styling functionality."""
     
-    def test_tile_wrapper_style_inactive(self):
-        """Test inactive tile wrapper styling."""
-        style = get_tile_wrapper_style(False)
-        
-        assert style['border'] == '2px solid #dee2e6'
-        assert style['backgroundColor'] == '#ffffff'
-        assert 'cursor' in style
+    def test_tile_wrapper_class_inactive(self):
+        """Test inactive tile wrapper class."""
+        assert get_tile_wrapper_class(False) == 'plot-tile-wrapper'
     
-    def test_tile_wrapper_style_active(self):
-        """Test active tile wrapper styling."""
-        style = get_tile_wrapper_style(True)
-        
-        assert style['border'] == '3px solid #2196f3'
-        assert style['backgroundColor'] == '#f3f8ff'
-        assert 'boxShadow' in style
+    def test_tile_wrapper_class_active(self):
+        """Test active tile wrapper class."""
+        assert get_tile_wrapper_class(True) == 'plot-tile-wrapper active'
     
-    def test_tile_header_style_inactive(self):
-        """Test inactive tile header styling."""
-        style = get_tile_header_style(False)
-        
-        assert style['backgroundColor'] == '#f8f9fa'
-        assert style['color'] == '#495057'
-        assert style['fontWeight'] == 'normal'
+    def test_tile_header_class_inactive(self):
+        """Test inactive tile header class."""
+        assert get_tile_header_class(False) == 'tile-header'
     
-    def test_tile_header_style_active(self):
-        """Test active tile header styling."""
-        style = get_tile_header_style(True)
+    def test_tile_header_class_active(self):
+        """Test active tile header class."""
+        assert get_tile_header_class(True) == 'tile-header active'
+    
+    def test_new_tile_is_inactive(self):
+        """Test that tiles start with inactive classes and no inline style."""
+        tile_wrapper = create_plot_tile(1)
         
-        assert style['backgroundColor'] == '#2196f3'
-        assert style['color'] == 'white'
-        assert style['fontWeight'] == 'bold'
+        assert tile_wrapper.className == get_tile_wrapper_class(False)
+        assert tile_wrapper.children[0].className == get_tile_header_class(False)
+        assert getattr(tile_wrapper, 'style', None) is None
 
 
 class TestSignalLabeling:
@@ -171,6 +221,35 @@ class TestTileStatusText:
         assert status == "Plotting: V(out) (Active)"
 
 
+class TestTileIds:
+    """Test tile ID helpers."""
+    
+    def test_tile_id_round_trip(self):
+        """Test converting between tile indices and tile IDs."""
+        assert get_tile_id(3) == 'plot-tile-3'
+        assert get_tile_index('plot-tile-3') == 3
+        assert get_tile_index(get_tile_id(32)) == 32
+    
+    def test_invalid_tile_id(self):
+        """Test that invalid tile IDs have no index."""
+        assert get_tile_index(None) is None
+        assert get_tile_index('signal-list-store') is None
+        assert get_tile_index('plot-tile-x') is None
+    
+    def test_tile_signals_normalization(self):
+        """Test normalizing single-signal and list tile configurations."""
+        assert get_tile_signals(None) == []
+        assert get_tile_signals("V(out)") == ["V(out)"]
+        assert get_tile_signals(["V(a)", "V(b)"]) == ["V(a)", "V(b)"]
+    
+    def test_plotted_signals(self):
+        """Test listing every plotted signal in tile order without duplicates."""
+        tile_config = {'plot-tile-1': ["V(a)", "V(b)"], 'plot-tile-2': "V(b)", 'plot-tile-3': ["V(c)", "V(a)"]}
+        
+        assert get_plotted_signals(tile_config) == ["V(a)", "V(b)", "V(c)"]
+        assert get_plotted_signals(None) == []
+
+
 class TestPlotFigureEdgeCases:
     """Test plot figure creation edge cases."""
     
@@ -198,5 +277,54 @@ class TestPlotFigureEdgeCases:
         assert "No signal plotted" in fig.layout.annotations[0].text
 
 
+class TestDenseOverlay:
+    """Test packing many overlaid signals into few traces."""
+    
+    def setup_method(self):
+        self.time_data = np.linspace(0, 1e-6, 50)
+        self.df = pd.DataFrame(
+            {f'V(bus{i})': np.sin(self.time_data * 1e7 + i) for i in range(200)},
+            index=self.time_data
+        )
+    
+    def test_overlay_group(self):
+        """Test that numbered nodes share an overlay group."""
+        assert get_overlay_group("V(bus12)") == get_overlay_group("V(bus3)") == "V(bus#)"
+        assert get_overlay_group("V(out)") == "V(out)"
+    
+    def test_many_signals_use_one_trace_per_group(self):
+        """Test that 200 bus nodes render as a single packed trace."""
+        signal_names = list(self.df.columns)
+        fig = create_multi_signal_plot_figure(signal_names, self.time_data, self.df, {}, 'plot-tile-1')
+        
+        assert len(fig.data) == 1
+        trace = fig.data[0]
+        assert trace.meta['signals'] == signal_names
+        assert trace.meta['packed'] == len(self.time_data)
+        assert trace.name == "V(bus#) (200)"
+        
+        # One line per signal, separated by NaN gaps
+        values = decode_typed_array(trace.y)
+        assert len(values) == 200 * 51 - 1
+        assert np.isnan(values[50::51]).all()
+        assert np.allclose(values[51:101], self.df['V(bus1)'], atol=1e-5)
+    
+    def test_groups_get_separate_traces(self):
+        """Test that each overlay group is its own trace."""
+        df = self.df.assign(**{'I(r1)': 0.0})
+        fig = create_multi_signal_plot_figure(['V(bus0)', 'I(r1)', 'V(bus1)'], self.time_data, df, {},
+                                              'plot-tile-1', overlay_mode='dense')
+        
+        assert [trace.meta['signals'] for trace in fig.data] == [['V(bus0)', 'V(bus1)'], ['I(r1)']]
+        assert fig.data[0].line.color != fig.data[1].line.color
+    
+    def test_few_signals_keep_separate_traces(self):
+        """Test that small overlays keep one trace per signal."""
+        signal_names = ['V(bus0)', 'V(bus1)', 'V(bus2)']
+        fig = create_multi_signal_plot_figure(signal_names, self.time_data, self.df, {}, 'plot-tile-1')
+        
+        assert [trace.name for trace in fig.data] == signal_names
+
+
 if __name__ == '__main__':
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Tests for device power and energy accounting.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset
+from src.utils import power as power_module
+from src.utils.power import (compute_device_power, cumulative_energy, pair_device_terminals, parse_netlist,
+                             power_table, sort_power_rows, summarize_power)
+from src.components.power_panel import create_power_figure, create_power_table
+
+NETLIST = """* RC divider driven by a sine source
+V1 in 0 SINE(0 1 1k)
+R1 in out 1k
+R2 out 0 1k ; bottom resistor
+C1 out 0
++ 1u
+XU1 out in 0 buffer gain=2
+M1 out in 0 0 nch
+.subckt buffer IN OUT GND params: gain=1
+R1 IN OUT 1k
+.ends buffer
+.tran 1m
+.end
+"""
+
+
+def make_dataset(points=2001):
+    """Create an RC divider whose device currents are consistent with its voltages."""
+    axis = np.linspace(0, 1e-3, points)
+    v_in = np.sin(2 * np.pi * 1e3 * axis)
+    v_out = 0.5 * v_in
+    waves = {
+        'V(in)': v_in,
+        'V(out)': v_out,
+        'I(R1)': (v_in - v_out) / 1e3,
+        'I(R2)': v_out / 1e3,
+        'I(V1)': -(v_in - v_out) / 1e3,
+        'Ix(u1:IN)': np.full_like(axis, 1e-3),
+        'Ix(u1:OUT)': np.full_like(axis, -1e-3),
+        'Id(M1)': np.full_like(axis, 2e-3),
+        'Ig(M1)': np.zeros_like(axis),
+        'Is(M1)': np.full_like(axis, -2e-3)
+    }
+    return Dataset('power', 'rc.raw', {0: axis}, {0: waves})
+
+
+class TestNetlist:
+    """Test netlist connections and pairing."""
+    
+    def test_parse_netlist(self):
+        """Test two-terminal, continued, semiconductor and subcircuit lines."""
+        connections = parse_netlist(NETLIST)
+        
+        assert connections['R1'] == {'+': 'in', '-': 'out'}
+        assert connections['C1'] == {'+': 'out', '-': '0'}
+        assert connections['XU1'] == {'IN': 'out', 'OUT': 'in', 'GND': '0'}
+        assert connections['M1'] == {'d': 'out', 'g': 'in', 's': '0', 'b': '0'}
+        # Devices inside subcircuit definitions are not top-level devices
+        assert len(connections) == 6
+    
+    def test_pairing(self):
+        """Test pairing currents with node voltages, including a missing terminal current."""
+        dataset = make_dataset()
+        
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(NETLIST))
+        
+        assert devices['R1'] == [('I(R1)', 'V(in)', 'V(out)')]
+        assert devices['R2'] == [('I(R2)', 'V(out)', None)]
+        assert set(devices['U1']) == {('Ix(u1:IN)', 'V(out)', None), ('Ix(u1:OUT)', 'V(in)', None)}
+        # The bulk current is missing, so the bulk node is the reference
+        assert ('Id(M1)', 'V(out)', None) in devices['M1']
+        assert 'C1' not in devices
+    
+    def test_pairing_without_netlist(self):
+        """Test that without a netlist only pins named after a node are paired."""
+        signal_names = ['V(vdd)', 'V(out)', 'Ix(x1:VDD)', 'Ix(x2:A)', 'I(R1)']
+        
+        devices = pair_device_terminals(signal_names)
+        
+        assert devices == {'X1': [('Ix(x1:VDD)', 'V(vdd)', None)]}
+
+
+class TestPowerAccounting:
+    """Test batched power and energy."""
+    
+    def test_resistor_power(self):
+        """Test instantaneous power and energy of the divider resistors."""
+        dataset = make_dataset()
+        axis = dataset.get_axis()
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(NETLIST))
+        
+        names, power = compute_device_power(axis, dataset.get_wave, devices)
+        by_name = dict(zip(names, power))
+        
+        np.testing.assert_allclose(by_name['R1'], (0.5 * dataset.get_wave('V(in)')) ** 2 / 1e3)
+        np.testing.assert_allclose(by_name['R1'] + by_name['R2'] + by_name['V1'], 0.0, atol=1e-15)
+        
+        # Mean of sin^2 over whole periods is 1/2
+        rows = {row['device']: row for row in power_table(dataset, devices)}
+        assert rows['R1']['average_power'] == pytest.approx(0.25 / 1e3 / 2, rel=1e-4)
+        assert rows['R1']['energy'] == pytest.approx(0.25 / 1e3 / 2 * 1e-3, rel=1e-4)
+        assert rows['V1']['energy'] < 0
+    
+    def test_window(self):
+        """Test energy over a window that does not fall on samples."""
+        axis = np.linspace(0, 1, 11)
+        power = np.vstack([np.ones(11), axis])
+        
+        summary = summarize_power(axis, power, [0.25, 0.75])
+        
+        np.testing.assert_allclose(summary['energy'], [0.5, 0.25])
+        np.testing.assert_allclose(summary['average_power'], [1.0, 0.5])
+        np.testing.assert_allclose(summary['peak_power'], [1.0, 0.7])
+        np.testing.assert_allclose(cumulative_energy(axis, power)[:, -1], [1.0, 0.5])
+    
+    def test_blocks_match_single_batch(self, monkeypatch):
+        """Test that processing devices in small blocks gives the same table."""
+        dataset = make_dataset()
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(NETLIST))
+        single = power_table(dataset, devices)
+        
+        monkeypatch.setattr(power_module, 'POWER_BLOCK_BYTES', 1)
+        
+        assert power_table(dataset, devices) == single
+    
+    def test_many_devices(self, monkeypatch):
+        """Test that thousands of devices are paired and accounted in bounded blocks."""
+        axis = np.linspace(0, 1, 101)
+        waves = {f'V(n{i})': np.sin(axis + i) for i in range(2001)}
+        waves.update({f'I(R{i})': np.cos(axis + i) for i in range(2000)})
+        netlist = "\n".join(f"R{i} n{i} n{i + 1} 1k" for i in range(2000))
+        dataset = Dataset('many', 'many.raw', {0: axis}, {0: waves})
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(netlist))
+        single = power_table(dataset, devices)
+        
+        monkeypatch.setattr(power_module, 'POWER_BLOCK_BYTES', 8 * 101 * 4 * 100)
+        
+        assert len(single) == 2000
+        assert power_table(dataset, devices) == single
+    
+    def test_sort_rows(self):
+        """Test sorting the table by a column and by name."""
+        rows = [{'device': 'B', 'energy': 1.0}, {'device': 'A', 'energy': 3.0}]
+        
+        assert [row['device'] for row in sort_power_rows(rows, 'energy')] == ['A', 'B']
+        assert [row['device'] for row in sort_power_rows(rows, 'device', descending=False)] == ['A', 'B']
+
+
+class TestPowerPanel:
+    """Test the power table and plot."""
+    
+    def test_table(self):
+        """Test the placeholder, empty and filled tables."""
+        dataset = make_dataset()
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(NETLIST))
+        
+        assert "Compute Power" in create_power_table(None)[0].children
+        assert "No device" in create_power_table({'rows': [], 'window': [0, 1]})[0].children
+        summary, table = create_power_table({'rows': power_table(dataset, devices), 'window': [0, 1e-3]})
+        
+        assert summary.children.startswith(f"{len(devices)} devices")
+        assert len(table.children[1].children) == len(devices)
+    
+    def test_figure(self):
+        """Test the power plot of selected devices."""
+        dataset = make_dataset()
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(NETLIST))
+        names, power = compute_device_power(dataset.get_axis(), dataset.get_wave,
+                                            {name: devices[name] for name in ('R1', 'R2')})
+        
+        fig = create_power_figure(dataset.get_axis(), names, power, 'power', [0, 5e-4])
+        
+        assert [trace.name for trace in fig.data] == ['R1', 'R2']
+        assert fig.layout.meta == {'analysis': 'power'}
+        assert len(fig.layout.shapes) == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -8,7 +8,6 @@ from src.components.signal_list import (
     create_signal_list_component, 
     create_signal_item, 
     create_signal_list_from_data,
-    get_plot_button_style,
     _classify_signal_type
 )
 
@@ -21,7 +20,7 @@ class TestSignalListComponent:
         component = create_signal_list_component()
         
         assert component.id == 'signal-selection-section'
-        assert len(component.children) == 5  # Title, List Display, Selected Display, Plot Button, Clear Button
+        assert len(component.children) == 8  # Title, Filter/Sort, List Display, Derived Input, Selected Display, Plot Button, Clear Button, Find Similar Button
         
         # Check for signal list display
         signal_list_display = None
@@ -116,21 +115,17 @@ class TestSignalListComponent:
 class TestPlotButtonStyling:
     """Test plot button styling functionality."""
     
-    def test_plot_button_enabled_style(self):
-        """Test enabled plot button styling."""
-        style = get_plot_button_style(True)
-        
-        assert style['backgroundColor'] == '#28a745'
-        assert style['cursor'] == 'pointer'
-        assert 'opacity' not in style
-    
-    def test_plot_button_disabled_style(self):
-        """Test disabled plot button styling."""
-        style = get_plot_button_style(False)
-        
-        assert style['backgroundColor'] == '#6c757d'
-        assert style['cursor'] == 'not-allowed'
-        assert style['opacity'] == '0.6'
+    def test_action_buttons_use_css_classes(self):
+        """Test that button state styling comes from CSS classes, not inline styles."""
+        component = create_signal_list_component()
+        buttons = {child.id: child for child in component.children
+                   if getattr(child, 'id', None) in ('plot-button', 'clear-tile-button')}
+        
+        assert buttons['plot-button'].className == 'plot-action-button'
+        assert buttons['clear-tile-button'].className == 'clear-tile-button'
+        for button in buttons.values():
+            assert button.disabled == True
+            assert getattr(button, 'style', None) is None
 
 
 class TestSignalTypeClassification:
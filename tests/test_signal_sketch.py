@@ -0,0 +1,114 @@
+"""
+Tests for per-signal shape sketches and the "find similar" ranking.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset, get_dataset_registry
+from src.utils import signal_sketch
+from src.utils.signal_sketch import SKETCH_LENGTH, SignalSketches, sketch_block
+from src.callbacks.signal_callbacks import handle_find_similar, update_signal_list_display
+from src.components.signal_list import SIMILARITY_SORT
+
+
+def make_waves():
+    """Create signals of a few distinct shapes on a non-uniform axis."""
+    rng = np.random.default_rng(0)
+    axis = np.sort(np.concatenate(([0.0, 1.0], rng.uniform(0, 1, 4998))))
+    waves = {
+        'V(sin)': np.sin(2 * np.pi * 3 * axis),
+        'V(sin_scaled)': 2.5 + 0.1 * np.sin(2 * np.pi * 3 * axis),
+        'V(sin_inverted)': -np.sin(2 * np.pi * 3 * axis),
+        'V(ramp)': axis,
+        'V(glitch)': np.where((axis > 0.4) & (axis < 0.45), 1.0, 0.0),
+        'V(vdd)': np.full_like(axis, 1.8)
+    }
+    return axis, waves
+
+
+class TestSketches:
+    """Test sketch computation."""
+    
+    def test_sketch_shape_and_norm(self):
+        """Test that sketches are unit-norm, zero-mean float32 rows."""
+        axis, waves = make_waves()
+        
+        sketches = SignalSketches.build(axis, waves)
+        
+        assert sketches.matrix.shape == (len(waves), SKETCH_LENGTH)
+        assert sketches.matrix.dtype == np.float32
+        assert sketches.matrix.flags['C_CONTIGUOUS']
+        np.testing.assert_allclose(np.linalg.norm(sketches.sketch('V(ramp)')), 1.0, rtol=1e-6)
+        assert abs(sketches.sketch('V(ramp)').mean()) < 1e-6
+    
+    def test_flat_signal_has_no_shape(self):
+        """Test that flat signals and zero-length axes get all-zero sketches."""
+        axis, waves = make_waves()
+        
+        sketches = SignalSketches.build(axis, waves)
+        
+        assert not sketches.sketch('V(vdd)').any()
+        assert not sketch_block(np.array([0.0]), np.array([[1.0]])).any()
+    
+    def test_blocks_match_single_pass(self, monkeypatch):
+        """Test that sketching in small blocks gives the same matrix."""
+        axis, waves = make_waves()
+        single = SignalSketches.build(axis, waves)
+        
+        monkeypatch.setattr(signal_sketch, 'SKETCH_BLOCK_BYTES', 1)
+        blocked = SignalSketches.build(axis, waves)
+        
+        np.testing.assert_array_equal(single.matrix, blocked.matrix)
+
+
+class TestRanking:
+    """Test ranking signals by similarity."""
+    
+    def test_rank_by_correlation(self):
+        """Test that offset and scale do not matter but inversion does."""
+        axis, waves = make_waves()
+        sketches = SignalSketches.build(axis, waves)
+        
+        ranking = sketches.rank(sketches.sketch('V(sin)'), exclude='V(sin)')
+        
+        assert ranking[0][0] == 'V(sin_scaled)'
+        assert ranking[0][1] == pytest.approx(1.0, abs=1e-4)
+        assert ranking[-1] == ('V(sin_inverted)', pytest.approx(-1.0, abs=1e-4))
+        assert 'V(sin)' not in [name for name, _ in ranking]
+    
+    def test_top(self):
+        """Test that a partial ranking keeps the best matches in order."""
+        axis, waves = make_waves()
+        sketches = SignalSketches.build(axis, waves)
+        full = sketches.rank(sketches.sketch('V(sin)'), exclude='V(sin)')
+        
+        assert sketches.rank(sketches.sketch('V(sin)'), top=2, exclude='V(sin)') == full[:2]
+    
+    def test_dataset_find_similar(self):
+        """Test ranking against native and derived reference signals."""
+        axis, waves = make_waves()
+        dataset = Dataset('id', 'file.raw', {0: axis}, {0: waves})
+        
+        assert dataset.find_similar('V(glitch)', top=1)[0][0] != 'V(glitch)'
+        assert dataset.find_similar('-V(sin)', top=1)[0][0] == 'V(sin_inverted)'
+        with pytest.raises(KeyError):
+            dataset.find_similar('V(missing)')
+    
+    def test_signal_list_ranking(self):
+        """Test the find similar action and the ranked signal list."""
+        axis, waves = make_waves()
+        dataset = Dataset('sketch-test', 'file.raw', {0: axis}, {0: waves})
+        get_dataset_registry().register(dataset)
+        
+        assert handle_find_similar(1, 'V(sin)') == ('V(sin)', SIMILARITY_SORT)
+        items = update_signal_list_display(list(waves), None, SIMILARITY_SORT, [], 'V(sin)', 'V(sin)',
+                                           {'dataset_id': 'sketch-test'})
+        
+        names = [item.id['index'] for item in items]
+        assert names[:2] == ['V(sin)', 'V(sin_scaled)']
+        assert names[-1] == 'V(sin_inverted)'
+        assert items[1].children[0].children[-1].children == "similarity 1.00"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
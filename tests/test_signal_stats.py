@@ -0,0 +1,99 @@
+"""
+Tests for per-signal summary statistics and the signal list filter.
+"""
+
+import pytest
+import numpy as np
+from src.utils.signal_stats import compute_signal_stats, filter_and_sort_signals, parse_stat_filter
+from src.callbacks.signal_callbacks import update_signal_list_display
+
+
+def make_waves(points=10001):
+    """Create a clock, a railed node and a sine on a 1 s axis."""
+    time_data = np.linspace(0, 1, points)
+    waves = {
+        'V(clk)': (np.sin(2 * np.pi * 5 * time_data) > 0).astype(float),
+        'V(vdd)': np.full(points, 3.3),
+        'V(out)': np.sin(2 * np.pi * time_data)
+    }
+    return {0: time_data}, {0: waves}
+
+
+class TestSignalStats:
+    """Test statistics computed at ingest."""
+    
+    def test_statistics(self):
+        """Test extrema, time-weighted averages and toggle counts."""
+        axes, waves = make_waves()
+        
+        stats = compute_signal_stats(axes, waves)
+        
+        assert stats['V(clk)']['toggles'] == 10
+        assert stats['V(clk)']['mean'] == pytest.approx(0.5, abs=1e-3)
+        assert stats['V(vdd)']['pp'] == 0
+        assert stats['V(vdd)']['toggles'] == 0
+        assert stats['V(out)']['rms'] == pytest.approx(np.sqrt(0.5))
+        assert stats['V(out)']['toggles'] == 1
+    
+    def test_chunks_do_not_change_results(self):
+        """Test that streaming in small chunks matches one chunk."""
+        axes, waves = make_waves()
+        
+        whole = compute_signal_stats(axes, waves)
+        chunked = compute_signal_stats(axes, waves, chunk_size=7)
+        
+        for name, stats in whole.items():
+            assert chunked[name] == pytest.approx(stats)
+    
+    def test_steps_are_combined(self):
+        """Test that statistics cover every simulation step."""
+        axes, waves = make_waves()
+        axes[1] = axes[0] + 1
+        waves[1] = {name: values * 2 for name, values in waves[0].items()}
+        
+        stats = compute_signal_stats(axes, waves)
+        
+        assert stats['V(vdd)']['max'] == pytest.approx(6.6)
+        assert stats['V(vdd)']['mean'] == pytest.approx(4.95)
+        assert stats['V(clk)']['toggles'] == 20
+
+
+class TestSignalFilter:
+    """Test filtering and sorting the signal list by statistics."""
+    
+    def test_parse_filter(self):
+        """Test name terms, conditions and SPICE scale suffixes."""
+        assert parse_stat_filter("out, pp > 100mV and toggles>=2") == \
+            (['out'], [('pp', '>', 0.1), ('toggles', '>=', 2.0)])
+        assert parse_stat_filter("rms < 1.5meg") == ([], [('rms', '<', 1.5e6)])
+        with pytest.raises(ValueError):
+            parse_stat_filter("slew > 1")
+    
+    def test_filter_and_sort(self):
+        """Test that only matching signals are kept, in statistic order."""
+        axes, waves = make_waves()
+        stats = compute_signal_stats(axes, waves)
+        signals = ['V(clk)', 'V(vdd)', 'V(out)', 'V(out)-V(clk)']
+        
+        assert filter_and_sort_signals(signals, stats, "pp > 100m", 'pp', True) == ['V(out)', 'V(clk)']
+        assert filter_and_sort_signals(signals, stats, "out") == ['V(out)', 'V(out)-V(clk)']
+        # Derived signals have no statistics and sort last
+        assert filter_and_sort_signals(signals, stats, sort_key='max') == \
+            ['V(clk)', 'V(out)', 'V(vdd)', 'V(out)-V(clk)']
+    
+    def test_signal_list_display(self):
+        """Test the signal list callback with a filter and statistics."""
+        axes, waves = make_waves()
+        parsed_data = {'metadata': {'signal_stats': compute_signal_stats(axes, waves)}}
+        
+        items = update_signal_list_display(['V(clk)', 'V(vdd)'], "pp = 0", 'name', [], None, None, parsed_data)
+        
+        assert [item.id['index'] for item in items] == ['V(vdd)']
+        assert items[0].children[0].children[1].children == "stuck at 3.3"
+        
+        message = update_signal_list_display(['V(clk)'], "slew > 1", 'name', [], None, None, parsed_data)
+        assert "Unknown statistic" in message[0].children
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
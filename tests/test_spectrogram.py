@@ -0,0 +1,137 @@
+"""
+Tests for the spectrogram (short-time FFT) and the spectrogram tile.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset, get_dataset_registry
+from src.data.spectrum_cache import get_spectrogram, get_spectrogram_cache
+from src.utils.spectrogram import (MAX_FRAMES_PER_COLUMN, SPECTROGRAM_COLUMNS, SPECTROGRAM_FFT_POINTS,
+                                  compute_spectrogram, spectrogram_plan)
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_chirp(points=200000, seed=0):
+    """Create a tone stepping from 10 kHz to 40 kHz halfway on an adaptive (random) time axis."""
+    rng = np.random.default_rng(seed)
+    time_data = np.sort(rng.uniform(0, 1e-3, points))
+    time_data[0], time_data[-1] = 0.0, 1e-3
+    frequency = np.where(time_data < 5e-4, 10e3, 40e3)
+    phase = 2 * np.pi * np.cumsum(frequency * np.diff(time_data, prepend=0.0))
+    return time_data, np.sin(phase)
+
+
+class TestSpectrogram:
+    """Test spectrogram layout and computation."""
+    
+    def test_plan(self):
+        """Test frame size, column count and averaging for short and long windows."""
+        short = spectrogram_plan(1000, n_columns=600)
+        long = spectrogram_plan(100_000_000, n_columns=600)
+        
+        assert short['n_fft'] == 64
+        assert short['frames_per_column'] == 1
+        assert short['n_columns'] == 600
+        assert short['n_grid'] <= 1000
+        assert long['n_fft'] == 256
+        assert long['frames_per_column'] == MAX_FRAMES_PER_COLUMN
+        assert long['hop'] == 256
+        assert long['n_grid'] == 600 * MAX_FRAMES_PER_COLUMN * 256
+    
+    def test_frequency_follows_time(self):
+        """Test that the strongest row moves from 10 kHz to 40 kHz halfway."""
+        time_data, values = make_chirp()
+        
+        spectrogram = compute_spectrogram(time_data, values, n_columns=100)
+        peak = spectrogram['frequency'][np.argmax(spectrogram['magnitude'], axis=0)]
+        resolution = spectrogram['frequency'][1]
+        
+        assert spectrogram['magnitude'].shape == (spectrogram['n_fft'] // 2 + 1, 100)
+        assert spectrogram['magnitude'].dtype == np.float32
+        assert abs(peak[10] - 10e3) <= resolution
+        assert abs(peak[90] - 40e3) <= resolution
+        assert spectrogram['time'][0] > 0 and spectrogram['time'][-1] < 1e-3
+    
+    def test_chunks_match_single_pass(self):
+        """Test that streaming frames in small chunks gives the same image."""
+        time_data, values = make_chirp()
+        
+        single = compute_spectrogram(time_data, values, n_columns=100, chunk_frames=1 << 20)
+        chunked = compute_spectrogram(time_data, values, n_columns=100, chunk_frames=3)
+        
+        np.testing.assert_allclose(single['magnitude'], chunked['magnitude'], atol=1e-3)
+    
+    def test_long_record_work_is_bounded(self):
+        """Test that the resampled grid stops growing with the record length at tile resolution."""
+        bound = SPECTROGRAM_COLUMNS * MAX_FRAMES_PER_COLUMN * SPECTROGRAM_FFT_POINTS
+        grids = [spectrogram_plan(samples)['n_grid'] for samples in (10 ** 7, 10 ** 8, 10 ** 10)]
+        
+        assert grids[0] == grids[1] == grids[2] <= bound
+        
+        time_data = np.linspace(0, 1e-3, 4_000_000)
+        spectrogram = compute_spectrogram(time_data, np.sin(2 * np.pi * 1e6 * time_data))
+        
+        assert spectrogram['frames_per_column'] == MAX_FRAMES_PER_COLUMN
+        assert spectrogram['magnitude'].shape[1] == SPECTROGRAM_COLUMNS
+    
+    def test_invalid_input(self):
+        """Test that complex signals, unknown windows and empty windows are rejected."""
+        time_data, values = make_chirp(points=1000)
+        
+        with pytest.raises(ValueError):
+            compute_spectrogram(time_data, values.astype(complex))
+        with pytest.raises(ValueError):
+            compute_spectrogram(time_data, values, window='kaiser')
+        with pytest.raises(ValueError):
+            compute_spectrogram(time_data, values, x_range=[2e-3, 3e-3])
+
+
+class TestSpectrogramTile:
+    """Test the cached spectrogram tile."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        time_data, values = make_chirp()
+        self.dataset = Dataset('spectrogram-test', 'osc.raw', {0: time_data},
+                               {0: {'V(out)': values, 'V(in)': 0.5 * values}}, {'processed_step': 0})
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(out)')
+    
+    def test_cached_per_signal_and_window(self):
+        """Test that repeated requests are served from the cache with the same layout."""
+        first = get_spectrogram(self.dataset, 'V(out)', 0)
+        second = get_spectrogram(self.dataset, 'V(out)', 0)
+        get_spectrogram(self.dataset, 'V(out)', 0, window='blackman')
+        
+        stats = get_spectrogram_cache().stats()
+        assert (stats['hits'], stats['entries']) == (1, 2)
+        np.testing.assert_array_equal(first['time'], second['time'])
+        np.testing.assert_array_equal(first['magnitude'], second['magnitude'])
+    
+    def test_cache_follows_dataset_eviction(self):
+        """Test that evicting the dataset drops its spectrograms."""
+        get_spectrogram(self.dataset, 'V(out)', 0)
+        get_dataset_registry().evict('spectrogram-test')
+        
+        assert get_spectrogram_cache().stats()['entries'] == 0
+    
+    def test_spectrogram_tile_figure(self):
+        """Test the spectrogram tile payload: a time-axis heatmap of the first signal."""
+        payload = _update_tile_figure('plot-tile-1', ['V(out)', 'V(in)'], self.parsed_data, [0.0, 5e-4],
+                                      mode='stft', spectral_window='hamming')
+        
+        trace = payload['data'][0]
+        assert trace['type'] == 'heatmap'
+        assert 'meta' not in payload['layout']
+        assert payload['layout']['xaxis']['range'] == [0.0, 5e-4]
+        assert 'V(out)' in payload['layout']['title']['text']
+        assert 'Hamming' in payload['layout']['title']['text']
+    
+    def test_missing_signal(self):
+        """Test that a missing signal is reported on the tile."""
+        payload = _update_tile_figure('plot-tile-1', ['V(missing)'], self.parsed_data, mode='stft')
+        
+        assert 'not found' in payload['layout']['annotations'][-1]['text']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,166 @@
+"""
+Tests for spectrum analysis and the spectrum tile.
+"""
+
+import pytest
+import numpy as np
+from src.data.datasets import Dataset, get_dataset_registry
+from src.data.figure_cache import get_figure_cache
+from src.data.spectrum_cache import get_spectra, get_spectrum_cache
+from src.utils.plot_encoding import decode_typed_array
+from src.utils.spectrum import compute_spectrum, resample_uniform, spectrum_size
+from src.callbacks.plot_callbacks import _update_tile_figure
+
+
+def make_tone(points=50000, f0=10e3, harmonic=0.01, seed=0):
+    """Create a 10 kHz tone with a 3rd harmonic on an adaptive (random) time axis."""
+    rng = np.random.default_rng(seed)
+    time_data = np.sort(rng.uniform(0, 1e-3, points))
+    time_data[0], time_data[-1] = 0.0, 1e-3
+    values = np.sin(2 * np.pi * f0 * time_data) + harmonic * np.sin(2 * np.pi * 3 * f0 * time_data)
+    return time_data, values
+
+
+class TestSpectrum:
+    """Test FFT computation and tone metrics."""
+    
+    def test_spectrum_size(self):
+        """Test that the FFT size is the power of two covering the window."""
+        axis = np.linspace(0, 1, 1000)
+        
+        assert spectrum_size(axis) == 1024
+        assert spectrum_size(axis, [0, 0.1]) == 128
+        assert spectrum_size(axis, max_points=256) == 256
+    
+    def test_uniform_resampling(self):
+        """Test resampling of an adaptive axis onto a uniform grid."""
+        axis = np.array([0.0, 0.1, 0.5, 1.0])
+        
+        resampled = resample_uniform(axis, [axis * 2], 0.0, 1.0, 4)
+        
+        np.testing.assert_allclose(resampled, [[0.0, 0.5, 1.0, 1.5]])
+    
+    def test_decimation_filters_out_of_band_tones(self):
+        """Test that a tone above the decimated Nyquist frequency does not fold back as a spur."""
+        time_data = np.arange(1 << 18) / (1 << 18)
+        values = np.sin(2 * np.pi * 2e3 * time_data) + np.sin(2 * np.pi * 20e3 * time_data)
+        
+        spectrum = compute_spectrum(time_data, {'V(out)': values}, n_points=1 << 14)
+        frequency, magnitude = spectrum['frequency'], spectrum['magnitude']['V(out)']
+        
+        # Without the filter, 20 kHz aliases to 16384 - 20000 = 3.6 kHz
+        assert spectrum['decimation'] == 16
+        assert len(frequency) == len(magnitude)
+        assert frequency[-1] == spectrum['bandwidth'] < 8192
+        assert magnitude[np.abs(frequency - 3616) < 5].max() < -90
+        assert spectrum['metrics']['V(out)']['fundamental'] == pytest.approx(2e3, rel=1e-3)
+        assert spectrum['metrics']['V(out)']['sfdr'] > 60
+    
+    def test_tone_metrics(self):
+        """Test fundamental, THD and SFDR of a tone with a -40 dBc harmonic."""
+        time_data, values = make_tone()
+        
+        spectrum = compute_spectrum(time_data, {'V(out)': values})
+        metrics = spectrum['metrics']['V(out)']
+        
+        assert metrics['fundamental'] == pytest.approx(10e3)
+        assert metrics['fundamental_db'] == pytest.approx(0.0, abs=0.1)
+        assert metrics['thd'] == pytest.approx(-40.0, abs=0.5)
+        assert metrics['thd_percent'] == pytest.approx(1.0, rel=0.05)
+        assert metrics['sfdr'] == pytest.approx(40.0, abs=0.5)
+        assert metrics['snr'] > 40
+    
+    def test_signals_share_one_transform(self):
+        """Test that several signals are analyzed together with matching results."""
+        time_data, values = make_tone()
+        
+        together = compute_spectrum(time_data, {'a': values, 'b': 2 * values})
+        alone = compute_spectrum(time_data, {'a': values})
+        
+        np.testing.assert_allclose(together['magnitude']['a'], alone['magnitude']['a'])
+        np.testing.assert_allclose(together['magnitude']['b'] - together['magnitude']['a'],
+                                   20 * np.log10(2), atol=1e-6)
+    
+    def test_dc_signal_has_no_tone(self):
+        """Test that a constant signal reports no fundamental."""
+        time_data = np.linspace(0, 1, 1000)
+        
+        metrics = compute_spectrum(time_data, {'dc': np.ones(1000)})['metrics']['dc']
+        
+        assert metrics['fundamental'] is None
+        assert metrics['thd'] is None
+    
+    def test_invalid_input(self):
+        """Test that bad windows, complex data and empty windows raise ValueError."""
+        time_data, values = make_tone(1000)
+        
+        with pytest.raises(ValueError):
+            compute_spectrum(time_data, {'a': values}, window='nope')
+        with pytest.raises(ValueError):
+            compute_spectrum(time_data, {'a': values.astype(complex)})
+        with pytest.raises(ValueError):
+            compute_spectrum(time_data, {'a': values}, x_range=[2e-3, 3e-3])
+
+
+class TestSpectrumTile:
+    """Test the cached spectrum tile."""
+    
+    @pytest.fixture(autouse=True)
+    def setup_dataset(self, register_tile_dataset):
+        time_data, values = make_tone()
+        self.dataset = Dataset('spectrum-test', 'osc.raw', {0: time_data},
+                               {0: {'V(out)': values, 'V(in)': 0.5 * values}}, {'processed_step': 0})
+        self.parsed_data = register_tile_dataset(self.dataset, 'V(out)')
+    
+    def test_spectra_are_cached_per_signal(self):
+        """Test that only signals missing from the cache are transformed."""
+        get_spectra(self.dataset, ['V(out)'], 0)
+        spectrum = get_spectra(self.dataset, ['V(out)', 'V(in)'], 0)
+        
+        stats = get_spectrum_cache().stats()
+        assert (stats['hits'], stats['entries']) == (1, 2)
+        assert set(spectrum['magnitude']) == {'V(out)', 'V(in)'}
+        
+        get_spectra(self.dataset, ['V(out)'], 0, window='blackman')
+        assert get_spectrum_cache().stats()['entries'] == 3
+    
+    def test_cache_follows_dataset_eviction(self):
+        """Test that evicting the dataset drops its spectra."""
+        get_spectra(self.dataset, ['V(out)'], 0)
+        get_dataset_registry().evict('spectrum-test')
+        
+        assert get_spectrum_cache().stats()['entries'] == 0
+    
+    def test_spectrum_tile_figure(self):
+        """Test the spectrum tile payload: frequency axis, metrics and window."""
+        payload = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, mode='fft',
+                                      spectral_window='blackman')
+        
+        trace = payload['data'][0]
+        assert trace['name'] == 'V(out)'
+        assert decode_typed_array(trace['x'])[-1] > 10e3
+        assert payload['layout']['meta'] == {'analysis': 'spectrum'}
+        assert 'Blackman' in payload['layout']['title']['text']
+        assert 'THD' in payload['layout']['annotations'][0]['text']
+    
+    def test_spectrum_tile_skips_frame(self, monkeypatch):
+        """Test that a spectrum tile is built and cached without slicing the signals into a frame."""
+        def fail(*args, **kwargs):
+            raise AssertionError("to_frame() called")
+        monkeypatch.setattr(self.dataset, 'to_frame', fail)
+        
+        payload = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, mode='fft')
+        
+        assert payload['layout']['meta'] == {'analysis': 'spectrum'}
+        assert get_figure_cache().stats()['entries'] == 1
+    
+    def test_time_window_is_not_applied_to_frequency_axis(self):
+        """Test that a zoom window selects the analyzed time range only."""
+        payload = _update_tile_figure('plot-tile-1', ['V(out)'], self.parsed_data, [0.0, 5e-4], mode='fft')
+        
+        assert 'range' not in payload['layout'].get('xaxis', {})
+        assert get_spectrum_cache().stats()['entries'] == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -5,7 +5,7 @@ Tests for file upload and parsing functionality.
 import pytest
 import base64
 import os
-from src.utils.spice_parser import parse_uploaded_raw_file, extract_signals_to_dataframe
+from src.utils.spice_parser import parse_uploaded_raw_file, extract_signals_to_dataframe, extract_all_steps
 from src.components.upload import create_file_upload_component, get_upload_feedback, get_error_feedback
 from spicelib import RawRead
 
@@ -100,6 +100,21 @@ class TestFileParsingIntegration:
         assert df.shape[0] == len(result['index'])  # Rows match index length
         assert df.shape[1] == len(result['signals'])  # Columns match signals
     
+    def test_extract_all_steps_from_sample(self):
+        """Test extracting every simulation step from the sample file."""
+        sample_file = "raw_data/Ring_Oscillator_7stage.raw"
+        if not os.path.exists(sample_file):
+            pytest.skip(f"Sample file {sample_file} not available")
+        
+        raw_data = RawRead(sample_file)
+        result = extract_signals_to_dataframe(raw_data)
+        axes, waves = extract_all_steps(raw_data, result['signals'])
+        
+        assert list(axes.keys()) == raw_data.get_steps()
+        first_step = list(axes.keys())[0]
+        assert len(axes[first_step]) == len(result['index'])
+        assert set(waves[first_step]) == set(result['signals'])
+    
     def test_parse_uploaded_file_format(self):
         """Test parsing a file in the upload format (base64)."""
         sample_file = "raw_data/Ring_Oscillator_7stage.op.raw"  # Use smaller file for testing
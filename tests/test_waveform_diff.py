@@ -0,0 +1,223 @@
+"""
+Tests for the waveform regression diff and the compare panel.
+"""
+
+import base64
+import pytest
+import numpy as np
+from src.data.datasets import Dataset, get_dataset_registry, get_golden_registry
+from src.callbacks.compare_callbacks import handle_golden_upload, run_compare
+from src.utils import waveform_diff
+from src.utils.waveform_diff import (
+    align_axes, compare_datasets, compare_waves, difference_trace, interpolate_block,
+    interpolation_plan, rank_differences
+)
+from src.components.compare_panel import MAX_COMPARE_ROWS, create_compare_figure, create_compare_table
+
+
+def make_runs(signals=3, points=2001):
+    """Create a run and a golden run of sines sampled on different axes."""
+    rng = np.random.default_rng(0)
+    axis = np.sort(np.concatenate(([0.0, 1.0], rng.uniform(0, 1, points - 2))))
+    golden_axis = np.linspace(0, 1, points)
+    waves = {f'V(n{i})': np.sin(2 * np.pi * (i + 1) * axis) for i in range(signals)}
+    golden_waves = {f'V(n{i})': np.sin(2 * np.pi * (i + 1) * golden_axis) for i in range(signals)}
+    return axis, waves, golden_axis, golden_waves
+
+
+class TestAlignment:
+    """Test grid alignment and interpolation."""
+    
+    def test_union_grid_covers_overlap(self):
+        """Test that the union grid holds every point of both axes in their common span."""
+        grid = align_axes(np.array([0.0, 1.0, 2.0, 3.0]), np.array([0.5, 1.5, 2.5, 4.0]))
+        
+        np.testing.assert_array_equal(grid, [0.5, 1.0, 1.5, 2.0, 2.5, 3.0])
+    
+    def test_uniform_grid(self):
+        """Test a uniform grid over the common span."""
+        grid = align_axes(np.linspace(0, 2, 5), np.linspace(1, 3, 5), 'uniform', n_points=11)
+        
+        np.testing.assert_allclose(grid, np.linspace(1, 2, 11))
+    
+    def test_unknown_grid(self):
+        """Test that an unknown grid mode is rejected."""
+        with pytest.raises(ValueError):
+            align_axes(np.arange(3.0), np.arange(3.0), 'nearest')
+    
+    def test_interpolation_matches_numpy(self):
+        """Test block interpolation, including repeated time points."""
+        axis = np.array([0.0, 1.0, 1.0, 2.0, 4.0])
+        block = np.array([[0.0, 1.0, 3.0, 2.0, 6.0], [1.0, 1.0, 1.0, 1.0, 1.0]])
+        grid = np.array([0.0, 0.5, 1.5, 3.0, 4.0])
+        
+        values = interpolate_block(block, *interpolation_plan(axis, grid))
+        
+        assert values.shape == (2, 5)
+        np.testing.assert_allclose(values[0], [0.0, 0.5, 2.5, 4.0, 6.0])
+        np.testing.assert_allclose(values[1], 1.0)
+
+
+class TestCompareWaves:
+    """Test per-signal error metrics."""
+    
+    def test_identical_signals(self):
+        """Test that the same waveform on different axes only shows interpolation error."""
+        axis, waves, golden_axis, golden_waves = make_runs()
+        
+        results = compare_waves(axis, waves, golden_axis, golden_waves, rel_tolerance=1e-2)
+        
+        assert [result['signal'] for result in results] == list(waves)
+        assert not any(result['diverged'] for result in results)
+        assert all(result['max_abs_error'] < 1e-2 for result in results)
+    
+    def test_step_change_metrics(self):
+        """Test max, RMS error and divergence time of an offset from t = 0.5."""
+        axis = np.linspace(0, 1, 1001)
+        golden = np.zeros_like(axis)
+        changed = np.where(axis >= 0.5, 0.2, 0.0)
+        
+        result, = compare_waves(axis, {'V(x)': changed}, axis, {'V(x)': golden})
+        
+        assert result['diverged']
+        assert result['max_abs_error'] == pytest.approx(0.2)
+        assert result['rms_error'] == pytest.approx(0.2 * np.sqrt(0.5), rel=1e-2)
+        assert result['first_divergence'] == pytest.approx(0.5, abs=1e-3)
+    
+    def test_chunked_matches_single_pass(self):
+        """Test that grid chunking and signal blocks do not change the results."""
+        axis, waves, golden_axis, golden_waves = make_runs(signals=5)
+        waves['V(n2)'] = waves['V(n2)'] + np.where(axis > 0.7, 0.1, 0.0)
+        
+        single = compare_waves(axis, waves, golden_axis, golden_waves, chunk_size=1 << 20)
+        chunked = compare_waves(axis, waves, golden_axis, golden_waves, chunk_size=37)
+        
+        for a, b in zip(single, chunked):
+            assert a['first_divergence'] == b['first_divergence']
+            assert a['max_abs_error'] == pytest.approx(b['max_abs_error'])
+            assert a['rms_error'] == pytest.approx(b['rms_error'])
+    
+    def test_only_common_signals(self):
+        """Test that signals missing from either run are skipped."""
+        axis = np.linspace(0, 1, 11)
+        
+        results = compare_waves(axis, {'a': axis, 'b': axis}, axis, {'b': axis, 'c': axis})
+        
+        assert [result['signal'] for result in results] == ['b']
+    
+    def test_ranking(self):
+        """Test that diverged signals come first, most divergent first."""
+        results = [
+            {'signal': 'quiet', 'diverged': False, 'relative_error': 1e-5, 'first_divergence': None},
+            {'signal': 'small', 'diverged': True, 'relative_error': 0.01, 'first_divergence': 0.2},
+            {'signal': 'large', 'diverged': True, 'relative_error': 0.5, 'first_divergence': 0.9}
+        ]
+        
+        assert [result['signal'] for result in rank_differences(results)] == ['large', 'small', 'quiet']
+    
+    def test_blocks_match_single_batch(self, monkeypatch):
+        """Test that comparing signals in small blocks gives the same results as one batch."""
+        axis, waves, golden_axis, golden_waves = make_runs(signals=1, points=2001)
+        waves = {f'V(n{i})': waves['V(n0)'] * (1 + 1e-3 * i) for i in range(200)}
+        golden_waves = {f'V(n{i})': golden_waves['V(n0)'] for i in range(200)}
+        waves['V(n123)'] = waves['V(n123)'] + 0.5
+        
+        single = rank_differences(compare_waves(axis, waves, golden_axis, golden_waves))
+        monkeypatch.setattr(waveform_diff, 'DIFF_BLOCK_BYTES', 1)
+        blocked = rank_differences(compare_waves(axis, waves, golden_axis, golden_waves))
+        
+        assert blocked == single
+        assert len(blocked) == 200
+        assert blocked[0]['signal'] == 'V(n123)'
+
+
+class TestCompareDatasets:
+    """Test comparing datasets and building the compare panel."""
+    
+    def make_datasets(self):
+        axis, waves, golden_axis, golden_waves = make_runs()
+        waves['V(n1)'] = waves['V(n1)'] * 1.1
+        dataset = Dataset('run', 'run.raw', {0: axis}, {0: waves})
+        golden = Dataset('golden', 'golden.raw', {0: golden_axis}, {0: golden_waves})
+        return dataset, golden
+    
+    def test_compare_datasets(self):
+        """Test ranked comparison of every common signal."""
+        dataset, golden = self.make_datasets()
+        
+        results = compare_datasets(dataset, golden)
+        
+        assert len(results) == 3
+        assert results[0]['signal'] == 'V(n1)'
+        assert results[0]['diverged']
+    
+    def test_difference_trace(self):
+        """Test the difference of one signal on the aligned grid."""
+        dataset, golden = self.make_datasets()
+        
+        grid, difference = difference_trace(dataset, golden, 'V(n1)')
+        
+        assert len(grid) == len(difference)
+        assert np.max(np.abs(difference)) == pytest.approx(0.1, rel=1e-2)
+    
+    def test_compare_table(self):
+        """Test the ranked table and its summary."""
+        dataset, golden = self.make_datasets()
+        
+        assert create_compare_table(None)[0].children.startswith("Load a golden run")
+        summary, table = create_compare_table(compare_datasets(dataset, golden))
+        
+        assert summary.children == "1 of 3 signals diverge"
+        assert len(table.children[1].children) == 3
+        
+        many = [{'signal': str(i), 'diverged': False, 'max_abs_error': 0.0, 'rms_error': 0.0,
+                 'relative_error': 0.0, 'first_divergence': None} for i in range(MAX_COMPARE_ROWS + 5)]
+        summary, table = create_compare_table(many)
+        assert f"top {MAX_COMPARE_ROWS}" in summary.children
+        assert len(table.children[1].children) == MAX_COMPARE_ROWS
+    
+    def test_compare_figure(self):
+        """Test the overlay and difference views."""
+        dataset, golden = self.make_datasets()
+        
+        overlay = create_compare_figure(dataset, golden, 'V(n1)', 'overlay')
+        difference = create_compare_figure(dataset, golden, 'V(n1)', 'difference')
+        
+        assert len(overlay.data) == 2
+        assert len(difference.data) == 1
+        assert difference.layout.meta == {'analysis': 'compare'}
+        assert len(create_compare_figure(None, None, None, 'overlay').data) == 0
+
+
+class TestGoldenUpload:
+    """Test loading a golden run next to the loaded run."""
+    
+    SAMPLE_FILE = "raw_data/Ring_Oscillator_7stage.raw"
+    
+    def teardown_method(self):
+        get_dataset_registry().evict('run1')
+        get_golden_registry().clear()
+    
+    def test_golden_with_same_filename_keeps_run(self):
+        """Test that a golden file named like the loaded run does not evict the run or its steps."""
+        axis = np.linspace(0, 1e-6, 101)
+        run = Dataset('run1', 'Ring_Oscillator_7stage.raw', {0: axis, 1: axis},
+                      {0: {'V(bus06)': np.sin(axis)}, 1: {'V(bus06)': np.cos(axis)}})
+        get_dataset_registry().register(run)
+        with open(self.SAMPLE_FILE, 'rb') as raw_file:
+            contents = 'data:application/octet-stream;base64,' + base64.b64encode(raw_file.read()).decode()
+        
+        status, golden_data = handle_golden_upload(contents, 'Ring_Oscillator_7stage.raw')
+        
+        assert status.startswith("Golden: Ring_Oscillator_7stage.raw")
+        assert get_dataset_registry().get('run1') is run
+        assert get_golden_registry().get(golden_data['dataset_id']) is not None
+        assert get_dataset_registry().get(golden_data['dataset_id']) is None
+        
+        results, options, selected, style = run_compare(1, {'dataset_id': 'run1'}, golden_data)
+        assert {'label': 'V(bus06)', 'value': 'V(bus06)'} in options
+        assert style == {'display': 'block'}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
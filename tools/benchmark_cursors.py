@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark dual-cursor readout latency across many long signals.
+
+Usage:
+    python tools/benchmark_cursors.py [--points N] [--signals N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.utils.cursors import measure_cursors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=10_000_000, help='samples per signal')
+    parser.add_argument('--signals', type=int, default=100, help='signals read out')
+    parser.add_argument('--repeat', type=int, default=50, help='readouts timed')
+    args = parser.parse_args()
+
+    # Adaptive-looking time axis; signals share one buffer so memory stays
+    # bounded while every lookup still indexes a full-length array
+    rng = np.random.default_rng(0)
+    axis = np.cumsum(rng.uniform(0.5e-12, 1.5e-12, args.points))
+    wave = np.sin(2 * np.pi * 1e9 * axis)
+    waves = {f'V(n{i:03d})': wave for i in range(args.signals)}
+
+    positions = rng.uniform(axis[0], axis[-1], (args.repeat, 2))
+    timings = []
+    for cursor_a, cursor_b in positions:
+        start = time.perf_counter()
+        measure_cursors(axis, waves, cursor_a, cursor_b)
+        timings.append(time.perf_counter() - start)
+
+    timings_ms = np.array(timings) * 1e3
+    print(f"{args.signals} signals x {args.points} points, {args.repeat} readouts")
+    print(f"median {np.median(timings_ms):.2f} ms, max {timings_ms.max():.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
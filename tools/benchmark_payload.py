@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark figure payload size and serialization time: JSON number lists
+versus base64 typed arrays.
+
+Usage:
+    python tools/benchmark_payload.py [--points N] [--signals N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from src.utils.plot_encoding import encode_typed_array
+
+
+def build_list_figure(time_data, signals):
+    """Build a figure the old way, with tolist() trace data."""
+    fig = go.Figure()
+    x_list = time_data.tolist()
+    for name, values in signals.items():
+        fig.add_trace(go.Scattergl(x=x_list, y=values.tolist(), mode='lines', name=name))
+    return fig
+
+
+def build_typed_array_figure(time_data, signals):
+    """Build a figure with base64 typed-array trace data."""
+    fig = go.Figure()
+    x_data = encode_typed_array(time_data, is_axis=True)
+    for name, values in signals.items():
+        fig.add_trace(go.Scattergl(x=x_data, y=encode_typed_array(values), mode='lines', name=name))
+    return fig
+
+
+def time_path(build, time_data, signals, repeat):
+    """Return (best build+serialize seconds, best deserialize seconds, payload bytes)."""
+    best_encode = best_decode = float('inf')
+    payload = ''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = pio.to_json(build(time_data, signals), validate=False)
+        best_encode = min(best_encode, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pio.from_json(payload, skip_invalid=True)
+        best_decode = min(best_decode, time.perf_counter() - start)
+    return best_encode, best_decode, len(payload.encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=200_000, help='samples per signal')
+    parser.add_argument('--signals', type=int, default=4, help='overlaid signals')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions (best is reported)')
+    args = parser.parse_args()
+
+    # Adaptive-looking time axis and oscillator-like signals
+    rng = np.random.default_rng(0)
+    time_data = np.cumsum(rng.uniform(0.5e-12, 1.5e-12, args.points))
+    signals = {
+        f'V(bus{i:02d})': 0.9 + 0.9 * np.sin(2 * np.pi * 1e9 * time_data + i)
+        for i in range(args.signals)
+    }
+
+    print(f"{args.signals} signals x {args.points} points")
+    print(f"{'path':<14}{'payload':>12}{'encode':>12}{'decode':>12}")
+
+    results = {}
+    for label, build in (('list', build_list_figure), ('typed array', build_typed_array_figure)):
+        encode_s, decode_s, size = time_path(build, time_data, signals, args.repeat)
+        results[label] = (encode_s, size)
+        print(f"{label:<14}{size / 1e6:>10.2f}MB{encode_s * 1e3:>10.1f}ms{decode_s * 1e3:>10.1f}ms")
+
+    list_encode, list_size = results['list']
+    typed_encode, typed_size = results['typed array']
+    print(f"payload {list_size / typed_size:.1f}x smaller, encode {list_encode / typed_encode:.1f}x faster")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark device power and energy accounting against the number of devices.
+
+Usage:
+    python tools/benchmark_power.py [--points N] [--devices N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.data.datasets import Dataset
+from src.utils.power import pair_device_terminals, parse_netlist, power_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=5001, help='samples per signal')
+    parser.add_argument('--devices', type=int, default=2000, help='resistors in the netlist')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions (best is reported)')
+    args = parser.parse_args()
+
+    # A resistor chain: one node voltage per node, one current per resistor
+    axis = np.linspace(0, 1e-3, args.points)
+    waves = {f'V(n{i})': np.sin(2 * np.pi * 1e3 * axis + i) for i in range(args.devices + 1)}
+    waves.update({f'I(R{i})': 1e-3 * np.cos(2 * np.pi * 1e3 * axis + i) for i in range(args.devices)})
+    netlist = "\n".join(f"R{i} n{i} n{i + 1} 1k" for i in range(args.devices))
+    dataset = Dataset('benchmark', 'chain.raw', {0: axis}, {0: waves})
+
+    best_pair = best_table = float('inf')
+    rows = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        devices = pair_device_terminals(dataset.signal_names, parse_netlist(netlist))
+        best_pair = min(best_pair, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        rows = power_table(dataset, devices)
+        best_table = min(best_table, time.perf_counter() - start)
+
+    print(f"{args.devices} devices x {args.points} points")
+    print(f"parse + pair: {best_pair * 1e3:.1f} ms")
+    print(f"power table:  {best_table * 1e3:.1f} ms ({len(rows)} rows)")
+
+
+if __name__ == '__main__':
+    main()
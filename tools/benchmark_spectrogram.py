@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark spectrogram computation against the record length.
+
+Usage:
+    python tools/benchmark_spectrogram.py [--points N] [--columns N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.utils.spectrogram import SPECTROGRAM_COLUMNS, compute_spectrogram
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=20_000_000, help='samples in the record')
+    parser.add_argument('--columns', type=int, default=SPECTROGRAM_COLUMNS, help='time columns')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions (best is reported)')
+    args = parser.parse_args()
+
+    # A 1 MHz tone over 1 ms on a uniform axis
+    time_data = np.linspace(0, 1e-3, args.points)
+    values = np.sin(2 * np.pi * 1e6 * time_data)
+
+    best = float('inf')
+    spectrogram = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        spectrogram = compute_spectrogram(time_data, values, n_columns=args.columns)
+        best = min(best, time.perf_counter() - start)
+
+    bins, columns = spectrogram['magnitude'].shape
+    print(f"{args.points} points -> {bins} bins x {columns} columns "
+          f"({spectrogram['frames_per_column']} frames per column)")
+    print(f"spectrogram: {best * 1e3:.1f} ms ({args.points / best / 1e6:.0f} M samples/s)")
+
+
+if __name__ == '__main__':
+    main()
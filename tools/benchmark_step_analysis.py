@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-step sweep analysis throughput against the number of workers.
+
+Usage:
+    python tools/benchmark_step_analysis.py [--steps N] [--points N] [--signals N] [--workers N]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.data.batch_analysis import run_step_analysis, shutdown_analysis_pool
+from src.data.datasets import Dataset
+from src.data.step_cache import ensure_step_cache
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--steps', type=int, default=500, help='sweep steps')
+    parser.add_argument('--points', type=int, default=100_000, help='samples per step')
+    parser.add_argument('--signals', type=int, default=4, help='signals measured per step')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='largest worker count')
+    args = parser.parse_args()
+
+    # Oscillator sweep: the frequency changes with the step parameter
+    rng = np.random.default_rng(0)
+    axes, waves = {}, {}
+    for step in range(args.steps):
+        axis = np.cumsum(rng.uniform(0.5e-9, 1.5e-9, args.points))
+        axes[step] = axis
+        waves[step] = {f'V(n{i})': np.sin(2 * np.pi * (1e6 + 1e3 * step) * axis + i)
+                       for i in range(args.signals)}
+    dataset = Dataset('benchmark', 'benchmark.raw', axes, waves)
+    signals = dataset.signal_names
+    del axes, waves
+
+    root = Path(tempfile.mkdtemp(prefix='wavedash-benchmark-'))
+    try:
+        start = time.perf_counter()
+        cache_dir = ensure_step_cache(dataset, root)
+        print(f"{args.steps} steps x {args.signals} signals x {args.points} points, "
+              f"cache written in {time.perf_counter() - start:.2f} s")
+        del dataset
+
+        baseline = None
+        for workers in range(1, args.workers + 1):
+            if workers > 1:
+                # Start and import the workers outside the timed run, as a
+                # long-running server would have them
+                run_step_analysis(cache_dir, signals, list(range(min(args.steps, 4 * workers))),
+                                  max_workers=workers)
+
+            start = time.perf_counter()
+            table = run_step_analysis(cache_dir, signals, max_workers=workers)
+            elapsed = time.perf_counter() - start
+
+            baseline = baseline or elapsed
+            speedup = baseline / elapsed
+            print(f"workers {workers:2d}: {elapsed:6.2f} s, {args.steps / elapsed:7.1f} steps/s, "
+                  f"speedup {speedup:4.2f}x, efficiency {100 * speedup / workers:3.0f}%")
+
+        assert len(table) == args.steps * args.signals
+    finally:
+        shutdown_analysis_pool()
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
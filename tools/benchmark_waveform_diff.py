@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark the waveform regression diff against the number of signals.
+
+Usage:
+    python tools/benchmark_waveform_diff.py [--points N] [--signals N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.utils.waveform_diff import compare_waves, rank_differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=20_000, help='samples per signal')
+    parser.add_argument('--signals', type=int, default=2000, help='signals compared')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions (best is reported)')
+    args = parser.parse_args()
+
+    # The run is on an adaptive axis, the golden run on a uniform one; the
+    # signals share one buffer per run so memory stays bounded
+    rng = np.random.default_rng(0)
+    axis = np.sort(np.concatenate(([0.0, 1.0], rng.uniform(0, 1, args.points - 2))))
+    golden_axis = np.linspace(0, 1, args.points)
+    run_wave = np.sin(2 * np.pi * axis)
+    golden_wave = np.sin(2 * np.pi * golden_axis)
+    waves = {f'V(n{i})': run_wave for i in range(args.signals)}
+    golden_waves = {f'V(n{i})': golden_wave for i in range(args.signals)}
+    waves['V(n0)'] = run_wave + 0.5
+
+    best = float('inf')
+    results = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        results = rank_differences(compare_waves(axis, waves, golden_axis, golden_waves))
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{args.signals} signals x {args.points} points")
+    print(f"compare + rank: {best * 1e3:.1f} ms ({best / args.signals * 1e6:.1f} us per signal)")
+    print(f"most divergent: {results[0]['signal']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark XY (parametric) decimation against the number of samples.
+
+Usage:
+    python tools/benchmark_xy_decimation.py [--points N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add the project root to the Python path to allow importing src
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import numpy as np
+
+from src.utils.decimation import decimate_xy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--points', type=int, default=10_000_000, help='samples per signal')
+    parser.add_argument('--repeat', type=int, default=3, help='repetitions (best is reported)')
+    args = parser.parse_args()
+
+    t = np.linspace(0, 1, args.points)
+    curves = {
+        # Traces its path once: reduced to a connected line
+        'spiral': (t * np.cos(2 * np.pi * 20 * t), t * np.sin(2 * np.pi * 20 * t)),
+        # Retraces the plane many times: falls back to occupied cells
+        'lissajous': (np.sin(2 * np.pi * 3000 * t), np.sin(2 * np.pi * 4110 * t + 0.3))
+    }
+
+    print(f"{args.points} points")
+    print(f"{'curve':<12}{'kept':>10}{'connected':>11}{'time':>12}")
+    for label, (x, y) in curves.items():
+        best = float('inf')
+        x_plot, connected = x, True
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            x_plot, _, connected = decimate_xy(x, y)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<12}{len(x_plot):>10}{str(connected):>11}{best * 1e3:>10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()